@@ -19,15 +19,17 @@ from io import StringIO, IOBase
 from pathlib import PurePath
 import traceback
 from collections import defaultdict
+from time import perf_counter
 
 from typing import (
-    List, Dict, Set, Tuple, Sequence, Optional, Union, Any, TYPE_CHECKING)
+    List, Dict, Set, Tuple, Sequence, Optional, Union, Callable, Any, TYPE_CHECKING)
 from pickle import load, dump, dumps  # type: ignore
 
 import numpy as np  # type: ignore
 from cpylog import get_logger2
 
 from pyNastran.utils import object_attributes, check_path
+from pyNastran.utils.read_profile import ReadProfile
 from .utils import parse_patran_syntax
 from .bdf_interface.utils import (
     _parse_pynastran_header, to_fields, parse_executive_control_deck,
@@ -536,6 +538,11 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         self.read_includes = True
         self._remove_disabled_cards = False
 
+        #: profile the next read (see ``set_read_profile``)
+        self._is_read_profile = False
+        #: the ReadProfile of the read; None if the read isn't profiled
+        self._read_profile = None
+
         # file management parameters
         self.active_filenames = []  # type: List[str]
         self.active_filename = None  # type: Optional[str]
@@ -1177,6 +1184,43 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         self._stop_on_parsing_error = stop_on_parsing_error
         self._stop_on_xref_error = stop_on_xref_error
 
+    def set_read_profile(self, is_profile: bool=True) -> None:
+        """
+        Records the time spent in each phase of ``read_bdf`` and the
+        parse time of each card type (see ``get_read_profile``)
+
+        Parameters
+        ----------
+        is_profile : bool; default=True
+            profile the read
+
+        """
+        self._is_read_profile = is_profile
+
+    def get_read_profile(self) -> Optional[Dict[str, Any]]:
+        """
+        Gets the profile of the last read (see ``set_read_profile``)
+
+        Returns
+        -------
+        profile : Dict[str, Any] / None
+            None : the read wasn't profiled
+            total_time : float
+                the wall time of read_bdf (sec)
+            phases : List[Dict[str, Any]]
+                the time spent in each phase: read_lines (including
+                the INCLUDE files), split_decks, case_control,
+                split_cards, parse_cards, finalize, validate and
+                cross_reference
+            cards : List[Dict[str, Any]]
+                the number of cards and parse time for each card_name
+
+        Each group can be loaded with ``pd.DataFrame(profile['cards'])``.
+        """
+        if self._read_profile is None:
+            return None
+        return self._read_profile.to_dict()
+
     def validate(self) -> None:
         """runs some checks on the input data beyond just type checking"""
         validate_bdf(self)
@@ -1296,6 +1340,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
         """
         self.save_file_structure = save_file_structure
+        profile = ReadProfile() if self._is_read_profile else None
+        self._read_profile = profile
         if bdf_filename and not isinstance(bdf_filename, (StringIO, list)):
             check_path(bdf_filename, 'bdf_filename')
         self._read_bdf_helper(bdf_filename, encoding, punch, read_includes)
@@ -1306,7 +1352,10 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                          nastran_format=self.nastran_format,
                          consider_superelements=self.is_superelements,
                          log=self.log, debug=self.debug)
+        obj.read_profile = profile
         out = obj.get_lines(bdf_filename, punch=self.punch, make_ilines=True)
+        if profile is not None:
+            t0 = perf_counter()
         (system_lines,
          executive_control_lines,
          case_control_lines,
@@ -1327,6 +1376,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         self.case_control_deck = CaseControlDeck(case_control_lines, self.log)
         self.case_control_deck.solmap_to_value = self._solmap_to_value
         self.case_control_deck.rsolmap_to_str = self.rsolmap_to_str
+        if profile is not None:
+            profile.add_phase('case_control', t0)
 
         try:
             self._parse_all_cards(bulk_data_lines, bulk_data_ilines)
@@ -1342,14 +1393,20 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                           encoding=encoding)
             return
 
+        if profile is not None:
+            t0 = perf_counter()
         if superelement_lines:
             self._add_superelements(superelement_lines, superelement_ilines)
 
         self.pop_parse_errors()
         fill_dmigs(self)
+        if profile is not None:
+            t0 = profile.add_phase('finalize', t0)
 
         if validate:
             self.validate()
+            if profile is not None:
+                t0 = profile.add_phase('validate', t0)
 
         if self._remove_disabled_cards:
             all_cards = set(self.card_count.keys())
@@ -1359,6 +1416,9 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
         self.cross_reference(xref=xref)
         self._xref = xref
+        if profile is not None:
+            profile.add_phase('cross_reference', t0)
+            profile.stop()
 
         self.log.debug('---finished BDF.read_bdf of %s---' % self.bdf_filename)
 
@@ -1371,6 +1431,9 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         strict = True
         cards_list = []
         cards_dict = {}
+        profile = self._read_profile
+        if profile is not None:
+            t0 = perf_counter()
         if self._is_cards_dict:
             cards_dict, card_count = self.get_bdf_cards_dict(
                 bulk_data_lines, bulk_data_ilines)
@@ -1390,7 +1453,11 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                 #card_name = card[0]
                 #if card_name == 'CBAR':
                     #print(card)
+        if profile is not None:
+            t0 = profile.add_phase('split_cards', t0)
         self._parse_cards(cards_list, cards_dict, card_count, strict=strict)
+        if profile is not None:
+            profile.add_phase('parse_cards', t0)
 
         if self.values_to_skip:
             for key, values in self.values_to_skip.items():
@@ -4211,6 +4278,10 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             raise NotImplementedError('save_file_structure=True is not supported\n%s' % (
                 list(cards_dict.keys())))
 
+        add_card = self.add_card
+        if self._read_profile is not None:
+            add_card = _profile_add_card(add_card, self._read_profile)
+
         for card_name, cards in sorted(cards_dict.items()):
             if self.is_reject(card_name):
                 self.log.info(f'    rejecting card_name = {card_name}')
@@ -4219,13 +4290,18 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                     self.reject_lines.append([_format_comment(comment)] + card_lines)
             else:
                 for comment, card_lines, (ifile, unused_iline) in cards:
-                    self.add_card(card_lines, card_name, comment=comment, ifile=ifile,
-                                  is_list=False, has_none=False)
+                    add_card(card_lines, card_name, comment=comment, ifile=ifile,
+                             is_list=False, has_none=False)
 
     def _parse_cards_list(self, cards_list: List[str], strict: bool=True):
         """parses the cards that are in list format"""
         add_card = self.add_card if strict else self.add_card_lax
+        add_card_ifile = self.add_card_ifile
         del strict
+        if self._read_profile is not None:
+            add_card = _profile_add_card(add_card, self._read_profile)
+            add_card_ifile = _profile_add_card(add_card_ifile, self._read_profile,
+                                               icard_name=2)
 
         save_file_structure = self.save_file_structure
         if save_file_structure:
@@ -4247,8 +4323,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
                     _check_replicated_cards(replicated_cards)
                     for replicated_card in replicated_cards:
-                        self.add_card_ifile(ifile, replicated_card, replicated_card[0],
-                                            comment=comment, is_list=True, has_none=True)
+                        add_card_ifile(ifile, replicated_card, replicated_card[0],
+                                       comment=comment, is_list=True, has_none=True)
                     continue
 
                 if self.is_reject(card_name):  # pragma: no cover
@@ -4256,8 +4332,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                     raise NotImplementedError(msg)
                     #self.reject_card_lines(card_name, card_lines, comment)
                 else:
-                    self.add_card_ifile(ifile, card_lines, card_name, comment=comment,
-                                        is_list=False, has_none=False)
+                    add_card_ifile(ifile, card_lines, card_name, comment=comment,
+                                   is_list=False, has_none=False)
 
         else:
             for icard, card in enumerate(cards_list):
@@ -4921,6 +4997,30 @@ def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True, xref: bool=T
         #model.get_bdf_stats()
     return model
 
+def _profile_add_card(add_card: Callable, profile: ReadProfile,
+                      icard_name: int=1) -> Callable:
+    """
+    Wraps add_card, so the parse time of each card type is added
+    to the read profile
+
+    Parameters
+    ----------
+    add_card : Callable
+        add_card, add_card_lax or add_card_ifile
+    profile : ReadProfile
+        the profile of the read
+    icard_name : int; default=1
+        the index of card_name in the arguments
+
+    """
+    def add_card_profile(*args, **kwargs):
+        t0 = perf_counter()
+        card_obj = add_card(*args, **kwargs)
+        profile.add('cards', {'card_name' : args[icard_name].upper()},
+                    ncards=1, time=perf_counter() - t0)
+        return card_obj
+    return add_card_profile
+
 def _prep_comment(comment):
     return comment.rstrip()
     #print('comment = %r' % comment)
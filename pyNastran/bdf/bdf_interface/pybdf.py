@@ -24,6 +24,7 @@ import os
 import shlex
 from collections import defaultdict
 from itertools import count
+from time import perf_counter
 from typing import List, Tuple, Optional, Union, Any, cast
 from io import StringIO
 
@@ -183,6 +184,9 @@ class BDFInputPy:
         self.debug = debug
         self.log = get_logger2(log, debug)
 
+        #: the ReadProfile of BDF.read_bdf; None if the read isn't profiled
+        self.read_profile = None
+
     def get_lines(self, bdf_filename: Union[str, StringIO],
                   punch: Optional[bool]=False,
                   make_ilines: bool=True) -> List[str]:
@@ -218,8 +222,13 @@ class BDFInputPy:
                  ilines = None
 
         """
+        profile = self.read_profile
+        if profile is not None:
+            t0 = perf_counter()
         main_lines = self.get_main_lines(bdf_filename)
         all_lines, ilines = self.lines_to_deck_lines(main_lines, make_ilines=make_ilines)
+        if profile is not None:
+            t0 = profile.add_phase('read_lines', t0)
 
         out = _lines_to_decks(all_lines, ilines, punch, self.log,
                               keep_enddata=True,
@@ -237,6 +246,8 @@ class BDFInputPy:
         else:
             msg = f'nastran_format={self.nastran_format!r} and must be msc, nx, optistruct, nasa95, mystran, or zona'
             raise NotImplementedError(msg)
+        if profile is not None:
+            profile.add_phase('split_decks', t0)
         return (system_lines, executive_control_lines, case_control_lines,
                 bulk_data_lines, bulk_data_ilines,
                 superelement_lines, superelement_ilines)
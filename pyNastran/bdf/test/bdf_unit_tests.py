@@ -116,6 +116,26 @@ class TestBDF(Tester):
         grid = model.nodes[1]
         grid.object_methods(mode='public', keys_to_skip=None)
 
+    def test_read_profile(self):
+        """tests the read profile"""
+        bdf_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.bdf')
+        model = BDF(debug=None)
+        model.read_bdf(bdf_filename)
+        assert model.get_read_profile() is None
+
+        model = BDF(debug=None)
+        model.set_read_profile()
+        model.read_bdf(bdf_filename)
+        profile = model.get_read_profile()
+        phases = [row['phase'] for row in profile['phases']]
+        assert phases == ['read_lines', 'split_decks', 'case_control', 'split_cards',
+                          'parse_cards', 'finalize', 'validate', 'cross_reference'], phases
+        assert profile['total_time'] >= sum(row['time'] for row in profile['phases'])
+
+        ncards = {row['card_name'] : row['ncards'] for row in profile['cards']}
+        assert ncards['GRID'] == len(model.nodes), ncards
+        assert ncards['CQUAD4'] == model.card_count['CQUAD4'], ncards
+
     def test_bdf_01(self):
         """checks solid_bending.dat"""
         bdf_filename = os.path.join(MODEL_PATH, 'solid_bending', 'solid_bending.bdf')
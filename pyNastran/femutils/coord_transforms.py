@@ -10,6 +10,7 @@ Defines general coordinate system related functions including:
  - rtp_to_rtz_array(xyz)
 
  - coords = cylindrical_rotation_matrix(thetar, dtype='float64')
+ - coords = spherical_rotation_matrix(thetar, phir, dtype='float64')
 
 """
 # pylint: disable=C0103
@@ -188,3 +189,41 @@ def cylindrical_rotation_matrix(thetar, dtype='float64'):
         #print(np.squeeze(rot))
         #print('---------')
     return rotation
+
+def spherical_rotation_matrix(thetar, phir, dtype='float64'):
+    """
+    Creates a series transformation matrices from the R-theta-phi
+    directions of a point to the xyz directions
+
+    Parameters
+    ----------
+    thetar : (n, ) float ndarray
+        the theta (angle from the z-axis) in radians
+    phir : (n, ) float ndarray
+        the phi (angle from the x-axis in the xy plane) in radians
+    dtype : dtype/str
+        the type of the output matrix
+
+    Returns
+    -------
+    rotation : (n, 3, 3)
+        the rotation matrices; the columns are the R, theta, phi unit
+        vectors of each point
+    """
+    theta = np.asarray(thetar, dtype=dtype)
+    phi = np.asarray(phir, dtype=dtype)
+    cos_theta = np.cos(theta)
+    sin_theta = np.sin(theta)
+    cos_phi = np.cos(phi)
+    sin_phi = np.sin(phi)
+
+    rotation = np.zeros((len(theta), 3, 3), dtype=dtype)
+    rotation[:, 0, 0] = sin_theta * cos_phi
+    rotation[:, 1, 0] = sin_theta * sin_phi
+    rotation[:, 2, 0] = cos_theta
+    rotation[:, 0, 1] = cos_theta * cos_phi
+    rotation[:, 1, 1] = cos_theta * sin_phi
+    rotation[:, 2, 1] = -sin_theta
+    rotation[:, 0, 2] = -sin_phi
+    rotation[:, 1, 2] = cos_phi
+    return rotation
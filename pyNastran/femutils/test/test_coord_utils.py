@@ -9,7 +9,7 @@ from pyNastran.femutils.coord_transforms import (
     xyz_to_rtz_array, xyz_to_rtp_array,
     rtz_to_xyz_array, rtp_to_xyz_array,
     rtz_to_rtp_array, rtp_to_rtz_array,
-    cylindrical_rotation_matrix,
+    cylindrical_rotation_matrix, spherical_rotation_matrix,
 )
 from pyNastran.femutils.coord_utils import (
     coords_from_vector_1d,
@@ -121,6 +121,28 @@ class TestCoordUtils(unittest.TestCase):
         #print(coords)
         ## TODO: not compared
 
+    def test_spherical_rotation_matrix(self):
+        """tests spherical_rotation_matrix"""
+        xyz = np.array([
+            [1., 0., 0.],
+            [1., 2., 0.],
+            [1., 2., 3.],
+            [-1., 2., -3.],
+        ])
+        rtp = xyz_to_rtp_array(xyz)
+        thetar = np.radians(rtp[:, 1])
+        phir = np.radians(rtp[:, 2])
+        rotations = spherical_rotation_matrix(thetar, phir, dtype='float64')
+        assert rotations.shape == (4, 3, 3), rotations.shape
+
+        # the R direction points away from the origin
+        unit_xyz = xyz / np.linalg.norm(xyz, axis=1)[:, np.newaxis]
+        assert np.allclose(rotations[:, :, 0], unit_xyz)
+
+        # the directions are orthonormal
+        eye = np.einsum('nji,njk->nik', rotations, rotations)
+        assert np.allclose(eye, np.eye(3))
+
     def test_coords_from_vector_1d(self):
         """tests coords_from_vector_1d"""
         v = [ # duplicate
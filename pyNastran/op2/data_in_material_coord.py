@@ -1,21 +1,23 @@
 """
 Defines:
- - data_in_material_coord(bdf, op2, in_place=False)
+ - data_in_material_coord(bdf, op2, in_place=False, material_angles=None)
+ - eids, thetarad = get_plate_material_angles(bdf)
+ - transform_solids(bdf_model, op2_model, cid)
 
 """
 from __future__ import annotations
 import copy
-from itertools import count
-from typing import TYPE_CHECKING
+from typing import Tuple, List, Dict, Optional, TYPE_CHECKING
 
 import numpy as np
 from numpy import cos, sin, cross
 from numpy.linalg import norm  # type: ignore
 
 from pyNastran.utils.numpy_utils import integer_types
+from pyNastran.op2.op2_interface.transforms import TRANSFORM_MAX_NBYTES
 
 if TYPE_CHECKING:  # pragma: no cover
-    from pyNastran.bdf.bdf import BDF, GRID
+    from pyNastran.bdf.bdf import BDF
     from pyNastran.op2.op2 import OP2
 
 force_vectors = ['cquad4_force', 'cquad8_force', 'cquadr_force',
@@ -24,6 +26,9 @@ stress_vectors = ['cquad4_stress', 'cquad8_stress', 'cquadr_stress',
                   'ctria3_stress', 'ctria6_stress', 'ctriar_stress']
 strain_vectors = ['cquad4_strain', 'cquad8_strain', 'cquadr_strain',
                   'ctria3_strain', 'ctria6_strain', 'ctriar_strain']
+QUAD_TYPES = ['CQUAD4', 'CQUAD8', 'CQUADR']
+TRIA_TYPES = ['CTRIA3', 'CTRIA6', 'CTRIAR']
+PLATE_TYPES = QUAD_TYPES + TRIA_TYPES
 
 
 def __transform_solids(model: OP2):  # pragma: no cover
@@ -125,8 +130,11 @@ def __transform_solids(model: OP2):  # pragma: no cover
     nodes_desired = [213972, 213973, 213974, 213975, 213980, 213982, 213989, 213990,
                      213998, 213999, 214420, 214431, 214457, 214458, 214459, 214460]
 
-def transform_solids(bdf_model: BDF, op2_model: OP2, cid: int):
+def transform_solids(bdf_model: BDF, op2_model: OP2, cid: int) -> None:
     """
+    Transforms the solid stresses/strains of an OP2 inplace from their
+    coordinate system (``element_cid``) to a rectangular coordinate system
+
     http://web.mit.edu/course/3/3.11/www/modules/trans.pdf
 
     [stress_out] = [T_out] [stress_0] [T_out]^T
@@ -134,185 +142,130 @@ def transform_solids(bdf_model: BDF, op2_model: OP2, cid: int):
     [stress_out] = [T_out] [T_in]^T [stress_in] [T_in] [T_out]^T
     [stress_out] = [T] [stress_in] [T]^T
     [T] = [T_out] [T_in]^T
+
+    Parameters
+    ----------
+    bdf_model : BDF
+        the model that defines the coordinate systems/elements
+    op2_model : OP2
+        the model with the results, which is modified
+    cid : int
+        the output coordinate system
+
     """
     Tout = np.eye(3, dtype='float64')
-    if cid != [-1, 0]:
+    if cid not in [-1, 0]:
         coord_out = bdf_model.coords[cid]
         assert coord_out.type in ['CORD2R', 'CORD1R'], coord_out
         Tout = coord_out.beta()
 
-    #coord = model.coords[1]
-    #T1 = coord.beta()
-
-
-    # TODO: should be this...
-    #strain_obj = model.op2_results.strain.ctetra_strain[1]
-
-    # TODO: all we have for now
-    #stress_obj = op2_model.ctetra_stress[1]
-    result_types = ['ctetra_stress', 'cpenta_stress', 'cpyram_stress', 'chexa_stress']
+    result_types = [
+        'ctetra_stress', 'cpenta_stress', 'cpyram_stress', 'chexa_stress',
+        'ctetra_strain', 'cpenta_strain', 'cpyram_strain', 'chexa_strain',
+    ]
+    # the element coordinate systems are shared by the results
+    element_axes = {}
     for res_type in result_types:
         res_dict = getattr(op2_model, res_type)
-        for subcase, stress_obj in res_dict.items():
-            _transform_solid_stress_obj(bdf_model, stress_obj, Tout)
+        for unused_subcase, stress_obj in res_dict.items():
+            _transform_solid_stress_obj(bdf_model, stress_obj, Tout, cid, element_axes)
 
-def _transform_solid_stress_obj(bdf_model: BDF, stress_obj, Tout):
-   #['oxx', 'oyy', 'ozz', 'txy', 'tyz', 'txz', 'omax', 'omid', 'omin', 'von_mises']
+def _transform_solid_stress_obj(bdf_model: BDF, stress_obj, Tout: np.ndarray,
+                                cid: int, element_axes: Dict[int, np.ndarray]) -> None:
+    """
+    Transforms the [oxx, oyy, ozz, txy, tyz, txz] of the nodes/time steps
+    of a solid stress/strain object inplace
+
+    The transform of each row is built once and all the time steps are
+    transformed with an einsum.
+    """
+    #['oxx', 'oyy', 'ozz', 'txy', 'tyz', 'txz', 'omax', 'omid', 'omin', 'von_mises']
     data = stress_obj.data
-    nmodes = data.shape[0]
-    if stress_obj.is_stress:
-        oxx = data[:, :, 0]
-        oyy = data[:, :, 1]
-        ozz = data[:, :, 2]
-        txy = data[:, :, 3]
-        tyz = data[:, :, 4]
-        txz = data[:, :, 5]
-    else:
-        exx = data[:, :, 0]
-        eyy = data[:, :, 1]
-        ezz = data[:, :, 2]
-        exy = data[:, :, 3] / 2
-        eyz = data[:, :, 4] / 2
-        exz = data[:, :, 5] / 2
-
-    nnodes = 5 # CTETRA4 / CTETRA10
     eids = stress_obj.element_node[:, 0]
-    neids = len(eids) // nnodes
-    nodes = stress_obj.element_node[:, 1].reshape(neids, nnodes)
-    ueids = np.unique(eids)
 
+    # the coordinate system of each row
     eids_cids = stress_obj.element_cid
-    cids = eids_cids[:, 1]
-    ucids = np.unique(cids)
+    isort = np.argsort(eids_cids[:, 0])
+    ieid = isort[np.searchsorted(eids_cids[:, 0], eids, sorter=isort)]
+    cids = eids_cids[ieid, 1]
 
-    for ucid in ucids:
-        if ucid == 0:
-            continue
+    irows = []
+    transforms = []
+    for ucid in np.unique(cids):
         if ucid == cid:
             continue
-
-        ieids = np.where(cids == ucid)[0]
-        ueids = eids_cids[ieids, 0]
-        nodes_xyz = {}
-        for nid in np.unique(nodes[ieids, 1:].ravel()):
-            node = bdf_model.nodes[nid] # type: GRID
-            nodes_xyz[nid] = node.get_position_wrt(bdf_model, ucid)
-
-        for eid, ieid in zip(ueids, ieids):
-            i0 = ieid * nnodes
-            i1 = i0 + nnodes
-            nodes_eid = nodes[ieid, 1:]
-            assert len(nodes_eid) == nnodes - 1
-            e_nodes = np.vstack([nodes_xyz[nid] for nid in nodes_eid])
-            avg_node = e_nodes.mean(axis=0)
-            assert len(avg_node) == 3
-
-            if ucid == -1:
-                element = bdf_model.elements[eid]
-                centroid, xe, ye, ze = element.material_coordinate_system()
-                Te = np.vstack([xe, ye, ze]) # Te
-            else:
+        irow = np.where(cids == ucid)[0]
+        if ucid == -1:
+            # this is ACTUALLY the element coordinate system
+            Tin = _get_solid_element_axes(bdf_model, eids[irow], element_axes)
+            T = np.einsum('ij,nkj->nik', Tout, Tin)
+        else:
+            Tin = np.eye(3, dtype='float64')
+            if ucid != 0:
                 coord_in = bdf_model.coords[ucid]
-                Tin = coord_in.beta()
-                if coord_in.type in ['CORD2R', 'CORD1R']:
-                    pass
-                #elif coord_in.type in ['CORD2C', 'CORD1C']:
-                    #thetad = avg_node[0]
-                    #print(avg_node)
-                    #theta = np.radians(thetad)
-                    #s = np.sin(theta)
-                    #c = np.cos(theta)
-                    #sc = s * c
-                    #c2 = c ** 2
-                    #s2 = s ** 2
-                    #Ar = np.array([
-                        #[c2, s2, 2. * sc],
-                        #[s2, c2, -2. * sc],
-                        #[-sc, sc, c2 - s2],
-                    #])
-                    #Ar = np.array([
-                        #[c, s, 0.],
-                        #[-s, c, 0.],
-                        #[0., 0., 1.],
-                    #])
-                    #Tin2 = Tin @ Ar.T
-                else:
+                if coord_in.type not in ['CORD2R', 'CORD1R']:
                     raise NotImplementedError(coord_in)
-            T = Tout @ Tin.T
-
-            for itime in range(nmodes):
-                for ielem in range(i0, i1):
-                    #exx = data[itime, ielem, 0]
-                    #eyy = data[itime, ielem, 1]
-                    #ezz = data[itime, ielem, 2]
-                    #exy_2 = data[itime, ielem, 3] / 2
-                    #eyz_2 = data[itime, ielem, 4] / 2
-                    #exz_2 = data[itime, ielem, 5] / 2
-                    #strain = np.array([
-                        #[exx, exy_2, exz_2],
-                        #[exy_2, eyy, eyz_2],
-                        #[exz_2, eyz_2, ezz],
-                    #])
-
-                    oxx = data[itime, ielem, 0]
-                    oyy = data[itime, ielem, 1]
-                    ozz = data[itime, ielem, 2]
-                    txy = data[itime, ielem, 3]
-                    tyz = data[itime, ielem, 4]
-                    txz = data[itime, ielem, 5]
-                    stress = np.array([
-                        [oxx, txy, txz],
-                        [txy, oyy, tyz],
-                        [txz, tyz, ozz],
-                    ])
-                    #[stress_out] = [T] [stress_in] [T]^T
-                    T11 = T[0, 0]
-                    T22 = T[1, 1]
-                    #T33 = T[2, 2]
-                    T12 = T[0, 1]
-                    T13 = T[0, 2]
-                    T32 = T23 = T[1, 2]
-
-                    T21 = T[1, 0]
-                    T31 = T[2, 0]
-                    oxx2 = (oxx*T11**2 + oyy*T21**2 + ozz*T31**2 + 2*txy*T11*T12 + 2*txz*T11*T13 + 2*tyz*T21*T31)
-                    oyy2 = (oxx*T12**2 + oyy*T22**2 + ozz*T32**2 + 2*txy*T11*T12 + 2*txz*T11*T13 + 2*tyz*T21*T31)
-                    ozz2 = (oxx*T11**2 + oyy*T21**2 + ozz*T31**2 + 2*txy*T11*T12 + 2*txz*T11*T13 + 2*tyz*T21*T31)
-                    #oxx2 = (oxx*T11**2 + oyy*T21**2 + ozz*T31**2 + 2*txy*T11*T12 + 2*txz*T11*T13 + 2*tyz*T21*T31)
-                    stress2 = T @ stress @ T.T
-                    print(eid)
-                    print(stress)
-                    print(stress2)
-                    #ss
-
-    inid0 = 0
-    for ieid, eid in enumerate(ueids):
-
-        # ------------------------------------------
-        # this is ACTUALLY the element coordinate system
-        ctetra = bdf_model.elements[eid]
-        #print(ctetra)
-        T = get_transform(T1, Te)
-
-        for unused_irange in range(5):
-            exxi = exx[:, inid0]
-            eyyi = eyy[:, inid0]
-            ezzi = ezz[:, inid0]
-            exyi = exy[:, inid0]
-            eyzi = eyz[:, inid0]
-            exzi = exz[:, inid0]
-
-            #  mode loop
-            for imode, exxii, eyyii, ezzii, exyii, eyzii, exzii in zip(count(), exxi, eyyi, ezzi, exyi, eyzi, exzi):
-                exxiit, eyyiit, ezziit, exyiit, eyziit, exziit = _transform_strain(
-                    T, exxii, eyyii, ezzii, exyii, eyzii, exzii)
-
-                #  save_op2 method
-                data[imode, inid0, :6] = exxiit, eyyiit, ezziit, exyiit, eyziit, exziit
-            inid0 += 1
-
-    #op2_filename_out = os.path.join(dirname, f'xform.op2')
-    #op2_model.write_op2(op2_filename_out, post=-1, endian=b'<', skips=None, nastran_format='nx')
+                Tin = coord_in.beta()
+            T = np.broadcast_to(Tout @ Tin.T, (len(irow), 3, 3))
+        irows.append(irow)
+        transforms.append(T)
+
+    if irows:
+        irow = np.hstack(irows)
+        T = np.vstack(transforms)
+        # the shear strains are engineering strains
+        shear_factor = 1. if stress_obj.is_stress else 2.
+        ntimes = data.shape[0]
+        nbytes_per_time = len(irow) * 9 * 8 * 3
+        ntimes_block = max(1, TRANSFORM_MAX_NBYTES // nbytes_per_time)
+        for itime0 in range(0, ntimes, ntimes_block):
+            itime1 = min(itime0 + ntimes_block, ntimes)
+            datai = data[itime0:itime1, irow, :6]
+            oxx, oyy, ozz = datai[:, :, 0], datai[:, :, 1], datai[:, :, 2]
+            txy = datai[:, :, 3] / shear_factor
+            tyz = datai[:, :, 4] / shear_factor
+            txz = datai[:, :, 5] / shear_factor
+            stress = np.stack([
+                np.stack([oxx, txy, txz], axis=-1),
+                np.stack([txy, oyy, tyz], axis=-1),
+                np.stack([txz, tyz, ozz], axis=-1),
+            ], axis=-2)
+
+            #[stress_out] = [T] [stress_in] [T]^T
+            stress2 = np.einsum('nij,tnjk,nlk->tnil', T, stress, T)
+            datai[:, :, 0] = stress2[:, :, 0, 0]
+            datai[:, :, 1] = stress2[:, :, 1, 1]
+            datai[:, :, 2] = stress2[:, :, 2, 2]
+            datai[:, :, 3] = stress2[:, :, 0, 1] * shear_factor
+            datai[:, :, 4] = stress2[:, :, 1, 2] * shear_factor
+            datai[:, :, 5] = stress2[:, :, 0, 2] * shear_factor
+            data[itime0:itime1, irow, :6] = datai
+    eids_cids[:, 1] = cid
+
+def _get_solid_element_axes(bdf_model: BDF, eids: np.ndarray,
+                            element_axes: Dict[int, np.ndarray]) -> np.ndarray:
+    """
+    Gets the element coordinate systems of some solid elements
+
+    Parameters
+    ----------
+    element_axes : Dict[int, (3, 3) float ndarray]
+        the axes that were already found; updated
+
+    Returns
+    -------
+    axes : (neids, 3, 3) float ndarray
+        the [xe, ye, ze] axes (rows) of each element
+
+    """
+    ueids, inverse = np.unique(eids, return_inverse=True)
+    for eid in ueids.tolist():
+        if eid not in element_axes:
+            element = bdf_model.elements[eid]
+            unused_centroid, xe, ye, ze = element.material_coordinate_system()
+            element_axes[eid] = np.vstack([xe, ye, ze]) # Te
+    axes = np.array([element_axes[eid] for eid in ueids.tolist()])
+    return axes[inverse]
 
 def get_transform(T1, Te):
     """
@@ -323,41 +276,13 @@ def get_transform(T1, Te):
     T = T1.T @ Te # TODO: is this the right order?; I think so...
     return T
 
-def _transform_strain(T, exxii, eyyii, ezzii, exyii, eyzii, exzii):
-    strain = np.array([
-        [exxii, exyii, exzii],
-        [exyii, eyyii, eyzii],
-        [exzii, eyzii, ezzii],
-    ])
-
-    # TODO: is it T.t @ inner @ T
-    #       or    T   @ inner @ T.T
-    #
-    # TODO: is it Ri  @ inner @ R
-    #       or    R   @ inner @ Ri
-    #
-    # TODO: is the T / R order right?
-    strain4 = T.T @ (R @ strain @ Ri) @ T
-    #print(T)
-
-    # TODO: or is it another strain?
-    strain_cid = strain4
-
-    exxiit = strain_cid[0, 0]
-    eyyiit = strain_cid[1, 1]
-    ezziit = strain_cid[2, 2]
-    exyiit = strain_cid[0, 1]
-    eyziit = strain_cid[1, 2]
-    exziit = strain_cid[0, 2]
-    return exxiit, eyyiit, ezziit, exyiit, eyziit, exziit
-
 def transf_Mohr(Sxx, Syy, Sxy, thetarad):
     """Mohr's Circle-based Plane Stress Transformation
 
     Parameters
     ----------
     Sxx, Syy, Sxy : array-like
-        Sigma_xx, Sigma_yy, Sigma_xy stresses.
+        Sigma_xx, Sigma_yy, Sigma_xy real/complex stresses.
     thetarad : array-like
         Array with angles for which the stresses should be transformed.
 
@@ -371,13 +296,17 @@ def transf_Mohr(Sxx, Syy, Sxy, thetarad):
     Syy = np.asarray(Syy)
     Sxy = np.asarray(Sxy)
     thetarad = np.asarray(thetarad)
+
+    # the rotation of the circle is linear in the stresses, so it's
+    # also valid for complex stresses
+    cos_2theta = cos(2*thetarad)
+    sin_2theta = sin(2*thetarad)
     Scenter = (Sxx + Syy)/2.
-    R = np.sqrt((Sxx - Scenter)**2 + Sxy**2)
-    thetarad_Mohr = np.arctan2(-Sxy, Sxx - Scenter) + 2*thetarad
-    cos_Mohr = cos(thetarad_Mohr)
-    Sxx_theta = Scenter + R*cos_Mohr
-    Syy_theta = Scenter - R*cos_Mohr
-    Sxy_theta = -R*sin(thetarad_Mohr)
+    Sradius = (Sxx - Syy)/2.
+    Sxx_rotated = Sradius*cos_2theta + Sxy*sin_2theta
+    Sxx_theta = Scenter + Sxx_rotated
+    Syy_theta = Scenter - Sxx_rotated
+    Sxy_theta = Sxy*cos_2theta - Sradius*sin_2theta
     return Sxx_theta, Syy_theta, Sxy_theta
 
 
@@ -461,7 +390,9 @@ def angle2vec(v1, v2):
 
     """
     denom = norm(v1, axis=1) * norm(v2, axis=1)
-    return np.arccos((v1 * v2).sum(axis=1) / denom)
+    # round off can put parallel vectors slightly outside [-1, 1]
+    cos_theta = np.clip((v1 * v2).sum(axis=1) / denom, -1., 1.)
+    return np.arccos(cos_theta)
 
 
 def calc_imat(normals, csysi):
@@ -478,12 +409,156 @@ def calc_imat(normals, csysi):
     is not a unit vector.
     """
     jmat = cross(normals, csysi) # k x i
-    jmat /= norm(jmat)
+    jmat /= norm(jmat, axis=1)[:, np.newaxis]
     imat = cross(jmat, normals)
     return imat
 
+def get_plate_material_angles(bdf: BDF) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the angle from the element coordinate system to the material
+    coordinate system (THETA/MCID) of the CQUAD4, CQUAD8, CQUADR, CTRIA3,
+    CTRIA6, and CTRIAR elements
 
-def data_in_material_coord(bdf: BDF, op2: OP2, in_place: bool=False) -> OP2:
+    The angles are calculated for all the elements at once.  They're
+    not cached, so to transform several OP2s with the same BDF, pass them
+    to ``data_in_material_coord(..., material_angles=...)``.
+
+    Parameters
+    ----------
+    bdf : :class:`.BDF` object
+        a cross-referenced model
+
+    Returns
+    -------
+    eids : (nelements, ) int ndarray
+        the sorted element ids
+    thetarad : (nelements, ) float ndarray
+        the material angle of each element in radians
+
+    """
+    eids = []
+    thetadeg = []
+    mcids = []
+    iplates = []
+    plate_types = []
+    plate_nodes = []
+    for eid, elem in bdf.elements.items():
+        theta_mcid = getattr(elem, 'theta_mcid', None)
+        is_plate = elem.type in PLATE_TYPES
+        if theta_mcid is None and not is_plate:
+            continue
+        is_mcidi = isinstance(theta_mcid, integer_types)
+
+        iplate = len(eids)
+        eids.append(eid)
+        thetadeg.append(0. if is_mcidi or theta_mcid is None else theta_mcid)
+        mcids.append(theta_mcid if is_mcidi else -1)
+        if is_plate:
+            iplates.append(iplate)
+            plate_types.append(elem.type)
+            nodes = elem.nodes[:4] if elem.type in QUAD_TYPES else elem.nodes[:3] * 2
+            plate_nodes.append(nodes[:4])
+
+    eids = np.array(eids, dtype='int64')
+    mcids = np.array(mcids, dtype='int64')
+    thetarad = np.deg2rad(np.array(thetadeg, dtype='float64'))
+    if iplates:
+        iplates = np.array(iplates)
+        thetarad[iplates] = _get_plate_thetarad(
+            bdf, np.array(plate_types), np.array(plate_nodes, dtype='int64'),
+            thetarad[iplates], mcids[iplates])
+
+    isort = np.argsort(eids)
+    return eids[isort], thetarad[isort]
+
+def _get_plate_thetarad(bdf: BDF, plate_types: np.ndarray, nodes: np.ndarray,
+                        thetarad: np.ndarray, mcids: np.ndarray) -> np.ndarray:
+    """
+    Vectorized helper for ``get_plate_material_angles``
+
+    Parameters
+    ----------
+    plate_types : (nplates, ) str ndarray
+        the element types
+    nodes : (nplates, 4) int ndarray
+        the corner nodes; [n1, n2, n3, n1] for the trias
+    thetarad : (nplates, ) float ndarray
+        the THETA of the elements
+    mcids : (nplates, ) int ndarray
+        the MCID of the elements; -1 for the elements with THETA
+
+    """
+    nid_cp_cd, xyz_cid0 = bdf.get_xyz_in_coord_array(
+        cid=0, fdtype='float64', idtype='int64')[:2]
+    nids = nid_cp_cd[:, 0]
+    isort = np.argsort(nids)
+    inode = isort[np.searchsorted(nids, nodes, sorter=isort)]
+    corner = xyz_cid0[inode, :]
+    g1 = corner[:, 0, :]
+    g2 = corner[:, 1, :]
+    g3 = corner[:, 2, :]
+    g4 = corner[:, 3, :]
+    is_quad = np.isin(plate_types, QUAD_TYPES)
+
+    # elems with MCID
+    is_mcid = mcids != -1
+    if np.any(is_mcid):
+        g1m = g1[is_mcid]
+        g2m = g2[is_mcid]
+        g3m = g3[is_mcid]
+        g4m = g4[is_mcid]
+        is_quadm = is_quad[is_mcid]
+
+        # quads: (n1 - n3) x (n2 - n4); trias: (n1 - n2) x (n1 - n3)
+        normals = np.where(is_quadm[:, np.newaxis],
+                           cross(g1m - g3m, g2m - g4m),
+                           cross(g1m - g2m, g1m - g3m))
+        normals /= norm(normals, axis=1)[:, np.newaxis]
+
+        umcids, imcid = np.unique(mcids[is_mcid], return_inverse=True)
+        csysi = np.array([bdf.coords[mcid].i for mcid in umcids.tolist()])[imcid]
+        imat = calc_imat(normals, csysi)
+        thetarad_mcid = angle2vec(g2m - g1m, imat)
+        # getting sign of THETA
+        check_normal = cross(g2m - g1m, imat)
+        thetarad_mcid *= np.sign((check_normal * normals).sum(axis=1))
+        thetarad[is_mcid] = thetarad_mcid
+
+    #NOTE the quads are relative to the bisector of the diagonals
+    if np.any(is_quad):
+        g1q = g1[is_quad]
+        g2q = g2[is_quad]
+        g3q = g3[is_quad]
+        g4q = g4[is_quad]
+        betarad = angle2vec(g3q - g1q, g2q - g1q)
+        gammarad = angle2vec(g4q - g2q, g1q - g2q)
+        alpharad = (betarad + gammarad) / 2.
+        thetarad[is_quad] += alpharad - betarad
+    return thetarad
+
+def _get_vector_thetarad(eids: np.ndarray, thetarad: np.ndarray,
+                         veceids: np.ndarray) -> np.ndarray:
+    """looks up the material angles of the elements of a result"""
+    #NOTE assuming thetarad=0 for elements that exist in the op2 but
+    #     not in the supplied bdf file
+    vecthetarad = np.zeros(len(veceids), dtype='float64')
+    if len(eids):
+        ieid = np.searchsorted(eids, veceids)
+        ieid[ieid == len(eids)] = 0
+        is_found = eids[ieid] == veceids
+        vecthetarad[is_found] = thetarad[ieid[is_found]]
+    return vecthetarad
+
+def _get_corner_rows(vector) -> np.ndarray:
+    """gets the rows of the corner nodes of a result (e.g., CQUAD8)"""
+    element_node = getattr(vector, 'element_node', None)
+    if element_node is not None:
+        return element_node[:, 1] != 0
+    nrows = vector.data.shape[1]
+    return np.arange(nrows) % 5 != 0
+
+def data_in_material_coord(bdf: BDF, op2: OP2, in_place: bool=False,
+                           material_angles: Optional[Tuple[np.ndarray, np.ndarray]]=None) -> OP2:
     """Convert OP2 2D element outputs to material coordinates
 
     Nastran allows the use of 'PARAM,OMID,YES' to print 2D element forces,
@@ -495,6 +570,10 @@ def data_in_material_coord(bdf: BDF, op2: OP2, in_place: bool=False) -> OP2:
     similarly to most of the post-processing tools (Patran, Femap, HyperView,
     etc). It handles both 2D elements with MCID or THETA.
 
+    The material angles are calculated once per call (see
+    ``get_plate_material_angles``) and each result is transformed for all
+    the elements and time steps at once.
+
     Parameters
     ----------
     bdf : :class:`.BDF` object
@@ -504,6 +583,9 @@ def data_in_material_coord(bdf: BDF, op2: OP2, in_place: bool=False) -> OP2:
     in_place : bool; default=False
         If true the original op2 object is modified, otherwise a new one
         is created.
+    material_angles : (eids, thetarad); default=None -> calculated
+        the output of ``get_plate_material_angles(bdf)``, which may be
+        reused for several op2s if the bdf isn't modified
 
     Returns
     -------
@@ -512,7 +594,7 @@ def data_in_material_coord(bdf: BDF, op2: OP2, in_place: bool=False) -> OP2:
 
     .. warning ::  doesn't handle composite stresses/strains/forces
     .. warning ::  doesn't handle solid stresses/strains/forces (e.g. MAT11)
-    .. warning ::  zeros out data for CQUAD8s
+    .. warning ::  zeros out data for the corners of CQUAD8s
 
     """
     if in_place:
@@ -520,262 +602,93 @@ def data_in_material_coord(bdf: BDF, op2: OP2, in_place: bool=False) -> OP2:
     else:
         op2_new = copy.deepcopy(op2)
 
-    eids = np.array(list(bdf.elements.keys()))
-    elems = np.array(list(bdf.elements.values()))
-    mcid = np.array([is_mcid(e) for e in elems])
-    elemsmcid = elems[mcid]
-    elemstheta = elems[~mcid]
-
-    thetadeg = np.zeros(elems.shape)
-    thetadeg[~mcid] = np.array([check_theta(e) for e in elemstheta])
-    thetarad = np.deg2rad(thetadeg)
-
-    #NOTE separating quad types to get vectorizable "corner"
-    quad_types = ['CQUAD4', 'CQUAD8', 'CQUADR']
-    for quad_type in quad_types:
-        # elems with THETA
-        thisquad = np.array([quad_type in e.type for e in elemstheta])
-        if np.any(thisquad):
-            quadelems = elemstheta[thisquad]
-            corner = np.array([e.get_node_positions() for e in quadelems])
-            g1 = corner[:, 0, :]
-            g2 = corner[:, 1, :]
-            g3 = corner[:, 2, :]
-            g4 = corner[:, 3, :]
-            betarad = angle2vec(g3 - g1, g2 - g1)
-            gammarad = angle2vec(g4 - g2, g1 - g2)
-            alpharad = (betarad + gammarad) / 2.
-            tmp = thetarad[~mcid]
-            tmp[thisquad] -= betarad
-            tmp[thisquad] += alpharad
-            thetarad[~mcid] = tmp
-
-        # elems with MCID
-        thisquad = np.array([quad_type in e.type for e in elemsmcid])
-        if np.any(thisquad):
-            quadelems = elemsmcid[thisquad]
-            corner = np.array([e.get_node_positions() for e in quadelems])
-            g1 = corner[:, 0, :]
-            g2 = corner[:, 1, :]
-            g3 = corner[:, 2, :]
-            g4 = corner[:, 3, :]
-            normals = np.array([e.Normal() for e in quadelems])
-            csysi = np.array([bdf.coords[e.theta_mcid].i for e in quadelems])
-            imat = calc_imat(normals, csysi)
-            tmp = thetarad[mcid]
-            tmp[thisquad] = angle2vec(g2 - g1, imat)
-            # getting sign of THETA
-            check_normal = cross(g2 - g1, imat)
-            tmp[thisquad] *= np.sign((check_normal * normals).sum(axis=1))
-            betarad = angle2vec(g3 - g1, g2 - g1)
-            gammarad = angle2vec(g4 - g2, g1 - g2)
-            alpharad = (betarad + gammarad) / 2.
-            tmp[thisquad] -= betarad
-            tmp[thisquad] += alpharad
-            thetarad[mcid] = tmp
-
-    tria_types = ['CTRIA3', 'CTRIA6', 'CTRIAR']
-    for tria_type in tria_types:
-        # elems with MCID
-        thistria = np.array([tria_type in e.type for e in elemsmcid])
-        if np.any(thistria):
-            triaelems = elemsmcid[thistria]
-            corner = np.array([e.get_node_positions() for e in triaelems])
-            g1 = corner[:, 0, :]
-            g2 = corner[:, 1, :]
-            g3 = corner[:, 2, :]
-            normals = np.array([e.Normal() for e in triaelems])
-            csysi = np.array([bdf.coords[e.theta_mcid].i for e in triaelems])
-            imat = calc_imat(normals, csysi)
-            tmp = thetarad[mcid]
-            tmp[thistria] = angle2vec(g2 - g1, imat)
-            # getting sign of THETA
-            check_normal = cross(g2 - g1, imat)
-            tmp[thistria] *= np.sign((check_normal * normals).sum(axis=1))
-            thetarad[mcid] = tmp
-
-    thetarad = dict([[eid, theta] for eid, theta in zip(eids, thetarad)])
+    if material_angles is None:
+        material_angles = get_plate_material_angles(bdf)
+    eids, thetarad = material_angles
 
     for vecname in force_vectors:
-        op2_vectors = getattr(op2, vecname)
         new_vectors = getattr(op2_new, vecname)
-        for subcase, vector in op2_vectors.items():
-            new_vector = new_vectors[subcase]
+        for unused_subcase, vector in new_vectors.items():
+            data = vector.data
             veceids = get_eids_from_op2_vector(vector)
-            #NOTE assuming thetarad=0 for elements that exist in the op2 but
-            #     not in the supplied bdf file
-            vecthetarad = np.array([thetarad.get(eid, 0.0) for eid in veceids])
-
-            if veceids.shape[0] == vector.data.shape[1] // 5:
-                steps = [5, 5, 5, 5, 5]
-            else: # assuming  always that veceids.shape[0] == vector.data.shape[1]
-                steps = [1]
-
-            for start, step in enumerate(steps):
-                slicei = slice(start, vector.data.shape[1], step)
-                # membrane terms
-                Sxx = vector.data[:, slicei, 0]
-                Syy = vector.data[:, slicei, 1]
-                Sxy = vector.data[:, slicei, 2]
-                if vector.data.dtype == np.complex64 or vector.data.dtype == np.complex128:
-                    Sxx_theta_real, Syy_theta_real, Sxy_theta_real = transf_Mohr(
-                        Sxx.real, Syy.real, Sxy.real, vecthetarad)
-                    new_vector.data[:, slicei, 0].real = Sxx_theta_real
-                    new_vector.data[:, slicei, 1].real = Syy_theta_real
-                    new_vector.data[:, slicei, 2].real = Sxy_theta_real
-                    Sxx_theta_imag, Syy_theta_imag, Sxy_theta_imag = transf_Mohr(
-                        Sxx.imag, Syy.imag, Sxy.imag, vecthetarad)
-                    new_vector.data[:, slicei, 0].imag = Sxx_theta_imag
-                    new_vector.data[:, slicei, 1].imag = Syy_theta_imag
-                    new_vector.data[:, slicei, 2].imag = Sxy_theta_imag
-                else:
-                    Sxx_theta, Syy_theta, Sxy_theta = transf_Mohr(Sxx, Syy, Sxy, vecthetarad)
-                    new_vector.data[:, slicei, 0] = Sxx_theta
-                    new_vector.data[:, slicei, 1] = Syy_theta
-                    new_vector.data[:, slicei, 2] = Sxy_theta
-
-                # bending terms
-                Sxx = vector.data[:, slicei, 3]
-                Syy = vector.data[:, slicei, 4]
-                Sxy = vector.data[:, slicei, 5]
-                if vector.data.dtype == np.complex64 or vector.data.dtype == np.complex128:
-                    Sxx_theta_real, Syy_theta_real, Sxy_theta_real = transf_Mohr(
-                        Sxx.real, Syy.real, Sxy.real, vecthetarad)
-                    new_vector.data[:, slicei, 3].real = Sxx_theta_real
-                    new_vector.data[:, slicei, 4].real = Syy_theta_real
-                    new_vector.data[:, slicei, 5].real = Sxy_theta_real
-                    Sxx_theta_imag, Syy_theta_imag, Sxy_theta_imag = transf_Mohr(
-                        Sxx.imag, Syy.imag, Sxy.imag, vecthetarad)
-                    new_vector.data[:, slicei, 3].imag = Sxx_theta_imag
-                    new_vector.data[:, slicei, 4].imag = Syy_theta_imag
-                    new_vector.data[:, slicei, 5].imag = Sxy_theta_imag
-
-                else:
-                    Sxx_theta, Syy_theta, Sxy_theta = transf_Mohr(Sxx, Syy, Sxy, vecthetarad)
-                    new_vector.data[:, slicei, 3] = Sxx_theta
-                    new_vector.data[:, slicei, 4] = Syy_theta
-                    new_vector.data[:, slicei, 5] = Sxy_theta
-
-                # transverse terms
-                Qx = vector.data[:, slicei, 6]
-                Qy = vector.data[:, slicei, 7]
-                if vector.data.dtype == np.complex64 or vector.data.dtype == np.complex128:
-                    Qx_new_real = cos(vecthetarad)*Qx.real + sin(vecthetarad)*Qy.real
-                    Qy_new_real = -sin(vecthetarad)*Qx.real + cos(vecthetarad)*Qy.real
-                    new_vector.data[:, slicei, 6].real = Qx_new_real
-                    new_vector.data[:, slicei, 7].real = Qy_new_real
-                    Qx_new_imag = cos(vecthetarad)*Qx.imag + sin(vecthetarad)*Qy.imag
-                    Qy_new_imag = -sin(vecthetarad)*Qx.imag + cos(vecthetarad)*Qy.imag
-                    new_vector.data[:, slicei, 6].imag = Qx_new_imag
-                    new_vector.data[:, slicei, 7].imag = Qy_new_imag
-                else:
-                    Qx_new = cos(vecthetarad)*Qx + sin(vecthetarad)*Qy
-                    Qy_new = -sin(vecthetarad)*Qx + cos(vecthetarad)*Qy
-                    new_vector.data[:, slicei, 6] = Qx_new
-                    new_vector.data[:, slicei, 7] = Qy_new
+            vecthetarad = _get_vector_thetarad(eids, thetarad, veceids)
+            if veceids.shape[0] == data.shape[1] // 5:
+                # centroid and corners
+                vecthetarad = np.repeat(vecthetarad, 5)
+
+            # membrane terms
+            _transform_plane_stress(data, [0, 1, 2], vecthetarad)
+            # bending terms
+            _transform_plane_stress(data, [3, 4, 5], vecthetarad)
+
+            # transverse terms
+            cos_theta = cos(vecthetarad)
+            sin_theta = sin(vecthetarad)
+            Qx = data[:, :, 6].copy()
+            Qy = data[:, :, 7].copy()
+            data[:, :, 6] = cos_theta*Qx + sin_theta*Qy
+            data[:, :, 7] = -sin_theta*Qx + cos_theta*Qy
 
             #TODO implement transformation for corner nodes
             #     for now we just zero the wrong values
             if 'quad8' in vecname:
-                for j in [1, 2, 3, 4]:
-                    new_vector.data[:, j, :] = 0
+                data[:, _get_corner_rows(vector), :] = 0
 
-    for vecname in stress_vectors:
-        op2_vectors = getattr(op2, vecname)
+    for vecname in stress_vectors + strain_vectors:
         new_vectors = getattr(op2_new, vecname)
-        for subcase, vector in op2_vectors.items():
-            new_vector = new_vectors[subcase]
+        is_strain = vecname in strain_vectors
+        for unused_subcase, vector in new_vectors.items():
+            data = vector.data
             veceids = get_eids_from_op2_vector(vector)
             check = veceids != 0
-            veceids = veceids[check]
-            #NOTE assuming thetarad=0 for elements that exist in the op2 but
-            #     not in the supplied bdf file
-            vecthetarad = np.array([thetarad.get(eid, 0.0) for eid in veceids])
-
-            # bottom and top in-plane stresses
-            if vector.data.shape[2] > 3:
-                Sxx = vector.data[:, :, 1][:, check]
-                Syy = vector.data[:, :, 2][:, check]
-                Sxy = vector.data[:, :, 3][:, check]
-            else:
-                Sxx = vector.data[:, :, 0][:, check]
-                Syy = vector.data[:, :, 1][:, check]
-                Sxy = vector.data[:, :, 2][:, check]
-            if vector.data.dtype == np.complex64 or vector.data.dtype == np.complex128:
-                Sxx_theta_real, Syy_theta_real, Sxy_theta_real = transf_Mohr(Sxx.real, Syy.real, Sxy.real, vecthetarad)
-                Sxx_theta_imag, Syy_theta_imag, Sxy_theta_imag = transf_Mohr(Sxx.imag, Syy.imag, Sxy.imag, vecthetarad)
-                tmp = np.zeros_like(new_vector.data[:, :, 0][:, check])
-                tmp.real = Sxx_theta_real
-                tmp.imag = Sxx_theta_imag
-                new_vector.data[:, :, 0][:, check] = tmp
-                tmp.real = Syy_theta_real
-                tmp.imag = Syy_theta_imag
-                new_vector.data[:, :, 1][:, check] = tmp
-                tmp.real = Sxy_theta_real
-                tmp.imag = Sxy_theta_imag
-                new_vector.data[:, :, 2][:, check] = tmp
-            else:
-                Sxx_theta, Syy_theta, Sxy_theta = transf_Mohr(Sxx, Syy, Sxy, vecthetarad)
-                new_vector.data[:, :, 1][:, check] = Sxx_theta
-                new_vector.data[:, :, 2][:, check] = Syy_theta
-                new_vector.data[:, :, 3][:, check] = Sxy_theta
-                thetadeg_new = thetadeg_to_principal(Sxx_theta, Syy_theta, Sxy_theta)
-                new_vector.data[:, :, 4][:, check] = thetadeg_new
+            vecthetarad = _get_vector_thetarad(eids, thetarad, veceids[check])
+            rows = slice(None) if check.all() else check
+
+            # bottom and top in-plane stresses/strains
+            is_real = data.shape[2] > 3
+            icolumns = [1, 2, 3] if is_real else [0, 1, 2]
+            datai = data[:, rows, :]
+            Sxx_theta, Syy_theta, Sxy_theta = _transform_plane_stress(
+                datai, icolumns, vecthetarad, shear_factor=2. if is_strain else 1.)
+            if is_real:
+                datai[:, :, 4] = thetadeg_to_principal(Sxx_theta, Syy_theta, Sxy_theta)
+            data[:, rows, :] = datai
 
             #TODO implement transformation for corner nodes
             #     for now we just zero the wrong values
             if 'quad8' in vecname:
-                for i in [2, 3, 4, 5, 6, 7, 8, 9]:
-                    new_vector.data[:, i, :] = 0
+                data[:, _get_corner_rows(vector), :] = 0
+    return op2_new
 
-    for vecname in strain_vectors:
-        op2_vectors = getattr(op2, vecname)
-        new_vectors = getattr(op2_new, vecname)
-        for subcase, vector in op2_vectors.items():
-            new_vector = new_vectors[subcase]
-            veceids = get_eids_from_op2_vector(vector)
-            check = veceids != 0
-            veceids = veceids[check]
-            #NOTE assuming thetarad=0 for elements that exist in the op2 but
-            #     not in the supplied bdf file
-            vecthetarad = np.array([thetarad.get(eid, 0.0) for eid in veceids])
-
-            # bottom and top in-plane strains
-            if vector.data.shape[2] > 3:
-                exx = vector.data[:, :, 1][:, check]
-                eyy = vector.data[:, :, 2][:, check]
-                exy = vector.data[:, :, 3][:, check] / 2.
-            else:
-                exx = vector.data[:, :, 0][:, check]
-                eyy = vector.data[:, :, 1][:, check]
-                exy = vector.data[:, :, 2][:, check] / 2.
-            if vector.data.dtype == np.complex64 or vector.data.dtype == np.complex128:
-                exx_theta_real, eyy_theta_real, exy_theta_real = transf_Mohr(exx.real, eyy.real, exy.real, vecthetarad)
-                exx_theta_imag, eyy_theta_imag, exy_theta_imag = transf_Mohr(exx.imag, eyy.imag, exy.imag, vecthetarad)
-                tmp = np.zeros_like(new_vector.data[:, :, 0][:, check])
-                tmp.real = exx_theta_real
-                tmp.imag = exx_theta_imag
-                new_vector.data[:, :, 0][:, check] = tmp
-                tmp.real = eyy_theta_real
-                tmp.imag = eyy_theta_imag
-                new_vector.data[:, :, 1][:, check] = tmp
-                tmp.real = exy_theta_real * 2.
-                tmp.imag = exy_theta_imag * 2.
-                new_vector.data[:, :, 2][:, check] = tmp
-            else:
-                exx_theta, eyy_theta, exy_theta = transf_Mohr(exx, eyy, exy, vecthetarad)
-                thetadeg_new = thetadeg_to_principal(exx_theta, eyy_theta, exy_theta)
-                new_vector.data[:, :, 1][:, check] = exx_theta
-                new_vector.data[:, :, 2][:, check] = eyy_theta
-                new_vector.data[:, :, 3][:, check] = exy_theta * 2.
-                new_vector.data[:, :, 4][:, check] = thetadeg_new
+def _transform_plane_stress(data: np.ndarray, icolumns: List[int],
+                            thetarad: np.ndarray,
+                            shear_factor: float=1.) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Transforms the [Sxx, Syy, Sxy] columns of a (ntimes, nrows, ncolumns)
+    real/complex data array inplace
 
-            #TODO implement transformation for corner nodes
-            #     for now we just zero the wrong values
-            if 'quad8' in vecname:
-                for i in [2, 3, 4, 5, 6, 7, 8, 9]:
-                    new_vector.data[:, i, :] = 0
-    return op2_new
+    Parameters
+    ----------
+    icolumns : List[int]
+        the Sxx, Syy, Sxy columns
+    thetarad : (nrows, ) float ndarray
+        the angle of each row
+    shear_factor : float; default=1.
+        2.0 for (engineering) shear strains
+
+    Returns
+    -------
+    Sxx_theta, Syy_theta, Sxy_theta : (ntimes, nrows) ndarray
+        the transformed tensor (the shear strain is the tensor shear strain)
+
+    """
+    isxx, isyy, isxy = icolumns
+    Sxx_theta, Syy_theta, Sxy_theta = transf_Mohr(
+        data[:, :, isxx], data[:, :, isyy], data[:, :, isxy] / shear_factor, thetarad)
+    data[:, :, isxx] = Sxx_theta
+    data[:, :, isyy] = Syy_theta
+    data[:, :, isxy] = Sxy_theta * shear_factor
+    return Sxx_theta, Syy_theta, Sxy_theta
 
 def main():  # pragma: no cover
     op2_filename = r'C:\NASA\m4\formats\git\pyNastran\models\solid_bending\solid_bending_coord1.op2'
@@ -24,6 +24,9 @@ class SixtyFourBitError(NotImplementedError):
 class OverwriteTableError(RuntimeError):
     pass
 
+class SinglePassError(RuntimeError):
+    pass
+
 class DoubleCardError(RuntimeError):
     pass
 
@@ -3,7 +3,8 @@ Defines:
  - FortranFormat
 
 """
-from typing import Optional
+from typing import Tuple, Optional
+import numpy as np
 from pyNastran.utils import object_attributes
 from pyNastran.utils.numpy_utils import integer_types
 #from pyNastran.op2.errors import FortranMarkerError, SortCodeError
@@ -26,6 +27,10 @@ from pyNastran.op2.tables.onmd import ONMD
 from pyNastran.op2.tables.opr import OPR
 from pyNastran.op2.tables.ogpwg import OGPWG
 
+#: the composite failure index/strength ratio tables have a row for each
+#: ply, but only the first row of an element has the element id
+ID_UNFILTERED_TABLES = {b'OEFIT', b'OEFITSTN', b'OESRT'}
+
 class FortranFormat:
     """defines basic methods for reading Fortran formatted data files"""
     def __init__(self):
@@ -44,6 +49,15 @@ class FortranFormat:
         #: stores if the user entered [] for isubcases
         self.is_all_subcases = True
         self.valid_subcases = []
+
+        #: the element/node ids to read (see ``set_element_ids``); None -> all
+        self.valid_element_ids = None
+        self.valid_node_ids = None
+
+        #: the precision of the result data/id arrays (see ``read_op2``);
+        #: None -> the op2 precision
+        self.result_dtype = None
+        self.id_dtype = None
         #self.op2_reader = OP2Reader()
         self.IS_TESTING = False
         self.reader_onmd = ONMD(self)
@@ -108,8 +122,30 @@ class FortranFormat:
         n = 0
         if self.read_mode == 2:
             self.ntotal = 0
-
-            data, ndata = op2_reader._read_record_ndata()
+            if self._is_lazy_subtable():
+                op2_reader._skip_record_ndata()
+                if hasattr(self, 'ogs'):
+                    # the OGS table 4 reader deletes the grid point stress surface id
+                    del self.ogs
+                self._cleanup_data_members()
+                return n
+
+            record = self._single_pass_records.pop(self.f.tell(), None)
+            if record is not None:
+                # the sizing pass already read (and filtered) the record
+                op2_reader._skip_record_ndata()
+                data, ndata = record
+                if ndata == 0:
+                    self._cleanup_data_members()
+                    return n
+            else:
+                data, ndata = op2_reader._read_record_view()
+                valid_ids = self._get_valid_ids(table4_parser)
+                if valid_ids is not None:
+                    data, ndata = self._filter_record_ids(data, ndata, valid_ids)
+                    if ndata == 0:
+                        self._cleanup_data_members()
+                        return n
             n = table4_parser(data, ndata)
             assert isinstance(n, integer_types), self.table_name
 
@@ -121,11 +157,34 @@ class FortranFormat:
             #n = op2_reader._skip_record()
             #n = table4_parser(datai, 300000)
             #self.show(100, types='ifs', endian=None, force=False)
+            valid_ids = self._get_valid_ids(table4_parser)
+            # a single pass keeps the record for read_mode=2, so the data is
+            # only read from the file once; the lazy results are never decoded
+            is_kept = self._single_pass and self._lazy_results is None
+            n0 = self.f.tell()
             if self.table_name in {b'R1TABRG', b'ONRGY1', b'PVT', b'PVT0', b'PVTS'}:
                 # these tables are always fully parsed
                 # PVT/PVTS - we want to know what the PARAM cards are,
                 #            so we can determine the NXVER
                 data, ndata = op2_reader._read_record_ndata()
+            elif valid_ids is not None:
+                # the ids are needed to size the arrays, but the data
+                # isn't decoded until read_mode=2
+                data, ndata = op2_reader._read_record_ndata()
+                data, ndata = self._filter_record_ids(data, ndata, valid_ids)
+                if is_kept:
+                    self._single_pass_records[n0] = (data, ndata)
+                if ndata == 0:
+                    self._cleanup_data_members()
+                    return n
+                data = None
+                record_len = ndata
+            elif is_kept:
+                # the array is sized from the record length, so the data
+                # isn't decoded until read_mode=2
+                data, ndata = op2_reader._read_record_view()
+                self._single_pass_records[n0] = (data, ndata)
+                data = None
             else:
                 try:
                     data, ndata = op2_reader._skip_record_ndata()
@@ -157,6 +216,73 @@ class FortranFormat:
         self._cleanup_data_members()
         return n
 
+    def _get_valid_ids(self, table4_parser) -> Optional[np.ndarray]:
+        """
+        Gets the element/node ids to filter a table 4 record by
+        (see ``set_element_ids`` and ``set_node_ids``)
+
+        Returns
+        -------
+        valid_ids : (n, ) int ndarray / None
+            None : the record isn't filtered
+
+        """
+        reader = getattr(table4_parser, '__self__', None)
+        if reader is self.reader_oes or reader is self.reader_oef:
+            valid_ids = self.valid_element_ids
+        elif reader is self.reader_oug or reader is self.reader_oqg or reader is self.reader_opg:
+            valid_ids = self.valid_node_ids
+        else:
+            return None
+
+        # SORT2 records are for a single element/node, so they're
+        # indexed by the time/mode/frequency
+        if valid_ids is None or not self.is_sort1:
+            return None
+        if self.table_name in ID_UNFILTERED_TABLES:
+            return None
+        return valid_ids
+
+    def _filter_record_ids(self, data: bytes, ndata: int,
+                           valid_ids: np.ndarray) -> Tuple[bytes, int]:
+        """
+        Removes the rows of a SORT1 table 4 record that aren't in valid_ids
+
+        Each row is num_wide words and starts with the element/node id
+        (eid_device/nid_device), so the filtered record is decoded and
+        sized as if only those elements/nodes were in the op2.
+
+        Parameters
+        ----------
+        data : bytes
+            the table 4 record
+        ndata : int
+            the length of the record
+        valid_ids : (n, ) int ndarray
+            the element/node ids to keep
+
+        Returns
+        -------
+        data : bytes
+            the filtered record
+        ndata : int
+            the length of the filtered record
+
+        """
+        ntotal = self.num_wide * self.size
+        if ntotal == 0 or ndata % ntotal != 0:
+            # not a fixed width table
+            return data, ndata
+        nrows = ndata // ntotal
+        ints = np.frombuffer(data, dtype=self.idtype8, count=nrows * self.num_wide)
+        ids = ints.reshape(nrows, self.num_wide)[:, 0] // 10
+        is_valid = np.isin(ids, valid_ids)
+        if is_valid.all():
+            return data, ndata
+        rows = np.frombuffer(data, dtype='uint8', count=ndata).reshape(nrows, ntotal)
+        data = rows[is_valid, :].tobytes()
+        return data, len(data)
+
     def _reset_vector_counter(self) -> None:
         """
         if reading the data
@@ -5,7 +5,9 @@ Defines the main OP2 class.  Defines:
  - read_op2(op2_filename=None, combine=True, subcases=None,
             exclude_results=None, include_results=None,
             log=None, debug=True, debug_file=None, build_dataframe=False,
-            skip_undefined_matrices=True, mode='msc', encoding=None)
+            skip_undefined_matrices=True, mode='msc', encoding=None,
+            single_pass=False, use_index=False, use_mmap=False, lazy=False,
+            lazy_max_nbytes=LAZY_MAX_NBYTES, nprocs=1)
 
  - OP2(debug=True, log=None, debug_file=None, mode='msc')
    - build_dataframe()
@@ -15,7 +17,9 @@ Defines the main OP2 class.  Defines:
    - object_methods(mode='public', keys_to_skip=None)
    - print_subcase_key()
    - read_op2(op2_filename=None, combine=True, build_dataframe=False,
-              skip_undefined_matrices=False, encoding=None)
+              skip_undefined_matrices=False, encoding=None, single_pass=False,
+              use_index=False, use_mmap=False, lazy=False,
+              lazy_max_nbytes=LAZY_MAX_NBYTES, nprocs=1)
    - set_mode(mode)
    - transform_displacements_to_global(i_transform, coords, xyz_cid0=None, debug=False)
    - transform_gpforce_to_global(nids_all, nids_transform, i_transform, coords, xyz_cid0=None)
@@ -37,16 +41,24 @@ from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.f06.errors import FatalError
 from pyNastran.op2.errors import (SortCodeError, DeviceCodeError,
                                   FortranMarkerError, SixtyFourBitError,
-                                  OverwriteTableError)
+                                  OverwriteTableError, SinglePassError)
 from pyNastran.op2.writer.op2_writer import OP2Writer
 #from pyNastran.op2.op2_interface.op2_f06_common import Op2F06Attributes
 from pyNastran.op2.op2_interface.op2_scalar import OP2_Scalar
+from pyNastran.op2.result_objects.op2_objects import ScalarObject
+from pyNastran.op2.op2_interface.op2_lazy import LazyResults, LAZY_MAX_NBYTES, load_lazy_result
+from pyNastran.op2.op2_interface.utils import get_result_dtypes
+from pyNastran.utils.read_profile import ReadProfile
 from pyNastran.op2.op2_interface.transforms import (
-    transform_displacement_to_global, transform_gpforce_to_globali)
+    get_node_transforms, transform_displacement_to_global, transform_gpforce_to_globali)
 from pyNastran.utils import check_path
 if TYPE_CHECKING:  # pragma: no cover
     from h5py import File as H5File
 
+# results that don't support DataFrames
+SKIP_PANDAS = ['params', 'gpdt', 'bgpdt', 'eqexin', 'grid_point_weight', 'psds',
+               'monitor1', 'monitor3']
+
 
 class OP2(OP2_Scalar, OP2Writer):
     _properties = ['is_real', 'is_complex', 'is_random',
@@ -472,6 +484,7 @@ class OP2(OP2_Scalar, OP2Writer):
             'additional_matrices',
             'apply_symmetry',
             'debug_file',
+            'dense_matrix_dirname',
             'expected_times',
             'f',
             'generalized_tables',
@@ -517,6 +530,50 @@ class OP2(OP2_Scalar, OP2Writer):
         #self.case_control_deck = CaseControlDeck(self.case_control_lines, log=self.log)
         self.log.debug('done loading!')
 
+    def save_snapshot(self, dirname: str) -> None:
+        """
+        Saves the results to a directory of raw ``.npy`` arrays
+        (e.g., data, element_node, _times) and a JSON manifest of the
+        other attributes (e.g., the data_code)
+
+        Parameters
+        ----------
+        dirname : str
+            the directory to write; it's created if it doesn't exist
+
+        Unlike ``save``, the arrays aren't pickled, so the snapshot
+        doesn't depend on the pyNastran/numpy version that wrote it.
+        See ``load_snapshot``.
+        """
+        from pyNastran.op2.op2_interface.op2_snapshot import save_op2_snapshot
+        save_op2_snapshot(self, dirname)
+
+    def load_snapshot(self, dirname: str, mmap: bool=True) -> None:
+        """
+        Loads the results that were saved by ``save_snapshot``
+
+        Parameters
+        ----------
+        dirname : str
+            the directory that was written by ``save_snapshot``
+        mmap : bool; default=True
+            True : the arrays are read-only memory maps of the ``.npy``
+                   files, so only the JSON manifest is read up front
+            False : the arrays are read into memory (e.g., to modify them)
+
+        .. code-block:: python
+
+           model = OP2()
+           model.read_op2(op2_filename)
+           model.save_snapshot('model_snapshot')
+
+           model2 = OP2()
+           model2.load_snapshot('model_snapshot')
+
+        """
+        from pyNastran.op2.op2_interface.op2_snapshot import load_op2_snapshot
+        load_op2_snapshot(self, dirname, mmap=mmap)
+
     @property
     def is_geometry(self) -> bool:
         return False
@@ -525,7 +582,15 @@ class OP2(OP2_Scalar, OP2Writer):
                  combine: bool=True,
                  build_dataframe: Optional[bool]=False,
                  skip_undefined_matrices: bool=False,
-                 encoding: Optional[str]=None) -> None:
+                 encoding: Optional[str]=None,
+                 single_pass: bool=False,
+                 use_index: bool=False,
+                 use_mmap: bool=False,
+                 lazy: bool=False,
+                 lazy_max_nbytes: int=LAZY_MAX_NBYTES,
+                 nprocs: int=1,
+                 result_dtype: Optional[str]=None,
+                 id_dtype: Optional[str]=None) -> None:
         """
         Starts the OP2 file reading
 
@@ -541,12 +606,49 @@ class OP2(OP2_Scalar, OP2Writer):
             #loads the op2 as an h5 file to save memory
             #stores the result.element/data attributes in h5 format
         build_dataframe : bool; default=False
-            builds a pandas DataFrame for op2 objects
+            builds a pandas DataFrame for op2 objects; the result
+            DataFrames are built on first access of ``obj.data_frame``
             None: True if in iPython, False otherwise
         skip_undefined_matrices : bool; default=False
              True : prevents matrix reading crashes
         encoding : str
             the unicode encoding (default=None; system default)
+        single_pass : bool; default=False
+            False : size all the arrays (read_mode=1) and then fill them
+                    (read_mode=2) by reading the file twice
+            True : size and then fill each table before moving on to
+                   the next one; the arrays are sized from the record
+                   headers and the result records are read from the
+                   file and decoded once; useful for very large files
+        use_index : bool; default=False
+            loads the table of contents (<op2_filename>.idx) or builds
+            it if the op2 has changed, so tables/subtables that were
+            excluded by ``set_subcases`` are seeked past instead of
+            being walked record by record
+        use_mmap : bool; default=False
+            memory maps the op2, so the result records are read as
+            views of the file instead of being copied into bytes
+            objects; the peak memory is about the size of the results
+        lazy : bool; default=False
+            only decode the result headers (e.g., data_code, the
+            modes/times, ntimes) and the byte offsets of the subtables;
+            the arrays (e.g., data, node_gridtype, element) are decoded
+            the first time they're accessed
+        lazy_max_nbytes : int; default=LAZY_MAX_NBYTES (1 GB)
+            the cap on the size of the decoded arrays for lazy=True; the
+            least recently decoded results are freed (and decoded again
+            on the next access), so don't modify a lazy result in place
+        nprocs : int; default=1
+            the number of worker processes that decode the results;
+            the subtables are split up between the workers and the
+            arrays are sent back through shared memory.  SORT2 results
+            are decoded in the main process.  Ignored for lazy=True.
+        result_dtype : str; default=None -> the op2 precision
+            the precision of the result data ('float32', 'float64');
+            complex results are stored as complex64/complex128.  A
+            64-bit op2 read with 'float32' uses half the memory.
+        id_dtype : str; default=None -> the op2 precision
+            the precision of the node/element id arrays ('int32', 'int64')
 
         """
         if op2_filename:
@@ -565,14 +667,119 @@ class OP2(OP2_Scalar, OP2Writer):
         assert self.ask in [True, False], self.ask
         self.is_vectorized = True
         self.log.debug(f'combine={combine}')
-        self.log.debug('-------- reading op2 with read_mode=1 (array sizing) --------')
-        self.read_mode = 1
-        self._close_op2 = False
-
         load_as_h5 = False
         if hasattr(self, 'load_as_h5'):
             load_as_h5 = self.load_as_h5
 
+        op2_reader = self.op2_reader
+        profile = ReadProfile() if self._is_read_profile else None
+        self._read_profile = profile
+        self.result_dtype, self.id_dtype = get_result_dtypes(result_dtype, id_dtype)
+        self._use_index = use_index
+        self._use_mmap = use_mmap
+        is_parallel = nprocs > 1 and not lazy
+        if is_parallel:
+            from pyNastran.op2.op2_interface.op2_parallel import (
+                check_shared_memory, decode_lazy_results)
+            check_shared_memory()
+        if lazy or is_parallel:
+            self._lazy_results = LazyResults(
+                OP2, op2_filename, mode, self.log,
+                max_nbytes=lazy_max_nbytes, use_mmap=use_mmap,
+                valid_element_ids=self.valid_element_ids,
+                valid_node_ids=self.valid_node_ids,
+                result_dtype=self.result_dtype, id_dtype=self.id_dtype)
+        try:
+            if single_pass:
+                self._read_op2_single_pass(op2_filename, load_as_h5, mode)
+            else:
+                self._read_op2_two_pass(op2_filename, load_as_h5, mode)
+            if profile is not None:
+                t0 = profile.add_phase('read_tables', profile.t0)
+            if lazy or is_parallel:
+                self._lazy_results.op2_filename = self.op2_filename
+                nlazy = self._lazy_results.attach()
+                self.log.debug(f'nlazy_results={nlazy}')
+            if is_parallel:
+                nresults = decode_lazy_results(self._lazy_results, nprocs)
+                self.log.debug(f'decoded {nresults} results with nprocs={nprocs}')
+                if profile is not None:
+                    t0 = profile.add_phase('decode_parallel', t0)
+        finally:
+            self._op2_index = None
+            self._lazy_results = None
+
+        self._finalize()
+        op2_reader._create_objects_from_matrices()
+        if profile is not None:
+            t0 = profile.add_phase('finalize', t0)
+        if build_dataframe:
+            # the vectorized result DataFrames are built on first access (obj.data_frame)
+            self._build_matrix_dataframes()
+            self._build_eager_dataframes()
+            if profile is not None:
+                t0 = profile.add_phase('build_dataframe', t0)
+        self.combine_results(combine=combine)
+        if profile is not None:
+            profile.add_phase('combine_results', t0)
+            profile.stop()
+        self.log.debug('finished reading op2')
+        str(self.op2_results)
+
+    def _read_op2_single_pass(self, op2_filename: str, load_as_h5: bool, mode: str) -> None:
+        """
+        Reads the op2 by sizing and then filling each table before moving on
+        to the next one (see ``_read_table_single_pass``), so the result
+        records are only read from the file once.
+
+        If a result spans multiple tables (e.g., the same OUGV1 subcase is
+        written twice), the result can't be sized until the end of the file,
+        so the results are cleared and we fall back to the two pass reader.
+        The geometry from the tables that were already filled is kept.
+        """
+        self.log.debug('-------- reading op2 with single_pass=True (array sizing/filling) --------')
+        self.read_mode = 1
+        self._close_op2 = True
+        self._single_pass = True
+        self._nfilled_tables = 0
+        try:
+            table_names = OP2_Scalar.read_op2(self, op2_filename=op2_filename,
+                                              load_as_h5=load_as_h5, mode=mode)
+            self.table_names = table_names
+        except FileNotFoundError:
+            raise
+        except SinglePassError as error:
+            self.log.warning(f'{error}; rereading with read_mode=1/2')
+            self._close_file()
+            self.f = None
+            self._single_pass = False
+            self._reset_results()
+            self._read_op2_two_pass(self.op2_filename, load_as_h5, mode)
+        except Exception:
+            OP2_Scalar.close_op2(self, force=True)
+            raise
+        finally:
+            self._single_pass = False
+            self._nfilled_tables = 0
+
+    def _reset_results(self) -> None:
+        """clears out the results, so the op2 can be reread"""
+        self.__objects_vector_init__()
+        self.__objects_init__()
+        self.__objects_common_init__()
+        self.result_names = set()
+        self.params = {}
+        if self._lazy_results is not None:
+            self._lazy_results.reset()
+
+    def _read_op2_two_pass(self, op2_filename: str, load_as_h5: bool, mode: str) -> None:
+        """
+        Reads the op2 with read_mode=1 (array sizing) and then read_mode=2
+        (array filling)
+        """
+        self.log.debug('-------- reading op2 with read_mode=1 (array sizing) --------')
+        self.read_mode = 1
+        self._close_op2 = False
         try:
             # get GUI object names, build objects, but don't read data
             table_names = OP2_Scalar.read_op2(self, op2_filename=op2_filename,
@@ -585,7 +792,6 @@ class OP2(OP2_Scalar, OP2Writer):
             self.read_mode = 2
             self._close_op2 = True
             self.log.debug('-------- reading op2 with read_mode=2 (array filling) --------')
-            op2_reader = self.op2_reader
             _create_hdf5_info(self.op2_reader.h5_file, self)
             OP2_Scalar.read_op2(self, op2_filename=self.op2_filename, mode=mode)
         except FileNotFoundError:
@@ -593,19 +799,33 @@ class OP2(OP2_Scalar, OP2Writer):
         except Exception:
             OP2_Scalar.close_op2(self, force=True)
             raise
-        self._finalize()
-        op2_reader._create_objects_from_matrices()
-        if build_dataframe:
-            self.build_dataframe()
-        self.combine_results(combine=combine)
-        self.log.debug('finished reading op2')
-        str(self.op2_results)
+
+    def _read_lazy_subtables(self, op2_filename: str, use_mmap: bool=False,
+                             result_dtype: Optional[str]=None,
+                             id_dtype: Optional[str]=None) -> None:
+        """
+        Decodes the subtables of lazy results (see ``LazyResults.load``)
+
+        ``_lazy_subtables``, ``_lazy_table_states`` and ``_op2_index`` are
+        set by the caller.  Unlike ``read_op2``, only the results are
+        finalized, so the time doesn't depend on the size of the op2.
+        """
+        self.encoding = sys.getdefaultencoding()
+        self.is_vectorized = True
+        self.result_dtype, self.id_dtype = get_result_dtypes(result_dtype, id_dtype)
+        self._use_mmap = use_mmap
+        self._read_op2_two_pass(op2_filename, load_as_h5=False, mode=self.mode)
+        self._finalize_results()
 
     def _finalize(self) -> None:
         """internal method"""
         if hasattr(self, 'subcase'):
             del self.subcase
+        self._finalize_results()
+        self.del_structs()
 
+    def _finalize_results(self) -> None:
+        """finalizes the results (e.g., SORT2 results are transposed)"""
         result_types = self.get_table_types()
         for result_type in result_types:
             if result_type in ['params', 'gpdt', 'bgpdt', 'eqexin', 'psds', 'monitor1', 'monitor3'] or result_type.startswith('responses.'):
@@ -618,12 +838,14 @@ class OP2(OP2_Scalar, OP2Writer):
                 raise
 
             for obj in values:
+                if getattr(obj, '_lazy_results', None) is not None:
+                    # finalized when it's decoded
+                    continue
                 if hasattr(obj, 'finalize'):
                     obj.finalize()
                 elif hasattr(obj, 'tCode') and not obj.is_sort1:
                     raise RuntimeError('object has not implemented finalize\n%s' % (
                         ''.join(obj.get_stats())))
-        self.del_structs()
 
     def build_dataframe(self) -> None:
         """
@@ -643,21 +865,10 @@ class OP2(OP2_Scalar, OP2Writer):
 
         no_sort2_classes = ['RealEigenvalues', 'ComplexEigenvalues', 'BucklingEigenvalues']
         result_types = self.get_table_types()
+        self._build_matrix_dataframes()
 
-        if len(self.matrices):
-            for key, matrix in sorted(self.matrices.items()):
-                if hasattr(matrix, 'build_dataframe'):
-                    matrix.build_dataframe()
-                else:
-                    self.log.warning('pandas: build_dataframe is not supported for key=%s type=%s' % (
-                        key, str(type(matrix))))
-                    raise NotImplementedError()
-                    #continue
-
-        skip_pandas = ['params', 'gpdt', 'bgpdt', 'eqexin', 'grid_point_weight', 'psds',
-                       'monitor1', 'monitor3']
         for result_type in result_types:
-            if result_type in skip_pandas or result_type.startswith('responses.'):
+            if result_type in SKIP_PANDAS or result_type.startswith('responses.'):
                 #self.log.debug('skipping %s' % result_type)
                 continue
 
@@ -703,7 +914,37 @@ class OP2(OP2_Scalar, OP2Writer):
                     self.log.error(f'build_dataframe is broken for {class_name}')
                     raise
 
-    def load_hdf5_filename(self, hdf5_filename: str, combine: bool=True) -> None:
+    def _build_eager_dataframes(self) -> None:
+        """
+        Converts the OP2 objects without a lazy ``data_frame`` (e.g., the
+        eigenvalues) into pandas DataFrames
+        """
+        for result_type in self.get_table_types():
+            if result_type in SKIP_PANDAS or result_type.startswith('responses.'):
+                continue
+            result = self.get_result(result_type)
+            for obj in result.values():
+                if isinstance(obj, ScalarObject):
+                    continue
+                obj.build_dataframe()
+
+    def _build_matrix_dataframes(self) -> None:
+        """Converts the OP2 matrices into pandas DataFrames"""
+        for key, matrix in sorted(self.matrices.items()):
+            if hasattr(matrix, 'build_dataframe'):
+                matrix.build_dataframe()
+            else:
+                self.log.warning('pandas: build_dataframe is not supported for key=%s type=%s' % (
+                    key, str(type(matrix))))
+                raise NotImplementedError()
+                #continue
+
+    def load_hdf5_filename(self, hdf5_filename: str, combine: bool=True,
+                           include_results: Optional[List[str]]=None,
+                           subcases: Optional[List[int]]=None,
+                           itimes: Optional[List[int]]=None,
+                           node_ids: Optional[List[int]]=None,
+                           element_ids: Optional[List[int]]=None) -> None:
         """
         Loads an h5 file into an OP2 object
 
@@ -713,6 +954,16 @@ class OP2(OP2_Scalar, OP2Writer):
             the path to the an hdf5 file
         combine : bool; default=True
             runs the combine routine
+        include_results : List[str]; default=None -> all results
+            the results to load (e.g., ['displacements', 'cquad4_stress'])
+        subcases : List[int]; default=None -> all subcases
+            the subcase ids to load
+        itimes : List[int]; default=None -> all time steps
+            the 0-based time step/mode/frequency indices to load
+        node_ids : List[int]; default=None -> all nodes
+            the nodes to load for the nodal results (e.g., displacements)
+        element_ids : List[int]; default=None -> all elements
+            the elements to load for the element results (e.g., stress)
 
         """
         check_path(hdf5_filename, 'hdf5_filename')
@@ -723,10 +974,17 @@ class OP2(OP2_Scalar, OP2Writer):
         self.log.info(f'hdf5_op2_filename = {hdf5_filename!r}')
         debug = False
         with h5py.File(hdf5_filename, 'r') as h5_file:
-            load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug)
+            load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug,
+                                    include_results=include_results, subcases=subcases,
+                                    itimes=itimes, node_ids=node_ids, element_ids=element_ids)
         self.combine_results(combine=combine)
 
-    def load_hdf5_file(self, h5_file: H5File, combine: bool=True) -> None:
+    def load_hdf5_file(self, h5_file: H5File, combine: bool=True,
+                       include_results: Optional[List[str]]=None,
+                       subcases: Optional[List[int]]=None,
+                       itimes: Optional[List[int]]=None,
+                       node_ids: Optional[List[int]]=None,
+                       element_ids: Optional[List[int]]=None) -> None:
         """
         Loads an h5 file object into an OP2 object
 
@@ -736,25 +994,49 @@ class OP2(OP2_Scalar, OP2Writer):
             an h5py file object
         combine : bool; default=True
             runs the combine routine
+        include_results : List[str]; default=None -> all results
+            the results to load (e.g., ['displacements', 'cquad4_stress'])
+        subcases : List[int]; default=None -> all subcases
+            the subcase ids to load
+        itimes : List[int]; default=None -> all time steps
+            the 0-based time step/mode/frequency indices to load
+        node_ids : List[int]; default=None -> all nodes
+            the nodes to load for the nodal results (e.g., displacements)
+        element_ids : List[int]; default=None -> all elements
+            the elements to load for the element results (e.g., stress)
 
         """
         from pyNastran.op2.op2_interface.hdf5_interface import load_op2_from_hdf5_file
         #self.op2_filename = hdf5_filename
         #self.log.info('hdf5_op2_filename = %r' % hdf5_filename)
         debug = False
-        load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug)
+        load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug,
+                                include_results=include_results, subcases=subcases,
+                                itimes=itimes, node_ids=node_ids, element_ids=element_ids)
         self.combine_results(combine=combine)
 
-    def export_hdf5_filename(self, hdf5_filename: str) -> None:
+    def export_hdf5_filename(self, hdf5_filename: str,
+                             compression: Optional[str]=None,
+                             compression_opts: Optional[int]=None) -> None:
         """
         Converts the OP2 objects into hdf5 object
 
+        Parameters
+        ----------
+        hdf5_filename : str
+            the HDF5 file to write
+        compression : str; default=None
+            the h5py compression filter of the arrays {None, gzip, lzf}
+        compression_opts : int; default=None
+            the compression level for gzip (0-9)
+
         TODO: doesn't support:
           - BucklingEigenvalues
 
         """
         from pyNastran.op2.op2_interface.hdf5_interface import export_op2_to_hdf5_filename
-        export_op2_to_hdf5_filename(hdf5_filename, self)
+        export_op2_to_hdf5_filename(hdf5_filename, self, compression=compression,
+                                    compression_opts=compression_opts)
 
     def export_hdf5_file(self, hdf5_file: H5File, exporter=None) -> None:
         """
@@ -775,6 +1057,31 @@ class OP2(OP2_Scalar, OP2Writer):
         from pyNastran.op2.op2_interface.hdf5_interface import export_op2_to_hdf5_file
         export_op2_to_hdf5_file(hdf5_file, self)
 
+    def export_parquet(self, directory: str,
+                       results: Optional[List[str]]=None) -> List[str]:
+        """
+        Writes each result object to a columnar Parquet file (requires pyarrow)
+
+        Parameters
+        ----------
+        directory : str
+            the directory to write <result_name>_<subcase_key>.parquet to
+        results : List[str]; default=None -> all results
+            the results to export (e.g., ['displacements', 'cquad4_stress'])
+
+        Returns
+        -------
+        filenames : List[str]
+            the Parquet files that were written
+
+        The columns are subcase, time, the node/element ids (e.g.,
+        element_id, node_id) and one column per component.  The rows of
+        each time step are written as a row group directly from the
+        ``data`` array, so a DataFrame isn't built.
+        """
+        from pyNastran.op2.op2_interface.parquet_interface import export_op2_to_parquet
+        return export_op2_to_parquet(directory, self, results=results)
+
     def combine_results(self, combine: str=True) -> None:
         """
         we want the data to be in the same format and grouped by subcase, so
@@ -920,6 +1227,8 @@ class OP2(OP2_Scalar, OP2Writer):
 
                     self.log.info(f'res={class_name} has combine')
                     res2 = result[key2]
+                    load_lazy_result(res1)
+                    load_lazy_result(res2)
                     del result[key1]
                     del result[key2]
                     res1.combine(res2)
@@ -1173,6 +1482,8 @@ class OP2(OP2_Scalar, OP2Writer):
             self.applied_loads,
             self.load_vectors,
         ]
+        # the transforms of the nodes are built once and shared by the results
+        transforms = None
         for disp_like_dict in disp_like_dicts:
             if not disp_like_dict:
                 continue
@@ -1180,9 +1491,12 @@ class OP2(OP2_Scalar, OP2Writer):
             for subcase, result in disp_like_dict.items():
                 if result.table_name in ['BOUGV1', 'BOPHIG', 'TOUGV1']:
                     continue
+                if transforms is None:
+                    transforms = get_node_transforms(icd_transform, coords, xyz_cid0,
+                                                     self.log, debug=debug)
                 self.log.debug(f'transforming {result.table_name}')
                 transform_displacement_to_global(subcase, result, icd_transform, coords, xyz_cid0,
-                                                 self.log, debug=debug)
+                                                 self.log, debug=debug, transforms=transforms)
 
     def transform_gpforce_to_global(self, nids_all, nids_transform, icd_transform, coords,
                                     xyz_cid0=None):
@@ -1218,14 +1532,18 @@ class OP2(OP2_Scalar, OP2Writer):
             #       even though it should be uncommented
             self.grid_point_forces,
         ]
+        transforms = None
         for disp_like_dict in disp_like_dicts:
             if not disp_like_dict:
                 continue
             self.log.debug('-----------')
             for subcase, result in disp_like_dict.items():
+                if transforms is None:
+                    transforms = get_node_transforms(icd_transform, coords, xyz_cid0, self.log)
                 transform_gpforce_to_globali(subcase, result,
                                              nids_all, nids_transform,
-                                             icd_transform, coords, xyz_cid0, self.log)
+                                             icd_transform, coords, xyz_cid0, self.log,
+                                             transforms=transforms)
         self.log.debug('-----------')
 
 
@@ -1240,7 +1558,15 @@ def read_op2(op2_filename: Optional[str]=None,
              build_dataframe: Optional[bool]=False,
              skip_undefined_matrices: bool=True,
              mode: Optional[str]=None,
-             encoding: Optional[str]=None) -> OP2:
+             encoding: Optional[str]=None,
+             single_pass: bool=False,
+             use_index: bool=False,
+             use_mmap: bool=False,
+             lazy: bool=False,
+             lazy_max_nbytes: int=LAZY_MAX_NBYTES,
+             nprocs: int=1,
+             result_dtype: Optional[str]=None,
+             id_dtype: Optional[str]=None) -> OP2:
     """
     Creates the OP2 object without calling the OP2 class.
 
@@ -1261,7 +1587,8 @@ def read_op2(op2_filename: Optional[str]=None,
         a list of result types to exclude/include
         one of these must be None
         build_dataframe : bool; default=False
-            builds a pandas DataFrame for op2 objects
+            builds a pandas DataFrame for op2 objects; the result
+            DataFrames are built on first access of ``obj.data_frame``
             None: True if in iPython, False otherwise
     skip_undefined_matrices : bool; default=False
          True : prevents matrix reading crashes
@@ -1278,6 +1605,25 @@ def read_op2(op2_filename: Optional[str]=None,
         {nx, msc, autodesk, optistruct, nasa95}
     encoding : str
         the unicode encoding (default=None; system default)
+    single_pass : bool; default=False
+        size and then fill each table before moving on to the next one,
+        so each table is reread while it's cached (see ``OP2.read_op2``)
+    use_index : bool; default=False
+        use the table of contents sidecar file to seek past the
+        tables/subtables that weren't requested (see ``OP2.read_op2``)
+    use_mmap : bool; default=False
+        memory map the op2 (see ``OP2.read_op2``)
+    lazy : bool; default=False
+        decode the result arrays the first time they're accessed
+        (see ``OP2.read_op2``)
+    lazy_max_nbytes : int; default=LAZY_MAX_NBYTES (1 GB)
+        the cap on the size of the decoded arrays for lazy=True
+    nprocs : int; default=1
+        the number of worker processes that decode the results
+        (see ``OP2.read_op2``)
+    result_dtype / id_dtype : str; default=None -> the op2 precision
+        the precision of the result data and id arrays
+        (e.g., 'float32', 'int32'; see ``OP2.read_op2``)
 
     Returns
     -------
@@ -1301,7 +1647,10 @@ def read_op2(op2_filename: Optional[str]=None,
             validate=True, xref=True,
             build_dataframe=build_dataframe,
             skip_undefined_matrices=skip_undefined_matrices,
-            mode=mode, log=log, debug=debug, encoding=encoding)
+            mode=mode, log=log, debug=debug, encoding=encoding,
+            single_pass=single_pass, use_index=use_index, use_mmap=use_mmap,
+            lazy=lazy, lazy_max_nbytes=lazy_max_nbytes, nprocs=nprocs,
+            result_dtype=result_dtype, id_dtype=id_dtype)
     else:
         model = OP2(log=log, debug=debug, mode=mode)
         model.set_subcases(subcases)
@@ -1310,7 +1659,9 @@ def read_op2(op2_filename: Optional[str]=None,
 
         model.read_op2(op2_filename=op2_filename, build_dataframe=build_dataframe,
                        skip_undefined_matrices=skip_undefined_matrices, combine=combine,
-                       encoding=encoding)
+                       encoding=encoding, single_pass=single_pass, use_index=use_index,
+                       use_mmap=use_mmap, lazy=lazy, lazy_max_nbytes=lazy_max_nbytes,
+                       nprocs=nprocs, result_dtype=result_dtype, id_dtype=id_dtype)
 
     ## TODO: this will go away when OP2 is refactored
     ## TODO: many methods will be missing, but it's a start...
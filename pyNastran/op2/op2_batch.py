@@ -0,0 +1,315 @@
+"""
+Defines:
+ - results = read_op2s(op2_filenames, results=None, subcases=None,
+                       nprocs=1, mode=None, log=None, debug=False)
+ - StackedResult(result_name, class_name, isubcase, op2_filenames,
+                 times, headers, id_name, ids, data)
+
+Reads a set of op2s with the same mesh and result requests (e.g., a design
+sweep) and stacks each result along a new file axis, so the results of
+hundreds of op2s can be compared without holding hundreds of ``OP2``
+objects.  The node/element ids are stored once.
+
+"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import PurePath
+from typing import List, Dict, Tuple, Optional, Union, Any, TYPE_CHECKING
+
+import numpy as np
+from cpylog import get_logger2
+from pyNastran.op2.op2 import read_op2
+from pyNastran.op2.op2_stream import ID_ARRAY_NAMES
+from pyNastran.op2.op2_interface.op2_parallel import (
+    check_shared_memory, _to_shared_memory, _from_shared_memory, _free_shared_memory)
+if TYPE_CHECKING:  # pragma: no cover
+    from cpylog import SimpleLogger
+
+SKIP_RESULTS = ['params', 'gpdt', 'bgpdt', 'eqexin', 'psds', 'monitor1', 'monitor3']
+
+
+class StackedResult:
+    """
+    A result that's stacked across a set of op2s
+
+    Attributes
+    ----------
+    result_name : str
+        the result name (e.g., 'displacements', 'stress.chexa_stress')
+    class_name : str
+        the class of the result in each op2 (e.g., 'RealDisplacementArray')
+    isubcase : int
+        the subcase id
+    op2_filenames : List[str]
+        the op2s, which are in the order of the file axis
+    times : (ntimes, ) ndarray
+        the mode/time/frequency/load steps
+    headers : List[str]
+        the component names (e.g., ['t1', 't2', 't3', 'r1', 'r2', 'r3'])
+    id_name : str
+        the name of the id array (e.g., 'node_gridtype', 'element_node')
+    ids : (nentities, ...) int ndarray
+        the node/element ids, which are the same for every op2
+    data : (nfiles, ntimes, nentities, ncomponents) ndarray
+        the results
+
+    """
+    def __init__(self, result_name: str, class_name: str, isubcase: int,
+                 op2_filenames: List[str], times: np.ndarray, headers: List[str],
+                 id_name: str, ids: np.ndarray, data: np.ndarray):
+        self.result_name = result_name
+        self.class_name = class_name
+        self.isubcase = isubcase
+        self.op2_filenames = op2_filenames
+        self.times = times
+        self.headers = headers
+        self.id_name = id_name
+        self.ids = ids
+        self.data = data
+
+    @property
+    def nfiles(self) -> int:
+        return self.data.shape[0]
+
+    @property
+    def ntimes(self) -> int:
+        return self.data.shape[1]
+
+    def __repr__(self) -> str:
+        nfiles, ntimes, ntotal, ncomponents = self.data.shape
+        return (f'StackedResult(result_name={self.result_name!r}, class_name={self.class_name!r}, '
+                f'isubcase={self.isubcase}, nfiles={nfiles}, ntimes={ntimes}, '
+                f'n{self.id_name}={ntotal}, ncomponents={ncomponents})')
+
+
+def read_op2s(op2_filenames: List[Union[str, PurePath]],
+              results: Optional[List[str]]=None,
+              subcases: Optional[List[int]]=None,
+              nprocs: int=1,
+              mode: Optional[str]=None,
+              log: Optional[SimpleLogger]=None,
+              debug: Optional[bool]=False,
+              ) -> Dict[str, Dict[Any, StackedResult]]:
+    """
+    Reads a set of op2s with the same mesh and stacks the results
+
+    Parameters
+    ----------
+    op2_filenames : List[str]
+        the op2s to read
+    results : List[str] / str; default=None -> all results
+        the results to read (e.g., ['displacements', 'stress'])
+    subcases : List[int, ...] / int; default=None->all subcases
+        list of [subcase1_ID,subcase2_ID]
+    nprocs : int; default=1
+        the number of worker processes; each op2 is read by one worker
+    mode : str; default=None -> 'msc'
+        the version of the Nastran you're using
+        {nx, msc, autodesk, optistruct, nasa95}
+    log : SimpleLogger; default=None
+        a logging object to write debug messages to
+    debug : bool/None; default=False
+        used to set the logger if no logger is passed in
+
+    Returns
+    -------
+    stacked_results : Dict[str, Dict[key, StackedResult]]
+        the results by result name (e.g., 'displacements') and subcase
+
+    Raises
+    ------
+    ValueError
+        the op2s have different results, times, headers or ids
+
+    Only the arrays of each op2 are kept, so the memory is about the size
+    of the stacked data arrays.  Results without a node/element id array
+    (e.g., eigenvalues) aren't stacked.
+
+    .. code-block:: python
+
+       stacked_results = read_op2s(op2_filenames, results=['displacements'], nprocs=4)
+       disp = stacked_results['displacements'][1]
+       max_t3 = np.abs(disp.data[:, :, :, 2]).max(axis=(1, 2))  # per op2
+
+    """
+    log = get_logger2(log, debug=debug)
+    op2_filenames = [str(op2_filename) for op2_filename in op2_filenames]
+    if isinstance(results, str):
+        results = [results]
+    nfiles = len(op2_filenames)
+    if nfiles == 0:
+        return {}
+
+    is_parallel = nprocs > 1 and nfiles > 1
+    jobs = [(op2_filename, results, subcases, mode, is_parallel)
+            for op2_filename in op2_filenames]
+
+    stacked_results = {}  # type: Dict[str, Dict[Any, StackedResult]]
+    if is_parallel:
+        check_shared_memory()
+        nworkers = min(nprocs, nfiles)
+        log.debug(f'reading {nfiles} op2s with nprocs={nworkers}')
+        with ProcessPoolExecutor(max_workers=nworkers) as executor:
+            futures = [executor.submit(_read_op2_arrays, job) for job in jobs]
+            nstacked = 0
+            try:
+                for ifile, future in enumerate(futures):
+                    file_results = future.result()
+                    nstacked += 1
+                    _stack_results(stacked_results, op2_filenames, ifile, file_results)
+            finally:
+                # an error leaves the shared memory of the op2s that weren't stacked
+                for future in futures[nstacked:]:
+                    if future.cancel():
+                        continue
+                    try:
+                        file_results = future.result()
+                    except Exception:
+                        continue
+                    _free_file_results(file_results)
+    else:
+        for ifile, job in enumerate(jobs):
+            file_results = _read_op2_arrays(job)
+            _stack_results(stacked_results, op2_filenames, ifile, file_results)
+    return stacked_results
+
+
+def _read_op2_arrays(job: Tuple[str, Optional[List[str]], Optional[List[int]],
+                                Optional[str], bool],
+                     ) -> List[Tuple[str, Any, Dict[str, Any], Any]]:
+    """
+    Reads an op2 (possibly in a worker process) and gets the arrays of
+    the results
+
+    Returns
+    -------
+    file_results : List[(result_name, key, header, arrays)]
+        header : Dict[str, Any]
+            the class_name, isubcase, times, headers and id_name
+        arrays : Dict[str, ndarray] / List[(name, shm_name, shape, dtype)]
+            the ids and data arrays, which are in shared memory for a
+            worker process
+
+    """
+    op2_filename, results, subcases, mode, is_shared_memory = job
+    model = read_op2(op2_filename, combine=True, subcases=subcases,
+                     include_results=results, debug=None, mode=mode)
+
+    file_results = []
+    for result_name in model.get_table_types():
+        if result_name in SKIP_RESULTS or result_name.startswith('responses.'):
+            continue
+        result = model.get_result(result_name)
+        if not isinstance(result, dict):
+            continue
+        for key, obj in result.items():
+            data = getattr(obj, 'data', None)
+            id_name = _get_id_name(obj)
+            if not isinstance(data, np.ndarray) or data.ndim != 3 or id_name is None:
+                continue
+            header = {
+                'class_name': obj.class_name,
+                'isubcase': obj.isubcase,
+                'times': np.asarray(getattr(obj, '_times', np.zeros(data.shape[0]))),
+                'headers': _get_headers(obj),
+                'id_name': id_name,
+            }
+            arrays = {'ids': getattr(obj, id_name), 'data': data}
+            if is_shared_memory:
+                arrays = _to_shared_memory(arrays)
+            file_results.append((result_name, key, header, arrays))
+    return file_results
+
+
+def _get_id_name(obj: Any) -> Optional[str]:
+    """gets the name of the node/element id array of a result"""
+    for name in ID_ARRAY_NAMES:
+        if isinstance(getattr(obj, name, None), np.ndarray):
+            return name
+    return None
+
+
+def _get_headers(obj: Any) -> List[str]:
+    """gets the component names; get_headers isn't implemented for every result"""
+    try:
+        return [str(header) for header in obj.get_headers()]
+    except (AttributeError, NotImplementedError, RuntimeError):
+        return []
+
+
+def _stack_results(stacked_results: Dict[str, Dict[Any, StackedResult]],
+                   op2_filenames: List[str], ifile: int,
+                   file_results: List[Tuple[str, Any, Dict[str, Any], Any]]) -> None:
+    """adds the results of an op2 to the stacked results and checks they're consistent"""
+    op2_filename = op2_filenames[ifile]
+
+    # the shared memory is freed before the results are checked
+    try:
+        file_results = [
+            (result_name, key, header,
+             arrays if isinstance(arrays, dict) else _from_shared_memory(arrays))
+            for result_name, key, header, arrays in file_results]
+    except Exception:
+        _free_file_results(file_results)
+        raise
+
+    keys = set()
+    for result_name, key, header, arrays in file_results:
+        keys.add((result_name, key))
+        ids = arrays['ids']
+        data = arrays['data']
+
+        result = stacked_results.setdefault(result_name, {})
+        if ifile == 0:
+            stacked_data = np.zeros((len(op2_filenames), ) + data.shape, dtype=data.dtype)
+            result[key] = StackedResult(
+                result_name, header['class_name'], header['isubcase'], op2_filenames,
+                header['times'], header['headers'], header['id_name'], ids, stacked_data)
+        elif key not in result:
+            raise ValueError(f'{result_name}[{key!r}] is in {op2_filename!r}, '
+                             f'but not in {op2_filenames[0]!r}')
+
+        stacked = result[key]
+        _check_consistency(stacked, op2_filename, header, ids, data)
+        stacked.data[ifile] = data
+
+    if ifile > 0:
+        missing = [(result_name, key) for result_name, result in stacked_results.items()
+                   for key in result if (result_name, key) not in keys]
+        if missing:
+            raise ValueError(f'{op2_filename!r} is missing {missing} '
+                             f'from {op2_filenames[0]!r}')
+
+
+def _free_file_results(file_results: List[Tuple[str, Any, Dict[str, Any], Any]]) -> None:
+    """frees the shared memory blocks of the results of an op2"""
+    for unused_result_name, unused_key, unused_header, arrays in file_results:
+        if not isinstance(arrays, dict):
+            _free_shared_memory(arrays)
+
+
+def _check_consistency(stacked: StackedResult, op2_filename: str,
+                       header: Dict[str, Any], ids: np.ndarray, data: np.ndarray) -> None:
+    """checks the header/ids of an op2 are the same as the first op2"""
+    name = f'{stacked.result_name}[{stacked.isubcase}]'
+    first_filename = stacked.op2_filenames[0]
+    for attr in ['class_name', 'headers', 'id_name']:
+        if header[attr] != getattr(stacked, attr):
+            raise ValueError(f'{name}: {attr}={header[attr]!r} in {op2_filename!r}, '
+                             f'but {attr}={getattr(stacked, attr)!r} in {first_filename!r}')
+    if data.shape != stacked.data.shape[1:] or data.dtype != stacked.data.dtype:
+        raise ValueError(f'{name}: data.shape={data.shape} ({data.dtype}) in {op2_filename!r}, '
+                         f'but data.shape={stacked.data.shape[1:]} ({stacked.data.dtype}) '
+                         f'in {first_filename!r}')
+
+    times = header['times']
+    if times.dtype.kind in 'fc':
+        is_same_times = times.shape == stacked.times.shape and np.allclose(times, stacked.times, equal_nan=True)
+    else:
+        is_same_times = np.array_equal(times, stacked.times)
+    if not is_same_times:
+        raise ValueError(f'{name}: times={times} in {op2_filename!r}, '
+                         f'but times={stacked.times} in {first_filename!r}')
+    if ids is not stacked.ids and not np.array_equal(ids, stacked.ids):
+        raise ValueError(f'{name}: the {stacked.id_name} ids in {op2_filename!r} '
+                         f'are different than in {first_filename!r}')
@@ -0,0 +1,399 @@
+"""
+Defines:
+ - combined_results = combine_subcases(model, combinations, results=None,
+                                       max_nbytes=COMBINE_MAX_NBYTES)
+
+Creates linear combinations of subcases (e.g., load combinations of unit
+load cases).  Rather than building each combination with ``a * 1.5 + b``
+(which copies the result at every step), all the combinations of a result
+are calculated with one matrix product over the subcase axis:
+
+    combined_data[ncombinations, n] = factors[ncombinations, nsubcases] @
+                                      data[nsubcases, n]
+
+which is done in blocks of rows, so the temporary arrays are bounded.
+The quantities that aren't linear (e.g., principal/von Mises stresses)
+are recalculated from the combined components.
+
+"""
+from __future__ import annotations
+import copy
+from typing import List, Dict, Tuple, Optional, Any, TYPE_CHECKING
+
+import numpy as np
+from pyNastran.op2.op2_stream import ID_ARRAY_NAMES
+from pyNastran.op2.op2_envelope import _get_row_keys
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.op2.op2 import OP2
+
+#: the size of the temporary arrays (bytes)
+COMBINE_MAX_NBYTES = 100 * 1024**2
+SKIP_RESULTS = ['params', 'gpdt', 'bgpdt', 'eqexin', 'psds', 'monitor1', 'monitor3']
+
+#: the row id arrays of a result; the element names identify GPFORCE rows
+ROW_ID_NAMES = ID_ARRAY_NAMES + ['element_names']
+
+#: the components that aren't combined (they're the same for each subcase)
+CONSTANT_NAMES = ['fiber_distance', 'fiber_curvature', 'sd']
+
+#: the components that are recalculated or set to nan (e.g., margins)
+NONLINEAR_NAMES = [
+    'angle', 'omax', 'omid', 'omin', 'emax', 'emid', 'emin', 'major', 'minor',
+    'von_mises', 'max_shear',
+    'smaxa', 'smina', 'smaxb', 'sminb', 'emaxa', 'emina', 'emaxb', 'eminb', 'smax', 'smin',
+    'MS_tension', 'MS_compression', 'SMa', 'SMt', 'margin',
+]
+
+#: class_name : (xx, yy, xy, angle, max, min,
+#:               shear_factor, von_mises_factor, max_shear_factor)
+#: the strains are engineering shear strains
+PLANE_TENSORS = {
+    'RealPlateStressArray': (
+        ['oxx', 'oyy', 'txy', 'angle', 'omax', 'omin'], 1., 1., 1.),
+    'RealPlateStrainArray': (
+        ['exx', 'eyy', 'exy', 'angle', 'emax', 'emin'], 0.5, 2. / 3., 2.),
+    'RealCompositePlateStressArray': (
+        ['o11', 'o22', 't12', 'angle', 'major', 'minor'], 1., 1., 1.),
+    'RealCompositePlateStrainArray': (
+        ['e11', 'e22', 'e12', 'angle', 'major', 'minor'], 0.5, 2. / 3., 2.),
+}
+#: class_name : (xx, yy, zz, xy, yz, xz, max, mid, min,
+#:               shear_factor, von_mises_factor)
+SOLID_TENSORS = {
+    'RealSolidStressArray': (
+        ['oxx', 'oyy', 'ozz', 'txy', 'tyz', 'txz', 'omax', 'omid', 'omin'], 1., 1.),
+    'RealSolidStrainArray': (
+        ['exx', 'eyy', 'ezz', 'exy', 'eyz', 'exz', 'emax', 'emid', 'emin'], 0.5, 2. / 3.),
+}
+#: class_name : [(points, axial, max, min), ...]
+BAR_POINTS = {
+    'RealBarStressArray': [(['s1a', 's2a', 's3a', 's4a'], 'axial', 'smaxa', 'smina'),
+                           (['s1b', 's2b', 's3b', 's4b'], 'axial', 'smaxb', 'sminb')],
+    'RealBarStrainArray': [(['e1a', 'e2a', 'e3a', 'e4a'], 'axial', 'emaxa', 'emina'),
+                           (['e1b', 'e2b', 'e3b', 'e4b'], 'axial', 'emaxb', 'eminb')],
+    'RealBeamStressArray': [(['sxc', 'sxd', 'sxe', 'sxf'], None, 'smax', 'smin')],
+    'RealBeamStrainArray': [(['sxc', 'sxd', 'sxe', 'sxf'], None, 'smax', 'smin')],
+}
+
+
+def combine_subcases(model: OP2,
+                     combinations: Dict[int, List[Tuple[int, float]]],
+                     results: Optional[List[str]]=None,
+                     max_nbytes: int=COMBINE_MAX_NBYTES) -> Dict[str, Dict[int, Any]]:
+    """
+    Creates linear combinations of subcases and adds them to the model
+
+    Parameters
+    ----------
+    model : OP2
+        the model with the (unit) subcases
+    combinations : Dict[int, List[(subcase, factor)]]
+        the new subcase id and the subcases/factors that are summed
+        (e.g., {101: [(1, 1.5), (2, 1.0)], 102: [(1, -1.0)]})
+    results : List[str]; default=None -> all results
+        the results to combine (e.g., ['displacements', 'cquad4_stress'])
+    max_nbytes : int; default=COMBINE_MAX_NBYTES
+        the size of the temporary arrays (bytes)
+
+    Returns
+    -------
+    combined_results : Dict[str, Dict[int, result]]
+        the combined results by result name and new subcase id, which are
+        also added to the model (e.g., model.displacements[101])
+
+    Raises
+    ------
+    ValueError
+        a new subcase id already exists or the subcases of a result have
+        different nodes/elements
+
+    The data of the combinations of a result are views of one
+    (ncombinations, ntimes, ntotal, ncomponents) array and the id arrays
+    are shared with the first subcase.  The GPFORCE rows (e.g., APP-LOAD)
+    are matched up between subcases, so they don't need to be the same.
+    Complex results and results that are missing one of the subcases
+    aren't combined.  Margins of safety can't be recalculated, so they're
+    nan.
+
+    """
+    log = model.log
+    if isinstance(results, str):
+        results = [results]
+    new_ids = list(combinations)
+    subcases = []  # type: List[Any]
+    for new_id in new_ids:
+        for subcase, unused_factor in combinations[new_id]:
+            if subcase not in subcases:
+                subcases.append(subcase)
+
+    # factors[ncombinations, nsubcases]
+    factors = np.zeros((len(new_ids), len(subcases)))
+    for icombination, new_id in enumerate(new_ids):
+        for subcase, factor in combinations[new_id]:
+            factors[icombination, subcases.index(subcase)] += factor
+
+    combined_results = {}  # type: Dict[str, Dict[int, Any]]
+    for result_name in model.get_table_types():
+        if result_name in SKIP_RESULTS or result_name.startswith('responses.'):
+            continue
+        if (results is not None and result_name not in results and
+                result_name.split('.')[-1] not in results):
+            continue
+        result = model.get_result(result_name)
+        if not isinstance(result, dict) or not result:
+            continue
+
+        missing = [subcase for subcase in subcases if subcase not in result]
+        if missing:
+            if len(missing) < len(subcases):
+                log.warning(f'combine_subcases: skipping {result_name!r} because '
+                            f'subcases={missing} are missing')
+            continue
+        objs = [result[subcase] for subcase in subcases]
+        data = getattr(objs[0], 'data', None)
+        if not isinstance(data, np.ndarray) or data.ndim != 3 or np.iscomplexobj(data):
+            continue
+        existing = [new_id for new_id in new_ids if new_id in result]
+        if existing:
+            raise ValueError(f'combine_subcases: {result_name}{existing} already exist')
+
+        combined_results[result_name] = _combine_result(
+            result_name, objs, new_ids, factors, max_nbytes)
+        result.update(combined_results[result_name])
+    return combined_results
+
+
+def _combine_result(result_name: str, objs: List[Any], new_ids: List[int],
+                    factors: np.ndarray, max_nbytes: int) -> Dict[int, Any]:
+    """combines the subcases of a result"""
+    obj0 = objs[0]
+    class_name = obj0.class_name
+    ntimes, unused_ntotal, ncomponents = obj0.data.shape
+    for obj in objs[1:]:
+        if obj.class_name != class_name or obj.data.shape[0] != ntimes:
+            raise ValueError(f'combine_subcases: {result_name} has class_name={obj.class_name} '
+                             f'and data.shape={obj.data.shape} for subcase={obj.isubcase}; '
+                             f'expected class_name={class_name} and ntimes={ntimes}')
+
+    id_arrays, irows = _get_combined_rows(result_name, objs)
+    nrows = irows.shape[1]
+    headers = _get_headers(obj0, ncomponents)
+    ilinear = np.array([i for i, name in enumerate(headers)
+                        if name not in CONSTANT_NAMES and name not in NONLINEAR_NAMES])
+    iconstant = [i for i, name in enumerate(headers) if name in CONSTANT_NAMES]
+
+    ncombinations = len(new_ids)
+    nsubcases = len(objs)
+    data = np.zeros((ncombinations, ntimes, nrows, ncomponents), dtype=obj0.data.dtype)
+
+    # data[ncombinations, ntimes, nrows, nlinear] = factors @ data[nsubcases, ...]
+    if len(ilinear):
+        nbytes_per_row = (nsubcases + ncombinations) * ntimes * len(ilinear) * 8
+        nrows_per_block = max(1, max_nbytes // nbytes_per_row)
+        for irow0 in range(0, nrows, nrows_per_block):
+            irow1 = min(irow0 + nrows_per_block, nrows)
+            subcase_data = np.zeros((nsubcases, ntimes, irow1 - irow0, len(ilinear)))
+            for isubcase, obj in enumerate(objs):
+                irowsi = irows[isubcase, irow0:irow1]
+                exists = irowsi >= 0
+                subcase_data[isubcase][:, exists, :] = obj.data[:, irowsi[exists], :][:, :, ilinear]
+            combined = factors @ subcase_data.reshape(nsubcases, -1)
+            data[:, :, irow0:irow1, ilinear] = combined.reshape(
+                ncombinations, ntimes, irow1 - irow0, len(ilinear))
+
+    for icomponent in iconstant:
+        exists = irows[0] >= 0
+        data[:, :, exists, icomponent] = obj0.data[:, irows[0, exists], icomponent]
+
+    nbytes_per_combination = max(data[0].nbytes * 4, 1)
+    ncombinations_per_block = max(1, max_nbytes // nbytes_per_combination)
+    for icombination0 in range(0, ncombinations, ncombinations_per_block):
+        icombination1 = min(icombination0 + ncombinations_per_block, ncombinations)
+        _set_nonlinear_components(class_name, headers, data[icombination0:icombination1])
+
+    combined_result = {}
+    for icombination, new_id in enumerate(new_ids):
+        obj = copy.copy(obj0)
+        obj.data = data[icombination]
+        obj.__dict__.update(id_arrays)
+        if id_arrays and hasattr(obj, 'ntotal'):
+            obj.ntotal = nrows
+        label = f'LOAD COMBINATION {new_id}'
+        obj.isubcase = new_id
+        obj.label = label
+        obj.data_code = dict(obj0.data_code)
+        obj.data_code['isubcase'] = new_id
+        obj.data_code['label'] = label
+        combined_result[new_id] = obj
+    return combined_result
+
+
+def _get_combined_rows(result_name: str, objs: List[Any]) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+    """
+    Gets the rows of each subcase that make up the rows of the
+    combination
+
+    Returns
+    -------
+    id_arrays : Dict[str, ndarray]
+        the id arrays of the combination if the subcases have different
+        rows (e.g., GPFORCE); {} if the id arrays of the first subcase
+        are used
+    irows : (nsubcases, nrows) int ndarray
+        the row of each subcase; -1 if the subcase doesn't have the row
+
+    """
+    obj0 = objs[0]
+    ntimes, ntotal = obj0.data.shape[:2]
+    names = [name for name in ROW_ID_NAMES
+             if isinstance(getattr(obj0, name, None), np.ndarray)]
+    if all(obj.data.shape[1] == ntotal and
+           all(np.array_equal(getattr(obj, name, None), getattr(obj0, name)) for name in names)
+           for obj in objs[1:]):
+        irows = np.tile(np.arange(ntotal), (len(objs), 1))
+        return {}, irows
+
+    if ntimes != 1 or not names:
+        raise ValueError(f'combine_subcases: the subcases of {result_name} have different '
+                         f'nodes/elements ({names})')
+
+    # find the unique rows, so the subcases can be lined up
+    string_codes = {}  # type: Dict[str, int]
+    row_ids = [_get_row_ids(obj, names, string_codes) for obj in objs]
+    nrows_by_subcase = [row_idsi.shape[0] for row_idsi in row_ids]
+    unique_row_ids, inverse = np.unique(np.vstack(row_ids), axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+    nrows = unique_row_ids.shape[0]
+    irows = np.full((len(objs), nrows), -1, dtype='int64')
+    source = np.full((nrows, 2), -1, dtype='int64')  # (isubcase, irow)
+    i0 = 0
+    for isubcase, nrowsi in enumerate(nrows_by_subcase):
+        irow_combined = inverse[i0:i0 + nrowsi]
+        irows[isubcase, irow_combined] = np.arange(nrowsi)
+        is_new = source[irow_combined, 0] < 0
+        source[irow_combined[is_new], 0] = isubcase
+        source[irow_combined[is_new], 1] = np.arange(nrowsi)[is_new]
+        i0 += nrowsi
+
+    # keep the order of the first subcase and append the new rows
+    order = np.lexsort((source[:, 1], source[:, 0]))
+    irows = irows[:, order]
+    source = source[order]
+
+    id_arrays = {}
+    for name in names:
+        arrays = [getattr(obj, name) for obj in objs]
+        axis = _get_row_axis(arrays[0], ntotal)
+        shape = list(arrays[0].shape)
+        shape[axis] = nrows
+        id_array = np.empty(shape, dtype=np.result_type(*arrays))
+        for isubcase, array in enumerate(arrays):
+            irow_combined = np.where(source[:, 0] == isubcase)[0]
+            index = [slice(None)] * array.ndim
+            index[axis] = irow_combined
+            id_array[tuple(index)] = np.take(array, source[irow_combined, 1], axis=axis)
+        id_arrays[name] = id_array
+    return id_arrays, irows
+
+
+def _get_row_axis(array: np.ndarray, ntotal: int) -> int:
+    """
+    Gets the row axis of an id array, which is (ntotal, ...) or
+    (ntimes, ntotal, ...) for an array that varies by time step
+    (e.g., the GPFORCE node_element)
+    """
+    if array.ndim >= 2 and array.shape[0] == 1 and array.shape[1] == ntotal and (
+            array.ndim == 3 or array.dtype.kind in 'SU'):
+        return 1
+    return 0
+
+
+def _get_row_ids(obj: Any, names: List[str], string_codes: Dict[str, int]) -> np.ndarray:
+    """gets an integer array that identifies each row (one row per data row)"""
+    ntotal = obj.data.shape[1]
+    columns = []
+    for name in names:
+        array = getattr(obj, name)
+        if _get_row_axis(array, ntotal) == 1:
+            array = array[0]
+        if array.dtype.kind in 'SU':
+            # element_names; the codes are shared by the subcases
+            unique, inverse = np.unique(np.char.strip(array.astype('U')), return_inverse=True)
+            codes = np.array([string_codes.setdefault(value, len(string_codes))
+                              for value in unique], dtype='int64')
+            array = codes[inverse.ravel()]
+        columns.append(array.reshape(ntotal, -1).astype('int64'))
+    row_ids = np.hstack(columns)
+    return _get_row_keys(row_ids)
+
+
+def _get_headers(obj: Any, ncomponents: int) -> List[str]:
+    """gets the component names; get_headers isn't implemented for every result"""
+    try:
+        headers = [str(header) for header in obj.get_headers()]
+    except (AttributeError, NotImplementedError, RuntimeError):
+        headers = []
+    if len(headers) != ncomponents:
+        headers = [f'component{icomponent+1}' for icomponent in range(ncomponents)]
+    return headers
+
+
+def _set_nonlinear_components(class_name: str, headers: List[str], data: np.ndarray) -> None:
+    """
+    Recalculates the components that aren't linear (e.g., von Mises) from
+    the combined components of a (ncombinations, ntimes, nrows, ncomponents)
+    array; the ones that can't be calculated (e.g., margins) are nan
+    """
+    is_set = np.array([name not in NONLINEAR_NAMES for name in headers])
+    if is_set.all():
+        return
+
+    def set_component(name: str, value: np.ndarray) -> None:
+        if name in headers:
+            icomponent = headers.index(name)
+            data[..., icomponent] = value
+            is_set[icomponent] = True
+
+    def get_component(name: str) -> np.ndarray:
+        return data[..., headers.index(name)].astype('float64')
+
+    if class_name in PLANE_TENSORS:
+        names, shear_factor, von_mises_factor, max_shear_factor = PLANE_TENSORS[class_name]
+        xx, yy, xy = (get_component(name) for name in names[:3])
+        xy *= shear_factor
+        center = (xx + yy) / 2.
+        radius = np.sqrt(((xx - yy) / 2.) ** 2 + xy ** 2)
+        omax = center + radius
+        omin = center - radius
+        set_component(names[3], np.degrees(0.5 * np.arctan2(2. * xy, xx - yy)))
+        set_component(names[4], omax)
+        set_component(names[5], omin)
+        set_component('von_mises', von_mises_factor * np.sqrt(omax ** 2 - omax * omin + omin ** 2))
+        set_component('max_shear', max_shear_factor * radius)
+    elif class_name in SOLID_TENSORS:
+        names, shear_factor, von_mises_factor = SOLID_TENSORS[class_name]
+        xx, yy, zz, xy, yz, xz = (get_component(name) for name in names[:6])
+        tensor = np.empty(xx.shape + (3, 3))
+        tensor[..., 0, 0] = xx
+        tensor[..., 1, 1] = yy
+        tensor[..., 2, 2] = zz
+        tensor[..., 0, 1] = tensor[..., 1, 0] = xy * shear_factor
+        tensor[..., 1, 2] = tensor[..., 2, 1] = yz * shear_factor
+        tensor[..., 0, 2] = tensor[..., 2, 0] = xz * shear_factor
+        # ascending
+        principals = np.linalg.eigvalsh(np.nan_to_num(tensor))
+        omax, omid, omin = principals[..., 2], principals[..., 1], principals[..., 0]
+        set_component(names[6], omax)
+        set_component(names[7], omid)
+        set_component(names[8], omin)
+        set_component('von_mises', von_mises_factor * np.sqrt(
+            ((omax - omid) ** 2 + (omid - omin) ** 2 + (omin - omax) ** 2) / 2.))
+    elif class_name in BAR_POINTS:
+        for points, axial_name, max_name, min_name in BAR_POINTS[class_name]:
+            values = np.stack([get_component(name) for name in points], axis=-1)
+            axial = 0. if axial_name is None else get_component(axial_name)
+            set_component(max_name, axial + values.max(axis=-1))
+            set_component(min_name, axial + values.min(axis=-1))
+
+    # margins, octahedral shear, ...
+    data[..., ~is_set] = np.nan
@@ -0,0 +1,439 @@
+"""
+Defines:
+ - envelope = envelope_op2s(op2_filenames, results=None, subcases=None,
+                            mode=None, log=None, debug=False)
+ - OP2Envelope()
+   - add_block(result_name, isubcase, dt, ids, data, headers=None)
+   - add_result(obj)
+   - add_op2(model)
+ - ResultEnvelope(result_name, headers)
+   - add(isubcase, dt, ids, data)
+
+Envelopes the results of many subcases/time steps one block at a time, so
+only the envelope (not every result) is in memory.  For each node/element
+and component, the max, min and abs-max value are stored along with the
+governing subcase and time.  Stress results also get the von Mises, max
+principal and max shear stresses.
+
+"""
+from __future__ import annotations
+from pathlib import PurePath
+from typing import List, Dict, Tuple, Optional, Union, Any, TYPE_CHECKING
+
+import numpy as np
+from pyNastran.op2.op2_stream import OP2Stream, ID_ARRAY_NAMES
+if TYPE_CHECKING:  # pragma: no cover
+    from cpylog import SimpleLogger
+    from pyNastran.op2.op2 import OP2
+
+SKIP_RESULTS = ['params', 'gpdt', 'bgpdt', 'eqexin', 'psds', 'monitor1', 'monitor3']
+
+#: the stress components that the derived stresses are calculated from
+SOLID_STRESS_NAMES = ['oxx', 'oyy', 'ozz', 'txy', 'tyz', 'txz']
+PLATE_STRESS_NAMES = ['oxx', 'oyy', 'txy']
+DERIVED_NAMES = ['von_mises', 'max_principal', 'max_shear']
+
+
+class ResultEnvelope:
+    """
+    The envelope of a result (e.g., 'cquad4_stress') across subcases and
+    time steps
+
+    Attributes
+    ----------
+    result_name : str
+        the result name (e.g., 'displacements', 'stress.chexa_stress')
+    names : List[str]
+        the components (e.g., ['oxx', ..., 'von_mises']) followed by the
+        derived stresses that aren't a component
+    ids : (nentities, nids) int ndarray
+        the node/element ids (e.g., node_gridtype, element_node)
+    max / min / abs_max : (nentities, nnames) ndarray
+        the enveloped values; abs_max keeps the sign
+    max_subcase / min_subcase / abs_max_subcase : (nentities, nnames) int ndarray
+        the governing subcase; -1 if there was no value
+    max_time / min_time / abs_max_time : (nentities, nnames) float ndarray
+        the governing time/mode/frequency/load step; nan for a static result
+
+    Complex results are enveloped by their magnitude.
+    """
+    def __init__(self, result_name: str, headers: List[str]):
+        self.result_name = result_name
+        self.headers = headers
+        self._derived = _get_derived_stress_type(headers)
+        self.names = list(headers)
+        if self._derived is not None:
+            self.names += [name for name in DERIVED_NAMES if name not in headers]
+        self.ids = None  # type: Optional[np.ndarray]
+        self._row_keys = None  # type: Optional[np.ndarray]
+        for name in ['max', 'min', 'abs_max']:
+            setattr(self, name, None)
+            setattr(self, name + '_subcase', None)
+            setattr(self, name + '_time', None)
+
+    @property
+    def nentities(self) -> int:
+        return 0 if self.ids is None else self.ids.shape[0]
+
+    def add(self, isubcase: int, dt: Any, ids: np.ndarray, data: np.ndarray) -> None:
+        """
+        Adds a time step to the envelope
+
+        Parameters
+        ----------
+        isubcase : int
+            the subcase id
+        dt : int / float / None
+            the mode/time/frequency/load step; None for a static result
+        ids : (nentities, ...) int ndarray
+            the node/element ids of the rows of data
+        data : (nentities, ncomponents) ndarray
+            the result for the time step
+
+        """
+        values = self._get_values(data)
+        rows = self._get_rows(ids)
+        time = np.nan if dt is None else float(np.real(dt))
+        abs_values = np.abs(values)
+        for name in ['max', 'min', 'abs_max']:
+            envelope = getattr(self, name)
+            subcases = getattr(self, name + '_subcase')
+            times = getattr(self, name + '_time')
+            current = envelope[rows]
+            if name == 'max':
+                is_governing = values > current
+            elif name == 'min':
+                is_governing = values < current
+            else:
+                is_governing = (abs_values > np.abs(current)) | (subcases[rows] < 0)
+            envelope[rows] = np.where(is_governing, values, current)
+            subcases[rows] = np.where(is_governing, isubcase, subcases[rows])
+            times[rows] = np.where(is_governing, time, times[rows])
+
+    def _get_values(self, data: np.ndarray) -> np.ndarray:
+        """gets the components and the derived stresses"""
+        if np.iscomplexobj(data):
+            return np.abs(data)
+        if self._derived is None:
+            return data
+        columns = [data]
+        derived = _get_derived_stresses(self._derived, self.headers, data)
+        for name in DERIVED_NAMES:
+            if name not in self.headers:
+                columns.append(derived[name][:, np.newaxis])
+        return np.hstack(columns)
+
+    def _get_rows(self, ids: np.ndarray) -> Union[slice, np.ndarray]:
+        """
+        Gets the rows of the envelope that the ids correspond to and adds
+        the rows that are new
+        """
+        ids = ids.reshape(ids.shape[0], -1)
+        if self.ids is not None and ids.shape == self.ids.shape and np.array_equal(ids, self.ids):
+            # the common case (every subcase has the same nodes/elements)
+            return slice(None)
+
+        row_keys = _get_row_keys(ids)
+        if self.ids is None:
+            self.ids = ids
+            self._row_keys = row_keys
+            self._resize(0, ids.shape[0])
+            return slice(None)
+
+        all_keys, inverse = np.unique(np.vstack([self._row_keys, row_keys]),
+                                      axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        nold = self.nentities
+        iold = inverse[:nold]
+        inew = inverse[nold:]
+        is_added = np.ones(all_keys.shape[0], dtype='bool')
+        is_added[iold] = False
+        iadded = np.where(is_added)[0]
+        if len(iadded):
+            # keep the old rows in place and append the new ones
+            irows = np.full(all_keys.shape[0], -1, dtype='int64')
+            irows[iold] = np.arange(nold)
+            irows[iadded] = np.arange(nold, nold + len(iadded))
+            self.ids = np.vstack([self.ids, all_keys[iadded, :-1].astype(self.ids.dtype)])
+            self._row_keys = np.vstack([self._row_keys, all_keys[iadded]])
+            self._resize(nold, len(iadded))
+            return irows[inew]
+        irows = np.empty(all_keys.shape[0], dtype='int64')
+        irows[iold] = np.arange(nold)
+        return irows[inew]
+
+    def _resize(self, nold: int, nadded: int) -> None:
+        """adds rows that don't have a value to the envelope"""
+        nnames = len(self.names)
+        for name, fill_value in [('max', -np.inf), ('min', np.inf), ('abs_max', 0.)]:
+            new = [np.full((nadded, nnames), fill_value),
+                   np.full((nadded, nnames), -1, dtype='int32'),
+                   np.full((nadded, nnames), np.nan)]
+            if nold:
+                new = [np.vstack([getattr(self, name + suffix), array])
+                       for suffix, array in zip(['', '_subcase', '_time'], new)]
+            setattr(self, name, new[0])
+            setattr(self, name + '_subcase', new[1])
+            setattr(self, name + '_time', new[2])
+
+    def __repr__(self) -> str:
+        return (f'ResultEnvelope(result_name={self.result_name!r}, '
+                f'nentities={self.nentities}, names={self.names})')
+
+
+class OP2Envelope:
+    """
+    The envelopes of the results, which are keyed by the result name
+    (e.g., 'displacements', 'cquad4_stress')
+
+    Blocks can be added from ``iter_op2_results``, result objects or
+    ``OP2`` objects (see ``envelope_op2s`` to stream op2s).
+    """
+    def __init__(self):
+        self.results = {}  # type: Dict[str, ResultEnvelope]
+
+    def __getitem__(self, result_name: str) -> ResultEnvelope:
+        return self.results[result_name]
+
+    def __contains__(self, result_name: str) -> bool:
+        return result_name in self.results
+
+    def add_block(self, result_name: str, isubcase: int, dt: Any,
+                  ids: np.ndarray, data: np.ndarray,
+                  headers: Optional[List[str]]=None) -> None:
+        """
+        Adds a time step to an envelope
+
+        Parameters
+        ----------
+        result_name / isubcase / dt / ids / data
+            a block from ``iter_op2_results``
+        headers : List[str]; default=None
+            the component names (e.g., ['oxx', 'oyy', 'txy', ...]), which
+            are used for the derived stresses;
+            None : component1, component2, ...
+
+        """
+        envelope = self.results.get(result_name)
+        if envelope is None:
+            headers = _get_unique_headers(headers, data.shape[1])
+            envelope = ResultEnvelope(result_name, headers)
+            self.results[result_name] = envelope
+        envelope.add(isubcase, dt, ids, data)
+
+    def add_result(self, obj: Any) -> None:
+        """adds each time step of a result object (e.g., op2.cquad4_stress[1])"""
+        data = getattr(obj, 'data', None)
+        times = getattr(obj, '_times', None)
+        if not isinstance(data, np.ndarray) or data.ndim != 3 or times is None:
+            return
+        ids = _get_ids(obj)
+        if ids is None:
+            return
+        try:
+            headers = obj.get_headers()
+        except (AttributeError, NotImplementedError, RuntimeError):
+            # get_headers isn't implemented for every result
+            headers = None
+
+        nonlinear_factor = obj.nonlinear_factor
+        is_static = nonlinear_factor is None or (
+            isinstance(nonlinear_factor, (float, np.floating)) and np.isnan(nonlinear_factor))
+        for itime in range(data.shape[0]):
+            dt = None if is_static else times[itime]
+            self.add_block(obj.result_name, obj.isubcase, dt, ids, data[itime],
+                           headers=headers)
+
+    def add_op2(self, model: OP2, results: Optional[List[str]]=None) -> None:
+        """
+        Adds the results of an OP2
+
+        Parameters
+        ----------
+        model : OP2
+            the model
+        results : List[str]; default=None -> all results
+            the results to envelope (e.g., ['displacements', 'cquad4_stress'])
+
+        """
+        for result_name in model.get_table_types():
+            if result_name in SKIP_RESULTS or result_name.startswith('responses.'):
+                continue
+            if (results is not None and result_name not in results and
+                    result_name.split('.')[-1] not in results):
+                continue
+            result = model.get_result(result_name)
+            if not isinstance(result, dict):
+                continue
+            for obj in result.values():
+                self.add_result(obj)
+
+    def __repr__(self) -> str:
+        return f'OP2Envelope(results={list(self.results)})'
+
+
+def envelope_op2s(op2_filenames: Union[str, PurePath, List[Union[str, PurePath]]],
+                  results: Optional[List[str]]=None,
+                  subcases: Optional[List[int]]=None,
+                  envelope: Optional[OP2Envelope]=None,
+                  mode: Optional[str]=None,
+                  log: Optional[SimpleLogger]=None,
+                  debug: Optional[bool]=False) -> OP2Envelope:
+    """
+    Envelopes the results of a set of op2s, which are streamed, so only
+    a subtable is in memory at a time
+
+    Parameters
+    ----------
+    op2_filenames : str / List[str]
+        the op2s
+    results : List[str] / str; default=None -> all results
+        the results to envelope (e.g., ['displacements', 'stress'])
+    subcases : List[int, ...] / int; default=None->all subcases
+        list of [subcase1_ID,subcase2_ID]
+    envelope : OP2Envelope; default=None -> a new envelope
+        an envelope to add to
+    mode : str; default=None -> 'msc'
+        the version of the Nastran you're using
+        {nx, msc, autodesk, optistruct, nasa95}
+    log : SimpleLogger; default=None
+        a logging object to write debug messages to
+    debug : bool/None; default=False
+        used to set the logger if no logger is passed in
+
+    Returns
+    -------
+    envelope : OP2Envelope
+        the envelopes by result name
+
+    .. code-block:: python
+
+       envelope = envelope_op2s(op2_filenames, results=['stress'])
+       cquad4 = envelope['cquad4_stress']
+       ivm = cquad4.names.index('von_mises')
+       max_von_mises = cquad4.max[:, ivm]
+       governing_subcase = cquad4.max_subcase[:, ivm]
+
+    """
+    if isinstance(op2_filenames, (str, PurePath)):
+        op2_filenames = [op2_filenames]
+    if isinstance(results, str):
+        results = [results]
+    if envelope is None:
+        envelope = OP2Envelope()
+    for op2_filename in op2_filenames:
+        model = _OP2Envelope(envelope, log=log, debug=debug, mode=mode)
+        model.set_subcases(subcases)
+        model.include_exclude_results(include_results=results)
+        model.envelope_op2(op2_filename)
+    return envelope
+
+
+class _OP2Envelope(OP2Stream):
+    """
+    Reads an op2 with ``single_pass=True`` and adds each result to an
+    envelope as it's filled (see ``envelope_op2s``)
+    """
+    def __init__(self, envelope: OP2Envelope,
+                 debug: Optional[bool]=False,
+                 log: Any=None,
+                 debug_file: Optional[str]=None,
+                 mode: Optional[str]=None):
+        OP2Stream.__init__(self, debug=debug, log=log, debug_file=debug_file, mode=mode)
+        self.envelope = envelope
+
+    def envelope_op2(self, op2_filename: Union[str, PurePath]) -> None:
+        """reads the op2 and adds the results to the envelope"""
+        self.read_op2(op2_filename, combine=False, single_pass=True)
+        self._flush_results()
+
+    def _put_result(self, unused_key: Tuple[Any, ...], obj: Any) -> None:
+        """finalizes a result and adds it to the envelope"""
+        if hasattr(obj, 'finalize'):
+            obj.finalize()
+        self.envelope.add_result(obj)
+
+
+def _get_ids(obj: Any) -> Optional[np.ndarray]:
+    """gets the node/element ids of the rows of the data array"""
+    data = obj.data
+    for name in ID_ARRAY_NAMES:
+        ids = getattr(obj, name, None)
+        if isinstance(ids, np.ndarray) and ids.shape[0] == data.shape[1]:
+            return ids
+    return None
+
+
+def _get_unique_headers(headers: Optional[List[str]], ncomponents: int) -> List[str]:
+    """gets the unique component names"""
+    if headers is None or len(headers) != ncomponents:
+        return [f'component{icomponent+1}' for icomponent in range(ncomponents)]
+    names = []
+    for header in headers:
+        name = str(header)
+        i = 2
+        while name in names:
+            name = f'{header}{i}'
+            i += 1
+        names.append(name)
+    return names
+
+
+def _get_row_keys(ids: np.ndarray) -> np.ndarray:
+    """
+    Gets a unique key for each row, which is the ids and the occurrence of
+    the ids (e.g., the top/bottom of a plate have the same element_node)
+    """
+    nrows = ids.shape[0]
+    if nrows == 0:
+        return np.zeros((0, ids.shape[1] + 1), dtype='int64')
+    order = np.lexsort(ids.T[::-1])
+    sorted_ids = ids[order]
+    is_first = np.ones(nrows, dtype='bool')
+    is_first[1:] = (sorted_ids[1:] != sorted_ids[:-1]).any(axis=1)
+    first = np.maximum.accumulate(np.where(is_first, np.arange(nrows), 0))
+    occurrence = np.empty(nrows, dtype='int64')
+    occurrence[order] = np.arange(nrows) - first
+    return np.column_stack([ids.astype('int64'), occurrence])
+
+
+def _get_derived_stress_type(headers: List[str]) -> Optional[str]:
+    """gets the type of stress tensor ('solid', 'plate') from the component names"""
+    if all(name in headers for name in SOLID_STRESS_NAMES):
+        return 'solid'
+    if all(name in headers for name in PLATE_STRESS_NAMES):
+        return 'plate'
+    return None
+
+
+def _get_derived_stresses(stress_type: str, headers: List[str],
+                          data: np.ndarray) -> Dict[str, np.ndarray]:
+    """calculates the von Mises, max principal and max shear stresses"""
+    if stress_type == 'solid':
+        oxx, oyy, ozz, txy, tyz, txz = (data[:, headers.index(name)]
+                                         for name in SOLID_STRESS_NAMES)
+        tensor = np.empty((data.shape[0], 3, 3), dtype=data.dtype)
+        tensor[:, 0, 0] = oxx
+        tensor[:, 1, 1] = oyy
+        tensor[:, 2, 2] = ozz
+        tensor[:, 0, 1] = tensor[:, 1, 0] = txy
+        tensor[:, 1, 2] = tensor[:, 2, 1] = tyz
+        tensor[:, 0, 2] = tensor[:, 2, 0] = txz
+        # ascending
+        principals = np.linalg.eigvalsh(np.nan_to_num(tensor))
+        omax = principals[:, 2]
+        omin = principals[:, 0]
+        von_mises = np.sqrt(0.5 * ((oxx - oyy) ** 2 + (oyy - ozz) ** 2 + (ozz - oxx) ** 2) +
+                            3. * (txy ** 2 + tyz ** 2 + txz ** 2))
+    else:
+        oxx, oyy, txy = (data[:, headers.index(name)] for name in PLATE_STRESS_NAMES)
+        center = (oxx + oyy) / 2.
+        radius = np.sqrt(((oxx - oyy) / 2.) ** 2 + txy ** 2)
+        omax = center + radius
+        omin = center - radius
+        von_mises = np.sqrt(omax ** 2 - omax * omin + omin ** 2)
+    return {
+        'von_mises': von_mises,
+        'max_principal': omax,
+        'max_shear': (omax - omin) / 2.,
+    }
@@ -34,6 +34,7 @@ from pyNastran.op2.tables.geom.axic import AXIC
 from pyNastran.bdf.bdf import BDF
 from pyNastran.bdf.errors import DuplicateIDsError
 from pyNastran.op2.op2 import OP2, FatalError, SortCodeError, DeviceCodeError, FortranMarkerError
+from pyNastran.op2.op2_interface.op2_lazy import LAZY_MAX_NBYTES
 if TYPE_CHECKING:  # pragma: no cover
     from cpylog import SimpleLogger
 
@@ -47,7 +48,15 @@ def read_op2_geom(op2_filename: Optional[Union[str, PurePath]]=None,
                   build_dataframe: bool=False, skip_undefined_matrices: bool=True,
                   mode: str='msc', log: SimpleLogger=None, debug: bool=True,
                   debug_file: Optional[str]=None,
-                  encoding: Optional[str]=None):
+                  encoding: Optional[str]=None,
+                  single_pass: bool=False,
+                  use_index: bool=False,
+                  use_mmap: bool=False,
+                  lazy: bool=False,
+                  lazy_max_nbytes: int=LAZY_MAX_NBYTES,
+                  nprocs: int=1,
+                  result_dtype: Optional[str]=None,
+                  id_dtype: Optional[str]=None):
     """
     Creates the OP2 object without calling the OP2 class.
 
@@ -81,6 +90,25 @@ def read_op2_geom(op2_filename: Optional[Union[str, PurePath]]=None,
         sets the filename that will be written to
     encoding : str
         the unicode encoding (default=None; system default)
+    single_pass : bool; default=False
+        size and then fill each table before moving on to the next one,
+        so the result records are read once (see ``OP2.read_op2``)
+    use_index : bool; default=False
+        use the table of contents sidecar file to seek past the
+        tables/subtables that weren't requested (see ``OP2.read_op2``)
+    use_mmap : bool; default=False
+        memory map the op2 (see ``OP2.read_op2``)
+    lazy : bool; default=False
+        decode the result arrays the first time they're accessed
+        (see ``OP2.read_op2``)
+    lazy_max_nbytes : int; default=LAZY_MAX_NBYTES (1 GB)
+        the cap on the size of the decoded arrays for lazy=True
+    nprocs : int; default=1
+        the number of worker processes that decode the results
+        (see ``OP2.read_op2``)
+    result_dtype / id_dtype : str; default=None -> the op2 precision
+        the precision of the result data and id arrays
+        (e.g., 'float32', 'int32'; see ``OP2.read_op2``)
 
     Returns
     -------
@@ -100,7 +128,9 @@ def read_op2_geom(op2_filename: Optional[Union[str, PurePath]]=None,
 
     model.read_op2(op2_filename=op2_filename, build_dataframe=build_dataframe,
                    skip_undefined_matrices=skip_undefined_matrices, combine=combine,
-                   encoding=encoding)
+                   encoding=encoding, single_pass=single_pass, use_index=use_index,
+                   use_mmap=use_mmap, lazy=lazy, lazy_max_nbytes=lazy_max_nbytes,
+                   nprocs=nprocs, result_dtype=result_dtype, id_dtype=id_dtype)
     if validate:
         model.validate()
     if xref:
@@ -313,12 +343,23 @@ class OP2Geom(BDF, OP2GeomCommon):
     def read_op2(self, op2_filename: Optional[Union[str, PurePath]]=None, combine: bool=True,
                  build_dataframe: Optional[bool]=False,
                  skip_undefined_matrices: bool=False,
-                 encoding: Optional[str]=None):
+                 encoding: Optional[str]=None,
+                 single_pass: bool=False,
+                 use_index: bool=False,
+                 use_mmap: bool=False,
+                 lazy: bool=False,
+                 lazy_max_nbytes: int=LAZY_MAX_NBYTES,
+                 nprocs: int=1,
+                 result_dtype: Optional[str]=None,
+                 id_dtype: Optional[str]=None):
         """see ``OP2.read_op2``"""
         OP2.read_op2(self, op2_filename=op2_filename, combine=combine,
                      build_dataframe=build_dataframe,
                      skip_undefined_matrices=skip_undefined_matrices,
-                     encoding=encoding)
+                     encoding=encoding, single_pass=single_pass,
+                     use_index=use_index, use_mmap=use_mmap,
+                     lazy=lazy, lazy_max_nbytes=lazy_max_nbytes,
+                     nprocs=nprocs, result_dtype=result_dtype, id_dtype=id_dtype)
         if len(self.nodes) == 0:
             self.gpdt_to_nodes()
 
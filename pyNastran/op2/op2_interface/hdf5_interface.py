@@ -8,15 +8,17 @@ defines:
  model = load_op2_from_hdf5_file(model, h5_file, log, debug=False)
  export_op2_to_hdf5_file(hdf5_filename, op2_model)
  export_op2_to_hdf5_file(hdf5_file, op2_model)
+ convert_op2_to_hdf5(op2_filename, hdf5_filename)
 
 """
-from typing import Tuple, List, Union, Optional, Any
+from typing import Tuple, List, Dict, Union, Optional, Any
 import numpy as np
 import h5py
 
 from cpylog import SimpleLogger
 import pyNastran
 from pyNastran.op2.op2 import OP2
+from pyNastran.op2.op2_stream import OP2Stream, ID_ARRAY_NAMES, get_op2_code
 
 from pyNastran.op2.result_objects.grid_point_weight import GridPointWeight
 from pyNastran.op2.tables.lama_eigenvalues.lama_objects import RealEigenvalues, ComplexEigenvalues, BucklingEigenvalues
@@ -1117,7 +1119,10 @@ def _load_eigenvalue(h5_result, encoding: str,
     return obj
 
 def _load_table(result_name, h5_result, objs: Tuple[Any], encoding: str,
-                log: SimpleLogger, debug: bool=False):# real_obj, complex_obj
+                log: SimpleLogger, debug: bool=False,
+                itimes: Optional[np.ndarray]=None,
+                node_ids: Optional[np.ndarray]=None,
+                element_ids: Optional[np.ndarray]=None):# real_obj, complex_obj
     """loads a RealEigenvectorArray/ComplexEigenvectorArray"""
     is_real = _cast(h5_result.get('is_real'))
     #is_complex = _cast(h5_result.get('is_complex'))
@@ -1179,14 +1184,129 @@ def _load_table(result_name, h5_result, objs: Tuple[Any], encoding: str,
     if obj.class_name != class_name:
         msg = 'class_name=%r selected; should be %r' % (obj.class_name, class_name)
         raise RuntimeError(msg)
+    selected_keys = {}
+    if itimes is not None or node_ids is not None or element_ids is not None:
+        selected_keys = _get_selected_keys(h5_result, str_data_names)
     _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str_data_names,
-                                     encoding, debug=debug)
+                                     encoding, debug=debug, selected_keys=selected_keys)
+    if selected_keys:
+        _apply_hdf5_selection(obj, h5_result, selected_keys, encoding,
+                              itimes, node_ids, element_ids)
     return obj
 
 
+def _get_selected_keys(h5_result: h5py.Group, str_data_names: List[str]) -> Dict[str, str]:
+    """
+    Gets the arrays that are sliced when a set of time steps/nodes/elements
+    is loaded
+
+    Returns
+    -------
+    selected_keys : Dict[str, str]
+        {key : 'time'/'data'/'row'/'id'}
+        'time' : the (ntimes, ) arrays (e.g., dts, modes)
+        'data' : the (ntimes, ntotal, ...) arrays (e.g., data)
+        'row' : the (ntotal, ...) id arrays (e.g., element_node)
+        'id' : the other id arrays (e.g., element_cid)
+
+    """
+    h5_data = h5_result.get('data')
+    if not isinstance(h5_data, h5py.Dataset) or h5_data.ndim < 2:
+        return {}
+    shape = h5_data.shape
+    selected_keys = {key: 'time' for key in str_data_names if key in h5_result}
+    for key, h5_value in h5_result.items():
+        if isinstance(h5_value, h5py.Dataset) and h5_value.ndim >= 2 and h5_value.shape[:2] == shape[:2]:
+            selected_keys[key] = 'data'
+    for key in ID_ARRAY_NAMES:
+        if key in h5_result and key not in selected_keys and h5_result[key].ndim:
+            is_row = h5_result[key].shape[0] == shape[1]
+            selected_keys[key] = 'row' if is_row else 'id'
+    return selected_keys
+
+
+def _apply_hdf5_selection(obj, h5_result: h5py.Group,
+                          selected_keys: Dict[str, str], encoding: str,
+                          itimes: Optional[np.ndarray],
+                          node_ids: Optional[np.ndarray],
+                          element_ids: Optional[np.ndarray]) -> None:
+    """
+    Loads the selected time steps and rows of the arrays that were skipped
+    by ``_apply_hdf5_attributes_to_object``
+
+    The rows are found with the stored node/element id of each row
+    (see ``_export_row_ids``).
+    """
+    irows = None
+    ids = None
+    if 'row_ids' in h5_result:
+        row_id_name = _cast_str(h5_result['row_id_name'], encoding)
+        ids = node_ids if row_id_name.startswith('node') else element_ids
+        if ids is not None:
+            row_ids = h5_result['row_ids'][()]
+            irows = np.flatnonzero(np.isin(row_ids, ids))
+
+    # the other time arrays (e.g., eigns, mode_cycles) don't define the time steps
+    times_name = obj.data_code['name'] + 's'
+    ntotal0 = h5_result['data'].shape[1]
+    for key, selection_type in selected_keys.items():
+        h5_value = h5_result[key]
+        if selection_type == 'time':
+            datai = h5_value[()]
+            if itimes is not None:
+                datai = datai[np.asarray(itimes, dtype='int64')]
+            setattr(obj, key, datai)
+            if key == times_name:
+                obj._times = datai
+            continue
+
+        if selection_type == 'data':
+            datai = _read_selection(h5_value, itimes, irows)
+        else:
+            datai = _cast(h5_value)
+            if irows is None:
+                pass
+            elif selection_type == 'row':
+                datai = datai[irows]
+            else:
+                idsi = datai[:, 0] if datai.ndim == 2 else datai
+                datai = datai[np.isin(idsi, ids)]
+        setattr(obj, key, datai)
+
+    ntimes, ntotal = obj.data.shape[:2]
+    if hasattr(obj, 'ntimes'):
+        obj.ntimes = ntimes
+    if getattr(obj, 'ntotal', None) == ntotal0:
+        obj.ntotal = ntotal
+    if hasattr(obj, 'nelements') and ntotal0:
+        obj.nelements = obj.nelements * ntotal // ntotal0
+
+
+def _read_selection(h5_value: h5py.Dataset,
+                    itimes: Optional[np.ndarray],
+                    irows: Optional[np.ndarray]) -> np.ndarray:
+    """reads the selected time steps and rows of an (ntimes, ntotal, ...) dataset"""
+    if itimes is None and irows is None:
+        return h5_value[()]
+    if irows is None:
+        return h5_value[itimes, ...] if len(itimes) else h5_value[:0]
+    if itimes is None:
+        itimes = np.arange(h5_value.shape[0])
+
+    # h5py only allows one array index, so the time steps are read one at a time
+    datai = np.zeros((len(itimes), len(irows)) + h5_value.shape[2:], dtype=h5_value.dtype)
+    if len(irows):
+        for i, itime in enumerate(itimes):
+            datai[i] = h5_value[itime, irows, ...]
+    return datai
+
+
 def _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str_data_names,
-                                     encoding: str, debug: bool=False):
+                                     encoding: str, debug: bool=False,
+                                     selected_keys: Optional[Dict[str, str]]=None):
     """helper method for ``_load_table``"""
+    if selected_keys is None:
+        selected_keys = {}
     keys_to_skip = [
         'class_name', 'headers', 'is_real', 'is_complex',
         'is_sort1', 'is_sort2', 'table_name_str',
@@ -1198,7 +1318,7 @@ def _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str
     #if result_name == 'eigenvectors':
         #debug = True
     for key in h5_result.keys():
-        if key not in filtered_attrs:
+        if key not in filtered_attrs or key in selected_keys:
             continue
         elif result_name == 'grid_point_forces' and key in ['element_name']:
             pass
@@ -1299,23 +1419,46 @@ def _get_obj_class(objs: Tuple[Any],
             #obj_class = complex_obj
     return obj_class
 
-def export_op2_to_hdf5_filename(hdf5_filename: str, op2_model: OP2) -> None:
-    """exports an OP2 object to an HDF5 file"""
+def export_op2_to_hdf5_filename(hdf5_filename: str, op2_model: OP2,
+                                compression: Optional[str]=None,
+                                compression_opts: Optional[int]=None) -> None:
+    """
+    exports an OP2 object to an HDF5 file
+
+    Parameters
+    ----------
+    hdf5_filename : str
+        the HDF5 file to write
+    op2_model : OP2
+        the model to export
+    compression : str; default=None
+        the h5py compression filter of the arrays {None, gzip, lzf}
+    compression_opts : int; default=None
+        the compression level for gzip (0-9)
+
+    The result arrays are chunked by time step and the node/element id of
+    each row is stored, so ``load_op2_from_hdf5_filename`` can load a few
+    time steps/nodes/elements without reading the whole array.
+    """
     #no_sort2_classes = ['RealEigenvalues', 'ComplexEigenvalues', 'BucklingEigenvalues']
     try:
         with h5py.File(hdf5_filename, 'w') as hdf5_file:
             op2_model.log.info(f'starting export_op2_to_hdf5_file of {hdf5_filename!r}')
-            export_op2_to_hdf5_file(hdf5_file, op2_model)
+            export_op2_to_hdf5_file(hdf5_file, op2_model, compression=compression,
+                                    compression_opts=compression_opts)
     except OSError:
         op2_model.log.error(f'failed to export {hdf5_filename!r}')
         raise
 
-def export_op2_to_hdf5_file(hdf5_file, op2_model: OP2) -> None:
+def export_op2_to_hdf5_file(hdf5_file, op2_model: OP2,
+                            compression: Optional[str]=None,
+                            compression_opts: Optional[int]=None) -> None:
     """exports an OP2 object to an HDF5 file object"""
     assert not isinstance(hdf5_file, str), hdf5_file
     create_info_group(hdf5_file, op2_model)
     export_matrices(hdf5_file, op2_model)
-    _export_subcases(hdf5_file, op2_model)
+    _export_subcases(hdf5_file, op2_model, compression=compression,
+                     compression_opts=compression_opts)
 
 def create_info_group(hdf5_file, op2_model: OP2) -> None:
     """creates the info HDF5 group"""
@@ -1340,7 +1483,9 @@ def export_matrices(hdf5_file, op2_model: OP2) -> None:
                 raise NotImplementedError(msg)
                 #continue
 
-def _export_subcases(hdf5_file, op2_model):
+def _export_subcases(hdf5_file, op2_model,
+                     compression: Optional[str]=None,
+                     compression_opts: Optional[int]=None):
     """exports the subcases to HDF5"""
     subcase_groups = {}
     result_types = op2_model.get_table_types()
@@ -1369,7 +1514,7 @@ def _export_subcases(hdf5_file, op2_model):
             if subcase_name in subcase_groups:
                 subcase_group = subcase_groups[subcase_name]
             else:
-                subcase_group = hdf5_file.create_group(subcase_name)
+                subcase_group = hdf5_file.require_group(subcase_name)
                 subcase_groups[subcase_name] = subcase_group
 
             #if hasattr(obj, 'element_name'):
@@ -1378,35 +1523,315 @@ def _export_subcases(hdf5_file, op2_model):
             #result_name = result_type + ':' + class_name
             result_name = result_type
             result_group = subcase_group.create_group(result_name)
-            obj.export_to_hdf5(result_group, op2_model.log)
+            obj.export_to_hdf5(result_group, op2_model.log, compression=compression,
+                               compression_opts=compression_opts)
+            _export_row_ids(result_group, obj)
+
+def _export_row_ids(result_group: h5py.Group, obj: Any) -> None:
+    """
+    Stores the node/element id of each row of the (ntimes, ntotal, ...)
+    data array, so a set of nodes/elements can be loaded
+    (see ``load_op2_from_hdf5_file``)
+    """
+    data = getattr(obj, 'data', None)
+    if not isinstance(data, np.ndarray) or data.ndim < 2:
+        return
+    for name in ID_ARRAY_NAMES:
+        ids = getattr(obj, name, None)
+        if (isinstance(ids, np.ndarray) and ids.ndim in {1, 2} and
+                ids.shape[0] == data.shape[1] and ids.dtype.kind in 'iu' and
+                not (name == 'element' and ids.ndim == 2)):  # strain energy
+            row_ids = ids if ids.ndim == 1 else ids[:, 0]
+            result_group.create_dataset('row_ids', data=row_ids)
+            result_group.create_dataset('row_id_name', data=name)
+            return
+
+def convert_op2_to_hdf5(op2_filename: str, hdf5_filename: str,
+                        compression: Optional[str]=None,
+                        compression_opts: Optional[int]=None,
+                        mode: Optional[str]=None,
+                        log: Optional[SimpleLogger]=None,
+                        debug: Optional[bool]=False) -> None:
+    """
+    Converts an OP2 to an HDF5 file without loading the whole OP2
+
+    The results are appended to resizable, chunked datasets as each
+    table block is decoded, so only the current time step of a SORT1
+    result (or the current table of a SORT2 result) is in memory.
+    The file can be loaded with ``load_op2_from_hdf5_filename``.
+
+    Parameters
+    ----------
+    op2_filename : str
+        the op2_filename
+    hdf5_filename : str
+        the HDF5 file to write
+    compression : str; default=None
+        the h5py compression filter of the arrays {None, gzip, lzf}
+    compression_opts : int; default=None
+        the compression level for gzip (0-9)
+    mode : str; default=None -> 'msc'
+        the version of the Nastran you're using
+        {nx, msc, autodesk, optistruct, nasa95}
+    log : SimpleLogger; default=None
+        a logging object to write debug messages to
+    debug : bool/None; default=False
+        used to set the logger if no logger is passed in
+
+    """
+    model = _OP2ToHDF5(log=log, debug=debug, mode=mode)
+    model.compression = compression
+    model.compression_opts = compression_opts
+    try:
+        with h5py.File(hdf5_filename, 'w') as hdf5_file:
+            model.log.info(f'starting convert_op2_to_hdf5 of {str(op2_filename)!r}')
+            model.convert(op2_filename, hdf5_file)
+    except OSError:
+        model.log.error(f'failed to export {hdf5_filename!r}')
+        raise
+
+
+class _OP2ToHDF5(OP2Stream):
+    """
+    Reads an op2 with ``single_pass=True`` and appends each result to an
+    HDF5 file as it's filled (see ``convert_op2_to_hdf5``)
+    """
+    def __init__(self, debug: Optional[bool]=False,
+                 log: Any=None,
+                 debug_file: Optional[str]=None,
+                 mode: Optional[str]=None):
+        OP2Stream.__init__(self, debug=debug, log=log, debug_file=debug_file, mode=mode)
+        self.compression = None
+        self.compression_opts = None
+        self._hdf5_file = None
+        #: {(code, result_name) : (result_group, class_name, ids)}
+        self._hdf5_results = {}
+
+    def convert(self, op2_filename: str, hdf5_file: h5py.File) -> None:
+        """reads the op2 and writes the results to an HDF5 file object"""
+        self._hdf5_file = hdf5_file
+        self._hdf5_results = {}
+        try:
+            self.read_op2(op2_filename, combine=False, single_pass=True)
+            self._flush_results()
+            create_info_group(hdf5_file, self)
+            export_matrices(hdf5_file, self)
+
+            # the results that aren't streamed (e.g., eigenvalues)
+            _export_subcases(hdf5_file, self, compression=self.compression,
+                             compression_opts=self.compression_opts)
+        finally:
+            self._hdf5_file = None
+            self._hdf5_results = {}
+
+    def _put_result(self, key: Tuple[Any, ...], obj: Any) -> None:
+        """finalizes a result and writes/appends it to the HDF5 file"""
+        if hasattr(obj, 'finalize'):
+            obj.finalize()
+        time_names = _get_time_array_names(obj)
+        ids = {name: getattr(obj, name) for name in ID_ARRAY_NAMES
+               if name not in time_names and isinstance(getattr(obj, name, None), np.ndarray)}
+
+        # the time steps of a result share the OP2 code (minus the
+        # table position that OP2Stream adds)
+        key = (get_op2_code(key), obj.result_name)
+        if key in self._hdf5_results:
+            result_group, class_name, ids0 = self._hdf5_results[key]
+            if (class_name == obj.class_name and
+                    _is_appendable(result_group, obj, time_names, ids, ids0)):
+                _append_time_arrays(result_group, obj, time_names)
+                return
+
+        result_group = self._create_result_group(obj.isubcase, obj.result_name)
+        obj.export_to_hdf5(result_group, self.log, resizable_names=time_names,
+                           compression=self.compression,
+                           compression_opts=self.compression_opts)
+        _export_row_ids(result_group, obj)
+        self._hdf5_results[key] = (result_group, obj.class_name, ids)
+
+    def _create_result_group(self, isubcase: int, result_name: str) -> h5py.Group:
+        """
+        Creates the result group
+
+        A result that can't be appended to the previous one (e.g., a
+        different set of nodes) is written to 'Subcase=1;2', 'Subcase=1;3'...
+        """
+        subcase_name = f'Subcase={isubcase}'
+        i = 1
+        while result_name in self._hdf5_file.get(subcase_name, {}):
+            i += 1
+            subcase_name = f'Subcase={isubcase};{i}'
+        subcase_group = self._hdf5_file.require_group(subcase_name)
+        return subcase_group.create_group(result_name)
+
+
+def _get_time_array_names(obj: Any) -> List[str]:
+    """
+    Gets the names of the arrays that are sized by the time steps
+    (e.g., data, dts, node_element for grid point forces).  A static
+    result isn't appended, so it has none.
+    """
+    data = getattr(obj, 'data', None)
+    nonlinear_factor = getattr(obj, 'nonlinear_factor', None)
+    if (not isinstance(data, np.ndarray) or data.ndim < 2 or
+            nonlinear_factor is None or (
+                isinstance(nonlinear_factor, float) and np.isnan(nonlinear_factor))):
+        return []
+
+    ntimes = data.shape[0]
+    names = ['data']
+    for data_name in obj.data_names:
+        name = data_name + 's'
+        value = getattr(obj, name, None)
+        if value is not None and len(value) == ntimes:
+            names.append(name)
+
+    for name in obj.object_attributes(filter_properties=True):
+        if name in names or name in ['data_code', 'dataframe', 'data_frame']:
+            continue
+        value = getattr(obj, name)
+        if isinstance(value, np.ndarray) and value.ndim >= 2 and value.shape[:2] == data.shape[:2]:
+            names.append(name)
+    return names
+
+
+def _is_appendable(result_group: h5py.Group, obj: Any,
+                   time_names: List[str],
+                   ids: Dict[str, np.ndarray],
+                   ids0: Dict[str, np.ndarray]) -> bool:
+    """can the time steps of the result be appended to the result group?"""
+    if not time_names:
+        return False
+    for name in time_names:
+        if name not in result_group:
+            return False
+        dataset = result_group[name]
+        value = np.asarray(getattr(obj, name))
+        if dataset.maxshape[0] is not None or dataset.shape[2:] != value.shape[2:]:
+            return False
+    if ids.keys() != ids0.keys():
+        return False
+    return all(np.array_equal(ids[name], ids0[name]) for name in ids)
+
+
+def _append_time_arrays(result_group: h5py.Group, obj: Any,
+                        time_names: List[str]) -> None:
+    """
+    Appends the time steps of a result to its resizable datasets
+
+    A time step with more nodes/elements than the previous ones
+    (e.g., strain energy) pads the previous time steps with 0s like
+    ``read_op2`` does.
+    """
+    data = result_group['data']
+    ntimes0, ntotal0 = data.shape[:2]
+    ntimes = ntimes0 + obj.data.shape[0]
+    ntotal = max(ntotal0, obj.data.shape[1])
+    for name in time_names:
+        dataset = result_group[name]
+        value = np.asarray(getattr(obj, name))
+        if dataset.dtype.kind == 'S' and value.dtype.kind == 'U':
+            value = value.astype(dataset.dtype)
+        if value.ndim == 1:
+            dataset.resize((ntimes, ))
+            dataset[ntimes0:] = value
+        else:
+            nrows = max(dataset.shape[1], value.shape[1])
+            dataset.resize((ntimes, nrows) + dataset.shape[2:])
+            dataset[ntimes0:, :value.shape[1]] = value
+
+    if 'ntimes' in result_group:
+        result_group['ntimes'][()] = ntimes
+    if ntotal > ntotal0:
+        for name in ['ntotal', 'nelements']:
+            if name in result_group and result_group[name][()] == ntotal0:
+                result_group[name][()] = ntotal
+
 
 def load_op2_from_hdf5(hdf5_filename, combine=True, log=None):
     return load_op2_from_hdf5_filename(hdf5_filename, combine=combine, log=log)
 
 def load_op2_from_hdf5_filename(hdf5_filename: str, combine: bool=True,
-                                log: Optional[SimpleLogger]=None):
-    """loads an hdf5 file into an OP2 object"""
+                                log: Optional[SimpleLogger]=None,
+                                include_results: Optional[List[str]]=None,
+                                subcases: Optional[List[int]]=None,
+                                itimes: Optional[List[int]]=None,
+                                node_ids: Optional[List[int]]=None,
+                                element_ids: Optional[List[int]]=None):
+    """
+    loads an hdf5 file into an OP2 object
+
+    Parameters
+    ----------
+    hdf5_filename : str
+        the path to the an hdf5 file
+    combine : bool; default=True
+        runs the combine routine
+    log : SimpleLogger; default=None
+        a logging object
+    include_results : List[str]; default=None -> all results
+        the results to load (e.g., ['displacements', 'cquad4_stress',
+        'chexa_stress' or 'stress.chexa_stress'])
+    subcases : List[int]; default=None -> all subcases
+        the subcase ids to load
+    itimes : List[int]; default=None -> all time steps
+        the 0-based time step/mode/frequency indices to load
+    node_ids : List[int]; default=None -> all nodes
+        the nodes to load for the nodal results (e.g., displacements)
+    element_ids : List[int]; default=None -> all elements
+        the elements to load for the element results (e.g., stress)
+
+    Only the selected time steps and rows of the chunked data arrays are
+    read, so a few elements can be loaded from a large file.
+    """
     check_path(hdf5_filename, 'hdf5_filename')
     model = OP2(log=log)
     model.op2_filename = hdf5_filename
 
-    log.info(f'hdf5_op2_filename = {hdf5_filename!r}')
+    model.log.info(f'hdf5_op2_filename = {hdf5_filename!r}')
     debug = False
     with h5py.File(hdf5_filename, 'r') as h5_file:
-        load_op2_from_hdf5_file(model, h5_file, log, debug=debug)
+        load_op2_from_hdf5_file(model, h5_file, model.log, debug=debug,
+                                include_results=include_results, subcases=subcases,
+                                itimes=itimes, node_ids=node_ids, element_ids=element_ids)
     model.combine_results(combine=combine)
     return model
 
 def load_op2_from_hdf5_file(model: OP2, h5_file,
-                            log: SimpleLogger, debug=False):
-    """loads an h5 file object into an OP2 object"""
+                            log: SimpleLogger, debug=False,
+                            include_results: Optional[List[str]]=None,
+                            subcases: Optional[List[int]]=None,
+                            itimes: Optional[List[int]]=None,
+                            node_ids: Optional[List[int]]=None,
+                            element_ids: Optional[List[int]]=None):
+    """
+    loads an h5 file object into an OP2 object
+
+    See ``load_op2_from_hdf5_filename`` for the result/subcase/time
+    step/node/element selection.
+    """
     encoding = 'latin1'
+    if isinstance(include_results, str):
+        include_results = [include_results]
+    if subcases is not None:
+        subcases = set(np.atleast_1d(subcases).tolist())
+    if itimes is not None:
+        # h5py requires increasing indices
+        itimes = np.unique(np.atleast_1d(itimes))
+    if node_ids is not None:
+        node_ids = np.atleast_1d(node_ids)
+    if element_ids is not None:
+        element_ids = np.atleast_1d(element_ids)
+
     for key in h5_file.keys():
         if key.startswith('Subcase'):
             h5_subcase = h5_file.get(key)
             #log.debug('subcase:')
             for result_name in h5_subcase.keys():
                 assert isinstance(result_name, str), f'result_name={result_name}; type={type(result_name)}'
+                if (include_results is not None and result_name not in include_results and
+                        result_name.split('.')[-1] not in include_results):
+                    continue
 
                 if result_name in ['eigenvalues', 'eigenvalues_fluid']:
                     #log.warning('    skipping %r...' % result_name)
@@ -1432,8 +1857,12 @@ def load_op2_from_hdf5_file(model: OP2, h5_file,
                         log.warning(f'  skipping {result_name}...')
                         continue
                     assert isinstance(objs, tuple), f'check that {result_name!r} is tuple in the above dictionary'
+                    if subcases is not None and _cast(h5_result.get('isubcase')) not in subcases:
+                        continue
                     obj = _load_table(result_name, h5_result, objs,
-                                      encoding, log=log, debug=debug)
+                                      encoding, log=log, debug=debug,
+                                      itimes=itimes, node_ids=node_ids,
+                                      element_ids=element_ids)
                     if obj is None:
                         continue
 
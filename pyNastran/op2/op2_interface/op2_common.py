@@ -54,6 +54,41 @@ class OP2Common(Op2Codes, F06Writer):
         #: 2 -   second pass
         self.read_mode = None
 
+        #: size and fill each table before moving on to the next one
+        #: (see ``OP2.read_op2(single_pass=True)``)
+        self._single_pass = False
+        #: the table 4 records that the sizing pass of a single pass read,
+        #: so the filling pass doesn't reread/refilter them (keyed by file position)
+        self._single_pass_records = {}
+        #: an object that was built by an earlier table was resized
+        self._single_pass_conflict = False
+        #: the number of tables that were sized and filled by the single pass
+        self._nfilled_tables = 0
+
+        #: load/build the table of contents, so excluded subcases can be
+        #: seeked past (see ``OP2.read_op2(use_index=True)``)
+        self._use_index = False
+        #: the OP2Index for the op2 that is being read
+        self._op2_index = None
+        #: memory map the op2 (see ``OP2.read_op2(use_mmap=True)``)
+        self._use_mmap = False
+
+        #: the LazyResults for a lazy read (see ``OP2.read_op2(lazy=True)``)
+        self._lazy_results = None
+        #: the byte offsets of the subtables to decode when a lazy result
+        #: is accessed; the other subtables are seeked past
+        self._lazy_subtables = None
+        #: the reader state at the start of each table from the lazy read
+        #: (see ``LazyResults.table_states``)
+        self._lazy_table_states = None
+        #: the byte offset of the subtable that is being read
+        self._subtable_n0 = None
+
+        #: profile the next read (see ``set_read_profile``)
+        self._is_read_profile = False
+        #: the ReadProfile of the read; None if the read isn't profiled
+        self._read_profile = None
+
         # Cross valdation flag so we can write:
         #   >>> modelA = OP2()
         #   >>> modelA.read_op2(op2_filename)
@@ -1035,8 +1070,8 @@ class OP2Common(Op2Codes, F06Writer):
             nids = ints[:, 0] // 10
             assert nids.min() > 0, nids.min()
             obj.node_gridtype[obj.itotal:itotal2, 0] = nids
-            obj.node_gridtype[obj.itotal:itotal2, 1] = ints[:, 1].copy()
-            obj.data[obj.itime, obj.itotal:itotal2, 0] = floats[:, 2].copy()
+            obj.node_gridtype[obj.itotal:itotal2, 1] = ints[:, 1]
+            obj.data[obj.itime, obj.itotal:itotal2, 0] = floats[:, 2]
             if np.abs(floats[:, 1:]).max() != 0:
                 msg = '%s is not a scalar result...do you have p-elements?\n' % (
                     obj.__class__.__name__)
@@ -1091,10 +1126,10 @@ class OP2Common(Op2Codes, F06Writer):
                 nids = ints[:, 0] // 10
                 assert nids.min() > 0, nids.min()
                 obj.node_gridtype[itotal:itotal2, 0] = nids
-                obj.node_gridtype[itotal:itotal2, 1] = ints[:, 1].copy()
+                obj.node_gridtype[itotal:itotal2, 1] = ints[:, 1]
 
             floats = np.frombuffer(data, dtype=self.fdtype).reshape(nnodes, 8)
-            obj.data[obj.itime, obj.itotal:itotal2, 0] = floats[:, 2].copy()
+            obj.data[obj.itime, obj.itotal:itotal2, 0] = floats[:, 2]
             assert np.abs(floats[:, 3:]).max() == 0, '%s is not a scalar result...' % obj.__class__.__name__
             obj._times[itime] = dt
             obj.itotal = itotal2
@@ -1128,22 +1163,23 @@ class OP2Common(Op2Codes, F06Writer):
         #assert self.obj is not None
 
         obj = self.obj
-        if self.use_vector and is_vectorized and 0:  # TODO: not done....
+        ntotal = 32 * self.factor # 32=4*8
+        if self.use_vector and is_vectorized:
+            # itime - the node number
+            # itotal - the time/frequency step
             itime = obj.itime
-            n = nnodes * 4 * 8
+            n = nnodes * ntotal
             itotal = obj.itotal
             itotal2 = itotal + nnodes
-            if obj.itime == 0:
-                ints = np.frombuffer(data, dtype=self.idtype).reshape(nnodes, 8)
-                #nids = ints[:, 0] // 10
-                nids = np.ones(nnodes, dtype='int32') * eid
-                assert nids.min() > 0, nids.min()
-                obj.node_gridtype[itotal:itotal2, 0] = nids
-                obj.node_gridtype[itotal:itotal2, 1] = ints[:, 1].copy()
 
-            floats = np.frombuffer(data, dtype=self.fdtype).reshape(nnodes, 8).copy()
-            obj._times[itime] = floats[:, 0]
-            obj.data[obj.itime, itotal:itotal2, :] = floats[:, 2]
+            floats = np.frombuffer(data, dtype=self.fdtype8).reshape(nnodes, 8)
+            ints = np.frombuffer(data, dtype=self.idtype8).reshape(nnodes, 8)
+
+            self._set_sort2_time(obj, self._analysis_code_fmt, ints, floats)
+            assert eid > 0, self.code_information()
+            obj.node_gridtype[itime, 0] = eid
+            obj.node_gridtype[itime, 1] = ints[0, 1]
+            obj.data[itotal:itotal2, itime, 0] = floats[:, 2]
             assert np.abs(floats[:, 3:]).max() == 0, '%s is not a scalar result...' % obj.__class__.__name__
             obj.itotal = itotal2
         else:
@@ -1192,8 +1228,8 @@ class OP2Common(Op2Codes, F06Writer):
             nids = ints[:, 0] // 10
             assert nids.min() > 0, nids.min()
             obj.node_gridtype[obj.itotal:itotal2, 0] = nids
-            obj.node_gridtype[obj.itotal:itotal2, 1] = ints[:, 1].copy()
-            obj.data[obj.itime, obj.itotal:itotal2, :] = floats[:, 2:].copy()
+            obj.node_gridtype[obj.itotal:itotal2, 1] = ints[:, 1]
+            obj.data[obj.itime, obj.itotal:itotal2, :] = floats[:, 2:]
             obj.itotal = itotal2
         else:
             n = read_real_table_static(self, obj, flag,
@@ -1230,10 +1266,10 @@ class OP2Common(Op2Codes, F06Writer):
                 nids = ints[:, 0] // 10
                 assert nids.min() > 0, nids.min()
                 obj.node_gridtype[itotal:itotal2, 0] = nids
-                obj.node_gridtype[itotal:itotal2, 1] = ints[:, 1].copy()
+                obj.node_gridtype[itotal:itotal2, 1] = ints[:, 1]
 
             floats = np.frombuffer(data, dtype=self.fdtype8).reshape(nnodes, 8)
-            obj.data[obj.itime, obj.itotal:itotal2, :] = floats[:, 2:].copy()
+            obj.data[obj.itime, obj.itotal:itotal2, :] = floats[:, 2:]
             obj._times[itime] = dt
             obj.itotal = itotal2
         else:
@@ -1276,7 +1312,7 @@ class OP2Common(Op2Codes, F06Writer):
                     #times = floats[:, 0]
                 #obj._times = times
             obj.node_gridtype[itime, 0] = nid
-            obj.node_gridtype[itime, 1] = ints[0, 1].copy()
+            obj.node_gridtype[itime, 1] = ints[0, 1]
             obj.data[itotal:itotal2, obj.itime, :] = floats[:, 2:]
             obj.itotal = itotal2
         else:
@@ -1295,7 +1331,62 @@ class OP2Common(Op2Codes, F06Writer):
             else:
                 assert analysis_code_fmt == b'f'
                 times = floats[:, 0]
-            obj._times = times
+            # don't hold a reference to the record
+            obj._times = times.copy()
+
+    def _set_sort2_element(self, obj, data: bytes, nrows: int) -> Tuple[int, int, int]:
+        """
+        Sets the times and element id of a SORT2 element result (e.g., OEF2)
+
+        A SORT2 subtable has a single element (obj.itime) and the rows are
+        the time steps, so the data is written straight into the SORT1
+        ordered array as ``obj.data[itime:itime2, ielement, :]``.
+
+        Parameters
+        ----------
+        obj : ScalarObject
+            the result, which was built with the times/elements flipped
+        data : bytes
+            the record
+        nrows : int
+            the number of time steps in the record
+
+        Returns
+        -------
+        ielement : int
+            the element index
+        itime / itime2 : int
+            the first/last+1 time step index of the record
+
+        """
+        ielement, itime, itime2 = self._set_sort2_times(obj, data, nrows)
+        eid = self.nonlinear_factor
+        assert eid > 0, self.code_information()
+        obj.element[ielement] = eid
+        return ielement, itime, itime2
+
+    def _set_sort2_times(self, obj, data: bytes, nrows: int) -> Tuple[int, int, int]:
+        """
+        Sets the times of a SORT2 element result
+
+        This is the part of ``_set_sort2_element`` that is shared with the
+        results that use an element_node/element_layer array (e.g., OES2
+        plates and solids), which set their ids themselves.
+
+        """
+        ielement = obj.itime
+        itime = obj.ielement
+        itime2 = itime + nrows
+        if ielement == 0:
+            if self._analysis_code_fmt == b'i':
+                dtype = self.idtype8
+            else:
+                assert self._analysis_code_fmt == b'f', self._analysis_code_fmt
+                dtype = self.fdtype8
+            times = np.frombuffer(data, dtype=dtype).reshape(nrows, self.num_wide)[:, 0]
+            obj._times[itime:itime2] = times
+        obj.ielement = itime2
+        return ielement, itime, itime2
 
     def _read_complex_table_sort1_mag(self, data, is_vectorized, nnodes, result_name, flag):
         if self.is_debug_file:
@@ -1441,7 +1532,7 @@ class OP2Common(Op2Codes, F06Writer):
 
             self._set_sort2_time(obj, self._analysis_code_fmt, ints, floats)
             obj.node_gridtype[itime, 0] = node_id
-            obj.node_gridtype[itime, 1] = ints[0, 1].copy()
+            obj.node_gridtype[itime, 1] = ints[0, 1]
 
             mag = floats[:, 2:8]
             phase = floats[:, 8:]
@@ -1483,7 +1574,7 @@ class OP2Common(Op2Codes, F06Writer):
 
             self._set_sort2_time(obj, self._analysis_code_fmt, ints, floats)
             obj.node_gridtype[itime, 0] = node_id
-            obj.node_gridtype[itime, 1] = ints[0, 1].copy()
+            obj.node_gridtype[itime, 1] = ints[0, 1]
 
             real = floats[:, 2:8]
             imag = floats[:, 8:]
@@ -1549,6 +1640,9 @@ class OP2Common(Op2Codes, F06Writer):
         if hasattr(self, 'isubcase'):
             if self.code in storage_obj:
                 self.obj = storage_obj[code]
+                if self._single_pass and self.read_mode == 1 and getattr(self.obj, 'is_built', False):
+                    # an earlier table already filled this object, so it can't be resized
+                    self._single_pass_conflict = True
                 if self.nonlinear_factor not in (None, np.nan):
                     if self.obj.nonlinear_factor in (None, np.nan):
                         msg = (
@@ -1591,6 +1685,8 @@ class OP2Common(Op2Codes, F06Writer):
                 self.obj = class_obj(self.data_code, is_sort1, self.isubcase, self.nonlinear_factor)
                 assert self.obj.table_name is not None, self.obj.data_code
             storage_obj[code] = self.obj
+            if self._lazy_results is not None and self.read_mode == 1:
+                self._lazy_results.add_subtable(self.obj, result_name, code, self._subtable_n0)
             #assert self.obj.table_name is not None
         else:
             if code in storage_obj:
@@ -1599,6 +1695,15 @@ class OP2Common(Op2Codes, F06Writer):
                 storage_obj[code] = self.obj
         assert self.obj.table_name is not None, f'apply the data_code...{self.data_code}'
 
+    def _is_lazy_subtable(self) -> bool:
+        """
+        In read_mode=2, the table 4 data of a lazy result (see
+        ``OP2.read_op2(lazy=True)``) isn't decoded until it's accessed
+        """
+        if self._lazy_results is None:
+            return False
+        return self._lazy_results.is_lazy_subtable(self._subtable_n0, self._op2_index)
+
     def _get_code(self):
         """
         The code is a the way you access something like self.displacements.
@@ -2021,7 +2126,7 @@ class OP2Common(Op2Codes, F06Writer):
                 self.code = self._get_code()
                 self.obj = slot[self.code]
                 #self.obj.update_data_code(self.data_code)
-                build_obj(self.obj)
+                build_obj(self.obj, self.result_dtype, self.id_dtype)
         else:  # not vectorized
             self.result_names.add(result_name)
             if self.read_mode == 1:
@@ -2047,7 +2152,7 @@ class OP2Common(Op2Codes, F06Writer):
             self.code = self._get_code()
             self.obj = slot[self.code]
             #self.obj.update_data_code(self.data_code)
-            build_obj(self.obj)
+            build_obj(self.obj, self.result_dtype, self.id_dtype)
         else:
             auto_return = True
         return auto_return
@@ -2131,7 +2236,7 @@ class OP2Common(Op2Codes, F06Writer):
 
                 #obj.update_data_code(self.data_code)
                 try:
-                    build_obj(self.obj)
+                    build_obj(self.obj, self.result_dtype, self.id_dtype)
                 except AssertionError:
                     print(self.code)
                     print(self.code_information())
@@ -2227,7 +2332,7 @@ class OP2Common(Op2Codes, F06Writer):
 
                 #obj.update_data_code(self.data_code)
                 try:
-                    build_obj(self.obj)
+                    build_obj(self.obj, self.result_dtype, self.id_dtype)
                 except AssertionError:
                     print(self.code)
                     print(self.code_information())
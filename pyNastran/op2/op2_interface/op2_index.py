@@ -0,0 +1,200 @@
+"""
+Defines the OP2 table of contents (index), which stores the byte offsets of:
+  - the tables (e.g., OUGV1, OES1X1)
+  - the subtables (a table 3 header and the table 4 data records after it)
+  - the data records
+
+The index is saved to a sidecar file (e.g., fem.op2.idx) and is reused
+as long as the size and modification time of the op2 are unchanged.
+
+"""
+from __future__ import annotations
+import os
+import json
+from math import isclose
+from pathlib import PurePath
+from typing import List, Dict, Tuple, Optional, Union, Any
+
+#: the version of the sidecar file; bump it when the layout changes
+INDEX_VERSION = 1
+
+
+def get_index_filename(op2_filename: Union[str, PurePath]) -> str:
+    """gets the sidecar filename (e.g., fem.op2 -> fem.op2.idx)"""
+    return f'{op2_filename}.idx'
+
+
+class OP2Index:
+    """
+    The table of contents of an OP2
+
+    Each table is a dictionary of::
+
+        table = {
+            'table_name' : 'OUGV1',
+            'n0' : 1024,     # the byte offset of the table name
+            'n1' : 8192,     # the byte offset of the next table
+            'records' : [[n0, ndata], ...],  # the start of the record; the number of bytes
+            'subtables' : [subtable, ...],
+        }
+
+    and each subtable is a table 3 header and the table 4 records after it::
+
+        subtable = {
+            'isubcase' : 1,
+            'table_code' : 1,
+            'analysis_code' : 2,
+            'time' : 3,      # the mode/time/frequency/load step
+            'irecord' : 0,   # the index of the table 3 record
+            'nrecords' : 2,  # the table 3 record and the table 4 records
+            'n0' : 2048,     # the byte offset of the table 3 record
+            'n1' : 4096,     # the byte offset after the last table 4 record
+        }
+
+    Geometry tables and matrices don't have subtables.
+
+    """
+    def __init__(self, op2_filename: str, nbytes: int, mtime_ns: int,
+                 tables: List[Dict[str, Any]]):
+        """
+        Creates an OP2Index
+
+        Parameters
+        ----------
+        op2_filename : str
+            the op2 that was indexed
+        nbytes : int
+            the size of the op2
+        mtime_ns : int
+            the modification time of the op2 in nanoseconds
+        tables : List[Dict[str, Any]]
+            the tables in the order they are in the op2
+
+        """
+        self.op2_filename = op2_filename
+        self.nbytes = nbytes
+        self.mtime_ns = mtime_ns
+        self.tables = tables
+
+    @classmethod
+    def from_tables(cls, op2_filename: str, tables: List[Dict[str, Any]]) -> OP2Index:
+        """creates an index for the current state of the op2"""
+        stat = os.stat(op2_filename)
+        return OP2Index(op2_filename, stat.st_size, stat.st_mtime_ns, tables)
+
+    def is_valid(self, op2_filename: Optional[str]=None) -> bool:
+        """is the index up to date with the op2?"""
+        if op2_filename is None:
+            op2_filename = self.op2_filename
+        if not os.path.exists(op2_filename):
+            return False
+        stat = os.stat(op2_filename)
+        return stat.st_size == self.nbytes and stat.st_mtime_ns == self.mtime_ns
+
+    def save(self, index_filename: Optional[str]=None) -> str:
+        """
+        Saves the index to a json sidecar file
+
+        Parameters
+        ----------
+        index_filename : str; default=None -> <op2_filename>.idx
+            the path to the index file
+
+        Returns
+        -------
+        index_filename : str
+            the path to the index file
+
+        """
+        if index_filename is None:
+            index_filename = get_index_filename(self.op2_filename)
+        data = {
+            'version' : INDEX_VERSION,
+            'op2_filename' : os.path.basename(self.op2_filename),
+            'nbytes' : self.nbytes,
+            'mtime_ns' : self.mtime_ns,
+            'tables' : self.tables,
+        }
+        with open(index_filename, 'w') as index_file:
+            json.dump(data, index_file)
+        return index_filename
+
+    @classmethod
+    def load(cls, op2_filename: str, index_filename: Optional[str]=None) -> Optional[OP2Index]:
+        """
+        Loads the index for an op2
+
+        Parameters
+        ----------
+        op2_filename : str
+            the op2 that was indexed
+        index_filename : str; default=None -> <op2_filename>.idx
+            the path to the index file
+
+        Returns
+        -------
+        index : OP2Index / None
+            None : the index doesn't exist, is from an older version
+                   or the op2 has changed since it was indexed
+
+        """
+        if index_filename is None:
+            index_filename = get_index_filename(op2_filename)
+        if not os.path.exists(index_filename):
+            return None
+        try:
+            with open(index_filename, 'r') as index_file:
+                data = json.load(index_file)
+        except (OSError, ValueError):
+            return None
+
+        if data.get('version') != INDEX_VERSION:
+            return None
+        index = OP2Index(op2_filename, data['nbytes'], data['mtime_ns'], data['tables'])
+        if not index.is_valid():
+            return None
+        return index
+
+    def get_table_names(self) -> List[str]:
+        """gets the table names in the order they are in the op2"""
+        return [table['table_name'] for table in self.tables]
+
+    def get_subtables(self, table_name: Optional[str]=None,
+                      isubcase: Optional[int]=None,
+                      time: Optional[float]=None) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Finds the subtables (e.g., OES1X subcase 14, mode 37)
+
+        Parameters
+        ----------
+        table_name : str; default=None -> all tables
+            the table name (e.g., 'OES1X')
+        isubcase : int; default=None -> all subcases
+            the subcase id
+        time : float; default=None -> all times
+            the mode/time/frequency/load step
+
+        Returns
+        -------
+        subtables : List[(table_name, subtable)]
+            the matching subtables; see ``OP2Index``
+
+        """
+        subtables = []
+        for table in self.tables:
+            if table_name is not None and table['table_name'] != table_name:
+                continue
+            for subtable in table['subtables']:
+                if isubcase is not None and subtable['isubcase'] != isubcase:
+                    continue
+                if time is not None and not isclose(subtable['time'], time, rel_tol=1e-6):
+                    continue
+                subtables.append((table['table_name'], subtable))
+        return subtables
+
+    def __repr__(self) -> str:
+        msg = f'OP2Index(op2_filename={self.op2_filename!r}, ntables={len(self.tables)})\n'
+        for table in self.tables:
+            msg += (f'  {table["table_name"]:<8s} n0={table["n0"]} n1={table["n1"]} '
+                    f'nrecords={len(table["records"])} nsubtables={len(table["subtables"])}\n')
+        return msg
@@ -0,0 +1,312 @@
+"""
+Defines the lazy results, which are used by ``OP2.read_op2(lazy=True)``.
+
+A lazy read sizes the result objects (read_mode=1), so the headers
+(e.g., data_code, the modes/times/frequencies, ntimes, nelements) are
+available, but the table 4 records aren't decoded.  Instead, the byte
+offsets of the subtables that make up each result are stored.
+
+The first time an array (e.g., data, node_gridtype, element) of a lazy
+result is accessed, only those subtables are reread and decoded; the
+reader seeks straight to them with the index and restores the state
+that the other tables set (see ``table_states``).  The
+least recently decoded results are evicted once the decoded arrays
+exceed ``max_nbytes`` and are decoded again if they're accessed later.
+
+"""
+from __future__ import annotations
+from collections import OrderedDict, defaultdict
+from typing import List, Set, Tuple, Optional, Any, TYPE_CHECKING
+
+import numpy as np
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.op2.op2_interface.op2_index import OP2Index
+
+#: the default cap on the decoded arrays (1 GB)
+LAZY_MAX_NBYTES = 1024 ** 3
+
+#: the arrays that are initialized to None by some results; they're
+#: removed from a lazy result, so they're decoded on first access
+LAZY_ARRAY_NAMES = [
+    'data', '_times', 'element', 'element_node', 'element_layer',
+    'node_element', 'element_type', 'location', 'xxb',
+]
+
+
+class LazyResults:
+    """
+    Tracks the results of a lazy read and the least recently decoded
+    results that are resident in memory
+    """
+    def __init__(self, model_class: Any, op2_filename: str,
+                 mode: Optional[str], log: Any,
+                 max_nbytes: int=LAZY_MAX_NBYTES,
+                 use_mmap: bool=False,
+                 valid_element_ids: Optional[np.ndarray]=None,
+                 valid_node_ids: Optional[np.ndarray]=None,
+                 result_dtype: Optional[np.dtype]=None,
+                 id_dtype: Optional[np.dtype]=None):
+        """
+        Creates a LazyResults
+
+        Parameters
+        ----------
+        model_class : OP2
+            the class that rereads the subtables
+        op2_filename : str
+            the op2 that was read
+        mode : str / None
+            the Nastran format (e.g., 'msc', 'nx'); None -> guess
+        log : SimpleLogger
+            the logger
+        max_nbytes : int; default=LAZY_MAX_NBYTES
+            the cap on the size of the decoded arrays
+        use_mmap : bool; default=False
+            memory map the op2 when the subtables are reread
+        valid_element_ids / valid_node_ids : (n, ) int ndarray; default=None -> all
+            the element/node ids that were read (see ``set_element_ids``)
+        result_dtype / id_dtype : np.dtype; default=None -> the op2 precision
+            the precision of the result data/id arrays
+
+        """
+        self.model_class = model_class
+        self.op2_filename = op2_filename
+        self.mode = mode
+        self.log = log
+        self.max_nbytes = max_nbytes
+        self.use_mmap = use_mmap
+        self.valid_element_ids = valid_element_ids
+        self.valid_node_ids = valid_node_ids
+        self.result_dtype = result_dtype
+        self.id_dtype = id_dtype
+        self.index = None  # type: Optional[OP2Index]
+
+        #: id(obj) : (obj, result_name, code, subtable_n0s)
+        self.results = {}
+
+        #: subtable_n0 : the id(obj) of the results in the subtable
+        self.subtables = defaultdict(set)
+
+        #: table_n0 : (count, nastran_format); the reader state at the start
+        #: of each table, so the other tables don't need to be read
+        self.table_states = {}
+
+        #: id(obj) : the attribute names from the headers
+        self.header_keys = {}
+
+        #: id(obj) : nbytes; the decoded results from oldest to newest
+        self.loaded = OrderedDict()  # type: OrderedDict[int, int]
+        self.nbytes = 0
+
+        #: the subtables that aren't decoded in read_mode=2;
+        #: None -> they need to be found
+        self._lazy_subtables = None  # type: Optional[Set[int]]
+
+    def reset(self) -> None:
+        """clears out the results, so the op2 can be reread"""
+        self.results = {}
+        self.subtables = defaultdict(set)
+        self.table_states = {}
+        self._lazy_subtables = None
+
+    def add_subtable(self, obj: Any, result_name: str, code: Tuple,
+                     subtable_n0: Optional[int]) -> None:
+        """
+        Stores a subtable of a result (read_mode=1)
+
+        Parameters
+        ----------
+        obj : ScalarObject
+            the result
+        result_name : str
+            the result name (e.g., 'displacements', 'cquad4_stress')
+        code : Tuple
+            the key of the result in the result dictionary
+        subtable_n0 : int / None
+            the byte offset of the table 3 record
+            None : the result wasn't read from a standard subtable,
+                   so it can't be lazy
+
+        """
+        key = id(obj)
+        if key not in self.results:
+            self.results[key] = (obj, result_name, code, set())
+        self.results[key][3].add(subtable_n0)
+        self.subtables[subtable_n0].add(key)
+        self._lazy_subtables = None
+
+    def is_lazy_subtable(self, subtable_n0: Optional[int],
+                         index: Optional[OP2Index]) -> bool:
+        """
+        Can the table 4 data be skipped (read_mode=2)?
+
+        Parameters
+        ----------
+        subtable_n0 : int / None
+            the byte offset of the table 3 record
+        index : OP2Index / None
+            the table of contents; required to find the subtables again
+
+        """
+        if index is None or subtable_n0 is None:
+            return False
+        if self._lazy_subtables is None:
+            self.index = index
+            self._lazy_subtables = self._get_lazy_subtables(index)
+        return subtable_n0 in self._lazy_subtables
+
+    def _get_lazy_subtables(self, index: OP2Index) -> Set[int]:
+        """
+        Finds the subtables that only have lazy results.
+
+        A result can be lazy if all of its subtables are in the index and
+        it's SORT1 (SORT2 results are transposed when they're finalized).
+        If a subtable has a result that can't be lazy, the other results
+        in the subtable are decoded too, so they can't be lazy either.
+        """
+        indexed_n0s = {
+            subtable['n0']
+            for table in index.tables
+            for subtable in table['subtables']}
+        lazy_keys = {
+            key for key, (obj, unused_result_name, unused_code, n0s) in self.results.items()
+            if obj.is_sort1 and not obj.is_built and n0s.issubset(indexed_n0s)}
+
+        nlazy = -1
+        lazy_subtables = set()
+        while nlazy != len(lazy_keys):
+            nlazy = len(lazy_keys)
+            lazy_subtables = {
+                n0 for n0, keys in self.subtables.items()
+                if n0 is not None and keys.issubset(lazy_keys)}
+            lazy_keys = {
+                key for key in lazy_keys
+                if self.results[key][3].issubset(lazy_subtables)}
+        return lazy_subtables
+
+    def attach(self) -> int:
+        """
+        Sets up the lazy results once the op2 has been read
+
+        Each result is built, so the headers (e.g., ntotal) are the same
+        as a result that was decoded, and then the arrays are freed.
+
+        Returns
+        -------
+        nlazy : int
+            the number of lazy results
+
+        """
+        lazy_subtables = self._lazy_subtables
+        results = {}
+        if lazy_subtables:
+            for key, result in self.results.items():
+                obj, unused_result_name, unused_code, n0s = result
+                if obj.is_built or not n0s.issubset(lazy_subtables):
+                    continue
+                results[key] = result
+                self.header_keys[key] = self._build_header(obj)
+
+        self.results = results
+        self.subtables = defaultdict(set)
+        return len(results)
+
+    def _build_header(self, obj: Any) -> Set[str]:
+        """builds the result and frees the arrays, so only the headers are left"""
+        keys = {name for name, value in obj.__dict__.items()
+                if not (name in LAZY_ARRAY_NAMES and value is None)}
+        obj.build()
+        for name in list(obj.__dict__):
+            if name not in keys:
+                del obj.__dict__[name]
+        obj.is_built = False
+        obj._lazy_results = self
+        return set(obj.__dict__)
+
+    def load(self, obj: Any) -> None:
+        """
+        Decodes the arrays of a lazy result and evicts the least
+        recently decoded results if there's too much data in memory
+
+        Parameters
+        ----------
+        obj : ScalarObject
+            the result
+
+        """
+        key = id(obj)
+        if key in self.loaded:
+            self.loaded.move_to_end(key)
+            return
+
+        unused_obj, result_name, code, subtable_n0s = self.results[key]
+        model = self.model_class(debug=None, log=self.log, mode=self.mode)
+        model._lazy_subtables = subtable_n0s
+        model._lazy_table_states = self.table_states
+        model._op2_index = self.index
+        model.valid_element_ids = self.valid_element_ids
+        model.valid_node_ids = self.valid_node_ids
+        model._read_lazy_subtables(self.op2_filename, use_mmap=self.use_mmap,
+                                   result_dtype=self.result_dtype, id_dtype=self.id_dtype)
+        obj_decoded = model.get_result(result_name)[code]
+        obj.__dict__.update(obj_decoded.__dict__)
+
+        header_keys = self.header_keys[key]
+        nbytes = sum(value.nbytes for name, value in obj.__dict__.items()
+                     if name not in header_keys and isinstance(value, np.ndarray))
+        self.loaded[key] = nbytes
+        self.nbytes += nbytes
+        while self.nbytes > self.max_nbytes and len(self.loaded) > 1:
+            self.evict(next(iter(self.loaded)))
+
+    def evict(self, key: int) -> None:
+        """
+        Frees the decoded arrays of a lazy result
+
+        Parameters
+        ----------
+        key : int
+            id(obj)
+
+        """
+        self.nbytes -= self.loaded.pop(key)
+        obj = self.results[key][0]
+        header_keys = self.header_keys[key]
+        for name in list(obj.__dict__):
+            if name not in header_keys:
+                del obj.__dict__[name]
+        obj.is_built = False
+
+    def detach(self, obj: Any) -> None:
+        """
+        Decodes a lazy result and keeps it in memory (e.g., before it's
+        combined with another result)
+
+        Parameters
+        ----------
+        obj : ScalarObject
+            the result
+
+        """
+        key = id(obj)
+        if key not in self.results:
+            return
+        self.load(obj)
+        self.nbytes -= self.loaded.pop(key)
+        del self.results[key], self.header_keys[key]
+        del obj._lazy_results
+
+    def get_stats(self) -> List[str]:
+        """gets the number of lazy/decoded results and the decoded size"""
+        return [f'LazyResults: nresults={len(self.results)} nloaded={len(self.loaded)} '
+                f'nbytes={self.nbytes} max_nbytes={self.max_nbytes}\n']
+
+    def __repr__(self) -> str:
+        return ''.join(self.get_stats())
+
+
+def load_lazy_result(obj: Any) -> None:
+    """decodes a lazy result and keeps it in memory; does nothing for other results"""
+    lazy_results = obj.__dict__.get('_lazy_results')
+    if lazy_results is not None:
+        lazy_results.detach(obj)
@@ -0,0 +1,260 @@
+"""
+Defines the parallel decoding of the results, which is used by
+``OP2.read_op2(nprocs=N)``.
+
+The op2 is read lazily (see ``op2_lazy``), so the headers and the byte
+offsets of the subtables are known.  The subtables are then split up
+into groups of roughly the same size and each group is decoded in a
+worker process.  The arrays are sent back to the main process through
+shared memory and are merged into the results.
+
+"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Dict, Set, Tuple, Optional, Any, TYPE_CHECKING
+
+import numpy as np
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # pragma: no cover
+    # Python 3.7
+    shared_memory = None
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.op2.op2_interface.op2_index import OP2Index
+    from pyNastran.op2.op2_interface.op2_lazy import LazyResults
+
+
+def check_shared_memory() -> None:
+    """the worker processes send the arrays back with multiprocessing.shared_memory"""
+    if shared_memory is None:  # pragma: no cover
+        raise NotImplementedError('nprocs > 1 requires Python 3.8+ (multiprocessing.shared_memory)')
+
+
+def decode_lazy_results(lazy_results: LazyResults, nprocs: int) -> int:
+    """
+    Decodes all the lazy results in worker processes and detaches them,
+    so they're regular results
+
+    Parameters
+    ----------
+    lazy_results : LazyResults
+        the lazy results from the read
+    nprocs : int
+        the number of worker processes
+
+    Returns
+    -------
+    nresults : int
+        the number of results that were decoded
+
+    """
+    results = lazy_results.results
+    if not results:
+        return 0
+
+    groups = _get_groups(results, lazy_results.index, nprocs)
+    jobs = []
+    for subtable_n0s, keys in groups:
+        requests = [(key, results[key][1], results[key][2]) for key in keys]
+        jobs.append((lazy_results.model_class, lazy_results.op2_filename,
+                     lazy_results.mode, lazy_results.index,
+                     lazy_results.table_states, subtable_n0s,
+                     requests, lazy_results.use_mmap,
+                     lazy_results.valid_element_ids, lazy_results.valid_node_ids,
+                     lazy_results.result_dtype, lazy_results.id_dtype))
+
+    nworkers = min(nprocs, len(jobs))
+    with ProcessPoolExecutor(max_workers=nworkers) as executor:
+        futures = [executor.submit(_decode_subtables, job) for job in jobs]
+        merged = set()
+        try:
+            for future in as_completed(futures):
+                decoded = future.result()
+                merged.add(future)
+                _merge_decoded(results, decoded)
+        finally:
+            # an error leaves the shared memory of the results that weren't merged
+            for future in futures:
+                if future in merged or future.cancel():
+                    continue
+                try:
+                    decoded = future.result()
+                except Exception:
+                    continue
+                _free_decoded(decoded)
+
+    nresults = len(results)
+    lazy_results.results = {}
+    lazy_results.header_keys = {}
+    return nresults
+
+
+def _merge_decoded(results: Dict[int, Tuple[Any, str, Tuple, Set[int]]],
+                   decoded: List[Tuple[int, Dict[str, Any], List[Tuple[str, str, Tuple[int, ...], str]]]],
+                   ) -> None:
+    """copies the decoded arrays of a worker into the lazy results"""
+    # the shared memory is freed before the results are updated
+    try:
+        decoded = [(key, obj_dict, _from_shared_memory(shared_arrays))
+                   for key, obj_dict, shared_arrays in decoded]
+    except Exception:
+        _free_decoded(decoded)
+        raise
+
+    for key, obj_dict, arrays in decoded:
+        obj_dict.update(arrays)
+        obj = results[key][0]
+        obj.__dict__.update(obj_dict)
+        del obj._lazy_results
+
+
+def _free_decoded(decoded: List[Tuple[int, Dict[str, Any], List[Tuple[str, str, Tuple[int, ...], str]]]],
+                  ) -> None:
+    """frees the shared memory blocks of the decoded arrays of a worker"""
+    for unused_key, unused_obj_dict, shared_arrays in decoded:
+        _free_shared_memory(shared_arrays)
+
+
+def _get_groups(results: Dict[int, Tuple[Any, str, Tuple, Set[int]]],
+                index: OP2Index,
+                nprocs: int) -> List[Tuple[Set[int], List[int]]]:
+    """
+    Splits the results into nprocs groups with about the same number of
+    bytes.  Results that share a subtable are in the same group.
+
+    Returns
+    -------
+    groups : List[(subtable_n0s, keys)]
+        subtable_n0s : Set[int]
+            the byte offsets of the subtables to decode
+        keys : List[int]
+            id(obj) for the results in the group
+
+    """
+    subtable_nbytes = {
+        subtable['n0']: subtable['n1'] - subtable['n0']
+        for table in index.tables
+        for subtable in table['subtables']}
+
+    # results that share a subtable have to be decoded together
+    components = []  # type: List[Tuple[Set[int], List[int]]]
+    component_by_n0 = {}  # type: Dict[int, int]
+    for key, (unused_obj, unused_result_name, unused_code, n0s) in results.items():
+        icomponents = {component_by_n0[n0] for n0 in n0s if n0 in component_by_n0}
+        n0s_new = set(n0s)
+        keys_new = [key]
+        for icomponent in icomponents:
+            n0s_old, keys_old = components[icomponent]
+            n0s_new.update(n0s_old)
+            keys_new.extend(keys_old)
+            components[icomponent] = (set(), [])
+        components.append((n0s_new, keys_new))
+        for n0 in n0s_new:
+            component_by_n0[n0] = len(components) - 1
+    components = [component for component in components if component[1]]
+
+    # biggest first into the group with the fewest bytes
+    components.sort(key=lambda component: -sum(subtable_nbytes[n0] for n0 in component[0]))
+    ngroups = min(nprocs, len(components))
+    groups = [(set(), []) for unused_i in range(ngroups)]  # type: List[Tuple[Set[int], List[int]]]
+    nbytes = [0] * ngroups
+    for n0s, keys in components:
+        igroup = nbytes.index(min(nbytes))
+        groups[igroup][0].update(n0s)
+        groups[igroup][1].extend(keys)
+        nbytes[igroup] += sum(subtable_nbytes[n0] for n0 in n0s)
+    return groups
+
+
+def _decode_subtables(job: Tuple[Any, str, Optional[str], OP2Index,
+                                 Dict[int, Tuple[int, Optional[str]]], Set[int],
+                                 List[Tuple[int, str, Tuple]], bool,
+                                 Optional[np.ndarray], Optional[np.ndarray],
+                                 Optional[np.dtype], Optional[np.dtype]],
+                      ) -> List[Tuple[int, Dict[str, Any], List[Tuple[str, str, Tuple[int, ...], str]]]]:
+    """
+    Decodes a group of subtables (in a worker process)
+
+    Returns
+    -------
+    decoded : List[(key, obj_dict, shared_arrays)]
+        key : int
+            id(obj) in the main process
+        obj_dict : Dict[str, Any]
+            the attributes of the result that aren't numpy arrays
+        shared_arrays : List[(name, shm_name, shape, dtype)]
+            the numpy arrays, which are in shared memory
+
+    """
+    (model_class, op2_filename, mode, index, table_states, subtable_n0s, requests,
+     use_mmap, valid_element_ids, valid_node_ids, result_dtype, id_dtype) = job
+    model = model_class(debug=None, mode=mode)
+    model._lazy_subtables = subtable_n0s
+    model._lazy_table_states = table_states
+    model._op2_index = index
+    model.valid_element_ids = valid_element_ids
+    model.valid_node_ids = valid_node_ids
+    model._read_lazy_subtables(op2_filename, use_mmap=use_mmap,
+                               result_dtype=result_dtype, id_dtype=id_dtype)
+
+    decoded = []
+    for key, result_name, code in requests:
+        obj = model.get_result(result_name)[code]
+        obj_dict = {}
+        arrays = {}
+        for name, value in obj.__dict__.items():
+            if isinstance(value, np.ndarray) and value.dtype != object:
+                arrays[name] = value
+            else:
+                obj_dict[name] = value
+        decoded.append((key, obj_dict, _to_shared_memory(arrays)))
+    return decoded
+
+
+def _to_shared_memory(arrays: Dict[str, np.ndarray]) -> List[Tuple[str, str, Tuple[int, ...], str]]:
+    """copies the arrays into shared memory blocks, which are freed by the main process"""
+    shared_arrays = []
+    try:
+        for name, array in arrays.items():
+            shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            shared_arrays.append((name, shm.name, array.shape, array.dtype.str))
+            try:
+                shared_array = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+                shared_array[...] = array
+                del shared_array
+            finally:
+                shm.close()
+    except Exception:
+        _free_shared_memory(shared_arrays)
+        raise
+    return shared_arrays
+
+
+def _from_shared_memory(shared_arrays: List[Tuple[str, str, Tuple[int, ...], str]]) -> Dict[str, np.ndarray]:
+    """copies the arrays out of the shared memory blocks and frees the blocks"""
+    arrays = {}
+    try:
+        for name, shm_name, shape, dtype in shared_arrays:
+            shm = shared_memory.SharedMemory(name=shm_name)
+            try:
+                arrays[name] = np.ndarray(shape, dtype=dtype, buffer=shm.buf).copy()
+            finally:
+                shm.close()
+                shm.unlink()
+    except Exception:
+        # the blocks that weren't copied
+        _free_shared_memory(shared_arrays)
+        raise
+    return arrays
+
+
+def _free_shared_memory(shared_arrays: List[Tuple[str, str, Tuple[int, ...], str]]) -> None:
+    """frees the shared memory blocks of arrays that won't be copied out"""
+    for unused_name, shm_name, unused_shape, unused_dtype in shared_arrays:
+        try:
+            shm = shared_memory.SharedMemory(name=shm_name)
+        except FileNotFoundError:
+            # already freed
+            continue
+        shm.close()
+        shm.unlink()
@@ -46,11 +46,12 @@ import os
 import sys
 from copy import deepcopy
 from itertools import count
+from time import perf_counter
 from struct import unpack, Struct # , error as struct_error
-from typing import Tuple, Optional, Callable, TYPE_CHECKING
+from typing import Tuple, List, Dict, Union, Optional, Callable, Any, TYPE_CHECKING
 
 import numpy as np
-import scipy  # type: ignore
+import scipy.sparse  # type: ignore
 
 from cpylog import SimpleLogger
 from pyNastran.utils.numpy_utils import integer_types
@@ -105,6 +106,8 @@ DENSE_MATRICES = [
     b'MEFMASS', b'MEFWTS', b'MPFACS', b'RBMASSS',
 
 ]
+#: the size of the column blocks used to fill a memory-mapped dense matrix
+DENSE_MATRIX_BLOCK_NBYTES = 100 * 1024 ** 2
 OPTISTRUCT_VERSIONS = [
     b'OS11XXXX', b'OS12.210', b'OS14.210',
     b'OS2017.1', b'OS2017.2',
@@ -131,6 +134,15 @@ class OP2Reader:
         # deck could crash.
         self._dump_deck = False
 
+        #: the subtables of the current table that are skipped using the OP2 index
+        #: {n0 : (n1, nrecords)}
+        self.subtable_skips = {}
+
+        #: a memoryview of the memory mapped op2 (see ``read_op2(use_mmap=True)``)
+        self.mmap_view = None
+        #: should the blocks be returned as slices of mmap_view
+        self._return_views = False
+
         self.op2 = op2  # type: OP2
 
         self.mapped_tables = {
@@ -1642,28 +1654,17 @@ class OP2Reader:
 
         self.read_3_markers([-2, 1, 0])
         marker = -3
-        if self.read_mode == 1 or op2.make_geom is False:
+        # the records still need to be walked the same way when we skip
+        # the table, so we don't end up in the middle of a record
+        is_skipped = self.read_mode == 1 or op2.make_geom is False
+        if is_skipped:
             if self.read_mode == 1 and op2.make_geom is False:
                 self.log.warning('reading the EXTRN tables requires the read_op2_geom')
             data = self._skip_record()
-            while 1:
-                #print('====================')
-                #print(f'***reading {marker}')
-                try:
-                    self.read_markers([marker, 1])
-                except FortranMarkerError:
-                    #op2.show_ndata(100)
-                    raise
-                nfields = self.get_marker1(rewind=True)
-                if nfields == 0:
-                    break
-                data, ndata = self._read_record_ndata()
-            return
-
-        # drop XSOP2DIR and PVT0
-        iextdb = op2.table_count[b'EXTDB'] + 0
-        xsop2dir_name = self.xsop2dir_names[iextdb]
-        if self.read_mode == 2:
+        else:
+            # drop XSOP2DIR and PVT0
+            iextdb = op2.table_count[b'EXTDB'] + 0
+            xsop2dir_name = self.xsop2dir_names[iextdb]
             data, ndata = self._read_record_ndata()
             name = ''
             name1 = ''
@@ -1758,8 +1759,10 @@ class OP2Reader:
                 break
             # ----------------------------------------------------------------------
 
-            data, ndata = self._read_record_ndata()
-            if self.read_mode == 2:
+            if is_skipped:
+                self._skip_record()
+            else:
+                data, ndata = self._read_record_ndata()
                 if name not in ['GEOM1', 'GEOM2', 'GEOM2X', 'IGEOM2X', 'GEOM4', 'EXTDB']:
                     if ndata != 12:
                         self.log.warning(f'--B; ndata={ndata}--')
@@ -2840,6 +2843,8 @@ class OP2Reader:
                 #self._skip_record()
             else:
                 self._skip_record()
+                if op2._single_pass and responses.convergence_data.is_built:
+                    op2._single_pass_conflict = True
                 responses.convergence_data.n += 1
 
             self.read_markers([-4, 1, 0, 0])
@@ -4086,9 +4091,14 @@ class OP2Reader:
         niter = 0
         niter_max = 100000000
 
-        GCi = []
-        GCj = []
-        reals = []
+        # Each string is a (first row, values) block of a column.  The
+        # values are kept as numpy views of the blocks; only the
+        # (column, first row, nterms) of each string is stored per string.
+        int_dtype, value_dtype = self._get_matrix_string_dtypes(tout)
+        string_cols = []
+        string_rows = []
+        string_nterms = []
+        string_values = []
         jj = 1
         while niter < niter_max:
             #nvalues = self.get_marker1(rewind=True)
@@ -4100,49 +4110,36 @@ class OP2Reader:
 
                 while nvalues >= 0:
                     nvalues = self.get_marker1(rewind=False)
-                    fmt, unused_nfloats, nterms = self._get_matrix_row_fmt_nterms_nfloats(
+                    unused_fmt, nfloats, nterms = self._get_matrix_row_fmt_nterms_nfloats(
                         nvalues, tout)
-                    GCjj = [jj] * nterms
-                    GCj += GCjj
 
                     #-----------
                     data = self.read_block()
-                    if self.size == 8:
-                        #self.log.warning('skipping matrix')
-                        #self.show_data(data, types='ifqd')
-                        fmt = mapfmt(fmt, self.size)
-                        #self.log.warning(fmt)
-                        #print('***itable=%s nvalues=%s fmt=%r' % (itable, nvalues, fmt))
-                        #continue
-                    out = unpack(fmt, data)
-                    #print(out)
-                    ii = out[0]
-                    values = out[1:]
-
-                    #list(range(2, 10))
-                    #[2, 3, 4, 5, 6, 7, 8, 9]
-                    GCii = list(range(ii, ii + nterms))
-                    GCi += GCii
-                    reals += values
+                    ii = int(np.frombuffer(data, dtype=int_dtype, count=1)[0])
+                    values = np.frombuffer(data, dtype=value_dtype, offset=self.size)
+                    assert len(values) == nfloats, 'tout=%s nfloats=%s nvalues=%s' % (
+                        tout, nfloats, len(values))
+
+                    string_cols.append(jj)
+                    string_rows.append(ii)
+                    string_nterms.append(nterms)
+                    string_values.append(values)
                     nvalues = self.get_marker1(rewind=True)
                     if self.debug_file:
-                        self.binary_debug.write('  GCi = %s\n' % GCii)
-                        self.binary_debug.write('  GCj = %s\n' % GCjj)
-                        self.binary_debug.write('  reals/imags = %s\n' % str(values))
-                assert len(GCi) == len(GCj), 'nGCi=%s nGCj=%s' % (len(GCi), len(GCj))
-                if self.size == 4:
-                    if tout in [1, 2]:
-                        assert len(GCi) == len(reals), 'tout=%s nGCi=%s nreals=%s' % (tout, len(GCi), len(reals))
-                    else:
-                        assert len(GCi)*2 == len(reals), 'tout=%s nGCi=%s nreals=%s' % (tout, len(GCi)*2, len(reals))
+                        self.binary_debug.write('  GCi = %s\n' % list(range(ii, ii + nterms)))
+                        self.binary_debug.write('  GCj = %s\n' % ([jj] * nterms))
+                        self.binary_debug.write('  reals/imags = %s\n' % values.tolist())
                 jj += 1
             else:
                 nvalues = self.get_marker1(rewind=False)
                 assert nvalues == 0, nvalues
 
+                GCi, GCj, reals = _get_matrix_coo_arrays(
+                    string_cols, string_rows, string_nterms, string_values)
+                del string_values
                 matrix = self._cast_matrix_mat(GCi, GCj, mrows, ncols, reals, tout, dtype)
-                if table_name in DENSE_MATRICES:
-                    matrix = matrix.toarray()
+                if table_name in DENSE_MATRICES and matrix is not None:
+                    matrix = self._to_dense_matrix(table_name, matrix)
                 m.data = matrix
                 if matrix is not None:
                     op2.matrices[table_name.decode('utf-8')] = m
@@ -4152,39 +4149,53 @@ class OP2Reader:
             niter += 1
         raise RuntimeError('MaxIteration: this should never happen; n=%s' % niter_max)
 
+    def _get_matrix_string_dtypes(self, tout: int) -> Tuple[np.dtype, np.dtype]:
+        """gets the dtypes of the first row and the values of a matrix string"""
+        endian = self._endian.decode('latin1')
+        if self.size == 8:
+            return np.dtype(endian + 'i8'), np.dtype(endian + 'f8')
+        if tout in [1, 3]:
+            value_dtype = np.dtype(endian + 'f4')
+        elif tout in [2, 4]:
+            value_dtype = np.dtype(endian + 'f8')
+        else:
+            raise RuntimeError('tout = %s' % tout)
+        return np.dtype(endian + 'i4'), value_dtype
+
     def _cast_matrix_mat(self, GCi, GCj, mrows, ncols, reals, tout, dtype):
-        """helper method for _read_matrix_mat"""
-        op2 = self.op2
-        #assert max(GCi) <= mrows, 'GCi=%s GCj=%s mrows=%s' % (GCi, GCj, mrows)
-        #assert max(GCj) <= ncols, 'GCi=%s GCj=%s ncols=%s' % (GCi, GCj, ncols)
+        """
+        helper method for _read_matrix_mat
+
+        Parameters
+        ----------
+        GCi / GCj : (nterms, ) int ndarray
+            the 0-based rows/columns; the columns are sorted
+        reals : (nfloats, ) float ndarray
+            the values; complex values are (real, imag) pairs
 
-        # we subtract 1 to the indicides to account for Fortran
-        GCi = np.array(GCi, dtype='int32') - 1
-        GCj = np.array(GCj, dtype='int32') - 1
+        """
+        op2 = self.op2
         try:
             if dtype == '???':
                 matrix = None
                 self.log.warning('what is the dtype?')
             elif tout in [1, 2]:
                 # real
-                real_array = np.array(reals, dtype=dtype)
-                matrix = scipy.sparse.coo_matrix(
-                    (real_array, (GCi, GCj)),
-                    shape=(mrows, ncols), dtype=dtype)
+                real_array = reals.astype(dtype)
+                matrix = _build_csc_matrix(real_array, GCi, GCj, mrows, ncols)
                 #self.log.info('created %s (real)' % self.table_name)
             elif tout in [3, 4]:
                 # complex
-                real_array = np.array(reals, dtype=dtype)
-                nvalues_matrix = real_array.shape[0] // 2
-                real_complex = real_array.reshape((nvalues_matrix, 2))
-                real_imag = real_complex[:, 0] + real_complex[:, 1]*1j
+                nvalues_matrix = reals.shape[0] // 2
+                real_complex = reals.reshape((nvalues_matrix, 2))
+                real_imag = np.empty(nvalues_matrix, dtype=dtype)
+                real_imag.real = real_complex[:, 0]
+                real_imag.imag = real_complex[:, 1]
                 if self.binary_debug:
                     #self.binary_debug.write('reals = %s' % real_complex[:, 0])
                     #self.binary_debug.write('imags = %s' % real_complex[:, 1])
                     self.binary_debug.write('real_imag = %s' % real_imag)
-                matrix = scipy.sparse.coo_matrix(
-                    (real_imag, (GCi, GCj)),
-                    shape=(mrows, ncols), dtype=dtype)
+                matrix = _build_csc_matrix(real_imag, GCi, GCj, mrows, ncols)
                 #msg = 'created %s (complex)' % self.table_name
                 #self.log.debug(msg)
                 #raise RuntimeError(msg)
@@ -4192,13 +4203,13 @@ class OP2Reader:
                 raise RuntimeError('this should never happen')
         except ValueError:
             self.log.warning('shape=(%s, %s)' % (mrows, ncols))
-            self.log.warning('cant make a coo/sparse matrix...trying dense')
+            self.log.warning('cant make a csc/sparse matrix...trying dense')
 
             if dtype == '???':
                 matrix = None
                 self.log.warning('what is the dtype?')
             else:
-                real_array = np.array(reals, dtype=dtype)
+                real_array = reals.astype(dtype)
                 self.log.debug('shape=%s mrows=%s ncols=%s' % (
                     str(real_array.shape), mrows, ncols))
                 if len(reals) == mrows * ncols:
@@ -4211,6 +4222,38 @@ class OP2Reader:
                 matrix = real_array
         return matrix
 
+    def _to_dense_matrix(self, table_name: bytes, matrix):
+        """
+        Converts a sparse matrix to a dense matrix.  If
+        ``OP2.dense_matrix_dirname`` is set, the matrix is memory-mapped
+        to ``<dense_matrix_dirname>/<name>.npy``.
+        """
+        if not scipy.sparse.issparse(matrix):
+            # the sparse matrix couldn't be built
+            return matrix
+        dirname = self.op2.dense_matrix_dirname
+        if dirname is None:
+            return matrix.toarray()
+
+        if not os.path.exists(dirname):
+            os.makedirs(dirname)
+        npy_filename = os.path.join(dirname, table_name.decode('utf-8') + '.npy')
+        self.log.debug(f'memory-mapping {table_name.decode("utf-8")} to {npy_filename!r}')
+
+        mrows, ncols = matrix.shape
+        dense = np.lib.format.open_memmap(
+            npy_filename, mode='w+', dtype=matrix.dtype, shape=(mrows, ncols),
+            fortran_order=True)
+
+        # the columns are filled a block at a time, so the full dense
+        # matrix is never in RAM
+        matrix = matrix.tocsc()
+        ncols_block = max(1, DENSE_MATRIX_BLOCK_NBYTES // max(1, mrows * matrix.dtype.itemsize))
+        for icol in range(0, ncols, ncols_block):
+            dense[:, icol:icol+ncols_block] = matrix[:, icol:icol+ncols_block].toarray()
+        dense.flush()
+        return dense
+
     def _skip_matrix_mat(self):
         """
         Reads a matrix in "standard" form.
@@ -5042,6 +5085,21 @@ class OP2Reader:
 
         return record, nrecord
 
+    def _read_record_view(self) -> Tuple[Union[bytes, memoryview], int]:
+        """
+        Reads a record and the length of the record.  When the op2 is
+        memory mapped, a single block record is a memoryview of the file,
+        so no intermediate bytes object is created.  Records that are split
+        across multiple blocks are joined into bytes.
+        """
+        if self.mmap_view is None or self.is_debug_file:
+            return self._read_record_ndata()
+        self._return_views = True
+        try:
+            return self._read_record_ndata()
+        finally:
+            self._return_views = False
+
     def _read_block_ndata4(self):
         """
         Reads a block following a pattern of:
@@ -5059,8 +5117,13 @@ class OP2Reader:
         data = op2.f.read(4)
         ndata, = op2.struct_i.unpack(data)
 
-        data_out = op2.f.read(ndata)
-        data = op2.f.read(4)
+        if self._return_views:
+            n = op2.f.tell()
+            data_out = self.mmap_view[n:n+ndata]
+            op2.f.seek(n + ndata + 4)
+        else:
+            data_out = op2.f.read(ndata)
+            data = op2.f.read(4)
         op2.n += 8 + ndata
         return data_out, ndata
 
@@ -5098,8 +5161,13 @@ class OP2Reader:
         data = op2.f.read(4)
         ndata, = op2.struct_i.unpack(data)
 
-        data_out = op2.f.read(ndata)
-        data = op2.f.read(4)
+        if self._return_views:
+            n = op2.f.tell()
+            data_out = self.mmap_view[n:n+ndata]
+            op2.f.seek(n + ndata + 4)
+        else:
+            data_out = op2.f.read(ndata)
+            data = op2.f.read(4)
         op2.n += 8 + ndata
         return data_out, ndata
     #------------------------------------------------------------------
@@ -5505,6 +5573,138 @@ class OP2Reader:
             markers = self.get_nmarkers(1, rewind=True)
         self.read_markers([0])
 
+    def index_table(self, is_result: bool) -> Dict[str, Any]:
+        """
+        Walks the next table and stores the byte offsets of the records
+        for the OP2 index (see ``OP2Index``).
+
+        Parameters
+        ----------
+        is_result : bool
+            should the table 3 headers be parsed into subtables
+
+        Returns
+        -------
+        table : Dict[str, Any]
+            the table name, the table bounds, the records and subtables
+
+        """
+        op2 = self.op2
+        n0 = op2.f.tell()
+        table_name = self._read_table_name(rewind=False)
+        self.read_markers([-1])
+        unused_data = self._skip_record()
+        self.read_3_markers([-2, 1, 0])
+        unused_data = self._skip_record()
+
+        table3_len = 584 * self.factor
+        records = []
+        subtables = []
+        isubtable = -3
+        self.read_3_markers([isubtable, 1, 0])
+        markers = self.get_nmarkers(1, rewind=True)
+        while markers[0] != 0:
+            nrecord = op2.f.tell()
+            unused_data, ndata = self._skip_record_ndata(debug=False)
+            if is_result and ndata == table3_len:
+                self._goto(nrecord)
+                data = self._read_record(debug=False)
+                subtable = self._index_table3(data)
+                subtable['irecord'] = len(records)
+                subtable['nrecords'] = 0
+                subtable['n0'] = nrecord
+                subtables.append(subtable)
+
+            records.append([nrecord, ndata])
+            if subtables:
+                subtables[-1]['nrecords'] += 1
+                subtables[-1]['n1'] = op2.f.tell()
+            isubtable -= 1
+            self.read_3_markers([isubtable, 1, 0])
+            markers = self.get_nmarkers(1, rewind=True)
+        self.read_markers([0])
+
+        table = {
+            'table_name' : table_name.decode('latin1'),
+            'n0' : n0,
+            'n1' : op2.f.tell(),
+            'records' : records,
+            'subtables' : subtables,
+        }
+        return table
+
+    def index_matrix(self) -> Dict[str, Any]:
+        """
+        Walks the next matrix for the OP2 index (see ``OP2Index``).
+        Only the table bounds are stored for "standard" matrices.
+        """
+        op2 = self.op2
+        n0 = op2.f.tell()
+        try:
+            table_name = self._read_table_name(rewind=True)
+            self._skip_matrix_mat()  # doesn't work for matpools
+        except MemoryError:
+            raise
+        except(RuntimeError, AssertionError, ValueError):
+            self._goto(n0)
+            return self.index_table(is_result=False)
+
+        table = {
+            'table_name' : table_name.decode('latin1'),
+            'n0' : n0,
+            'n1' : op2.f.tell(),
+            'records' : [],
+            'subtables' : [],
+        }
+        return table
+
+    def index_nonstandard_table(self, skip_table: Callable) -> Dict[str, Any]:
+        """
+        Walks the next table for the OP2 index (see ``OP2Index``) using
+        a table specific method.  Only the table bounds are stored.
+
+        Parameters
+        ----------
+        skip_table : Callable
+            a method that walks the table without storing anything
+            (e.g., ``_skip_pcompts``)
+
+        """
+        op2 = self.op2
+        n0 = op2.f.tell()
+        table_name = self._read_table_name(rewind=True)
+        skip_table()
+        table = {
+            'table_name' : table_name.decode('latin1'),
+            'n0' : n0,
+            'n1' : op2.f.tell(),
+            'records' : [],
+            'subtables' : [],
+        }
+        return table
+
+    def _index_table3(self, data: bytes) -> Dict[str, Any]:
+        """parses the subcase and mode/time/frequency from a table 3 record"""
+        if self.size == 4:
+            approach_code, tcode, unused_int3, isubcase, itime = unpack(
+                self._endian + b'5i', data[:20])
+            ftime, = unpack(self._endian + b'f', data[16:20])
+        else:
+            approach_code, tcode, unused_int3, isubcase, itime = unpack(
+                self._endian + b'5q', data[:40])
+            ftime, = unpack(self._endian + b'd', data[32:40])
+
+        analysis_code = approach_code // 10
+        # frequency, transient, nonlinear statics
+        time = ftime if analysis_code in {5, 6, 10} else itime
+        subtable = {
+            'isubcase' : isubcase,
+            'table_code' : tcode % 1000,
+            'analysis_code' : analysis_code,
+            'time' : time,
+        }
+        return subtable
+
     def _skip_record(self):
         """
         the skip version of ``_read_record``
@@ -5897,6 +6097,7 @@ class OP2Reader:
 
         #nstart = op2.n
         op2.isubtable = -3
+        op2._subtable_n0 = None
         self.read_3_markers([-3, 1, 0])
         if self.is_debug_file:
             self.binary_debug.write(f'***isubtable = {op2.isubtable:d}\n')
@@ -5938,32 +6139,44 @@ class OP2Reader:
             self.binary_debug.write(f'---marker0 = {markers}---\n')
 
         # while the subtables aren't done
+        profile = op2._read_profile
         while markers[0] != 0:
             #print(markers)
             op2.is_start_of_subtable = True
             if self.is_debug_file:
                 self.binary_debug.write(f'***isubtable = {op2.isubtable:d}\n')
 
-            try:
-                self._read_subtable_3_4(table3_parser, table4_parser, passer)
-            except EmptyRecordError:
-                self.log.error('catching EmptyRecordError')
-                self.read_markers([1, 0], macro_rewind=False)
-                #n = op2.n
-                #try:
-                marker146 = self.get_marker1(rewind=True)
-                #except AssertionError:
-                    #self.log.debug('resetting n!')
-                    #op2.f.seek(n)
-                    #op2.n = n
-                    #raise
-                op2.isubtable -= 1
-                if marker146 == 146:
-                    continue
-                break
-            except Exception:  # pragma: no cover
-                print(f'failed reading {table_name} isubtable={op2.isubtable:d}')
-                raise
+            subtable_skip = self.subtable_skips.get(op2.f.tell())
+            if subtable_skip is not None:
+                # the index says this subcase wasn't requested,
+                # so jump over the table 3/4 records
+                n1, nrecords = subtable_skip
+                self._goto(n1)
+                op2.isubtable -= nrecords - 1
+            else:
+                try:
+                    if profile is None:
+                        self._read_subtable_3_4(table3_parser, table4_parser, passer)
+                    else:
+                        self._read_subtable_3_4_profile(table3_parser, table4_parser, passer)
+                except EmptyRecordError:
+                    self.log.error('catching EmptyRecordError')
+                    self.read_markers([1, 0], macro_rewind=False)
+                    #n = op2.n
+                    #try:
+                    marker146 = self.get_marker1(rewind=True)
+                    #except AssertionError:
+                        #self.log.debug('resetting n!')
+                        #op2.f.seek(n)
+                        #op2.n = n
+                        #raise
+                    op2.isubtable -= 1
+                    if marker146 == 146:
+                        continue
+                    break
+                except Exception:  # pragma: no cover
+                    print(f'failed reading {table_name} isubtable={op2.isubtable:d}')
+                    raise
             #force_table4 = self._read_subtable_3_4(table3_parser, table4_parser, passer)
             op2.isubtable -= 1
 
@@ -5995,10 +6208,43 @@ class OP2Reader:
             self.binary_debug.write(f'breaking on marker={markers}\n')
 
         # we've finished reading all subtables, but have one last marker to read
+        op2._subtable_n0 = None
         marker = self.get_marker1(rewind=False, macro_rewind=False)
         assert marker == 0, marker
         op2._finish()
 
+    def _read_subtable_3_4_profile(self,
+                                   table3_parser: Optional[Callable],
+                                   table4_parser: Optional[Callable],
+                                   passer: Optional[Callable]) -> None:
+        """
+        Reads a subtable 3/4 record and adds the time, bytes and decoded
+        values to the read profile (see ``OP2.set_read_profile``)
+        """
+        op2 = self.op2
+        t0 = perf_counter()
+        n0 = op2.f.tell()
+        record_len = self._get_record_length()
+        # a table 4 record belongs to the subcase of the table 3 record,
+        # but isubcase is deleted once the table 4 record is decoded
+        isubcase = getattr(op2, 'isubcase', None)
+        self._read_subtable_3_4(table3_parser, table4_parser, passer)
+
+        table_name = op2.table_name
+        is_geom = table_name in GEOM_TABLES
+        isubcase = None if is_geom else getattr(op2, 'isubcase', isubcase)
+        is_decoded = not passer and (
+            is_geom or op2.is_all_subcases or isubcase in op2.valid_subcases)
+        key = {
+            'table_name' : table_name.decode('latin1'),
+            'isubcase' : isubcase,
+            'read_mode' : self.read_mode,
+        }
+        op2._read_profile.add(
+            'subcases', key, nrecords=1, time=perf_counter() - t0,
+            nbytes=op2.f.tell() - n0,
+            nvalues=record_len // self.size if is_decoded else 0)
+
     def _read_subtable_3_4(self,
                            table3_parser: Optional[Callable],
                            table4_parser: Optional[Callable],
@@ -6029,6 +6275,7 @@ class OP2Reader:
         IS_TESTING = op2.IS_TESTING
         if self.binary_debug:
             self.binary_debug.write('-' * 60 + '\n')
+        n0 = op2.f.tell()
         # this is the length of the current record inside table3/table4
         record_len = self._get_record_length()
         if self.is_debug_file:
@@ -6039,6 +6286,8 @@ class OP2Reader:
         #print('record_len =', record_len)
         table_name = op2.table_name
         if record_len == 584 * factor:  # table3 has a length of 584
+            # the table 4 records belong to this subtable (for lazy results)
+            op2._subtable_n0 = n0
             if table_name in oes_nl and hasattr(op2, 'num_wide') and op2.num_wide == 146:
                 data_code_old = deepcopy(op2.data_code)
 
@@ -6060,6 +6309,12 @@ class OP2Reader:
                         self.binary_debug.write('except SortCodeError!\n')
                     if table_name in oes_nl:
                         update_op2_datacode(op2, data_code_old)
+                        valid_ids = op2._get_valid_ids(table4_parser)
+                        if valid_ids is not None:
+                            data, ndata = op2._filter_record_ids(data, ndata, valid_ids)
+                            if ndata == 0:
+                                return False
+                            record_len = ndata
 
                         n = table4_parser(data, ndata)
                         #print(data_code_old)
@@ -6281,6 +6536,64 @@ def get_table_size_from_ncolumns(table_name: str, nvalues: int, ncolumns: int) -
         raise RuntimeError(msg)
     return nrows
 
+def _get_matrix_coo_arrays(string_cols: List[int], string_rows: List[int],
+                           string_nterms: List[int], string_values: List[np.ndarray],
+                           ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Gets the row/column indices and the values of the strings of a matrix
+
+    Parameters
+    ----------
+    string_cols / string_rows : List[int]
+        the 1-based column/first row of each string
+    string_nterms : List[int]
+        the number of terms of each string
+    string_values : List[(nfloats, ) float ndarray]
+        the values of each string; complex values are (real, imag) pairs
+
+    Returns
+    -------
+    GCi / GCj : (nterms, ) int32 ndarray
+        the 0-based row/column of each term
+    reals : (nfloats, ) float ndarray
+        the values
+
+    """
+    nterms = np.array(string_nterms, dtype='int64')
+    nterms_total = nterms.sum()
+
+    # the offset of the first term of each string
+    istart = np.cumsum(nterms) - nterms
+    row0 = np.array(string_rows, dtype='int64') - 1 - istart
+    GCi = (np.repeat(row0, nterms) + np.arange(nterms_total)).astype('int32')
+    GCj = np.repeat(np.array(string_cols, dtype='int32') - 1, nterms)
+    if string_values:
+        reals = np.concatenate(string_values)
+    else:
+        reals = np.zeros(0, dtype='float64')
+    return GCi, GCj, reals
+
+
+def _build_csc_matrix(values: np.ndarray, irows: np.ndarray, jcols: np.ndarray,
+                      mrows: int, ncols: int) -> scipy.sparse.csc_matrix:
+    """
+    Builds a csc_matrix from the terms of a matrix, which are sorted by
+    column, without the COO -> CSC sort
+
+    Raises
+    ------
+    ValueError
+        an index is out of bounds
+    """
+    if len(irows) and (irows.min() < 0 or irows.max() >= mrows or
+                       jcols.min() < 0 or jcols.max() >= ncols):
+        raise ValueError('index exceeds matrix dimensions; shape=(%s, %s)' % (mrows, ncols))
+    assert len(jcols) < 2 or (np.diff(jcols) >= 0).all(), 'the columns are not sorted'
+    indptr = np.zeros(ncols + 1, dtype='int64')
+    np.cumsum(np.bincount(jcols, minlength=ncols), out=indptr[1:])
+    return scipy.sparse.csc_matrix((values, irows, indptr), shape=(mrows, ncols))
+
+
 def dscmcol_dresp1(responses: Dict[int, Dict[str, Any]],
                    nresponses_dresp1: int,
                    ints, floats) -> None:
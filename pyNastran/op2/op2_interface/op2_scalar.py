@@ -6,6 +6,8 @@ Defines the sub-OP2 class.  This should never be called outside of the OP2 class
 
    **Methods**
    - set_subcases(subcases=None)
+   - set_element_ids(element_ids=None)
+   - set_node_ids(node_ids=None)
    - set_transient_times(times)
    - read_op2(op2_filename=None, combine=False)
    - set_additional_generalized_tables_to_read(tables)
@@ -42,7 +44,9 @@ Defines the sub-OP2 class.  This should never be called outside of the OP2 class
 
 """
 import os
-from struct import Struct, unpack
+import mmap
+from time import perf_counter
+from struct import Struct, unpack, error as struct_error
 from collections import defaultdict
 from typing import List, Tuple, Dict, Set, Union, Optional, Any
 
@@ -60,8 +64,9 @@ else:  # pramga: no cover
 
 
 from pyNastran import is_release, __version__
+from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.f06.errors import FatalError
-from pyNastran.op2.errors import EmptyRecordError
+from pyNastran.op2.errors import EmptyRecordError, FortranMarkerError, SinglePassError
 from pyNastran.op2.op2_interface.op2_reader import OP2Reader, reshape_bytes_block
 from pyNastran.bdf.cards.params import PARAM
 
@@ -71,6 +76,7 @@ from pyNastran.op2.op2_interface.msc_tables import MSC_RESULT_TABLES, MSC_MATRIX
 from pyNastran.op2.op2_interface.nx_tables import NX_RESULT_TABLES, NX_MATRIX_TABLES, NX_GEOM_TABLES
 
 from pyNastran.op2.op2_interface.op2_common import OP2Common
+from pyNastran.op2.op2_interface.op2_index import OP2Index
 from pyNastran.op2.fortran_format import FortranFormat
 
 from pyNastran.utils import is_binary_file
@@ -564,6 +570,10 @@ class OP2_Scalar(OP2Common, FortranFormat):
         #: should a MATPOOL "symmetric" matrix be stored as symmetric
         #: it takes double the RAM, but is easier to use
         self.apply_symmetry = True
+
+        #: the directory to memory-map the dense matrices (e.g., KELM) to;
+        #: None keeps them in RAM
+        self.dense_matrix_dirname = None
         OP2Common.__init__(self)
 
         FortranFormat.__init__(self)
@@ -615,6 +625,84 @@ class OP2_Scalar(OP2Common, FortranFormat):
             self.valid_subcases = set(subcases)
         self.log.debug(f'set_subcases - subcases = {self.valid_subcases}')
 
+    def set_element_ids(self, element_ids=None):
+        """
+        Allows you to read only the elements in the list of element ids
+        for the stress/strain/force (OES/OSTR/OEF) tables.
+
+        The table 4 records are filtered before they're decoded, so the
+        result arrays are only sized for those elements.  SORT2 tables
+        aren't filtered.
+
+        Parameters
+        ----------
+        element_ids : List[int, ...] / Set[int] / int ndarray; default=None -> all elements
+            the element ids to read
+
+        """
+        self.valid_element_ids = _get_valid_ids(element_ids)
+        self.log.debug(f'set_element_ids - element_ids = {self.valid_element_ids}')
+
+    def set_node_ids(self, node_ids=None):
+        """
+        Allows you to read only the nodes in the list of node ids for the
+        displacement/eigenvector/spc force/mpc force/applied load
+        (OUG/OQG/OPG) tables.
+
+        The table 4 records are filtered before they're decoded, so the
+        result arrays are only sized for those nodes.  SORT2 tables
+        aren't filtered.
+
+        Parameters
+        ----------
+        node_ids : List[int, ...] / Set[int] / int ndarray; default=None -> all nodes
+            the node ids to read
+
+        """
+        self.valid_node_ids = _get_valid_ids(node_ids)
+        self.log.debug(f'set_node_ids - node_ids = {self.valid_node_ids}')
+
+    def set_read_profile(self, is_profile: bool=True) -> None:
+        """
+        Records the wall time, bytes read, records and decoded values of
+        each table/subcase when the op2 is read (see ``get_read_profile``)
+
+        Parameters
+        ----------
+        is_profile : bool; default=True
+            profile the read
+
+        """
+        self._is_read_profile = is_profile
+
+    def get_read_profile(self) -> Optional[Dict[str, Any]]:
+        """
+        Gets the profile of the last read (see ``set_read_profile``)
+
+        Returns
+        -------
+        profile : Dict[str, Any] / None
+            None : the read wasn't profiled
+            total_time : float
+                the wall time of read_op2 (sec)
+            phases : List[Dict[str, Any]]
+                the time spent reading the tables, finalizing the
+                results, building the dataframes, etc.
+            tables : List[Dict[str, Any]]
+                the time, bytes and number of tables for each
+                (table_name, read_mode); a repeated table is summed
+            subcases : List[Dict[str, Any]]
+                the time, bytes, records and decoded values (words)
+                for each (table_name, isubcase, read_mode); isubcase
+                is None for a geometry table
+
+        Each group can be loaded with ``pd.DataFrame(profile['tables'])``.
+        Tables that are read in parallel (``nprocs > 1``) aren't included.
+        """
+        if self._read_profile is None:
+            return None
+        return self._read_profile.to_dict()
+
     def set_transient_times(self, times):  # TODO this name sucks...
         """
         Takes a dictionary of list of times in a transient case and
@@ -1809,9 +1897,21 @@ class OP2_Scalar(OP2Common, FortranFormat):
                              'No tables exist...check for a license issue')
 
         self._make_tables()
+        if self.read_mode != 2 and self._lazy_subtables is None:
+            # a lazy result is decoded with the index from the lazy read
+            use_index = self._use_index or self._lazy_results is not None
+            self._op2_index = self._load_op2_index(table_name) if use_index else None
+
         table_names = []
+        if self._single_pass:
+            # the geometry readers count the repeated tables (e.g., EPT in SOL 200),
+            # so they see the tables that have been read so far
+            self.table_names = table_names
         try:
-            self._read_tables(table_name, table_names)
+            if self._lazy_subtables is not None:
+                self._read_lazy_tables(table_names)
+            else:
+                self._read_tables(table_name, table_names)
         except EmptyRecordError:
             self.show(500, types='ifs', endian=None, force=False)
             raise
@@ -1835,13 +1935,27 @@ class OP2_Scalar(OP2Common, FortranFormat):
             if self.f is not None:
                 # can happen if:
                 #  - is ascii file
-                self.f.close()
+                self._close_file()
             del self.binary_debug
             del self.f
             self._cleanup_data_members()
             self._cleanup_words()
             #self.op2_reader.h5_file.close()
 
+    def _close_file(self) -> None:
+        """closes the op2 file (or the memory map)"""
+        mmap_view = self.op2_reader.mmap_view
+        if mmap_view is not None:
+            mmap_view.release()
+            self.op2_reader.mmap_view = None
+        try:
+            self.f.close()
+        except BufferError:
+            # an array still references the memory map; it'll be
+            # unmapped when the array is garbage collected
+            self.log.warning('the op2 memory map is still in use and will '
+                             'be closed when it is no longer referenced')
+
     def _cleanup_words(self):
         """
         Remove internal parameters that are not useful and just clutter
@@ -1856,7 +1970,7 @@ class OP2_Scalar(OP2Common, FortranFormat):
             'element_name', 'sort_bits', 'code', 'n', 'use_vector', 'ask',
             'stress_bits', 'expected_times', 'table_code', 'sort_code',
             'is_all_subcases', 'num_wide', '_table_mapper', 'label',
-            'apply_symmetry',
+            'apply_symmetry', 'dense_matrix_dirname',
             'words', 'device_code', 'table_name', '_count', 'additional_matrices',
             # 350
             'data_names', '_close_op2',
@@ -1894,7 +2008,12 @@ class OP2_Scalar(OP2Common, FortranFormat):
         if not hasattr(self, 'f') or self.f is None:
             #: the OP2 file object
             op2_filename = self.op2_filename
-            self.f = open(op2_filename, 'rb')
+            if self._use_mmap:
+                with open(op2_filename, 'rb') as op2_file:
+                    self.f = mmap.mmap(op2_file.fileno(), 0, access=mmap.ACCESS_READ)
+                self.op2_reader.mmap_view = memoryview(self.f)
+            else:
+                self.f = open(op2_filename, 'rb')
             #: the endian in bytes
             self._endian = None
             #: the endian in unicode
@@ -1955,6 +2074,11 @@ class OP2_Scalar(OP2Common, FortranFormat):
         """
         op2_reader = self.op2_reader
         self.table_count = defaultdict(int)
+        index_tables = {}
+        if self._op2_index is not None:
+            index_tables = {table['n0']: table for table in self._op2_index.tables}
+
+        itable = 0
         while table_name is not None:
             self.table_count[table_name] += 1
             table_names.append(table_name)
@@ -1971,55 +2095,279 @@ class OP2_Scalar(OP2Common, FortranFormat):
                 #op2_reader._skip_table(table_name)
             #else:
             #print(table_name, table_name in op2_reader.mapped_tables)
-            if table_name in self.generalized_tables:
-                t0 = self.f.tell()
-                self.generalized_tables[table_name](self)
-                assert self.f.tell() != t0, 'the position was unchanged...'
-            elif table_name in op2_reader.mapped_tables:
-                t0 = self.f.tell()
-                op2_reader.mapped_tables[table_name]()
-                assert self.f.tell() != t0, 'the position was unchanged...'
-            elif table_name in GEOM_TABLES:
-                op2_reader.read_geom_table()  # DIT (agard)
-            elif table_name in MATRIX_TABLES:
-                op2_reader.read_matrix(table_name)
-            elif table_name in RESULT_TABLES:
-                op2_reader.read_results_table()
-            elif self.skip_undefined_matrices:
-                op2_reader.read_matrix(table_name)
-            elif table_name.strip() in self.additional_matrices:
-                op2_reader.read_matrix(table_name)
+            n0 = self.f.tell()
+            if self._lazy_results is not None:
+                # the lazy results are decoded without reading the other tables
+                self._lazy_results.table_states[n0] = (self._count, self._nastran_format)
+            op2_reader.subtable_skips = self._get_subtable_skips(index_tables.get(n0))
+            if op2_reader.subtable_skips is None:
+                # the index says none of the requested subcases are in the table
+                op2_reader._goto(index_tables[n0]['n1'])
+                if self._single_pass:
+                    self._nfilled_tables += 1
+            elif self._single_pass:
+                self._read_table_single_pass(table_name)
+                self._nfilled_tables += 1
+            elif self.read_mode == 2 and itable < self._nfilled_tables:
+                # a failed single pass already read the geometry from this table
+                make_geom = self.make_geom
+                self.make_geom = False
+                try:
+                    self._read_table(table_name)
+                finally:
+                    self.make_geom = make_geom
             else:
-                #self.show(1000, types='ifsq')
-                msg = (
-                    f'Invalid Table = {table_name!r}\n\n'
-                    'If you have matrices that you want to read, see:\n'
-                    '  model.set_additional_matrices_to_read(matrices)\n'
-                    '  matrices = {\n'
-                    "      b'BHH' : True,\n"
-                    "      b'KHH' : False,\n"
-                    '  }  # you want to read some matrices, but not others\n'
-                    "  matrices = [b'BHH', b'KHH']  # assumes True\n\n"
-
-                    'If you the table is a geom/result table, see:\n'
-                    '  model.set_additional_result_tables_to_read(methods_dict)\n'
-                    "  methods_dict = {\n"
-                    "      b'OUGV1' : [method3, method4],\n"
-                    "      b'GEOM4SX' : [method3, method4],\n"
-                    "      b'OES1X1' : False,\n"
-                    '  }\n\n'
-
-                    'If you want to take control of the OP2 reader (mainly useful '
-                    'for obscure tables), see:\n'
-                    "  methods_dict = {\n"
-                    "      b'OUGV1' : [method],\n"
-                    '  }\n'
-                    '  model.set_additional_generalized_tables_to_read(methods_dict)\n'
-                )
-                raise NotImplementedError(msg)
+                self._read_table(table_name)
+            itable += 1
 
             table_name = op2_reader._read_table_name(last_table_name=table_name,
                                                      rewind=True, stop_on_failure=False)
+        op2_reader.subtable_skips = {}
+
+    def _read_lazy_tables(self, table_names: List[bytes]) -> None:
+        """
+        Reads the subtables of the lazy results (see ``OP2.read_op2(lazy=True)``)
+
+        Only the tables with a lazy subtable are read and the other
+        subtables are seeked past.  The state that the skipped tables set
+        (e.g., the DESCYC/R1TABRG design cycle count, PARAM,NXVER) is
+        restored from the lazy read.
+
+        Parameters
+        ----------
+        table_names : List[bytes str]
+            the table names that were read
+
+        """
+        op2_reader = self.op2_reader
+        self.table_count = defaultdict(int)
+        for table in self._op2_index.tables:
+            subtable_skips = self._get_subtable_skips(table)
+            if len(subtable_skips) == len(table['subtables']):
+                continue
+
+            table_name = table['table_name'].encode('latin1')
+            self.table_count[table_name] += 1
+            table_names.append(table_name)
+            self.table_name = table_name
+
+            self._count, nastran_format = self._lazy_table_states[table['n0']]
+            if nastran_format == 'nx' and not self.is_nx:
+                self.set_as_nx()
+            op2_reader._goto(table['n0'])
+            op2_reader.subtable_skips = subtable_skips
+            self._read_table(table_name)
+        op2_reader.subtable_skips = {}
+
+    def _get_subtable_skips(self, table: Optional[Dict[str, Any]]) -> Optional[Dict[int, Tuple[int, int]]]:
+        """
+        Finds the subtables that can be seeked past because their subcase
+        wasn't requested (see ``set_subcases``)
+
+        Parameters
+        ----------
+        table : Dict[str, Any] / None
+            the table from the OP2Index
+            None : the table wasn't indexed
+
+        Returns
+        -------
+        subtable_skips : Dict[int, Tuple[int, int]] / None
+            {n0 : (n1, nrecords)}
+            None : the whole table can be skipped
+
+        """
+        if table is not None and self._lazy_subtables is not None:
+            # only the subtables of a lazy result are decoded
+            return {
+                subtable['n0'] : (subtable['n1'], subtable['nrecords'])
+                for subtable in table['subtables']
+                if subtable['n0'] not in self._lazy_subtables}
+
+        if table is None or self.is_all_subcases:
+            return {}
+
+        subtables = table['subtables']
+        subtable_skips = {
+            subtable['n0'] : (subtable['n1'], subtable['nrecords'])
+            for subtable in subtables
+            if subtable['isubcase'] not in self.valid_subcases}
+        if subtables and len(subtable_skips) == len(subtables) and subtables[0]['irecord'] == 0:
+            return None
+        return subtable_skips
+
+    def _load_op2_index(self, table_name: bytes) -> Optional[OP2Index]:
+        """
+        Loads the OP2Index sidecar file or builds (and saves) it if the
+        op2 has changed since it was indexed
+
+        Parameters
+        ----------
+        table_name : bytes str
+            the first table's name
+
+        Returns
+        -------
+        index : OP2Index / None
+            None : the op2 couldn't be indexed
+
+        The sidecar file is only used for ``use_index=True``, so a lazy
+        read keeps the index in memory.
+        """
+        if self._use_index:
+            index = OP2Index.load(self.op2_filename)
+            if index is not None:
+                self.log.debug(f'loaded the op2 index for {self.op2_filename!r}')
+                return index
+
+        op2_reader = self.op2_reader
+        # tables that don't follow the standard record structure
+        # and are walked without storing anything
+        nonstandard_tables = {
+            b'PCOMPT' : op2_reader._skip_pcompts,
+            b'PCOMPTS' : op2_reader._skip_pcompts,
+            b'INTMOD' : op2_reader.read_intmod,
+            b'EXTDB' : op2_reader.read_extdb,
+        }
+        n0 = self.f.tell()
+        tables = []
+        try:
+            while table_name is not None:
+                if table_name in nonstandard_tables:
+                    table = op2_reader.index_nonstandard_table(nonstandard_tables[table_name])
+                elif table_name in MATRIX_TABLES:
+                    table = op2_reader.index_matrix()
+                else:
+                    table = op2_reader.index_table(is_result=table_name in RESULT_TABLES)
+                tables.append(table)
+                table_name = op2_reader._read_table_name(last_table_name=table_name,
+                                                         rewind=True, stop_on_failure=False)
+        except (FortranMarkerError, EmptyRecordError, struct_error,
+                RuntimeError, AssertionError, ValueError) as error:
+            self.log.warning(f'the op2 could not be indexed; table_name={table_name!r}\n{error}')
+            return None
+        finally:
+            op2_reader._goto(n0)
+
+        index = OP2Index.from_tables(self.op2_filename, tables)
+        if not self._use_index:
+            return index
+        try:
+            index.save()
+        except OSError as error:
+            self.log.warning(f'the op2 index could not be saved\n{error}')
+        return index
+
+    def _read_table_single_pass(self, table_name: bytes) -> None:
+        """
+        Sizes (read_mode=1) and then fills (read_mode=2) a single table
+        before moving on to the next one.
+
+        The arrays are sized from the table 3 headers and the record
+        lengths.  The table 4 records are read from the file once and are
+        kept, so the filling pass only rereads the headers and decodes
+        the kept records.
+
+        Parameters
+        ----------
+        table_name : bytes str
+            the table's name
+
+        """
+        n0 = self.f.tell()
+        self._single_pass_conflict = False
+        try:
+            self.read_mode = 1
+            self._read_table(table_name)
+            if self._single_pass_conflict:
+                raise SinglePassError(f'table_name={table_name!r} extends a result that '
+                                      'was filled by an earlier table')
+
+            self.op2_reader._goto(n0)
+            self.read_mode = 2
+            self._read_table(table_name)
+        finally:
+            self._single_pass_records = {}
+
+    def _read_table(self, table_name: bytes) -> None:
+        """
+        Reads a table and adds it to the read profile (see ``set_read_profile``)
+
+        Parameters
+        ----------
+        table_name : bytes str
+            the table's name
+
+        """
+        profile = self._read_profile
+        if profile is None:
+            self._read_table_by_type(table_name)
+            return
+
+        t0 = perf_counter()
+        n0 = self.f.tell()
+        self._read_table_by_type(table_name)
+        key = {'table_name' : table_name.decode('latin1'), 'read_mode' : self.read_mode}
+        profile.add('tables', key, ntables=1, time=perf_counter() - t0,
+                    nbytes=self.f.tell() - n0)
+
+    def _read_table_by_type(self, table_name: bytes) -> None:
+        """
+        Reads a geometry/result/matrix table using the current read_mode
+
+        Parameters
+        ----------
+        table_name : bytes str
+            the table's name
+
+        """
+        op2_reader = self.op2_reader
+        if table_name in self.generalized_tables:
+            t0 = self.f.tell()
+            self.generalized_tables[table_name](self)
+            assert self.f.tell() != t0, 'the position was unchanged...'
+        elif table_name in op2_reader.mapped_tables:
+            t0 = self.f.tell()
+            op2_reader.mapped_tables[table_name]()
+            assert self.f.tell() != t0, 'the position was unchanged...'
+        elif table_name in GEOM_TABLES:
+            op2_reader.read_geom_table()  # DIT (agard)
+        elif table_name in MATRIX_TABLES:
+            op2_reader.read_matrix(table_name)
+        elif table_name in RESULT_TABLES:
+            op2_reader.read_results_table()
+        elif self.skip_undefined_matrices:
+            op2_reader.read_matrix(table_name)
+        elif table_name.strip() in self.additional_matrices:
+            op2_reader.read_matrix(table_name)
+        else:
+            #self.show(1000, types='ifsq')
+            msg = (
+                f'Invalid Table = {table_name!r}\n\n'
+                'If you have matrices that you want to read, see:\n'
+                '  model.set_additional_matrices_to_read(matrices)\n'
+                '  matrices = {\n'
+                "      b'BHH' : True,\n"
+                "      b'KHH' : False,\n"
+                '  }  # you want to read some matrices, but not others\n'
+                "  matrices = [b'BHH', b'KHH']  # assumes True\n\n"
+
+                'If you the table is a geom/result table, see:\n'
+                '  model.set_additional_result_tables_to_read(methods_dict)\n'
+                "  methods_dict = {\n"
+                "      b'OUGV1' : [method3, method4],\n"
+                "      b'GEOM4SX' : [method3, method4],\n"
+                "      b'OES1X1' : False,\n"
+                '  }\n\n'
+
+                'If you want to take control of the OP2 reader (mainly useful '
+                'for obscure tables), see:\n'
+                "  methods_dict = {\n"
+                "      b'OUGV1' : [method],\n"
+                '  }\n'
+                '  model.set_additional_generalized_tables_to_read(methods_dict)\n'
+            )
+            raise NotImplementedError(msg)
 
     def set_additional_generalized_tables_to_read(self, tables):
         """
@@ -2285,6 +2633,14 @@ class OP2_Scalar(OP2Common, FortranFormat):
         del self.dof
         del self.word
 
+def _get_valid_ids(ids) -> Optional[np.ndarray]:
+    """gets the sorted element/node ids for ``set_element_ids``/``set_node_ids``"""
+    if ids is None:
+        return None
+    if isinstance(ids, integer_types):
+        ids = [ids]
+    return np.unique(np.asarray(list(ids), dtype='int64'))
+
 def main():  # pragma: no cover
     """testing pickling"""
     from pickle import dump, load
@@ -0,0 +1,293 @@
+"""
+Defines the OP2 snapshot, which is used by ``OP2.save_snapshot`` and
+``OP2.load_snapshot``.
+
+A snapshot is a directory of raw ``.npy`` arrays (e.g., data,
+element_node, _times) and a small JSON manifest (``snapshot.json``) of
+the other attributes (e.g., the data_code) of the results and matrices.
+Unlike pickling, the arrays aren't copied on load; they're memory-mapped,
+so reopening a processed model is fast regardless of its size.
+
+"""
+from __future__ import annotations
+import os
+import json
+import importlib
+from typing import Dict, Any, TYPE_CHECKING
+
+import numpy as np
+import scipy.sparse as sp
+
+import pyNastran
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.op2.op2 import OP2
+
+#: the name of the manifest file
+SNAPSHOT_MANIFEST = 'snapshot.json'
+SNAPSHOT_VERSION = 1
+
+#: the model attributes that are stored in the snapshot (besides the results)
+SNAPSHOT_MODEL_ATTRIBUTES = [
+    'op2_filename', 'title', 'date', 'isubcase_name_map', 'subcase_key',
+    'table_names', 'matrices', 'matdicts',
+]
+
+#: the object attributes that are rebuilt or don't make sense to store
+SNAPSHOT_SKIP_ATTRIBUTES = [
+    '_lazy_results', 'log', 'h5_file',
+    'dataframe', 'data_frame', '_data_frame', '_data_frame_source',
+    '_entity_index', '_entity_index_source',
+]
+
+
+def save_op2_snapshot(model: OP2, dirname: str) -> None:
+    """
+    Saves the results of an OP2 to a directory of ``.npy`` arrays and
+    a JSON manifest
+
+    Parameters
+    ----------
+    model : OP2
+        the model to save
+    dirname : str
+        the directory to write; it's created if it doesn't exist
+
+    """
+    os.makedirs(dirname, exist_ok=True)
+    writer = _SnapshotWriter(dirname)
+
+    results = {}
+    for result_name in model.get_table_types():
+        result = model.get_result(result_name)
+        if result is None or (isinstance(result, dict) and len(result) == 0):
+            continue
+        results[result_name] = writer.encode(result)
+
+    model_attributes = {}
+    for name in SNAPSHOT_MODEL_ATTRIBUTES:
+        model_attributes[name] = writer.encode(getattr(model, name, None))
+
+    manifest = {
+        'snapshot_version': SNAPSHOT_VERSION,
+        'pyNastran_version': pyNastran.__version__,
+        'nastran_format': model._nastran_format,
+        'model': model_attributes,
+        'results': results,
+    }
+    with open(os.path.join(dirname, SNAPSHOT_MANIFEST), 'w') as manifest_file:
+        json.dump(manifest, manifest_file, indent=1)
+    model.log.debug(f'saved {writer.narrays} arrays to {dirname!r}')
+
+
+def load_op2_snapshot(model: OP2, dirname: str, mmap: bool=True) -> None:
+    """
+    Loads the results of a snapshot into an OP2
+
+    Parameters
+    ----------
+    model : OP2
+        the model to load the results into
+    dirname : str
+        the directory that was written by ``save_op2_snapshot``
+    mmap : bool; default=True
+        True : the arrays are read-only memory maps of the ``.npy`` files
+        False : the arrays are read into memory
+
+    """
+    manifest_filename = os.path.join(dirname, SNAPSHOT_MANIFEST)
+    with open(manifest_filename, 'r') as manifest_file:
+        manifest = json.load(manifest_file)
+    if manifest['snapshot_version'] != SNAPSHOT_VERSION:
+        raise RuntimeError(f'snapshot_version={manifest["snapshot_version"]} is not supported; '
+                           f'expected {SNAPSHOT_VERSION}')
+
+    reader = _SnapshotReader(dirname, mmap=mmap)
+    nastran_format = manifest['nastran_format']
+    if nastran_format is not None:
+        model.set_mode(nastran_format)
+    for name, value in manifest['model'].items():
+        setattr(model, name, reader.decode(value))
+    for result_name, value in manifest['results'].items():
+        _set_result(model, result_name, reader.decode(value))
+
+    # the results are filled (see ``OP2.read_op2``)
+    model.read_mode = 2
+
+
+def _set_result(model: OP2, result_name: str, result: Any) -> None:
+    """setattr, but considers sub-objects (see ``OP2.get_result``)"""
+    if '.' in result_name:
+        obj_name, result_name = result_name.split('.')
+        storage_obj = getattr(model.op2_results, obj_name)
+    elif hasattr(model.op2_results, result_name):
+        # some of the model attributes are deprecated properties
+        storage_obj = model.op2_results
+    else:
+        storage_obj = model
+    setattr(storage_obj, result_name, result)
+
+
+class _SnapshotWriter:
+    """encodes a result as JSON and writes its arrays as .npy files"""
+    def __init__(self, dirname: str):
+        self.dirname = dirname
+        self.narrays = 0
+
+    def encode(self, value: Any) -> Any:
+        """converts a value into something json can write"""
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, os.PathLike):
+            return os.fspath(value)
+        if isinstance(value, complex):
+            return {'__type__': 'complex', 'value': [value.real, value.imag]}
+        if isinstance(value, np.ndarray):
+            return self._encode_array(value)
+        if isinstance(value, np.generic):
+            return {'__type__': 'scalar', 'dtype': value.dtype.str,
+                    'value': self.encode(value.item())}
+        if isinstance(value, np.dtype):
+            return {'__type__': 'dtype', 'dtype': value.str}
+        if isinstance(value, bytes):
+            return {'__type__': 'bytes', 'value': value.decode('latin1')}
+        if sp.issparse(value):
+            value = value.tocsc()
+            return {
+                '__type__': 'csc_matrix',
+                'shape': list(value.shape),
+                'data': self._encode_array(value.data),
+                'indices': self._encode_array(value.indices),
+                'indptr': self._encode_array(value.indptr),
+            }
+        if isinstance(value, tuple):
+            return {'__type__': 'tuple', 'items': [self.encode(item) for item in value]}
+        if isinstance(value, (set, frozenset)):
+            return {'__type__': 'set', 'items': [self.encode(item) for item in sorted(value)]}
+        if isinstance(value, dict):
+            return self._encode_dict(value)
+        if isinstance(value, list):
+            items = [self.encode(item) for item in value]
+            if type(value) is list:
+                return items
+            return {'__type__': 'list', 'class': _get_class_name(value),
+                    'items': items, 'attributes': self._encode_state(value)}
+        if hasattr(value, '__dict__'):
+            return {'__type__': 'object', 'class': _get_class_name(value),
+                    'attributes': self._encode_state(value)}
+        raise TypeError(f'type={type(value)} cannot be saved to a snapshot')
+
+    def _encode_dict(self, value: Dict[Any, Any]) -> Any:
+        """a dict with str keys is written as is; otherwise as pairs"""
+        if all(isinstance(key, str) for key in value) and '__type__' not in value:
+            return {key: self.encode(valuei) for key, valuei in value.items()}
+        return {'__type__': 'dict',
+                'items': [[self.encode(key), self.encode(valuei)]
+                          for key, valuei in value.items()]}
+
+    def _encode_state(self, obj: Any) -> Dict[str, Any]:
+        """encodes the attributes of an object"""
+        lazy_results = obj.__dict__.get('_lazy_results')
+        if lazy_results is not None:
+            lazy_results.load(obj)
+        state = obj.__getstate__() if hasattr(obj, '__getstate__') else obj.__dict__.copy()
+        if state is None:
+            state = {}
+        return {key: self.encode(valuei) for key, valuei in state.items()
+                if key not in SNAPSHOT_SKIP_ATTRIBUTES}
+
+    def _encode_array(self, array: np.ndarray) -> Dict[str, Any]:
+        """writes an array to <dirname>/<iarray>.npy"""
+        if array.dtype.hasobject:
+            return {'__type__': 'object_array', 'shape': list(array.shape),
+                    'items': [self.encode(item) for item in array.ravel().tolist()]}
+        filename = f'{self.narrays:06d}.npy'
+        self.narrays += 1
+        np.save(os.path.join(self.dirname, filename), np.asarray(array), allow_pickle=False)
+        out = {'__type__': 'ndarray', 'filename': filename}
+        if isinstance(array, np.chararray):
+            out['chararray'] = True
+        return out
+
+
+class _SnapshotReader:
+    """decodes the JSON of a snapshot and loads the .npy files"""
+    def __init__(self, dirname: str, mmap: bool=True):
+        self.dirname = dirname
+        self.mmap_mode = 'r' if mmap else None
+
+    def decode(self, value: Any) -> Any:
+        """the inverse of ``_SnapshotWriter.encode``"""
+        if isinstance(value, list):
+            return [self.decode(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+        if '__type__' not in value:
+            return {key: self.decode(valuei) for key, valuei in value.items()}
+
+        value_type = value['__type__']
+        if value_type == 'ndarray':
+            return self._load_array(value)
+        if value_type == 'dict':
+            return {self.decode(key): self.decode(valuei) for key, valuei in value['items']}
+        if value_type == 'tuple':
+            return tuple(self.decode(item) for item in value['items'])
+        if value_type == 'set':
+            return set(self.decode(item) for item in value['items'])
+        if value_type == 'scalar':
+            return np.dtype(value['dtype']).type(self.decode(value['value']))
+        if value_type == 'dtype':
+            return np.dtype(value['dtype'])
+        if value_type == 'bytes':
+            return value['value'].encode('latin1')
+        if value_type == 'complex':
+            real, imag = value['value']
+            return complex(real, imag)
+        if value_type == 'csc_matrix':
+            return sp.csc_matrix(
+                (self._load_array(value['data']), self._load_array(value['indices']),
+                 self._load_array(value['indptr'])), shape=tuple(value['shape']))
+        if value_type == 'object_array':
+            array = np.empty(len(value['items']), dtype='object')
+            array[:] = [self.decode(item) for item in value['items']]
+            return array.reshape(value['shape'])
+        if value_type == 'list':
+            obj = self._new(value['class'])
+            obj.extend(self.decode(item) for item in value['items'])
+            obj.__dict__.update(self.decode(value['attributes']))
+            return obj
+        if value_type == 'object':
+            obj = self._new(value['class'])
+            obj.__dict__.update(self.decode(value['attributes']))
+            return obj
+        raise NotImplementedError(f'__type__={value_type!r} is not supported')
+
+    def _load_array(self, value: Dict[str, Any]) -> np.ndarray:
+        """loads/memory-maps an array"""
+        filename = os.path.join(self.dirname, value['filename'])
+        try:
+            array = np.load(filename, mmap_mode=self.mmap_mode, allow_pickle=False)
+        except ValueError:
+            # an empty array can't be memory-mapped
+            array = np.load(filename, allow_pickle=False)
+        if value.get('chararray'):
+            array = array.view(np.chararray)
+        return array
+
+    @staticmethod
+    def _new(class_name: str) -> Any:
+        """creates a pyNastran object without calling __init__"""
+        module_name, qualname = class_name.split(':')
+        if module_name.split('.')[0] != 'pyNastran':
+            raise TypeError(f'class={class_name!r} is not a pyNastran class')
+        obj = importlib.import_module(module_name)
+        for name in qualname.split('.'):
+            obj = getattr(obj, name)
+        return obj.__new__(obj)
+
+
+def _get_class_name(obj: Any) -> str:
+    """gets the importable name of a pyNastran object (e.g., 'module:class')"""
+    cls = obj.__class__
+    if cls.__module__.split('.')[0] != 'pyNastran':
+        raise TypeError(f'type={cls} cannot be saved to a snapshot')
+    return f'{cls.__module__}:{cls.__qualname__}'
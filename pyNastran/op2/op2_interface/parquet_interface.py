@@ -0,0 +1,198 @@
+"""
+defines:
+ filenames = export_op2_to_parquet(directory, op2_model, results=None)
+
+Writes each result object to a columnar Parquet file, so the results can be
+queried with Spark/DuckDB/pyarrow without building a pandas DataFrame.
+
+Each file has one row group per time step and the columns:
+ - subcase
+ - time : the time/mode/frequency/load step
+ - the id columns (e.g., node_id/grid_type or element_id/node_id)
+ - one column per component (e.g., t1, ..., oxx, ...); complex results
+   have a <component>_real and <component>_imag column
+
+"""
+from __future__ import annotations
+import os
+import re
+from typing import List, Tuple, Optional, Any, TYPE_CHECKING
+
+import numpy as np
+from pyNastran.utils.numpy_utils import integer_types
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.op2.op2 import OP2
+
+#: the column names of each id array
+ID_COLUMNS = {
+    'node_gridtype': ['node_id', 'grid_type'],
+    'node_element': ['node_id', 'element_id'],
+    'element_node': ['element_id', 'node_id'],
+    'element_layer': ['element_id', 'layer'],
+    'element': ['element_id'],
+}
+SKIP_RESULTS = ['params', 'gpdt', 'bgpdt', 'eqexin', 'psds', 'monitor1', 'monitor3']
+
+
+def export_op2_to_parquet(directory: str, op2_model: OP2,
+                          results: Optional[List[str]]=None) -> List[str]:
+    """
+    Writes each result object to a Parquet file
+
+    Parameters
+    ----------
+    directory : str
+        the directory to write <result_name>_<subcase_key>.parquet to
+    op2_model : OP2
+        the model to export
+    results : List[str]; default=None -> all results
+        the results to export (e.g., ['displacements', 'cquad4_stress',
+        'chexa_stress' or 'stress.chexa_stress'])
+
+    Returns
+    -------
+    filenames : List[str]
+        the Parquet files that were written
+
+    The columns are written directly from the ``data`` and id arrays
+    (e.g., ``element_node``) one time step (row group) at a time, so a
+    result is never copied into a DataFrame.
+    """
+    import pyarrow.parquet as pq
+
+    if isinstance(results, str):
+        results = [results]
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    log = op2_model.log
+    filenames = []
+    for result_name in op2_model.get_table_types():
+        if result_name in SKIP_RESULTS or result_name.startswith('responses.'):
+            continue
+        if (results is not None and result_name not in results and
+                result_name.split('.')[-1] not in results):
+            continue
+        result = op2_model.get_result(result_name)
+        if not isinstance(result, dict):
+            continue
+
+        for key, obj in result.items():
+            id_array = _get_id_array(obj)
+            if id_array is None:
+                log.warning(f'parquet: skipping {result_name!r} ({obj.class_name})')
+                continue
+
+            parquet_filename = os.path.join(
+                directory, f'{result_name}_{_get_key_str(key)}.parquet')
+            writer = None
+            try:
+                for itime in range(obj.data.shape[0]):
+                    table = _get_time_step_table(obj, itime, *id_array)
+                    if writer is None:
+                        writer = pq.ParquetWriter(parquet_filename, table.schema)
+                    writer.write_table(table)
+            finally:
+                if writer is not None:
+                    writer.close()
+            filenames.append(parquet_filename)
+    return filenames
+
+
+def _get_key_str(key: Any) -> str:
+    """gets the filename-safe version of a result key"""
+    if isinstance(key, integer_types):
+        return str(key)
+    key_str = '_'.join(str(value) for value in key if value != '')
+    return re.sub(r'[^\w.-]', '', key_str.replace(' ', '_'))
+
+
+def _get_id_array(obj: Any) -> Optional[Tuple[str, np.ndarray, bool]]:
+    """
+    Gets the id array of the rows of the (ntimes, ntotal, ncomponents)
+    data array
+
+    Returns
+    -------
+    name : str
+        the name of the id array (e.g., 'element_node')
+    ids : (ntotal, ...) / (ntimes, ntotal, ...) int ndarray
+        the id array
+    is_time : bool
+        do the ids vary by time step (e.g., strain energy)?
+
+    Returns None if the result can't be written (e.g., it's not an array)
+    """
+    data = getattr(obj, 'data', None)
+    if not isinstance(data, np.ndarray) or data.ndim != 3:
+        return None
+    ntimes, ntotal = data.shape[:2]
+    for name, columns in ID_COLUMNS.items():
+        ids = getattr(obj, name, None)
+        if not isinstance(ids, np.ndarray):
+            continue
+        ndim = 1 if len(columns) == 1 else 2
+        if ids.ndim == ndim and ids.shape[0] == ntotal:
+            return name, ids, False
+        if ids.ndim == ndim + 1 and ids.shape[:2] == (ntimes, ntotal):
+            return name, ids, True
+    return None
+
+
+def _get_time_step_table(obj: Any, itime: int,
+                         id_name: str, ids: np.ndarray, is_time: bool):
+    """creates the pyarrow table of a time step"""
+    import pyarrow as pa
+
+    data = obj.data[itime, :, :]
+    ntotal, ncomponents = data.shape
+    columns = {}
+    columns['subcase'] = pa.array(np.full(ntotal, obj.isubcase, dtype='int32'))
+
+    times = getattr(obj, '_times', None)
+    time = None if times is None else times[itime]
+    if time is None or isinstance(time, (str, bytes)):
+        columns['time'] = pa.nulls(ntotal, type=pa.float64())
+    else:
+        columns['time'] = pa.array(np.full(ntotal, time))
+
+    if is_time:
+        ids = ids[itime]
+    id_columns = ID_COLUMNS[id_name]
+    if ids.ndim == 1:
+        columns[id_columns[0]] = pa.array(ids)
+    else:
+        for icolumn, column in enumerate(id_columns):
+            columns[column] = pa.array(ids[:, icolumn])
+
+    headers = _get_component_names(obj, ncomponents, list(columns))
+    for icomponent, header in enumerate(headers):
+        values = data[:, icomponent]
+        if np.iscomplexobj(values):
+            columns[f'{header}_real'] = pa.array(values.real)
+            columns[f'{header}_imag'] = pa.array(values.imag)
+        else:
+            columns[header] = pa.array(values)
+    return pa.table(columns)
+
+
+def _get_component_names(obj: Any, ncomponents: int,
+                         id_columns: List[str]) -> List[str]:
+    """gets the unique column names of the components"""
+    try:
+        headers = [str(header) for header in obj.get_headers()]
+    except (AttributeError, NotImplementedError, RuntimeError):
+        # get_headers isn't implemented for every result
+        headers = []
+    if len(headers) != ncomponents:
+        headers = [f'component{icomponent+1}' for icomponent in range(ncomponents)]
+
+    names = []
+    for header in headers:
+        name = header
+        i = 2
+        while name in names or name in id_columns:
+            name = f'{header}{i}'
+            i += 1
+        names.append(name)
+    return names
@@ -1,4 +1,4 @@
-from typing import List, Any
+from typing import List, Tuple, Optional, Any
 import numpy as np
 from pyNastran.op2.op2_helper import polar_to_real_imag
 
@@ -72,14 +72,86 @@ def mapfmt_str(fmt: str, size: int) -> str:
         return fmt
     return fmt.replace('i', 'q').replace('f', 'd')
 
-def build_obj(obj):
+def build_obj(obj, result_dtype: Optional[np.dtype]=None,
+              id_dtype: Optional[np.dtype]=None):
     """
     there are some cases in build objects that set things that aren't consistent,
     so this exists to combine those
+
+    Parameters
+    ----------
+    obj : ScalarObject
+        the result to build
+    result_dtype / id_dtype : np.dtype; default=None -> the op2 precision
+        the precision of obj.data and the id arrays (see ``OP2.read_op2``)
+
     """
     if not obj.is_built:
-        obj.build()
+        obj.build(result_dtype, id_dtype)
         obj.is_built = True
+        if result_dtype is not None or id_dtype is not None:
+            # the arrays that a build method doesn't size at the requested
+            # precision; the arrays that are already at it aren't copied
+            cast_result_arrays(obj, result_dtype, id_dtype)
+
+def get_result_dtypes(result_dtype: Optional[str],
+                      id_dtype: Optional[str]) -> Tuple[Optional[np.dtype], Optional[np.dtype]]:
+    """
+    Checks the ``read_op2`` storage precision options
+
+    Parameters
+    ----------
+    result_dtype : str / np.dtype; default=None -> the op2 precision
+        'float32' or 'float64'
+    id_dtype : str / np.dtype; default=None -> the op2 precision
+        'int32' or 'int64'
+
+    Returns
+    -------
+    result_dtype / id_dtype : np.dtype / None
+        the precision of obj.data and the id arrays
+
+    """
+    if result_dtype is not None:
+        result_dtype = np.dtype(result_dtype)
+        if result_dtype not in (np.float32, np.float64):
+            raise ValueError(f"result_dtype={result_dtype} is not supported; use 'float32' or 'float64'")
+    if id_dtype is not None:
+        id_dtype = np.dtype(id_dtype)
+        if id_dtype not in (np.int32, np.int64):
+            raise ValueError(f"id_dtype={id_dtype} is not supported; use 'int32' or 'int64'")
+    return result_dtype, id_dtype
+
+def cast_result_arrays(obj, result_dtype: Optional[np.dtype],
+                       id_dtype: Optional[np.dtype]) -> None:
+    """
+    Changes the precision of the arrays of a result that was just built,
+    so the arrays are filled at that precision
+
+    Parameters
+    ----------
+    obj : ScalarObject
+        the result
+    result_dtype : np.dtype / None
+        float32 / float64; complex results are stored as complex64 / complex128
+    id_dtype : np.dtype / None
+        int32 / int64 for the integer arrays (e.g., element, node_gridtype);
+        the times are left alone
+
+    """
+    for name, value in list(obj.__dict__.items()):
+        if not isinstance(value, np.ndarray) or name == '_times':
+            continue
+        kind = value.dtype.kind
+        if name == 'data' and result_dtype is not None and kind in 'fc':
+            dtype = result_dtype
+            if kind == 'c':
+                dtype = np.complex64 if result_dtype == np.float32 else np.complex128
+        elif kind == 'i' and id_dtype is not None:
+            dtype = id_dtype
+        else:
+            continue
+        setattr(obj, name, value.astype(dtype, copy=False))
 
 def apply_mag_phase(floats: Any, is_magnitude_phase: bool,
                     isave_real: List[int], isave_imag: List[int]) -> Any:
@@ -4,7 +4,7 @@ from itertools import count
 from typing import Tuple, Any, TYPE_CHECKING
 
 import numpy as np
-import scipy  # type: ignore
+import scipy.sparse  # type: ignore
 
 from cpylog import SimpleLogger
 from pyNastran.nptyping import NDArrayNint
@@ -369,13 +369,13 @@ def read_matpool_dmig_4(op2: OP2, data: bytes,
             reals.append(real)
             imags.append(imag)
 
-            row_nids_array = np.hstack(row_nids)
-            row_dofs_array = np.hstack(row_dofs)
+        row_nids_array = np.hstack(row_nids)
+        row_dofs_array = np.hstack(row_dofs)
 
-            col_nids_array = np.hstack(col_nids)
-            col_dofs_array = np.hstack(col_dofs)
-            real_array = np.hstack(reals)
-            #print(real_array)
+        col_nids_array = np.hstack(col_nids)
+        col_dofs_array = np.hstack(col_dofs)
+        real_array = np.hstack(reals)
+        #print(real_array)
         ioffset = kstop[-1] + 4
 
         if is_complex:
@@ -837,13 +837,12 @@ def read_matpool_dmig(op2: OP2, data: bytes,
             reals.append(real)
             imags.append(imag)
 
-            row_nids_array = np.hstack(row_nids)
-            row_dofs_array = np.hstack(row_dofs)
+        row_nids_array = np.hstack(row_nids)
+        row_dofs_array = np.hstack(row_dofs)
 
-            col_nids_array = np.hstack(col_nids)
-            col_dofs_array = np.hstack(col_dofs)
-            real_array = np.hstack(reals)
-            print(real_array)
+        col_nids_array = np.hstack(col_nids)
+        col_dofs_array = np.hstack(col_dofs)
+        real_array = np.hstack(reals)
         ioffset = kstop[-1] + 4
 
         if is_complex:
@@ -1223,13 +1222,12 @@ def read_matpool_dmig_8(op2: OP2, data: bytes,
             reals.append(real)
             imags.append(imag)
 
-            row_nids_array = np.hstack(row_nids)
-            row_dofs_array = np.hstack(row_dofs)
+        row_nids_array = np.hstack(row_nids)
+        row_dofs_array = np.hstack(row_dofs)
 
-            col_nids_array = np.hstack(col_nids)
-            col_dofs_array = np.hstack(col_dofs)
-            real_array = np.hstack(reals)
-            print(real_array)
+        col_nids_array = np.hstack(col_nids)
+        col_dofs_array = np.hstack(col_dofs)
+        real_array = np.hstack(reals)
         ioffset = kstop[-1] + 4
 
         if is_complex:
@@ -1271,9 +1269,6 @@ def _cast_matrix_matpool(table_name: str,
     #op2 = self.op2
     make_matrix_symmetric = apply_symmetry and matrix_shape == 'symmetric'
 
-    # TODO: this is way slower than it should be
-    #       because we didn't preallocate the data and the
-    #       grids_comp_array_to_index function needs work
     grids1 = col_nids_array
     comps1 = col_dofs_array
     grids2 = row_nids_array
@@ -1306,7 +1301,7 @@ def _cast_matrix_matpool(table_name: str,
     #print(j2)
     #print(mrows, ncols)
     try:
-        matrix = scipy.sparse.coo_matrix(
+        matrix = scipy.sparse.csc_matrix(
             (real_imag_array, (j2, j1)),
             shape=(mrows, ncols), dtype=dtype)
     except ValueError:
@@ -1619,23 +1614,32 @@ def grids_comp_array_to_index(grids1, comps1, grids2, comps2,
             j_index[i] = nid_comp_to_dof_indexb[tuple(nid_dof)]
         return j_index, j_index, nj_sym, nj_sym, nj_sym
     else:
-        nid_comp_to_dof_indexa = {}
-        nid_comp_to_dof_indexb = {}
-        a_keys = set()
-        b_keys = set()
-        nja = grids_comp_array_to_indexi(nid_comp_to_dof_indexa, a_keys, ai, j=0)
-        njb = grids_comp_array_to_indexi(nid_comp_to_dof_indexb, b_keys, bi, j=0)
-        nja = len(nid_comp_to_dof_indexa)
-        njb = len(nid_comp_to_dof_indexb)
+        ja_index, nja = _get_first_index(grids1, comps1, idtype)
+        jb_index, njb = _get_first_index(grids2, comps2, 'int32')
         nj_sym = -1
+        return ja_index, jb_index, nja, njb, nj_sym
+
 
-        ja_index = np.zeros(grids1.shape, dtype=idtype)
-        for i, nid_dof in zip(count(), ai.tolist()):
-            ja_index[i] = nid_comp_to_dof_indexa[tuple(nid_dof)]
+def _get_first_index(grids: np.ndarray, comps: np.ndarray,
+                     idtype: str) -> Tuple[np.ndarray, int]:
+    """
+    Maps each (grid, component) to a 0-based index in the order the
+    (grid, component) first appears
 
-        jb_index = np.zeros(grids2.shape, dtype='int32')
-        for i, nid_dof in zip(count(), bi.tolist()):
-            jb_index[i] = nid_comp_to_dof_indexb[tuple(nid_dof)]
+    Returns
+    -------
+    j_index : (n,) int ndarray
+        the index of each (grid, component)
+    nj : int
+        the number of unique (grid, component) pairs
 
-        return ja_index, jb_index, nja, njb, nj_sym
+    """
+    # the component is 0-6
+    keys = np.asarray(grids, dtype='int64') * 10 + np.asarray(comps, dtype='int64')
+    unused_ukeys, ifirst, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    nj = len(ifirst)
+    rank = np.empty(nj, dtype=idtype)
+    rank[np.argsort(ifirst)] = np.arange(nj, dtype=idtype)
+    j_index = rank[inverse.ravel()]
+    return j_index, nj
 
@@ -2,11 +2,14 @@
 Defines methods for the op2 & hdf5 writer
 """
 from struct import Struct, pack
-from typing import List
+from typing import List, Tuple, Optional
 
 import numpy as np
 import scipy.sparse as sp
 
+#: the maximum size of an HDF5 chunk of a result array (bytes)
+CHUNK_NBYTES = 1024 ** 2
+
 
 def set_table3_field(str_fields, ifield, value):
     """
@@ -91,6 +94,62 @@ def to_column_bytes(data_list: List[np.ndarray], dtype_out: str,
         raise
     return out
 
+def write_table4_rows(op2_file, columns: List[Tuple[bytes, np.ndarray]],
+                      endian: bytes=b'<') -> int:
+    """
+    Writes the rows of a table 4 record (e.g., [eid_device, oxx, oyy, ...])
+    as one structured array, so the ids and values are interleaved by
+    numpy instead of packing each row with a Struct
+
+    Parameters
+    ----------
+    op2_file : file
+        the op2 file object
+    columns : List[(fmt, values)]
+        fmt : bytes
+            the type of the column(s) {b'i', b'f', b'4s', b'8s'}
+        values : (nrows, ) / (nrows, ncolumns) ndarray
+            the ids/values; complex values must be split into
+            real/imaginary columns
+    endian : bytes; default=b'<'
+        the endian of the ints/floats
+
+    Returns
+    -------
+    nwords : int
+        the number of 4-byte words that were written
+
+    .. code-block:: python
+
+       # [eid_device, axial, torsion]
+       write_table4_rows(op2_file, [(b'i', eids_device), (b'f', data[itime, :, :])])
+
+    """
+    if isinstance(endian, bytes):
+        endian = endian.decode('latin1')
+    nrows = len(columns[0][1])
+    dtype = []
+    for icolumn, (fmt, values) in enumerate(columns):
+        if fmt.endswith(b's'):
+            column_dtype = 'S' + fmt[:-1].decode('latin1')
+        else:
+            column_dtype = endian + fmt.decode('latin1') + '4'
+        dtype.append((f'f{icolumn}', column_dtype, values.shape[1:]))
+
+    record = np.empty(nrows, dtype=dtype)
+    for icolumn, (unused_fmt, values) in enumerate(columns):
+        record[f'f{icolumn}'] = values
+    op2_file.write(record.tobytes())
+    return record.itemsize * nrows // 4
+
+def interleave_real_imag(data: np.ndarray) -> np.ndarray:
+    """
+    Splits an (nrows, ncolumns) complex array into an (nrows, 2*ncolumns)
+    float array of [real1, imag1, real2, imag2, ...]
+    """
+    nrows = data.shape[0]
+    return np.stack([data.real, data.imag], axis=-1).reshape(nrows, -1)
+
 def get_complex_fdtype(dtype):
     """complex64 -> float32; complex128 -> float64"""
     if dtype.itemsize == 8:
@@ -115,8 +174,30 @@ def view_dtype(array_obj, dtype):
         return array_obj.view(dtype)
     return array_obj.astype(dtype)
 
-def export_to_hdf5(self, group, log):
-    """exports the object to HDF5 format"""
+def export_to_hdf5(self, group, log, resizable_names=None,
+                   compression=None, compression_opts=None):
+    """
+    exports the object to HDF5 format
+
+    The (ntimes, ntotal, ...) data array is chunked by time step, so a
+    few time steps/modes can be read without reading the whole array.
+
+    Parameters
+    ----------
+    group : h5py.Group
+        the group to write the attributes to
+    log : SimpleLogger
+        a logging object
+    resizable_names : List[str]; default=None
+        the names of the arrays that are written as resizable, chunked
+        datasets, so time steps can be appended to them
+        (see ``convert_op2_to_hdf5``)
+    compression : str; default=None
+        the h5py compression filter of the arrays {None, gzip, lzf}
+    compression_opts : int; default=None
+        the compression level for gzip (0-9)
+
+    """
     #headers = self.get_headers()
 
     # for some reason we can't just not write the properties...
@@ -135,11 +216,12 @@ def export_to_hdf5(self, group, log):
         elif isinstance(value, dict):
             log.warning(f'HDF5: skipping name={name!r} value={value:d}')
             continue
-        elif isinstance(value, sp.coo.coo_matrix):
+        elif sp.issparse(value):
             # F:\work\pyNastran\pyNastran\master2\pyNastran\bdf\test\nx_spike\out_bsh111svd2.op2
             #
             # https://stackoverflow.com/questions/43390038/storing-scipy-sparse-matrix-as-hdf5
             #g = group.create_group('Mcoo')
+            value = value.tocoo()
             group.create_dataset('data', data=value.data)
             group.create_dataset('row', data=value.row)
             group.create_dataset('col', data=value.col)
@@ -174,7 +256,9 @@ def export_to_hdf5(self, group, log):
             #msg = 'sub-object export_to_hdf5 not supported\nkey=%s value=%s' % (key, value)
             #raise NotImplementedError(msg)
         try:
-            group.create_dataset(name, data=value)
+            _create_dataset(group, name, value,
+                            is_resizable=resizable_names is not None and name in resizable_names,
+                            compression=compression, compression_opts=compression_opts)
         except TypeError:
             print('name = %r; type=%s' % (name, type(value)))
             print(value)
@@ -182,3 +266,37 @@ def export_to_hdf5(self, group, log):
             raise
             #continue
         #print('done')
+
+def _create_dataset(group, name: str, value,
+                    is_resizable: bool=False,
+                    compression: Optional[str]=None,
+                    compression_opts: Optional[int]=None) -> None:
+    """helper for ``export_to_hdf5``"""
+    if not isinstance(value, np.ndarray) and not is_resizable:
+        group.create_dataset(name, data=value)
+        return
+
+    value = np.asarray(value)
+    kwargs = {}
+    if is_resizable:
+        # the number of nodes/elements can vary by time step
+        # (e.g., strain energy), so the 2nd dimension is resizable
+        kwargs['maxshape'] = (None, ) if value.ndim == 1 else (None, None) + value.shape[2:]
+        kwargs['chunks'] = True
+    if (name == 'data' or is_resizable) and value.ndim >= 2 and value.size:
+        kwargs['chunks'] = get_chunks(value.shape, value.dtype.itemsize)
+    if compression is not None and value.ndim and value.size:
+        kwargs['compression'] = compression
+        kwargs['compression_opts'] = compression_opts
+    group.create_dataset(name, data=value, **kwargs)
+
+def get_chunks(shape: Tuple[int, ...], itemsize: int) -> Tuple[int, ...]:
+    """
+    Gets the HDF5 chunk shape of an (ntimes, ntotal, ...) array
+
+    Each chunk is a single time step; a large time step is split by
+    rows, so a chunk is at most ~CHUNK_NBYTES.
+    """
+    nbytes_row = itemsize * int(np.prod(shape[2:], dtype='int64'))
+    nrows = min(shape[1], max(1, CHUNK_NBYTES // nbytes_row))
+    return (1, nrows) + tuple(shape[2:])
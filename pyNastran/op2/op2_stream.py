@@ -0,0 +1,250 @@
+"""
+Defines:
+ - iter_op2_results(op2_filename, results=None, subcases=None,
+                    mode=None, log=None, debug=False)
+ - code = get_op2_code(key)
+ - OP2Stream(debug=False, log=None, debug_file=None, mode=None)
+   - OP2
+
+The results are streamed one time step at a time, so a long transient
+(e.g., SOL 109/112 with thousands of time steps) can be post-processed
+without holding the (ntimes, nnodes, 6) arrays in memory.
+
+"""
+from __future__ import annotations
+import threading
+from queue import Queue, Empty
+from pathlib import PurePath
+from typing import List, Tuple, Optional, Union, Any, Iterator, TYPE_CHECKING
+
+import numpy as np
+from pyNastran.op2.op2 import OP2
+if TYPE_CHECKING:  # pragma: no cover
+    from cpylog import SimpleLogger
+
+#: the id arrays of a result, in the order they're checked
+ID_ARRAY_NAMES = [
+    'node_gridtype', 'node_element', 'element_node', 'element_layer',
+    'element', 'element_cid',
+]
+
+
+def iter_op2_results(op2_filename: Union[str, PurePath],
+                     results: Optional[List[str]]=None,
+                     subcases: Optional[List[int]]=None,
+                     mode: Optional[str]=None,
+                     log: Optional[SimpleLogger]=None,
+                     debug: Optional[bool]=False,
+                     ) -> Iterator[Tuple[str, int, Any, np.ndarray, np.ndarray]]:
+    """
+    Streams the results of an op2 one time step at a time
+
+    Parameters
+    ----------
+    op2_filename : str
+        the op2_filename
+    results : List[str] / str; default=None -> all results
+        the results to read (e.g., ['displacements', 'stress'])
+    subcases : List[int, ...] / int; default=None->all subcases
+        list of [subcase1_ID,subcase2_ID]
+    mode : str; default=None -> 'msc'
+        the version of the Nastran you're using
+        {nx, msc, autodesk, optistruct, nasa95}
+    log : SimpleLogger; default=None
+        a logging object to write debug messages to
+    debug : bool/None; default=False
+        used to set the logger if no logger is passed in
+
+    Yields
+    ------
+    result_name : str
+        the result name (e.g., 'displacements', 'stress.ctetra_stress')
+    isubcase : int
+        the subcase id
+    dt : int / float / None
+        the mode/time/frequency/load step; None for a static result
+    ids : (nnodes, 2) / (nelements, ...) int ndarray
+        the node_gridtype/element_node/element array of the result
+    data : (nnodes, nresults) ndarray
+        the result for the time step
+
+    A SORT1 result is yielded as soon as its time step is decoded.
+    A SORT2 result stores all the time steps of a node/element together,
+    so it's yielded after its table has been read.  Each record is
+    yielded, so a result that's written more than once (e.g., a repeated
+    OUGV1) is yielded more than once and a result with a variable number
+    of nodes/elements per time step (e.g., strain energy) isn't padded.
+
+    .. code-block:: python
+
+       for result_name, isubcase, dt, ids, data in iter_op2_results(
+               'fem.op2', results=['displacements']):
+           max_disp = np.abs(data[:, :3]).max()
+
+    """
+    model = OP2Stream(log=log, debug=debug, mode=mode)
+    model.set_subcases(subcases)
+    model.include_exclude_results(include_results=results)
+    return model.iter_results(op2_filename)
+
+
+class _StopStream(Exception):
+    """the generator was closed before the op2 was read"""
+
+
+class _TablePosition(int):
+    """the position of the (sub)table that ``OP2Stream._get_code`` adds to the code"""
+
+
+def get_op2_code(key: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """removes the table position from a result key of an OP2Stream"""
+    return tuple(value for value in key if not isinstance(value, _TablePosition))
+
+
+class OP2Stream(OP2):
+    """
+    Reads an op2 with ``single_pass=True`` and hands the results to
+    ``iter_results`` as each time step is filled
+
+    A SORT1 result is created for each subtable (so it has one time step)
+    and a SORT2 result is created for each table.  The results are
+    deleted once they're yielded.
+    """
+    def __init__(self, debug: Optional[bool]=False,
+                 log: Any=None,
+                 debug_file: Optional[str]=None,
+                 mode: Optional[str]=None):
+        OP2.__init__(self, debug=debug, log=log, debug_file=debug_file, mode=mode)
+        self._stream_table_n0 = None
+        self._stream_blocks = None  # type: Optional[Queue]
+        self._stream_is_stopped = False
+
+    def iter_results(self, op2_filename: Union[str, PurePath],
+                     ) -> Iterator[Tuple[str, int, Any, np.ndarray, np.ndarray]]:
+        """
+        Streams the results of an op2 one time step at a time
+        (see ``iter_op2_results``)
+
+        The op2 is read in a background thread and the blocks are passed
+        back one at a time, so only the current time step is in memory.
+        """
+        done = object()
+        blocks = Queue(maxsize=1)
+        self._stream_blocks = blocks
+        self._stream_is_stopped = False
+
+        def read_op2():
+            try:
+                self.read_op2(op2_filename, combine=False, single_pass=True)
+                self._flush_results()
+            except _StopStream:
+                pass
+            except Exception as error:
+                blocks.put(error)
+            finally:
+                blocks.put(done)
+
+        thread = threading.Thread(target=read_op2, daemon=True)
+        thread.start()
+        try:
+            while True:
+                block = blocks.get()
+                if block is done:
+                    break
+                if isinstance(block, Exception):
+                    raise block
+                yield block
+        finally:
+            # the generator was closed early (or failed), so stop the reader
+            self._stream_is_stopped = True
+            while thread.is_alive():
+                try:
+                    blocks.get(timeout=0.1)
+                except Empty:
+                    pass
+            thread.join()
+            self._stream_blocks = None
+
+    def _read_table_single_pass(self, table_name: bytes) -> None:
+        """reads a table and yields the results that are left (e.g., SORT2)"""
+        self._stream_table_n0 = self.f.tell()
+        try:
+            OP2._read_table_single_pass(self, table_name)
+        finally:
+            self._stream_table_n0 = None
+        self._flush_results()
+
+    def _get_code(self):
+        """a SORT1 result is unique to a subtable and a SORT2 result is unique to a table"""
+        code = OP2._get_code(self)
+        if self._stream_table_n0 is None:
+            return code
+        n0 = self._subtable_n0 if self.is_sort1 else self._stream_table_n0
+        self.code = code + (_TablePosition(n0), )
+        return self.code
+
+    def _reset_vector_counter(self) -> None:
+        """yields a SORT1 result once all its time steps have been filled"""
+        OP2._reset_vector_counter(self)
+        obj = getattr(self, 'obj', None)
+        if (self._stream_table_n0 is None or obj is None or
+                not getattr(obj, 'is_sort1', False) or
+                getattr(obj, 'itime', 0) != getattr(obj, 'ntimes', -1)):
+            return
+
+        result = self.get_result(obj.result_name)
+        key = self.code
+        if result.get(key) is not obj:
+            keys = [key for key, obji in result.items() if obji is obj]
+            if not keys:
+                # already yielded
+                return
+            key = keys[0]
+        del result[key]
+        self._put_result(key, obj)
+
+    def _flush_results(self) -> None:
+        """yields the results that haven't been yielded yet"""
+        for result_type in self.get_table_types():
+            if result_type in ['params', 'gpdt', 'bgpdt', 'eqexin', 'psds', 'monitor1', 'monitor3'] or result_type.startswith('responses.'):
+                continue
+            result = self.get_result(result_type)
+            if not isinstance(result, dict):
+                continue
+            for key in list(result):
+                obj = result[key]
+                if not getattr(obj, 'is_built', False):
+                    continue
+                del result[key]
+                self._put_result(key, obj)
+
+    def _put_result(self, unused_key: Tuple[Any, ...], obj: Any) -> None:
+        """finalizes a result and yields each time step"""
+        if hasattr(obj, 'finalize'):
+            obj.finalize()
+        data = getattr(obj, 'data', None)
+        times = getattr(obj, '_times', None)
+        if not isinstance(data, np.ndarray) or data.ndim < 2 or times is None:
+            return
+
+        ids = None
+        for name in ID_ARRAY_NAMES:
+            idsi = getattr(obj, name, None)
+            if isinstance(idsi, np.ndarray) and idsi.shape[0] == data.shape[1]:
+                ids = idsi
+                break
+
+        nonlinear_factor = obj.nonlinear_factor
+        is_static = nonlinear_factor is None or (
+            isinstance(nonlinear_factor, (float, np.floating)) and np.isnan(nonlinear_factor))
+        for itime in range(data.shape[0]):
+            dt = None if is_static else times[itime]
+            self._put_block((obj.result_name, obj.isubcase, dt, ids, data[itime]))
+
+    def _put_block(self, block: Tuple[str, int, Any, np.ndarray, np.ndarray]) -> None:
+        """passes a block to ``iter_results``"""
+        if self._stream_is_stopped:
+            raise _StopStream()
+        self._stream_blocks.put(block)
+        if self._stream_is_stopped:
+            raise _StopStream()
@@ -30,7 +30,7 @@ from typing import List
 import numpy as np
 #from numpy import float32
 
-from pyNastran.op2.result_objects.op2_objects import ScalarObject
+from pyNastran.op2.result_objects.op2_objects import ScalarObject, apply_result_dtypes
 from pyNastran.f06.f06_formatting import write_floats_13e, write_imag_floats_13e, write_float_12e
 from pyNastran.op2.errors import SixtyFourBitError
 from pyNastran.op2.op2_interface.write_utils import set_table3_field
@@ -352,7 +352,7 @@ class RealContactTractionAndPressureArray(ScalarObject):  # displacement style t
     def _reset_indices(self) -> None:
         self.itotal = 0
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the TableArray"""
         #print('_nnodes=%s ntimes=%s sort1?=%s ntotal=%s -> _nnodes=%s' % (self._nnodes, self.ntimes, self.is_sort1,
                                                                           #self.ntotal, self._nnodes // self.ntimes))
@@ -394,9 +394,11 @@ class RealContactTractionAndPressureArray(ScalarObject):  # displacement style t
             #print("***SORT2 ntotal=%s nnodes=%s ntimes=%s" % (ntotal, nnodes, ntimes))
         else:
             raise RuntimeError('expected sort1/sort2\n%s' % self.code_information())
-        self.build_data(ntimes, nnodes, ntotal, nx, ny, self._times_dtype)
+        self.build_data(ntimes, nnodes, ntotal, nx, ny, self._times_dtype,
+                        result_dtype, id_dtype)
 
-    def build_data(self, ntimes, nnodes, ntotal, nx, ny, float_fmt):
+    def build_data(self, ntimes, nnodes, ntotal, nx, ny, float_fmt,
+                   result_dtype=None, id_dtype=None):
         """actually performs the build step"""
         self.ntimes = ntimes
         self._nnodes = nnodes
@@ -404,10 +406,11 @@ class RealContactTractionAndPressureArray(ScalarObject):  # displacement style t
 
         _times = np.zeros(ntimes, dtype=float_fmt)
         int_fmt = 'int32' if self.size == 4 else 'int64'
+        fdtype, int_fmt = apply_result_dtypes(self.data_type(), int_fmt, result_dtype, id_dtype)
         node_gridtype = np.zeros((nnodes, 2), dtype=int_fmt)
 
         #[pressure, s1, s2, s3]
-        data = np.zeros((nx, ny, 4), self.data_type())
+        data = np.zeros((nx, ny, 4), fdtype)
         if self.load_as_h5:
             group = self._get_result_group()
             self._times = group.create_dataset('_times', data=_times)
@@ -496,8 +499,7 @@ class RealContactTractionAndPressureArray(ScalarObject):  # displacement style t
     def _write_table_3(self, op2_file, fascii, new_result, itable=-3, itime=0):
         import inspect
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        fascii.write('%s.write_table_3: %s\n' % (self.__class__.__name__, call_frame[1][3]))
+        fascii.write('%s.write_table_3: %s\n' % (self.__class__.__name__, frame.f_back.f_code.co_name))
 
         if new_result and itable != -3:
             header = [
@@ -777,8 +779,7 @@ class RealContactTractionAndPressureArray(ScalarObject):  # displacement style t
         assert self.table_name in allowed_tables, self.table_name
 
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        fascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
+        fascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, frame.f_back.f_code.co_name))
 
         if itable == -1:
             self._write_table_header(op2_file, fascii, date)
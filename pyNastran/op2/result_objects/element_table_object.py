@@ -5,7 +5,7 @@ from numpy import allclose, asarray, vstack
 
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.op2.result_objects.table_object import append_sort1_sort2
-from pyNastran.op2.result_objects.op2_objects import BaseElement
+from pyNastran.op2.result_objects.op2_objects import BaseElement, apply_result_dtypes
 from pyNastran.f06.f06_formatting import write_floats_13e, write_float_12e
 
 
@@ -145,7 +145,7 @@ class ElementTableArray(BaseElement):  # displacement style table
         self.itotal = 0
         self.ielement = 0
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the ElementTableArray"""
         #print('_nelements=%s ntimes=%s sort1?=%s ntotal=%s -> _nelements=%s' % (
             #self._nelements, self.ntimes, self.is_sort1,
@@ -172,11 +172,12 @@ class ElementTableArray(BaseElement):  # displacement style table
         self._times = zeros(ntimes, dtype=self._times_dtype)
         #self.types = array(self.nelements, dtype='|S1')
 
-        self.element = zeros(nelements, dtype='int32')
+        fdtype, idtype = apply_result_dtypes(self.data_type(), 'int32', result_dtype, id_dtype)
+        self.element = zeros(nelements, dtype=idtype)
         self.element_data_type = empty(nelements, dtype='|U8')
 
         #[t1, t2, t3, r1, r2, r3]
-        self.data = zeros((nx, ny, 6), self.data_type())
+        self.data = zeros((nx, ny, 6), fdtype)
 
     def add_sort1(self, dt, eid, etype, v1, v2, v3, v4, v5, v6):
         """unvectorized method for adding SORT1 transient data"""
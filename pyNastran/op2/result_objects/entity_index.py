@@ -0,0 +1,143 @@
+"""
+Defines:
+ - EntityIndex(ids)
+ - index = get_entity_index(ids, icolumn=0)
+
+The entity index maps a node/element id to the rows of a result
+(e.g., the rows of element_node for an element), so repeated lookups
+(e.g., ``obj.select(eids=[10])``) don't search the id array each time.
+The ids don't need to be sorted.
+
+The index is built once per id array and is shared between results with
+the same ids (e.g., the stress and strain of the same element type and
+subcase).
+
+"""
+import hashlib
+import weakref
+from typing import Tuple, Dict, Optional, Union
+
+import numpy as np
+
+#: the id arrays of a result and their (element, node) id columns
+ENTITY_ID_COLUMNS = {
+    'node_gridtype': (None, 0),
+    'node_element': (1, 0),
+    'element_node': (0, 1),
+    'element_layer': (0, None),
+    'element': (0, None),
+    'element_cid': (0, None),
+}
+
+#: the shared indices; an index is freed when no result references it
+_ENTITY_INDEX_CACHE = weakref.WeakValueDictionary()  # type: weakref.WeakValueDictionary
+
+
+class EntityIndex:
+    """maps the ids of one column of an id array to their rows"""
+    def __init__(self, ids: np.ndarray):
+        """
+        Parameters
+        ----------
+        ids : (nrows, ) int ndarray
+            the ids of each row (e.g., element_node[:, 0]); the ids may
+            be repeated (e.g., the nodes of an element) and unsorted
+
+        """
+        nrows = len(ids)
+        #: the rows sorted by id
+        self.order = np.argsort(ids, kind='stable')
+        sorted_ids = ids[self.order]
+        #: the unique ids and the start/stop of their rows in order
+        self.ids, self.starts, counts = np.unique(sorted_ids, return_index=True,
+                                                  return_counts=True)
+        self.stops = self.starts + counts
+
+        #: the ids are sorted, so the rows of an id are a range
+        self.is_sorted = nrows == 0 or bool(np.all(self.order == np.arange(nrows)))
+        self._id_map: Optional[Dict[int, Tuple[int, int]]] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def get_range(self, entity_id: int) -> Tuple[int, int]:
+        """
+        Gets the [start, stop) of the rows of an id in ``order`` with a
+        dictionary lookup, which is the fastest way to look up one id
+
+        For sorted ids, ``order[start:stop]`` is ``range(start, stop)``.
+        """
+        if self._id_map is None:
+            self._id_map = dict(zip(self.ids.tolist(),
+                                    zip(self.starts.tolist(), self.stops.tolist())))
+        try:
+            return self._id_map[entity_id]
+        except KeyError:
+            raise KeyError(f'id={entity_id} was not found') from None
+
+    def get_rows(self, entity_ids: Union[int, np.ndarray]) -> Union[slice, np.ndarray]:
+        """
+        Gets the rows of a set of ids in the order of the ids
+
+        Returns
+        -------
+        rows : slice / (nrows, ) int ndarray
+            a slice if the rows are a contiguous range, so indexing the
+            data array returns a view
+
+        """
+        if isinstance(entity_ids, (int, np.integer)):
+            start, stop = self.get_range(int(entity_ids))
+            if self.is_sorted:
+                return slice(start, stop)
+            return _to_slice(self.order[start:stop])
+
+        entity_ids = np.asarray(entity_ids).ravel()
+        iids = np.searchsorted(self.ids, entity_ids)
+        if len(self.ids):
+            iids[iids == len(self.ids)] = 0
+            is_missing = self.ids[iids] != entity_ids
+        else:
+            is_missing = np.ones(len(entity_ids), dtype='bool')
+        if np.any(is_missing):
+            raise KeyError(f'ids={entity_ids[is_missing].tolist()} were not found')
+
+        starts = self.starts[iids]
+        counts = self.stops[iids] - starts
+        nrows = counts.sum()
+        # [start1, start1+1, ..., start2, start2+1, ...]
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        irows = offsets + np.arange(nrows)
+        rows = irows if self.is_sorted else self.order[irows]
+        return _to_slice(rows)
+
+
+def get_entity_index(ids: np.ndarray, icolumn: int=0) -> EntityIndex:
+    """
+    Gets the index of a column of an id array, which is shared by id
+    arrays with the same values
+
+    Parameters
+    ----------
+    ids : (nrows, ) or (nrows, ncolumns) int ndarray
+        the id array (e.g., node_gridtype, element, element_node)
+    icolumn : int; default=0
+        the column to index (e.g., 1 for the nodes of element_node)
+
+    """
+    idsi = ids if ids.ndim == 1 else ids[:, icolumn]
+    idsi = np.ascontiguousarray(idsi)
+    key = (icolumn, idsi.shape, idsi.dtype.str, hashlib.sha1(idsi).hexdigest())
+    index = _ENTITY_INDEX_CACHE.get(key)
+    if index is None:
+        index = EntityIndex(idsi)
+        _ENTITY_INDEX_CACHE[key] = index
+    return index
+
+
+def _to_slice(rows: np.ndarray) -> Union[slice, np.ndarray]:
+    """converts a contiguous range of rows to a slice"""
+    nrows = len(rows)
+    if nrows and rows[-1] - rows[0] == nrows - 1 and (nrows == 1 or np.all(np.diff(rows) == 1)):
+        return slice(int(rows[0]), int(rows[-1]) + 1)
+    return rows
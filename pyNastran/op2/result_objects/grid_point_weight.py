@@ -103,9 +103,11 @@ class GridPointWeight:
         self.approach_code = approach_code
         self.table_code = table_code
 
-    def export_to_hdf5(self, group, log) -> None:
+    def export_to_hdf5(self, group, log, resizable_names=None,
+                       compression=None, compression_opts=None) -> None:
         """exports the object to HDF5 format"""
-        export_to_hdf5(self, group, log)
+        export_to_hdf5(self, group, log, resizable_names=resizable_names,
+                       compression=compression, compression_opts=compression_opts)
 
     def object_attributes(self, mode='public', keys_to_skip=None,
                           filter_properties=False):
@@ -208,8 +210,7 @@ class GridPointWeight:
     def _write_table_3(self, op2_file, fascii, new_result, table_name, itable=-3):
         import inspect
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        fascii.write('%s.write_table_3: %s\n' % (self.__class__.__name__, call_frame[1][3]))
+        fascii.write('%s.write_table_3: %s\n' % (self.__class__.__name__, frame.f_back.f_code.co_name))
 
         if new_result and itable != -3:
             header = [
@@ -303,8 +304,7 @@ class GridPointWeight:
         table_name = 'OGPWG'
 
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         subtable_name = b'OGPWG'
         if itable == -1:
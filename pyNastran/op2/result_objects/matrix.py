@@ -1,5 +1,5 @@
 """Defines the Matrix class"""
-from scipy.sparse import coo_matrix  # type: ignore
+from scipy.sparse import issparse  # type: ignore
 import numpy as np
 from pyNastran.op2.op2_interface.write_utils import export_to_hdf5
 from pyNastran.utils import object_attributes, object_methods
@@ -15,8 +15,8 @@ class Matrix:
     name : str
         the name of the matrix
     data : varies
-        dense : np.ndarray
-        sparse : coo_matrix
+        dense : np.ndarray (or np.memmap; see ``OP2.dense_matrix_dirname``)
+        sparse : csc_matrix
         data is initialized by setting the matrix.data attribute externally
     is_matpool : bool
         is this a matpool matrix
@@ -84,7 +84,8 @@ class Matrix:
         matrix = self.data
         if matrix is None:
             return
-        if isinstance(matrix, coo_matrix):
+        if issparse(matrix):
+            matrix = matrix.tocoo()
             data = {'row': matrix.row, 'col': matrix.col, 'data' : matrix.data}
             data_frame = pd.DataFrame(data=data).reindex(columns=['row', 'col', 'data'])
         elif isinstance(matrix, np.ndarray):
@@ -102,7 +103,8 @@ class Matrix:
             skip_msg = 'skipping %s because data is None\n\n' % self.name
             mat.write(skip_msg.encode('ascii'))
             return
-        if isinstance(matrix, coo_matrix):
+        if issparse(matrix):
+            matrix = matrix.tocoo()
             if print_full:
                 for row, col, value in zip(matrix.row, matrix.col, matrix.data):
                     mat.write(np.compat.asbytes("(%i, %i) %s\n" % (row, col, value)))
@@ -1,9 +1,10 @@
 #pylint: disable=C0301,C0111
 import copy
 import warnings
+import weakref
 from itertools import count
 from struct import pack
-from typing import Tuple, List, Union
+from typing import Tuple, List, Union, Optional
 import numpy as np
 
 from cpylog import SimpleLogger
@@ -15,6 +16,7 @@ from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.op2.errors import OverwriteTableError
 from pyNastran.op2.op2_interface.op2_codes import Op2Codes, get_sort_method_from_table_name
 from pyNastran.op2.op2_interface.write_utils import write_table_header, export_to_hdf5
+from pyNastran.op2.result_objects.entity_index import ENTITY_ID_COLUMNS, EntityIndex, get_entity_index
 
 GRID_TYPE_INT_TO_STR = {
     1 : 'G', # GRID
@@ -62,15 +64,30 @@ class BaseScalarObject(Op2Codes):
         #self.ntotal = 0
         #assert isinstance(self.name, (str, bytes)), 'name=%s type=%s' % (self.name, type(self.name))
 
+    def __getattr__(self, name: str):
+        """
+        Only called when the attribute doesn't exist, so for a lazy result
+        (see ``OP2.read_op2(lazy=True)``), the arrays are decoded on first
+        access.
+        """
+        lazy_results = self.__dict__.get('_lazy_results')
+        if lazy_results is None or name.startswith('__'):
+            raise AttributeError(f'{self.__class__.__name__!r} object has no attribute {name!r}')
+        lazy_results.load(self)
+        return object.__getattribute__(self, name)
+
     def object_attributes(self, mode='public', keys_to_skip=None,
                           filter_properties=False):
+        lazy_results = self.__dict__.get('_lazy_results')
+        if lazy_results is not None:
+            lazy_results.load(self)
         if keys_to_skip is None:
             keys_to_skip = []
         elif isinstance(keys_to_skip, str):
             keys_to_skip = [keys_to_skip]
 
         my_keys_to_skip = [
-            'object_methods', 'object_attributes',
+            'object_methods', 'object_attributes', 'data_frame', 'dataframe',
         ]
         return object_attributes(self, mode=mode, keys_to_skip=keys_to_skip+my_keys_to_skip,
                                  filter_properties=filter_properties)
@@ -106,9 +123,13 @@ class BaseScalarObject(Op2Codes):
         """creates a pandas dataframe"""
         print('build_dataframe is not implemented in %s' % self.__class__.__name__)
 
-    def export_to_hdf5(self, group, log: SimpleLogger) -> None:
+    def export_to_hdf5(self, group, log: SimpleLogger,
+                       resizable_names: Optional[List[str]]=None,
+                       compression: Optional[str]=None,
+                       compression_opts: Optional[int]=None) -> None:
         """exports the object to HDF5 format"""
-        export_to_hdf5(self, group, log)
+        export_to_hdf5(self, group, log, resizable_names=resizable_names,
+                       compression=compression, compression_opts=compression_opts)
 
     def write_f06(self, f06_file, header=None, page_stamp='PAGE %s',
                   page_num=1, is_mag_phase=False, is_sort1=True) -> int:
@@ -269,6 +290,11 @@ class ScalarObject(BaseScalarObject):
             del state['_add_new_node']
         if 'dataframe' in state:
             del state['dataframe']
+        # the DataFrame/entity index are rebuilt on first access
+        for key in ['data_frame', '_data_frame', '_data_frame_source',
+                    '_entity_index', '_entity_index_source']:
+            if key in state:
+                del state[key]
 
         #for key, value in state.items():
             #if isinstance(value, (int, float, str, np.ndarray, list)) or value is None:
@@ -316,11 +342,181 @@ class ScalarObject(BaseScalarObject):
         assert sort_method in [1, 2], 'sort_method=%r\n%s' % (sort_method, self.code_information())
         return sort_method
 
+    @property
+    def data_frame(self):
+        """
+        Gets the pandas DataFrame
+
+        The DataFrame is built on first access and cached until ``data``
+        is replaced, so only the results that are looked at are built.
+        """
+        data = getattr(self, 'data', None)
+        if not self._is_data_frame_current(data):
+            self._data_frame = None
+            self._data_frame_source = _get_data_source(data)
+            if data is not None:
+                try:
+                    self.build_dataframe()
+                except ImportError:  # pandas isn't installed
+                    pass
+        return self._data_frame
+
+    @data_frame.setter
+    def data_frame(self, data_frame) -> None:
+        """sets the DataFrame, which is valid for the current ``data``"""
+        self._data_frame = data_frame
+        self._data_frame_source = _get_data_source(getattr(self, 'data', None))
+
+    def _is_data_frame_current(self, data) -> bool:
+        """was the cached DataFrame built from ``data``?"""
+        if '_data_frame_source' not in self.__dict__:
+            return False
+        source = self._data_frame_source
+        if data is None or source is None:
+            return data is None and source is None
+        return source() is data
+
     @property
     def dataframe(self):
         """alternate way to get the dataframe"""
         return self.data_frame
 
+    def get_entity_index(self, icolumn: int=0) -> EntityIndex:
+        """
+        Gets the cached index of the node/element ids of the rows
+        (e.g., node_gridtype, element, element_node)
+
+        Parameters
+        ----------
+        icolumn : int; default=0
+            the column of the id array (e.g., 1 for the nodes of element_node)
+
+        The index is built on first access and cached until the id array
+        is replaced.  It's shared by the results with the same ids.
+        """
+        ids_name = self._get_entity_ids_name()
+        ids = getattr(self, ids_name)
+        source = self.__dict__.get('_entity_index_source')
+        if source is None or source() is not ids:
+            self._entity_index = {}
+            self._entity_index_source = _get_data_source(ids)
+        indices = self._entity_index
+        if icolumn not in indices:
+            indices[icolumn] = get_entity_index(np.asarray(ids), icolumn)
+        return indices[icolumn]
+
+    def get_row_index(self, eids=None, nids=None) -> np.ndarray:
+        """
+        Gets the rows of the data array of a set of elements/nodes
+
+        Parameters
+        ----------
+        eids : int / List[int]; default=None -> all elements
+            the element ids
+        nids : int / List[int]; default=None -> all nodes
+            the node ids (e.g., the corner nodes of an element_node result)
+
+        Returns
+        -------
+        rows : (nrows, ) int ndarray
+            the rows in the order of the ids
+
+        """
+        rows = self._get_rows(eids, nids)
+        if isinstance(rows, slice):
+            rows = np.arange(rows.start, rows.stop)
+        return rows
+
+    def select(self, eids=None, nids=None, times=None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Selects the rows of the result by element/node id and time step
+
+        Parameters
+        ----------
+        eids : int / List[int]; default=None -> all elements
+            the element ids
+        nids : int / List[int]; default=None -> all nodes
+            the node ids (e.g., the corner nodes of an element_node result)
+        times : float / List[float]; default=None -> all time steps
+            the times/modes/frequencies (see ``_times``)
+
+        Returns
+        -------
+        ids : (nrows, ...) int ndarray
+            the ids of the selected rows (e.g., node_gridtype, element_node)
+        data : (ntimes, nrows, ncomponents) ndarray
+            the selected data; a view if the time steps and rows are
+            contiguous (e.g., one element, one time step)
+
+        The rows are found with a cached index (see ``get_entity_index``),
+        so the ids don't need to be sorted and repeated lookups are fast.
+
+        .. code-block:: python
+
+           # the centroid/corner stresses of element 10 for all time steps
+           element_node, data = model.cquad4_stress[1].select(eids=10)
+
+           # the displacement of nodes 1-3 for mode 2
+           node_gridtype, data = model.eigenvectors[1].select(nids=[1, 2, 3], times=2)
+
+        """
+        rows = self._get_rows(eids, nids)
+        ids = getattr(self, self._get_entity_ids_name())[rows]
+        itimes = self._get_time_index(times)
+        data = self.data
+        if isinstance(itimes, slice) or isinstance(rows, slice):
+            return ids, data[itimes, rows]
+        return ids, data[np.ix_(itimes, rows)]
+
+    def _get_entity_ids_name(self) -> str:
+        """gets the name of the id array of the rows of the data array"""
+        nrows = self.data.shape[1]
+        for ids_name in ENTITY_ID_COLUMNS:
+            ids = getattr(self, ids_name, None)
+            if ids is not None and hasattr(ids, 'shape') and ids.ndim in (1, 2) and (
+                    ids.shape[0] == nrows):
+                return ids_name
+        raise NotImplementedError(f'{self.class_name} does not have a node/element id array '
+                                  f'with {nrows} rows')
+
+    def _get_rows(self, eids, nids):
+        """gets the rows of a set of elements/nodes as a slice if possible"""
+        ids_name = self._get_entity_ids_name()
+        ieid, inid = ENTITY_ID_COLUMNS[ids_name]
+        if eids is not None and ieid is None:
+            raise ValueError(f'{self.class_name} is a nodal result ({ids_name}); eids={eids}')
+        if nids is not None and inid is None:
+            raise ValueError(f'{self.class_name} is an element result ({ids_name}); nids={nids}')
+
+        if eids is not None:
+            rows = self.get_entity_index(ieid).get_rows(eids)
+            if nids is None:
+                return rows
+            ids = getattr(self, ids_name)
+            rows = np.arange(ids.shape[0])[rows]
+            return rows[np.isin(ids[rows, inid], nids)]
+        if nids is not None:
+            return self.get_entity_index(inid).get_rows(nids)
+        return slice(None)
+
+    def _get_time_index(self, times):
+        """gets the time steps of a set of times as a slice if possible"""
+        if times is None:
+            return slice(None)
+        _times = np.asarray(self._times)
+        is_scalar = np.ndim(times) == 0
+        times = np.atleast_1d(times)
+        itimes = np.searchsorted(_times, times) if np.all(_times[1:] >= _times[:-1]) else (
+            np.argmin(np.abs(_times[np.newaxis, :] - times[:, np.newaxis]), axis=1))
+        itimes = np.minimum(itimes, len(_times) - 1)
+        is_missing = ~np.isclose(_times[itimes], times)
+        if np.any(is_missing):
+            raise KeyError(f'times={times[is_missing].tolist()} were not found; '
+                           f'_times={_times.tolist()}')
+        if is_scalar:
+            return slice(itimes[0], itimes[0] + 1)
+        return itimes
+
     def apply_data_code(self) -> None:
         #print(self.__class__.__name__)
         if self.table_name is not None and self.table_name != self.data_code['table_name']:
@@ -726,15 +922,13 @@ class BaseElement(ScalarObject):
         import pandas as pd
         columns = pd.MultiIndex.from_arrays(column_values, names=column_names)
 
-        eid_item = []
-        for eid in element:
-            for header in headers:
-                eid_item.append([eid, header])
         ntimes, nelements = data.shape[:2]
-        A = data.reshape(ntimes, nelements*len(headers)).T
+        nheaders = len(headers)
+        A = data.reshape(ntimes, nelements*nheaders).T
 
         names = ['ElementID', 'Item']
-        index = pd.MultiIndex.from_tuples(eid_item, names=names)
+        eid_item = [np.repeat(element, nheaders), np.tile(headers, len(element))]
+        index = pd.MultiIndex.from_arrays(eid_item, names=names)
         try:
             data_frame = pd.DataFrame(A, columns=columns, index=index)
         except ValueError:
@@ -784,19 +978,16 @@ class BaseElement(ScalarObject):
         if from_tuples:
             nvars = element_node.shape[1]
             assert len(names) == nvars + 1, f'names={names} element_node={element_node} {element_node.shape}'
-            eid_nid_item = []
-            for eid, nid in element_node:
-                for header in headers:
-                    eid_nid_item.append([eid, nid, header])
-            index = pd.MultiIndex.from_tuples(eid_nid_item, names=names)
+            nrows = element_node.shape[0]
+            eid_nid_item = [np.repeat(element_node[:, ivar], nheaders)
+                            for ivar in range(nvars)]
+            eid_nid_item.append(np.tile(headers, nrows))
+            index = pd.MultiIndex.from_arrays(eid_nid_item, names=names)
         elif from_array:
             nvars = len(element_node)
             assert len(names) == nvars + 1, f'names={names} element_node={element_node} (n={len(element_node)})'
-            eid_nid_item = []
-            for eid in element_node:
-                eidi = np.vstack([eid]*nheaders)
-                eid_nid_item.append(eidi.ravel())
-            eid_nid_item.append(headers * nelements)
+            eid_nid_item = [np.repeat(eid, nheaders) for eid in element_node]
+            eid_nid_item.append(np.tile(headers, nelements))
             index = pd.MultiIndex.from_arrays(eid_nid_item, names=names)
         else:  # pragma: no cover
             raise RuntimeError('from_tuple, from_array')
@@ -809,8 +1000,29 @@ class BaseElement(ScalarObject):
         #print(data_frame)
         return data_frame
 
+def _get_data_source(data):
+    """gets a weak reference to the array a DataFrame is built from"""
+    if data is None:
+        return None
+    try:
+        return weakref.ref(data)
+    except TypeError:
+        # not weak referenceable (e.g., a list); hold the object instead
+        return lambda: data
+
 def get_times_dtype(nonlinear_factor: Union[int, float], size: int,
-                    analysis_code_fmt=None) -> Tuple[str, str, str]:
+                    analysis_code_fmt=None,
+                    result_dtype: Optional[np.dtype]=None,
+                    id_dtype: Optional[np.dtype]=None) -> Tuple[str, str, str]:
+    """
+    Gets the dtypes of the times, ids, and data of a real result
+
+    Parameters
+    ----------
+    result_dtype / id_dtype : np.dtype; default=None -> the op2 precision
+        the precision of the data and id arrays (see ``OP2.read_op2``)
+
+    """
     dtype = 'float'
     if isinstance(nonlinear_factor, integer_types):
         dtype = 'int'
@@ -824,12 +1036,24 @@ def get_times_dtype(nonlinear_factor: Union[int, float], size: int,
         fdtype = 'float64'
         idtype = 'int64'
 
+    fdtype, idtype = apply_result_dtypes(fdtype, idtype, result_dtype, id_dtype)
     if analysis_code_fmt:
         dtype = analysis_code_fmt
         return dtype, idtype, fdtype
     return dtype, idtype, fdtype
 
-def get_complex_times_dtype(nonlinear_factor: Union[int, float], size: int) -> Tuple[str, str, str]:
+def get_complex_times_dtype(nonlinear_factor: Union[int, float], size: int,
+                            result_dtype: Optional[np.dtype]=None,
+                            id_dtype: Optional[np.dtype]=None) -> Tuple[str, str, str]:
+    """
+    Gets the dtypes of the times, ids, and data of a complex result
+
+    Parameters
+    ----------
+    result_dtype / id_dtype : np.dtype; default=None -> the op2 precision
+        float32 -> complex64 and float64 -> complex128 for the data
+
+    """
     dtype = 'float'
     if isinstance(nonlinear_factor, integer_types):
         dtype = 'int'
@@ -842,8 +1066,35 @@ def get_complex_times_dtype(nonlinear_factor: Union[int, float], size: int) -> T
         dtype += '64'
         cfdtype = 'complex128'
         idtype = 'int64'
+    cfdtype, idtype = apply_result_dtypes(cfdtype, idtype, result_dtype, id_dtype)
     return dtype, idtype, cfdtype
 
+def apply_result_dtypes(fdtype: str, idtype: str,
+                        result_dtype: Optional[np.dtype],
+                        id_dtype: Optional[np.dtype]) -> Tuple[str, str]:
+    """
+    Swaps the op2 precision of the data/id arrays for the one that was
+    requested, so the arrays of a result are built at that precision
+
+    Parameters
+    ----------
+    fdtype : str
+        the dtype of the data (e.g., 'float32', 'complex128')
+    idtype : str
+        the dtype of the ids (e.g., 'int32')
+    result_dtype / id_dtype : np.dtype / None
+        the requested precision; None -> fdtype/idtype
+
+    """
+    if result_dtype is not None:
+        if np.dtype(fdtype).kind == 'c':
+            fdtype = 'complex64' if np.dtype(result_dtype) == np.float32 else 'complex128'
+        else:
+            fdtype = np.dtype(result_dtype).name
+    if id_dtype is not None:
+        idtype = np.dtype(id_dtype).name
+    return fdtype, idtype
+
 def _check_element(table1: BaseElement, table2: BaseElement, log: SimpleLogger) -> None:
     """checks the ``element_node`` variable"""
     if not hasattr(table1, 'element'):
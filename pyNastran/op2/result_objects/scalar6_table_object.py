@@ -11,7 +11,7 @@ import numpy as np
 from numpy import zeros, searchsorted, unique, where, float32
 from numpy import allclose, asarray, vstack
 
-from pyNastran.op2.result_objects.op2_objects import ScalarObject
+from pyNastran.op2.result_objects.op2_objects import ScalarObject, apply_result_dtypes
 from pyNastran.op2.result_objects.table_object import append_sort1_sort2
 from pyNastran.f06.f06_formatting import write_floats_13e, write_float_12e
 from pyNastran.op2.op2_interface.write_utils import set_table3_field
@@ -164,7 +164,7 @@ class ScalarTableArray(ScalarObject):  # displacement style table
     def _reset_indices(self) -> None:
         self.itotal = 0
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the ScalarTableArray"""
         #print('_nnodes=%s ntimes=%s sort1?=%s ntotal=%s -> _nnodes=%s' % (
             #self._nnodes, self.ntimes, self.is_sort1,
@@ -191,9 +191,11 @@ class ScalarTableArray(ScalarObject):  # displacement style table
             #print("***SORT2 ntotal=%s nnodes=%s ntimes=%s" % (ntotal, nnodes, ntimes))
         else:
             raise RuntimeError('expected sort1/sort2\n%s' % self.code_information())
-        self.build_data(ntimes, nnodes, ntotal, nx, ny, self._times_dtype)
+        self.build_data(ntimes, nnodes, ntotal, nx, ny, self._times_dtype,
+                        result_dtype, id_dtype)
 
-    def build_data(self, ntimes, nnodes, ntotal, nx, ny, float_fmt):
+    def build_data(self, ntimes, nnodes, ntotal, nx, ny, float_fmt,
+                   result_dtype=None, id_dtype=None):
         """actually performs the build step"""
         self.ntimes = ntimes
         self._nnodes = nnodes
@@ -201,10 +203,11 @@ class ScalarTableArray(ScalarObject):  # displacement style table
 
         _times = zeros(ntimes, dtype=float_fmt)
         #self.types = array(self.nelements, dtype='|S1')
-        node_gridtype = zeros((nnodes, 2), dtype='int32')
+        fdtype, idtype = apply_result_dtypes(self.data_type(), 'int32', result_dtype, id_dtype)
+        node_gridtype = zeros((nnodes, 2), dtype=idtype)
 
         #[t1]
-        data = zeros((nx, ny, 1), self.data_type())
+        data = zeros((nx, ny, 1), fdtype)
         if self.load_as_h5:
             group = self._get_result_group()
             self._times = group.create_dataset('_times', data=_times)
@@ -391,8 +394,7 @@ class RealScalarTableArray(ScalarTableArray):  # temperature style table
     def _write_table_3(self, op2_file, fascii, new_result, itable=-3, itime=0):
         import inspect
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        fascii.write('%s.write_table_3: %s\n' % (self.__class__.__name__, call_frame[1][3]))
+        fascii.write('%s.write_table_3: %s\n' % (self.__class__.__name__, frame.f_back.f_code.co_name))
 
         if new_result and itable != -3:
             header = [
@@ -492,8 +494,7 @@ class RealScalarTableArray(ScalarTableArray):  # temperature style table
         assert self.table_name in {'OPG1', 'OUGV1', 'TOUGV1', 'OUG1', 'OTEMP1'}, self.table_name  # 'OUGV1', 'OQMG1', 'OQG1'
 
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        fascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
+        fascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, frame.f_back.f_code.co_name))
 
         if itable == -1:
             self._write_table_header(op2_file, fascii, date)
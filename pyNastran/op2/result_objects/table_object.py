@@ -24,7 +24,7 @@ these are used by:
 """
 from __future__ import annotations
 import copy
-from struct import Struct, pack
+from struct import pack
 import warnings
 from typing import List
 
@@ -32,10 +32,10 @@ import numpy as np
 #from numpy import float32
 
 from pyNastran.bdf import MAX_32_BIT_INT
-from pyNastran.op2.result_objects.op2_objects import ScalarObject
+from pyNastran.op2.result_objects.op2_objects import ScalarObject, apply_result_dtypes
 from pyNastran.f06.f06_formatting import write_floats_13e, write_imag_floats_13e, write_float_12e
 from pyNastran.op2.errors import SixtyFourBitError
-from pyNastran.op2.op2_interface.write_utils import set_table3_field, view_dtype, view_idtype_as_fdtype
+from pyNastran.op2.op2_interface.write_utils import set_table3_field, write_table4_rows
 from pyNastran.utils.numpy_utils import integer_types, float_types
 from pyNastran.op2.writer.utils import fix_table3_types
 
@@ -367,7 +367,7 @@ class TableArray(ScalarObject):  # displacement style table
     def _reset_indices(self) -> None:
         self.itotal = 0
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the TableArray"""
         #print('_nnodes=%s ntimes=%s sort1?=%s ntotal=%s -> _nnodes=%s' % (self._nnodes, self.ntimes, self.is_sort1,
                                                                           #self.ntotal, self._nnodes // self.ntimes))
@@ -409,9 +409,11 @@ class TableArray(ScalarObject):  # displacement style table
             #print("***SORT2 ntotal=%s nnodes=%s ntimes=%s" % (ntotal, nnodes, ntimes))
         else:
             raise RuntimeError('expected sort1/sort2\n%s' % self.code_information())
-        self.build_data(ntimes, nnodes, ntotal, nx, ny, self._times_dtype)
+        self.build_data(ntimes, nnodes, ntotal, nx, ny, self._times_dtype,
+                        result_dtype, id_dtype)
 
-    def build_data(self, ntimes, nnodes, ntotal, nx, ny, float_fmt: str):
+    def build_data(self, ntimes, nnodes, ntotal, nx, ny, float_fmt: str,
+                   result_dtype=None, id_dtype=None):
         """actually performs the build step"""
         self.ntimes = ntimes
         self._nnodes = nnodes
@@ -419,10 +421,11 @@ class TableArray(ScalarObject):  # displacement style table
 
         _times = np.zeros(ntimes, dtype=float_fmt)
         int_fmt = 'int32' if self.size == 4 else 'int64'
+        fdtype, int_fmt = apply_result_dtypes(self.data_type(), int_fmt, result_dtype, id_dtype)
         node_gridtype = np.zeros((nnodes, 2), dtype=int_fmt)
 
         #[t1, t2, t3, r1, r2, r3]
-        data = np.zeros((nx, ny, 6), self.data_type())
+        data = np.zeros((nx, ny, 6), fdtype)
         if self.load_as_h5:
             group = self._get_result_group()
             self._times = group.create_dataset('_times', data=_times)
@@ -513,19 +516,14 @@ class TableArray(ScalarObject):  # displacement style table
                 A = self.data[:, :, 0].T
                 data_frame = pd.DataFrame(A, columns=columns, index=index)
             else:
-                node_gridtype_item = []
                 node_ids = self.node_gridtype[:, 0]
-                for nid, gridtype in zip(node_ids, gridtype_str):
-                    node_gridtype_item.extend([[nid, gridtype, 't1']])
-                    node_gridtype_item.extend([[nid, gridtype, 't2']])
-                    node_gridtype_item.extend([[nid, gridtype, 't3']])
-                    node_gridtype_item.extend([[nid, gridtype, 'r1']])
-                    node_gridtype_item.extend([[nid, gridtype, 'r2']])
-                    node_gridtype_item.extend([[nid, gridtype, 'r3']])
-
-
+                node_gridtype_item = [
+                    np.repeat(node_ids, 6),
+                    np.repeat(gridtype_str, 6),
+                    np.tile(['t1', 't2', 't3', 'r1', 'r2', 'r3'], nnodes),
+                ]
                 names = ['NodeID', 'Type', 'Item']
-                index = pd.MultiIndex.from_tuples(node_gridtype_item, names=names)
+                index = pd.MultiIndex.from_arrays(node_gridtype_item, names=names)
                 A = self.data.reshape(ntimes, nnodes*6).T
                 try:
                     data_frame = pd.DataFrame(A, columns=columns, index=index)
@@ -765,8 +763,7 @@ class TableArray(ScalarObject):  # displacement style table
     def _write_table_3(self, op2_file, fascii, new_result, itable=-3, itime=0):
         import inspect
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        fascii.write('%s.write_table_3: %s\n' % (self.__class__.__name__, call_frame[1][3]))
+        fascii.write('%s.write_table_3: %s\n' % (self.__class__.__name__, frame.f_back.f_code.co_name))
 
         if new_result and itable != -3:
             header = [
@@ -1146,8 +1143,7 @@ class RealTableArray(TableArray):
         assert self.table_name in allowed_tables, self.table_name
 
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        fascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
+        fascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, frame.f_back.f_code.co_name))
 
         if itable == -1:
             self._write_table_header(op2_file, fascii, date)
@@ -1171,19 +1167,8 @@ class RealTableArray(TableArray):
         if max_id > MAX_32_BIT_INT:
             raise SixtyFourBitError(f'64-bit OP2 writing is not supported; max id={max_id}')
 
-        fdtype = self.data.dtype
-        if self.size == 4:
-            pass
-        else:
+        if self.size != 4:
             warnings.warn(f'downcasting {self.class_name}...this is buggy')
-            #idtype = np.int32(1)
-            fdtype = np.float32(1.0)
-
-        nodedevice_gridtype = np.column_stack([nnodes_device, gridtype])
-        node_gridtype_floats = view_idtype_as_fdtype(nodedevice_gridtype, fdtype)
-
-        #print(node_gridtype_floats)
-        #node_gridtype_floats = nodedevice_gridtype.view(fdtype) # .reshape(nnodes, 2)
 
         #format_table4_1 = Struct(self._endian + b'15i')
         #format_table4_2 = Struct(self._endian + b'3i')
@@ -1215,11 +1200,13 @@ class RealTableArray(TableArray):
             fascii.write('r4 [4, %s, 4]\n' % (itable))
             fascii.write('r4 [4, %i, 4]\n' % (4*ntotal))
 
-            datai = view_dtype(self.data[itime, :, :], fdtype)
-            node_gridtype_data = np.hstack([node_gridtype_floats, datai])
-            op2_file.write(node_gridtype_data)
-            assert ntotal == node_gridtype_data.size
-            #print(self.data.shape, ntotal)
+            # [node_device, gridtype, t1, t2, t3, r1, r2, r3]
+            nwords = write_table4_rows(op2_file, [
+                (b'i', nnodes_device),
+                (b'i', gridtype),
+                (b'f', self.data[itime, :, :]),
+            ], endian)
+            assert ntotal == nwords, f'ntotal={ntotal} nwords={nwords}'
 
             itable -= 1
             header = [4 * ntotal,]
@@ -1681,19 +1668,15 @@ class ComplexTableArray(TableArray):
         assert self.table_name in allowed_tables, self.table_name
 
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        fascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
+        fascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, frame.f_back.f_code.co_name))
 
         if itable == -1:
             self._write_table_header(op2_file, fascii, date)
             itable = -3
 
         #print('nonlinear_factor =', self.nonlinear_factor)
-        if self.is_sort1:
-            op2_format = endian + b'2i 12f'
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
-        s = Struct(op2_format)
 
         node = self.node_gridtype[:, 0]
         max_id = node.max()
@@ -1752,19 +1735,15 @@ class ComplexTableArray(TableArray):
             #node_gridtype_data_bytes = node_gridtype_data.tobytes()
             #op2_file.write(node_gridtype_data_bytes)
 
-            t1 = self.data[itime, :, 0]
-            t2 = self.data[itime, :, 1]
-            t3 = self.data[itime, :, 2]
-            r1 = self.data[itime, :, 3]
-            r2 = self.data[itime, :, 4]
-            r3 = self.data[itime, :, 5]
-
-            for node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i in zip(nnodes_device, gridtype, t1, t2, t3, r1, r2, r3):
-                data = [node_id, gridtypei,
-                        t1i.real, t2i.real, t3i.real, r1i.real, r2i.real, r3i.real,
-                        t1i.imag, t2i.imag, t3i.imag, r1i.imag, r2i.imag, r3i.imag]
-                fascii.write('  nid, grid_type, dx, dy, dz, rx, ry, rz = %s\n' % data)
-                op2_file.write(s.pack(*data))
+            # [node_device, gridtype, t1r, ..., r3r, t1i, ..., r3i]
+            datai = self.data[itime, :, :]
+            nwords = write_table4_rows(op2_file, [
+                (b'i', nnodes_device),
+                (b'i', gridtype),
+                (b'f', datai.real),
+                (b'f', datai.imag),
+            ], endian)
+            assert ntotal == nwords, f'ntotal={ntotal} nwords={nwords}'
 
             itable -= 1
             header = [4 * ntotal,]
@@ -25,7 +25,7 @@ from pyNastran.bdf.cards.thermal.thermal import PCONV, PHBDY, PCONVM
 # PCOMPG, PBUSH1D, PBEAML, PBEAM3
 from pyNastran.op2.op2_interface.op2_reader import (
     mapfmt, reshape_bytes_block_size) # reshape_bytes_block,
-from .utils import get_minus1_start_end
+from .utils import get_minus1_start_end, unpack_cards
 from .geom2 import DoubleCardError
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.op2.op2_geom import OP2Geom
@@ -2927,18 +2927,14 @@ class EPT:
         PSHELL(2302,23,283) - the marker for Record 51
         """
         op2 = self.op2
-        ntotal = 44 * self.factor  # 11*4
-        s = Struct(mapfmt(op2._endian + b'iififi4fi', self.size))
-        nproperties = (len(data) - n) // ntotal
-        for unused_i in range(nproperties):
-            edata = data[n:n+ntotal]
-            out = s.unpack(edata)
+        n, cards = unpack_cards(op2, data, n, b'iififi4fi')  # 11*4
+        nproperties = len(cards)
+        for out in cards.tolist():
             (pid, mid1, unused_t, mid2, unused_bk, mid3, unused_ts,
              unused_nsm, unused_z1, unused_z2, mid4) = out
             if op2.is_debug_file:
                 op2.binary_debug.write('  PSHELL=%s\n' % str(out))
             prop = PSHELL.add_op2_data(out)
-            n += ntotal
 
             if pid in op2.properties:
                 # this is a fake PSHELL
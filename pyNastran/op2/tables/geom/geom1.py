@@ -19,7 +19,7 @@ from pyNastran.bdf.cards.coordinate_systems import (
 from pyNastran.bdf.cards.elements.damper import CVISC
 #from pyNastran.bdf.cards.elements.mass import CMASS2
 from pyNastran.op2.op2_interface.op2_reader import mapfmt, reshape_bytes_block
-from .utils import get_minus1_start_end
+from .utils import get_minus1_start_end, unpack_cards, create_cards
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.op2.op2_geom import OP2Geom
 
@@ -730,9 +730,8 @@ class GEOM1:
 
         ngrids = len(grids)
         assert n is not None
-        for nid, grid in grids.items():
-            op2.nodes[nid] = grid
-            op2._type_to_id_map['GRID'].append(nid)
+        op2.nodes.update(grids)
+        op2._type_to_id_map['GRID'].extend(grids)
 
         op2.card_count['GRID'] = ngrids
         return n
@@ -740,40 +739,32 @@ class GEOM1:
     def _read_grid_8(self, data: bytes, n: int) -> Tuple[int, Dict[int, GRID]]:  # 21.8 sec, 18.9
         """(4501,45,1) - the marker for Record 17"""
         op2 = self.op2
-        structi = Struct(mapfmt(op2._endian + b'ii 3f 3i', op2.size))
         ntotal = 32 * op2.factor
         ndatai = len(data) - n
         nentries = ndatai // ntotal
         assert nentries > 0, nentries
         assert ndatai % ntotal == 0, f'ndatai={ndatai} ntotal={ntotal} leftover={ndatai % ntotal}'
-        grids = {}
-        for unused_i in range(nentries):
-            edata = data[n:n + ntotal]
-            out = structi.unpack(edata)
-            (nid, cp, x1, x2, x3, cd, ps, seid) = out
-            if op2.is_debug_file:
+        n, cards = unpack_cards(op2, data, n, b'ii 3f 3i',
+                                names=('nid', 'cp', 'x1', 'x2', 'x3', 'cd', 'ps', 'seid'))
+        if op2.is_debug_file:
+            for out in cards.tolist():
                 op2.binary_debug.write('  GRID=%s\n' % str(out))
-            #if nid < 10000000:
-            # cd can be < 0
-            if ps == 0:
-                ps = ''
-            node = GRID(nid, np.array([x1, x2, x3]), cp, cd, ps, seid)
-            #op2._type_to_id_map['GRID'].append(nid)
-            #self.nodes[nid] = node
-            grids[nid] = node
-            #if nid in self.nodes:
-                #self.reject_lines.append(str(node))
-            #else:
-            #self.nodes[nid] = node
-            #self.add_node(node)
-            #else:
-                #op2.log.warning('*nid=%s cp=%s x1=%-5.2f x2=%-5.2f x3=%-5.2f cd=%-2s ps=%s '
-                                 #'seid=%s' % (nid, cp, x1, x2, x3, cd, ps, seid))
-                #node = GRID(nid, np.array([x1, x2, x3]), cp, cd, ps, seid)
-                #self.rejects.append(str(node))
-                #nfailed += 1
-            n += ntotal
-        #op2.increase_card_count('GRID', nentries - nfailed)
+
+        # cd can be < 0
+        nids = cards['nid'].tolist()
+        xyz = np.column_stack([cards['x1'], cards['x2'], cards['x3']]).astype('float64')
+        pss = [ps if ps else '' for ps in cards['ps'].tolist()]
+        values = {
+            'nid': nids,
+            'xyz': list(xyz),
+            'cp': cards['cp'].tolist(),
+            'cd': cards['cd'].tolist(),
+            'ps': pss,
+            'seid': cards['seid'].tolist(),
+        }
+        # GRID(nid, xyz, cp, cd, ps, seid)
+        node0 = GRID(*[value[0] for value in values.values()])
+        grids = dict(zip(nids, create_cards(node0, values)))
         return n, grids
 
     def _read_grid_11(self, data: bytes, n: int) -> Tuple[int, Dict[int, GRID]]:  # 21.8 sec, 18.9
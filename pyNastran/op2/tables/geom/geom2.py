@@ -5,7 +5,7 @@ defines readers for BDF objects in the OP2 GEOM2/GEOM2S table
 from __future__ import annotations
 from struct import Struct
 from functools import partial
-from typing import Tuple, List, Union, Any, TYPE_CHECKING
+from typing import Tuple, List, Union, Optional, Any, TYPE_CHECKING
 import numpy as np
 
 from pyNastran.bdf.cards.elements.elements import CGAP, PLOTEL
@@ -35,6 +35,7 @@ from pyNastran.bdf.cards.elements.acoustic import CHACAB, CHACBR, CAABSF
 from pyNastran.op2.errors import MixedVersionCard
 from pyNastran.op2.op2_interface.op2_reader import mapfmt # , reshape_bytes_block
 from pyNastran.op2.tables.geom.geom4 import RBE3
+from pyNastran.op2.tables.geom.utils import unpack_cards, create_cards
 
 from pyNastran.op2.errors import DoubleCardError, EmptyCardError
 if TYPE_CHECKING:  # pragma: no cover
@@ -626,6 +627,34 @@ class GEOM2:
         op2._add_methods._add_element_object(elem, allow_overwrites=False)
         #print(str(elem)[:-1])
 
+    def add_op2_elements(self, elements: List[Any]) -> None:
+        """
+        Adds a block of elements of the same type (the bulk version of
+        ``add_op2_element``)
+
+        The elements are added one at a time if any of them need to be
+        checked (e.g., a duplicate element id).
+        """
+        if not elements:
+            return
+        op2 = self.op2
+        elem0 = elements[0]
+        eids = [elem.eid for elem in elements]
+        is_simple = (
+            elem0.type not in ['CTRIA6', 'CQUAD8'] and
+            all(elem.type == elem0.type for elem in elements) and
+            min(eids) > 0 and
+            len(set(eids)) == len(eids) and
+            op2.elements.keys().isdisjoint(eids) and
+            all(-1 not in elem.nodes for elem in elements))
+        if not is_simple:
+            for elem in elements:
+                self.add_op2_element(elem)
+            return
+
+        op2.elements.update(zip(eids, elements))
+        op2._type_to_id_map[elem0.type].extend(eids)
+
 # 1-AEROQ4 (???)
 # AEROT3   (???)
 # 1-BEAMAERO (1701,17,0)
@@ -1867,12 +1896,9 @@ class GEOM2:
         CHEXA(7308,73,253) - the marker for Record 45
         """
         op2 = self.op2
-        s = Struct(mapfmt(op2._endian + b'22i', self.size))
-        ntotal = 88 * self.factor  # 22*4
-        nelements = (len(data) - n) // ntotal
-        for unused_i in range(nelements):
-            edata = data[n:n+ntotal]
-            out = s.unpack(edata)
+        n, cards = unpack_cards(op2, data, n, b'22i')  # 22*4
+        nelements = len(cards)
+        for out in cards.tolist():
             if op2.is_debug_file:
                 op2.binary_debug.write('  CHEXA=%s\n' % str(out))
             (eid, pid, g1, g2, g3, g4, g5, g6, g7, g8, g9, g10,
@@ -1886,7 +1912,6 @@ class GEOM2:
             else:
                 elem = CHEXA8.add_op2_data(data_in)
             self.add_op2_element(elem)
-            n += ntotal
         op2.card_count['CHEXA'] = nelements
         return n
 
@@ -2758,12 +2783,9 @@ class GEOM2:
         CPENT6FD(16000,160,9999) - the marker for Record 66
         """
         op2 = self.op2
-        ntotal = 68 * self.factor  # 17*4
-        s = Struct(mapfmt(op2._endian + b'17i', self.size))
-        nelements = (len(data) - n) // ntotal
-        for unused_i in range(nelements):
-            edata = data[n:n + ntotal]
-            out = s.unpack(edata)
+        n, cards = unpack_cards(op2, data, n, b'17i')  # 17*4
+        nelements = len(cards)
+        for out in cards.tolist():
             if op2.is_debug_file:
                 op2.binary_debug.write('  CPENTA=%s\n' % str(out))
             (eid, pid, g1, g2, g3, g4, g5, g6, g7, g8, g9, g10,
@@ -2776,7 +2798,6 @@ class GEOM2:
             else:
                 elem = CPENTA6.add_op2_data(data_in)
             self.add_op2_element(elem)
-            n += ntotal
         op2.card_count['CPENTA'] = nelements
         return n
 
@@ -2930,8 +2951,11 @@ class GEOM2:
             methods, data, n)
 
         nentries = len(elements)
-        for elem in elements:
-            add_method(elem)
+        if add_method == self.add_op2_element:
+            self.add_op2_elements(elements)
+        else:
+            for elem in elements:
+                add_method(elem)
         op2.card_count[card_name] = nentries
         return n
 
@@ -3120,9 +3144,7 @@ class GEOM2:
             1004, 20, 20100, 20101, 20201, 20200, 0,    0, 0, 0, -1.0, -1.0, -1.0, -1.0, -1)
         """
         op2 = self.op2
-        elements = []
         ntotal = 60 * self.factor  # 15*4
-        nelements = (len(data) - n) // ntotal
         leftover = (len(data) - n) % ntotal
         assert leftover == 0, leftover
 
@@ -3131,7 +3153,6 @@ class GEOM2:
         #   3f-i zeros as float/int???
         #   4f correct
         #   i correct
-        structi = Struct(mapfmt(op2._endian + b'6i 3fi 4f i', self.size))
         #if op2.is_debug_file:
             #op2.binary_debug.write('ndata=%s\n' % (nelements * 44))
 
@@ -3139,48 +3160,26 @@ class GEOM2:
             op2.binary_debug.write(f'  {element.type}=(eid, pid, [n1, n2, n3, n4], theta, zoffs, '
                                     'unused_blank, [tflag, t1, t2, t3, t4]); theta_mcid\n')
 
-        for unused_i in range(nelements):
-            edata = data[n:n + ntotal]
-            #self.show_data(edata)
-            out = structi.unpack(edata)
-            # theta, zoffs, blank, tflag, t1, t2, t3, t4
-            (eid, pid, n1, n2, n3, n4,
-             theta, zoffs, blank, tflag,
-             t1, t2, t3, t4,
-             minus1) = out
-            assert blank == 0.0
-            assert isinstance(tflag, int), tflag
-            #minus1 = out[-1]
-            #eid, pid, n1, n2, n3, n4, theta, a, b, c, t1, t2, t3, t4, minus1 = out
-            #print(eid, pid)
-
-            msg = ('eid=%s pid=%s nodes=%s '
-                   'theta=%s zoffs=%s '
-                   'blank=%s tflag=%s '
-                   't1-t4=%s minus1=%s' % (
-                       eid, pid, (n1, n2, n3, n4),
-                       theta, zoffs,
-                       blank, tflag,
-                       (t1, t2, t3, t4), minus1))
-            #print(msg)
-            #assert theta == 0, msg
-            assert zoffs == 0, msg
-            assert blank == 0, msg
-            assert tflag == 0, msg
+        n, cards = unpack_cards(op2, data, n, b'6i 3fi 4f i', names=(
+            'eid', 'pid', 'n1', 'n2', 'n3', 'n4', 'theta', 'zoffs', 'blank', 'tflag',
+            't1', 't2', 't3', 't4', 'minus1'))
+        #assert theta == 0, msg
+        for name, value in [('zoffs', 0), ('blank', 0), ('tflag', 0), ('minus1', -1)]:
+            ibad = np.where(cards[name] != value)[0]
+            assert len(ibad) == 0, f'{name} != {value}; cards={cards[ibad].tolist()}'
 
-            theta_mcid = convert_theta_to_mcid(theta)
-            if op2.is_debug_file:
+        theta_mcids = convert_theta_to_mcid_array(cards['theta'])
+        if op2.is_debug_file:
+            for out, theta_mcid in zip(cards.tolist(), theta_mcids):
+                (eid, pid, n1, n2, n3, n4,
+                 theta, zoffs, blank, tflag,
+                 t1, t2, t3, t4,
+                 unused_minus1) = out
                 op2.binary_debug.write(
                     f'  {element.type}=({eid}, {pid}, [{n1}, {n2}, {n3}, {n4}], '
                     f'{theta}, {zoffs}, {blank}, [{tflag}, {t1}, {t2}, {t3}, {t4})]; {theta_mcid}\n')
-            assert minus1 == -1, minus1
 
-            data_init = [
-                eid, pid, n1, n2, n3, n4, theta_mcid, zoffs,
-                tflag, t1, t2, t3, t4]
-            elem = element.add_op2_data(data_init)
-            elements.append(elem)
-            n += ntotal
+        elements = _create_shells(element, cards, 4, theta_mcids)
         #if stop:
             #raise RuntimeError('theta is too large...make the quad wrong')
         #op2.card_count[element.type] = nelements
@@ -3199,12 +3198,10 @@ class GEOM2:
         )
         """
         op2 = self.op2
-        elements = []
         ntotal = 56 * self.factor  # 14*4
         nelements = (len(data) - n) // ntotal
         leftover = (len(data) - n) % ntotal
         assert leftover == 0, leftover
-        s = Struct(mapfmt(op2._endian + b'6i ff ii 4f', self.size))
         if op2.is_debug_file:
             op2.binary_debug.write('ndata=%s\n' % (nelements * 44))
 
@@ -3212,13 +3209,14 @@ class GEOM2:
             op2.binary_debug.write(f'  {element.type}=(eid, pid, [n1, n2, n3, n4], theta, zoffs, '
                                     'unused_blank, [tflag, t1, t2, t3, t4]); theta_mcid\n')
 
-        for unused_i in range(nelements):
-            edata = data[n:n + ntotal]
-            out = s.unpack(edata)
-            (eid, pid, n1, n2, n3, n4, theta, zoffs, unused_blank, tflag,
-             t1, t2, t3, t4) = out
-            theta_mcid = convert_theta_to_mcid(theta)
-            if op2.is_debug_file:
+        n, cards = unpack_cards(op2, data, n, b'6i ff ii 4f', names=(
+            'eid', 'pid', 'n1', 'n2', 'n3', 'n4', 'theta', 'zoffs', 'blank', 'tflag',
+            't1', 't2', 't3', 't4'))
+        theta_mcids = convert_theta_to_mcid_array(cards['theta'])
+        if op2.is_debug_file:
+            for out, theta_mcid in zip(cards.tolist(), theta_mcids):
+                (eid, pid, n1, n2, n3, n4, theta, zoffs, unused_blank, tflag,
+                 t1, t2, t3, t4) = out
                 op2.binary_debug.write(
                     f'  {element.type}=({eid}, {pid}, [{n1}, {n2}, {n3}, {n4}], '
                     f'{theta}, {zoffs}, {unused_blank}, [{tflag}, {t1}, {t2}, {t3}, {t4})]; {theta_mcid}\n')
@@ -3228,13 +3226,7 @@ class GEOM2:
                       #eid, pid, n1, n2, n3, n4, theta, zoffs,
                       #blank, tflag, t1, t2, t3, t4))
 
-            data_init = [
-                eid, pid, n1, n2, n3, n4, theta_mcid, zoffs,
-                tflag, t1, t2, t3, t4]
-            elem = element.add_op2_data(data_init)
-            #op2.add_op2_element(elem)
-            elements.append(elem)
-            n += ntotal
+        elements = _create_shells(element, cards, 4, theta_mcids)
         #if stop:
             #raise RuntimeError('theta is too large...make the quad wrong')
         #op2.card_count[element.type] = nelements
@@ -3600,13 +3592,10 @@ class GEOM2:
         CROD(3001,30,48)    - the marker for Record 81
         """
         op2 = self.op2
-        ntotal = 16 * self.factor # 4*4
-        struct_4i = Struct(mapfmt(op2._endian + b'4i', self.size))
-        nelements = (len(data) - n) // ntotal
+        n, cards = unpack_cards(op2, data, n, b'4i')  # 4*4
+        nelements = len(cards)
         #is_long_ids = False
-        for unused_i in range(nelements):
-            edata = data[n:n + ntotal]
-            out = struct_4i.unpack(edata)
+        for out in cards.tolist():
             if op2.is_debug_file:
                 op2.binary_debug.write('  CROD=%s\n' % str(out))
             #(eid, pid, n1, n2) = out
@@ -3614,7 +3603,6 @@ class GEOM2:
                 #is_long_ids = True
             elem = CROD.add_op2_data(out)
             self.add_op2_element(elem)
-            n += ntotal
         #self._is_long_ids = is_long_ids
         op2.card_count['CROD'] = nelements
         return n
@@ -3723,12 +3711,9 @@ class GEOM2:
         CTETR4FD(16100,161,9999) - the marker for Record 91
         """
         op2 = self.op2
-        ntotal = 48 * self.factor  # 12*4
-        s = Struct(mapfmt(op2._endian + b'12i', self.size))
-        nelements = (len(data) - n) // ntotal
-        for unused_i in range(nelements):
-            edata = data[n:n + ntotal]
-            out = s.unpack(edata)
+        n, cards = unpack_cards(op2, data, n, b'12i')  # 12*4
+        nelements = len(cards)
+        for out in cards.tolist():
             if op2.is_debug_file:
                 op2.binary_debug.write('  CTETRA=%s\n' % str(out))
             (eid, pid, n1, n2, n3, n4, n5, n6, n7, n8, n9, n10) = out
@@ -3739,14 +3724,13 @@ class GEOM2:
                 elem = CTETRA10.add_op2_data(data_in + big_nodes)
             else:
                 elem = CTETRA4.add_op2_data(data_in)
+            # validate checks the integer fields, so the card isn't written (str(elem))
             try:
                 elem.validate()
-                str(elem)
             except Exception:
                 print(data_in, big_nodes)
                 raise
             self.add_op2_element(elem)
-            n += ntotal
         op2.card_count['CTETRA'] = nelements
         return n
 
@@ -3774,27 +3758,19 @@ class GEOM2:
 
         """
         op2 = self.op2
-        ntotal = 52 * self.factor  # 13*4
-        s = Struct(mapfmt(op2._endian + b'5iff3i3f', self.size))
-        nelements = (len(data) - n)// ntotal
-        elements = []
-        for unused_i in range(nelements):
-            edata = data[n:n+ntotal]
-            out = s.unpack(edata)
-            #print('eid=%s pid=%s n1=%s n2=%s n3=%s theta=%s zoffs=%s '
-                  #'blank1=%s blank2=%s tflag=%s t1=%s t2=%s t3=%s' % (
-                      #eid, pid, n1, n2, n3, theta, zoffs,
-                      #blank1, blank2, tflag, t1, t2, t3))
-            (eid, pid, n1, n2, n3, theta, zoffs, unused_blank1,
-             unused_blank2, tflag, t1, t2, t3) = out
-            if op2.is_debug_file:
+        n, cards = unpack_cards(op2, data, n, b'5iff3i3f', names=(  # 13*4
+            'eid', 'pid', 'n1', 'n2', 'n3', 'theta', 'zoffs', 'blank1', 'blank2', 'tflag',
+            't1', 't2', 't3'))
+        #print('eid=%s pid=%s n1=%s n2=%s n3=%s theta=%s zoffs=%s '
+              #'blank1=%s blank2=%s tflag=%s t1=%s t2=%s t3=%s' % (
+                  #eid, pid, n1, n2, n3, theta, zoffs,
+                  #blank1, blank2, tflag, t1, t2, t3))
+        if op2.is_debug_file:
+            for out in cards.tolist():
                 op2.binary_debug.write('  CTRIA3=%s\n' % str(out))
 
-            theta_mcid = convert_theta_to_mcid(theta)
-            data_in = [eid, pid, n1, n2, n3, theta_mcid, zoffs, tflag, t1, t2, t3]
-            elem = CTRIA3.add_op2_data(data_in)
-            elements.append(elem)
-            n += ntotal
+        theta_mcids = convert_theta_to_mcid_array(cards['theta'])
+        elements = _create_shells(CTRIA3, cards, 3, theta_mcids)
         return n, elements
 
     def _read_ctria3_56(self, card_obj, data: bytes, n: int) -> int:
@@ -3816,31 +3792,18 @@ class GEOM2:
 
         """
         op2 = self.op2
-        ntotal = 56 * self.factor  # 13*4
-        s = Struct(mapfmt(op2._endian + b'5i f 4i 3f i', self.size))
-        nelements = (len(data) - n)// ntotal
-        elements = []
-        for unused_i in range(nelements):
-            edata = data[n:n+ntotal]
-            out = s.unpack(edata)
-            #print('eid=%s pid=%s n1=%s n2=%s n3=%s theta=%s zoffs=%s '
-                  #'blank1=%s blank2=%s tflag=%s t1=%s t2=%s t3=%s' % (
-                      #eid, pid, n1, n2, n3, theta, zoffs,
-                      #blank1, blank2, tflag, t1, t2, t3))
-            (eid, pid, n1, n2, n3, theta, a, b, c, d,
-             t1, t2, t3, minus1) = out
-            abcd = (a, b, c, d)
-            assert abcd == (0, 0, 0, 0), abcd
-            if op2.is_debug_file:
+        n, cards = unpack_cards(op2, data, n, b'5i f 4i 3f i', names=(  # 14*4
+            'eid', 'pid', 'n1', 'n2', 'n3', 'theta', 'a', 'b', 'c', 'd',
+            't1', 't2', 't3', 'minus1'))
+        abcd = np.column_stack([cards['a'], cards['b'], cards['c'], cards['d']])
+        assert (abcd == 0).all(), abcd
+        if op2.is_debug_file:
+            for out in cards.tolist():
                 op2.binary_debug.write('  CTRIA3=%s\n' % str(out))
 
-            zoffs = 0.0
-            tflag = 0
-            theta_mcid = convert_theta_to_mcid(theta)
-            data_in = [eid, pid, n1, n2, n3, theta_mcid, zoffs, tflag, t1, t2, t3]
-            elem = CTRIA3.add_op2_data(data_in)
-            elements.append(elem)
-            n += ntotal
+        theta_mcids = convert_theta_to_mcid_array(cards['theta'])
+        elements = _create_shells(CTRIA3, cards, 3, theta_mcids,
+                                  zoffs=0.0, tflag=0)
         return n, elements
 
 
@@ -5162,6 +5125,70 @@ def convert_theta_to_mcid(theta):
         theta = cid
     return theta
 
+def _create_shells(element: Union[CTRIA3, CQUAD4, CQUADR], cards: np.ndarray,
+                   nnodes: int, theta_mcids: List[Union[int, float]],
+                   zoffs: Optional[float]=None, tflag: Optional[int]=None) -> List[Any]:
+    """
+    Creates a block of CTRIA3s/CQUAD4s/CQUADRs (the bulk version of
+    ``element.add_op2_data``)
+
+    Parameters
+    ----------
+    element : CTRIA3 / CQUAD4 / CQUADR
+        the card type
+    cards : (nelements, ) structured ndarray
+        eid, pid, n1..n{nnodes}, t1..t{nnodes} and optionally zoffs/tflag
+    nnodes : int
+        the number of corner nodes (3/4)
+    theta_mcids : List[int/float]
+        the theta/mcid values (see ``convert_theta_to_mcid_array``)
+    zoffs / tflag : float / int; default=None -> use the cards
+        the value for all the elements
+
+    """
+    nelements = len(cards)
+    if nelements == 0:
+        return []
+    nids = np.column_stack([cards[f'n{i}'] for i in range(1, nnodes + 1)])
+    thickness = np.column_stack([cards[f't{i}'] for i in range(1, nnodes + 1)])
+    zoffsets = cards['zoffs'].tolist() if zoffs is None else [zoffs] * nelements
+    tflags = cards['tflag'] if tflag is None else np.full(nelements, tflag)
+
+    ibad = np.where((nids <= 0).any(axis=1))[0]
+    assert len(ibad) == 0, f'{element.type} nids={nids[ibad, :].tolist()}'
+    ibad = np.where((tflags != 0) & (tflags != 1))[0]
+    assert len(ibad) == 0, f'{element.type} tflag={tflags[ibad].tolist()}'
+    thickness = np.where(thickness == -1.0, 1.0, thickness)
+
+    values = {
+        'eid': cards['eid'].tolist(),
+        'pid': cards['pid'].tolist(),
+        'nodes': nids.tolist(),
+        'theta_mcid': theta_mcids,
+        'zoffset': zoffsets,
+        'tflag': tflags.tolist(),
+    }
+    for i, thicknessi in enumerate(thickness.T.tolist()):
+        values[f'T{i+1}'] = thicknessi
+
+    data_init = ([values['eid'][0], values['pid'][0]] + values['nodes'][0] +
+                 [theta_mcids[0], zoffsets[0], values['tflag'][0]] +
+                 [values[f'T{i+1}'][0] for i in range(nnodes)])
+    elem0 = element.add_op2_data(data_init)
+    return create_cards(elem0, values)
+
+def convert_theta_to_mcid_array(theta: np.ndarray) -> List[Union[int, float]]:
+    """vectorized version of ``convert_theta_to_mcid``"""
+    theta_mcid = theta.tolist()
+    icid = np.where(theta > 511.)[0]
+    if len(icid):
+        cid_float = theta[icid].astype('float64') / 512. - 1
+        cid = cid_float.astype('int64')
+        assert np.allclose(cid, cid_float), 'theta=%s cid=%s cid_float=%s' % (theta[icid], cid, cid_float)
+        for i, cidi in zip(icid.tolist(), cid.tolist()):
+            theta_mcid[i] = cidi
+    return theta_mcid
+
 def get_minus_4_index(idata):
     """helper for ``get_minus_4_index``"""
     #print('idata =', idata)
@@ -15,6 +15,7 @@ from pyNastran.bdf.cards.dynamic import (TSTEPNL,
 from pyNastran.bdf.cards.thermal.radiation import RADM
 from pyNastran.op2.op2_interface.op2_reader import mapfmt # , reshape_bytes_block
 from .geom2 import DoubleCardError
+from .utils import unpack_cards
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.op2.op2_geom import OP2Geom
 
@@ -123,16 +124,12 @@ class MPT:
         MAT1(103,1,77) - record 2
         """
         op2 = self.op2
-        ntotal = 48 * self.factor  # 12*4
-        s = Struct(mapfmt(op2._endian + b'i10fi', self.size))
-        nmaterials = (len(data) - n) // ntotal
-        for unused_i in range(nmaterials):
-            edata = data[n:n+ntotal]
-            out = s.unpack(edata)
+        n, cards = unpack_cards(op2, data, n, b'i10fi')  # 12*4
+        nmaterials = len(cards)
+        for out in cards.tolist():
             #(mid, E, G, nu, rho, A, tref, ge, St, Sc, Ss, mcsid) = out
             mat = MAT1.add_op2_data(out)
             self.add_op2_material(mat)
-            n += ntotal
         op2.card_count['MAT1'] = nmaterials
         return n
 
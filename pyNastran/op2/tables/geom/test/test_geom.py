@@ -225,6 +225,40 @@ class TestOP2GeomUnit(unittest.TestCase):
             op2.reader_geom1._read_grid_11(data_bytes3, 12)
 
         #-----------------------------------
+    def test_read_cquad4_ctria3(self):
+        """the CQUAD4/CTRIA3 blocks are created in bulk"""
+        op2 = OP2Geom(make_geom=True, debug=False, log=None, debug_file=None, mode='nx')
+        op2._endian = b'<'
+        op2.op2_reader.factor = 1
+        data = (
+            2958, 51, 177,
+            # eid, pid, n1, n2, n3, n4, theta, zoffs, blank, tflag, t1, t2, t3, t4
+            1, 1, 1, 2, 8, 7, 0., 0., 0, 0, -1., -1., -1., -1.,
+            2, 1, 2, 3, 9, 8, 1024., 0.5, 0, 1, 0.1, 0.2, 0.3, 0.4,
+        )
+        data_bytes = struct.pack(b'<3i ' + b'6i 2f 2i 4f ' * 2, *data)
+        op2.reader_geom2._read_cquad4(data_bytes, 12)
+        assert op2.card_count['CQUAD4'] == 2, op2.card_count
+        quad1, quad2 = op2.elements[1], op2.elements[2]
+        assert quad1.nodes == [1, 2, 8, 7], quad1.nodes
+        assert quad1.T1 == 1.0 and quad1.theta_mcid == 0.0, quad1
+        assert quad2.nodes == [2, 3, 9, 8], quad2.nodes
+        assert quad2.theta_mcid == 1 and quad2.tflag == 1, quad2
+        assert np.allclose([quad2.zoffset, quad2.T4], [0.5, 0.4]), quad2
+        assert quad1.nodes is not quad2.nodes
+
+        data = (
+            5959, 59, 282,
+            # eid, pid, n1, n2, n3, theta, zoffs, blank1, blank2, tflag, t1, t2, t3
+            3, 1, 1, 2, 3, 0., 0., 0, 0, 0, -1., -1., -1.,
+        )
+        data_bytes = struct.pack(b'<3i ' + b'5i 2f 3i 3f', *data)
+        op2.reader_geom2._read_ctria3(data_bytes, 12)
+        tri = op2.elements[3]
+        assert tri.type == 'CTRIA3' and tri.nodes == [1, 2, 3], tri
+        assert op2._type_to_id_map['CQUAD4'] == [1, 2], op2._type_to_id_map
+        assert op2._type_to_id_map['CTRIA3'] == [3], op2._type_to_id_map
+
     def test_read_grid_11(self):
         op2 = OP2Geom(make_geom=True, debug=False, log=None, debug_file=None, mode='msc')
         op2._endian = b'<'
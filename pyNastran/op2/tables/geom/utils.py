@@ -1,8 +1,125 @@
-from typing import Tuple
+from __future__ import annotations
+import gc
+import re
+from typing import Tuple, List, Dict, Optional, Any, TYPE_CHECKING
 import numpy as np
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.op2.op2_geom import OP2Geom
 
 def get_minus1_start_end(ints: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     iminus1 = np.where(ints == -1)[0]
     istart = [0] + list(iminus1[:-1] + 1)
     iend = iminus1
     return istart, iend
+
+def get_card_dtype(fmt: bytes, endian: bytes, size: int,
+                   names: Optional[Tuple[str, ...]]=None) -> np.dtype:
+    """
+    Gets the structured dtype of a fixed length card
+
+    Parameters
+    ----------
+    fmt : bytes
+        the struct format of the card (e.g., b'ii 3f 3i'); only
+        i/f are supported (8 bytes for size=8 like ``mapfmt``)
+    endian : bytes
+        b'<' or b'>'
+    size : int
+        4/8 bytes
+    names : Tuple[str, ...]; default=None -> f0, f1, ...
+        the names of the fields
+
+    """
+    idtype = np.dtype(f'{endian.decode()}i{size}')
+    fdtype = np.dtype(f'{endian.decode()}f{size}')
+    dtypes = []
+    for count, code in re.findall(rb'(\d*)([if])', fmt):
+        dtype = idtype if code == b'i' else fdtype
+        dtypes.extend([dtype] * int(count or 1))
+
+    assert len(re.sub(rb'[\dif\s]', b'', fmt)) == 0, f'fmt={fmt!r} is not supported'
+    if names is None:
+        names = tuple(f'f{i}' for i in range(len(dtypes)))
+    assert len(names) == len(dtypes), f'fmt={fmt!r} names={names}'
+    return np.dtype(list(zip(names, dtypes)))
+
+def unpack_cards(op2: OP2Geom, data: bytes, n: int, fmt: bytes,
+                 names: Optional[Tuple[str, ...]]=None) -> Tuple[int, np.ndarray]:
+    """
+    Decodes a block of fixed length cards with a single ``np.frombuffer``,
+    which is much faster than unpacking the cards one at a time
+
+    Parameters
+    ----------
+    op2 : OP2Geom
+        the op2 (sets the endian and the 4/8 byte size)
+    data : bytes
+        the record
+    n : int
+        the starting position
+    fmt : bytes
+        the struct format of the card (e.g., b'ii 3f 3i')
+    names : Tuple[str, ...]; default=None -> f0, f1, ...
+        the names of the fields
+
+    Returns
+    -------
+    n : int
+        the position after the last full card
+    cards : (ncards, ) structured ndarray
+        the cards; ``cards.tolist()`` is the same as unpacking each card
+
+    """
+    dtype = get_card_dtype(fmt, op2._endian, op2.size, names=names)
+    ncards = (len(data) - n) // dtype.itemsize
+    cards = np.frombuffer(data, dtype=dtype, count=ncards, offset=n)
+    return n + ncards * dtype.itemsize, cards
+
+def create_cards(card0: Any, values: Dict[str, List[Any]]) -> List[Any]:
+    """
+    Creates a block of cards of the same type by copying a card that was
+    created the normal way (e.g., with ``add_op2_data``)
+
+    The checks in ``__init__`` are skipped, so the values must already
+    be checked (e.g., with a vectorized check on the card array).
+
+    Parameters
+    ----------
+    card0 : BaseCard
+        the first card, which is the template
+    values : Dict[str, List[Any]]
+        the attributes that change from card to card (e.g., eid, nodes);
+        each list has one value per card
+
+    Returns
+    -------
+    cards : List[BaseCard]
+        the cards
+
+    """
+    template = card0.__dict__
+    for name, value in template.items():
+        if name not in values:
+            # a shared list/array would be modified by every card
+            assert value is None or isinstance(value, (int, float, str)), (
+                f'{card0.type}.{name}={value!r} must be in values')
+
+    card_class = card0.__class__
+    names = list(values)
+    cards = []
+
+    # the garbage collector is paused, so it's not rerun every few
+    # hundred cards (the cards don't have reference cycles)
+    is_gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for row in zip(*values.values()):
+            card = object.__new__(card_class)
+            card_dict = template.copy()
+            card_dict.update(zip(names, row))
+            card.__dict__ = card_dict
+            cards.append(card)
+    finally:
+        if is_gc_enabled:
+            gc.enable()
+    return cards
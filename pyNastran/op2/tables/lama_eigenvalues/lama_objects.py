@@ -117,8 +117,7 @@ class RealEigenvalues(BaseScalarObject):
         import inspect
         from struct import Struct, pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             _write_table_header(self.table_name, op2_file, op2_ascii, date)
@@ -197,8 +196,7 @@ class RealEigenvalues(BaseScalarObject):
         import inspect
         from struct import pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write('%s.write_table_3: %s\n' % (self.__class__.__name__, call_frame[1][3]))
+        op2_ascii.write('%s.write_table_3: %s\n' % (self.__class__.__name__, frame.f_back.f_code.co_name))
 
         #print('new_result=%s itable=%s' % (new_result, itable))
         if new_result and itable != -3:
@@ -467,8 +465,7 @@ class ComplexEigenvalues(BaseScalarObject):
         import inspect
         from struct import Struct, pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             _write_table_header(self.table_name, op2_file, op2_ascii, date)
@@ -545,8 +542,7 @@ class ComplexEigenvalues(BaseScalarObject):
         import inspect
         from struct import pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write('%s.write_table_3: %s\n' % (self.__class__.__name__, call_frame[1][3]))
+        op2_ascii.write('%s.write_table_3: %s\n' % (self.__class__.__name__, frame.f_back.f_code.co_name))
 
         #print('new_result=%s itable=%s' % (new_result, itable))
         if new_result and itable != -3:
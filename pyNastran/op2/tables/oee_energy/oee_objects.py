@@ -65,7 +65,7 @@ class RealStrainEnergyArray(BaseElement):
         ]
         return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RealStrainEnergyArray"""
         del self.dt_temp
 
@@ -89,7 +89,8 @@ class RealStrainEnergyArray(BaseElement):
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self.build_data(dtype, idtype, fdtype)
 
     def build_data(self, dtype, idtype, fdtype):
@@ -514,8 +515,7 @@ class RealStrainEnergyArray(BaseElement):
         import inspect
         from struct import Struct, pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -591,8 +591,7 @@ class RealStrainEnergyArray(BaseElement):
         import inspect
         from struct import pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write('%s.write_table_3: %s\n' % (self.__class__.__name__, call_frame[1][3]))
+        op2_ascii.write('%s.write_table_3: %s\n' % (self.__class__.__name__, frame.f_back.f_code.co_name))
 
         #print('new_result=%s itable=%s' % (new_result, itable))
         if new_result and itable != -3:
@@ -783,7 +782,7 @@ class ComplexStrainEnergyArray(BaseElement):
         ]
         return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the ComplexStrainEnergyArray"""
         del self.dt_temp
 
@@ -807,7 +806,8 @@ class ComplexStrainEnergyArray(BaseElement):
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self.build_data(dtype)
 
     def build_data(self, dtype):
@@ -525,7 +525,7 @@ class ONR:
                 obj.element[itime, ielement:ielement2] = eids
 
                 #[energy, percent, density]
-                obj.data[itime, ielement:ielement2, :] = floats[:, 1:].copy()
+                obj.data[itime, ielement:ielement2, :] = floats[:, 1:]
                 obj.itotal2 = itotal2
                 obj.ielement = ielement2
             else:
@@ -628,7 +628,7 @@ class ONR:
 
                 #[energyr, energyi, percent, density]
                 obj.element[obj.itime, itotal:itotal2] = eids
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:]
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -678,7 +678,7 @@ class ONR:
                     obj.element_type[obj.itime, itotal:itotal2, :] = s
 
                 #[energy, percent, density]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 4:].copy()
+                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 4:]
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
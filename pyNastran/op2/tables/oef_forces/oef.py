@@ -577,7 +577,7 @@ class OEF:
                     #obj.element_type[obj.itime, itotal:itotal2, :] = strings[:, 3:]
 
                 #[etype, xgrad, ygrad, zgrad, xflux, yflux, zflux]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 3:].copy()
+                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 3:]
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -673,7 +673,7 @@ class OEF:
                 obj.element_data_type[itotal:itotal2] = array([s1+s2 for s1, s2 in zip(strings[:, 1], strings[:, 2])])
 
                 #[etype, xgrad, ygrad, zgrad, xflux, yflux, zflux]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 3:].copy()
+                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 3:]
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -719,7 +719,7 @@ class OEF:
                     obj.element_data_type[itotal:itotal2] = array([s1+s2 for s1, s2 in zip(strings[:, 1], strings[:, 2])])
 
                 #[etype, xgrad, ygrad, zgrad, xflux, yflux, zflux, zed]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 3:-1].copy()
+                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 3:-1]
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -810,7 +810,7 @@ class OEF:
                         #obj.element_type[obj.itime, itotal:itotal2, :] = strings[:, 3:]
 
                     #[fapplied, free_conv, force_conv, frad, ftotal]
-                    obj.data[obj.itime, itotal:itotal2, :] = floats[:, 3:].copy()
+                    obj.data[obj.itime, itotal:itotal2, :] = floats[:, 3:]
                     obj.itotal = itotal2
                     obj.ielement = ielement2
                 else:
@@ -1291,9 +1291,14 @@ class OEF:
                     obj.element[itotal:itotal2] = eids
 
                 #[axial, torsion]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:]
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and obj.is_sort2:
+                n = nelements * ntotal
+                ielement, itime, itime2 = op2._set_sort2_element(obj, data, nelements)
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 3)
+                obj.data[itime:itime2, ielement, :] = floats[:, 1:]
             else:
                 n = oef_crod_real_3(op2, data, obj,
                                     nelements, ntotal)
@@ -1334,6 +1339,12 @@ class OEF:
                 obj.data[obj.itime, itotal:itotal2, :] = real_imag
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and obj.is_sort2:
+                n = nelements * ntotal
+                ielement, itime, itime2 = op2._set_sort2_element(obj, data, nelements)
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 5).copy()
+                real_imag = apply_mag_phase(floats, is_magnitude_phase, [1, 2], [3, 4])
+                obj.data[itime:itime2, ielement, :] = real_imag
             else:
                 n = oef_crod_imag_5(op2, data, obj,
                                     nelements, ntotal,
@@ -1602,9 +1613,14 @@ class OEF:
                     obj.element[itotal:itotal2] = eids
 
                 #(eid_device, force)
-                obj.data[obj.itime, itotal:itotal2, 0] = floats[:, 1].copy()
+                obj.data[obj.itime, itotal:itotal2, 0] = floats[:, 1]
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and obj.is_sort2:
+                n = nelements * ntotal
+                ielement, itime, itime2 = op2._set_sort2_element(obj, data, nelements)
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 2)
+                obj.data[itime:itime2, ielement, 0] = floats[:, 1]
             else:
                 n = oef_celas_cdamp_real_2(op2, data, obj,
                                            nelements, ntotal, dt)
@@ -1644,6 +1660,12 @@ class OEF:
                 obj.data[obj.itime, itotal:itotal2, 0] = real_imag
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and obj.is_sort2:
+                n = nelements * ntotal
+                ielement, itime, itime2 = op2._set_sort2_element(obj, data, nelements)
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 3).copy()
+                real_imag = apply_mag_phase(floats, is_magnitude_phase, 1, 2)
+                obj.data[itime:itime2, ielement, 0] = real_imag
             else:
                 n = oef_celas_cdamp_imag_3(op2, data, obj,
                                            nelements, ntotal,
@@ -1693,7 +1715,7 @@ class OEF:
                     obj.element[itotal:itotal2] = eids
 
                 #(eid_device, axial, torque)
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:]
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -1815,7 +1837,7 @@ class OEF:
                     obj.element[itotal:itotal2] = eids
 
                 #[bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:]
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             # elif op2.use_vector and is_vectorized and op2.sort_method == 1:
@@ -1881,7 +1903,7 @@ class OEF:
                     obj.element[itotal:itotal2] = eids
 
                 #[axial, torsion, SMa, SMt]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:]
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -1953,9 +1975,14 @@ class OEF:
                     obj.element[ielement:ielement2] = eids
 
                 #[mx, my, mxy, bmx, bmy, bmxy, tx, ty]
-                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:].copy()
+                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:]
                 obj.itotal = ielement2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and obj.is_sort2:
+                n = nelements * ntotal
+                ielement, itime, itime2 = op2._set_sort2_element(obj, data, nelements)
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 9)
+                obj.data[itime:itime2, ielement, :] = floats[:, 1:]
             else:
                 n = oef_cquad4_33_real_9(op2, data, obj,
                                          nelements, ntotal)
@@ -1992,6 +2019,14 @@ class OEF:
                 obj.data[obj.itime, itotal:itotal2, :] = real_imag
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and obj.is_sort2:
+                n = nelements * ntotal
+                ielement, itime, itime2 = op2._set_sort2_element(obj, data, nelements)
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 17).copy()
+                isave1 = [1, 2, 3, 4, 5, 6, 7, 8]
+                isave2 = [9, 10, 11, 12, 13, 14, 15, 16]
+                real_imag = apply_mag_phase(floats, is_magnitude_phase, isave1, isave2)
+                obj.data[itime:itime2, ielement, :] = real_imag
             else:
                 n = oef_cquad4_33_imag_17(op2, data, ndata, obj,
                                           nelements, ntotal,
@@ -2271,7 +2306,7 @@ class OEF:
 
                 # [f41, f21, f12, f32, f23, f43, f34, f14, kf1,
                 #  s12, kf2, s23, kf3, s34, kf4, s41]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:]
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -2367,7 +2402,7 @@ class OEF:
                     obj.element[itotal:itotal2] = eids
 
                 # [hopa, bmu, bmv, tm, su, sv]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:]
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -2417,7 +2452,7 @@ class OEF:
                     obj.element[itotal:itotal2] = eids
 
                 # [fx, sfy, sfz, u, v, w, sv, sw]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:]
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -2663,7 +2698,7 @@ class OEF:
                     obj.element[itotal:itotal2] = eids
 
                 #[axial_force, torque]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 3:].copy()
+                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 3:]
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -2793,7 +2828,7 @@ class OEF:
                 results = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, numwide_real)
 
                 #[fx, fy, fz, mx, my, mz]
-                obj.data[obj.itime, istart:iend, :] = results[:, 1:].copy()
+                obj.data[obj.itime, istart:iend, :] = results[:, 1:]
             else:
                 n = oef_cbush_real_7(op2, data, obj,
                                      nelements, ntotal, dt)
@@ -2842,6 +2877,7 @@ def oef_crod_real_3(op2: OP2, data: bytes,
     n = 0
     fmt = mapfmt(op2._endian + op2._analysis_code_fmt + b'ff', op2.size)  # 3
     s = Struct(fmt)
+    add_sort = obj.add_sort2 if obj.is_sort2 else obj.add_sort1
     for unused_i in range(nelements):
         edata = data[n:n+ntotal]
         out = s.unpack(edata)
@@ -2850,7 +2886,7 @@ def oef_crod_real_3(op2: OP2, data: bytes,
             eid_device, op2.nonlinear_factor, op2.sort_method)
         if op2.is_debug_file:
             op2.binary_debug.write('OEF_Rod - %s\n' % (str(out)))
-        obj.add_sort1(dt, eid, axial, torque)
+        add_sort(dt, eid, axial, torque)
         n += ntotal
     return n
 
@@ -2861,6 +2897,7 @@ def oef_crod_imag_5(op2: OP2, data: bytes,
     n = 0
     fmt = mapfmt(op2._endian + op2._analysis_code_fmt + b'4f', op2.size)
     s = Struct(fmt)
+    add_sort = obj.add_sort2 if obj.is_sort2 else obj.add_sort1
     for unused_i in range(nelements):
         edata = data[n:n+ntotal]
 
@@ -2877,7 +2914,7 @@ def oef_crod_imag_5(op2: OP2, data: bytes,
             axial = complex(axial_real, axial_imag)
             torque = complex(torque_real, torque_imag)
 
-        obj.add_sort1(dt, eid, axial, torque)
+        add_sort(dt, eid, axial, torque)
         n += ntotal
     return n
 
@@ -2889,6 +2926,7 @@ def oef_celas_cdamp_imag_3(self, data: bytes,
     n = 0
     fmt = mapfmt(op2._endian + op2._analysis_code_fmt + b'2f', self.size)
     s = Struct(fmt)
+    add_sort = obj.add_sort2 if obj.is_sort2 else obj.add_sort1
     for unused_i in range(nelements):
         edata = data[n:n + ntotal]
         out = s.unpack(edata)
@@ -2901,7 +2939,7 @@ def oef_celas_cdamp_imag_3(self, data: bytes,
             force = polar_to_real_imag(force_real, force_imag)
         else:
             force = complex(force_real, force_imag)
-        obj.add_sort1(dt, eid, force)
+        add_sort(dt, eid, force)
         n += ntotal
     return n
 
@@ -3371,6 +3409,7 @@ def oef_celas_cdamp_real_2(self, data: bytes,
     n = 0
     fmt = mapfmt(op2._endian + op2._analysis_code_fmt + b'f', self.size)
     s = Struct(fmt)  # 2
+    add_sort = obj.add_sort2 if obj.is_sort2 else obj.add_sort1
     for unused_i in range(nelements):
         edata = data[n:n + ntotal]
         out = s.unpack(edata)
@@ -3379,7 +3418,7 @@ def oef_celas_cdamp_real_2(self, data: bytes,
         (eid_device, force) = out
         eid, dt = get_eid_dt_from_eid_device(
             eid_device, op2.nonlinear_factor, op2.sort_method)
-        obj.add_sort1(dt, eid, force)
+        add_sort(dt, eid, force)
         n += ntotal
     return n
 
@@ -3478,6 +3517,7 @@ def oef_cquad4_33_real_9(self, data: bytes,
     op2 = self
     n = 0
     s = Struct(mapfmt(op2._endian + op2._analysis_code_fmt + b'8f', op2.size))
+    add_sort = obj.add_sort2 if obj.is_sort2 else obj.add_sort1
     for unused_i in range(nelements):
         edata = data[n:n+ntotal]
         out = s.unpack(edata)
@@ -3486,7 +3526,7 @@ def oef_cquad4_33_real_9(self, data: bytes,
         (eid_device, mx, my, mxy, bmx, bmy, bmxy, tx, ty) = out
         eid, dt = get_eid_dt_from_eid_device(
             eid_device, op2.nonlinear_factor, op2.sort_method)
-        obj.add_sort1(dt, eid, mx, my, mxy, bmx, bmy, bmxy, tx, ty)
+        add_sort(dt, eid, mx, my, mxy, bmx, bmy, bmxy, tx, ty)
         n += ntotal
     return n
 
@@ -3497,6 +3537,7 @@ def oef_cquad4_33_imag_17(self, data: bytes, ndata: int,
     op2 = self
     n = 0
     s = Struct(mapfmt(op2._endian + op2._analysis_code_fmt + b'16f', op2.size))
+    add_sort = obj.add_sort2 if obj.is_sort2 else obj.add_sort1
     for unused_i in range(nelements):
         edata = data[n:n+ntotal]
         out = s.unpack(edata)
@@ -3526,7 +3567,7 @@ def oef_cquad4_33_imag_17(self, data: bytes, ndata: int,
             bmxy = complex(bmxyr, bmxyi)
             tx = complex(txr, txi)
             ty = complex(tyr, tyi)
-        obj.add_sort1(dt, eid, mx, my, mxy, bmx, bmy, bmxy, tx, ty)
+        add_sort(dt, eid, mx, my, mxy, bmx, bmy, bmxy, tx, ty)
         n += ntotal
     return n
 
@@ -6,8 +6,10 @@ import numpy as np
 from numpy import zeros, searchsorted, allclose
 
 from pyNastran.utils.numpy_utils import integer_types
-from pyNastran.op2.result_objects.op2_objects import BaseElement, get_complex_times_dtype
+from pyNastran.op2.result_objects.op2_objects import (
+    BaseElement, get_complex_times_dtype, apply_result_dtypes)
 from pyNastran.op2.tables.oef_forces.oef_force_objects import ForceObject
+from pyNastran.op2.op2_interface.write_utils import write_table4_rows
 from pyNastran.f06.f06_formatting import write_imag_floats_13e, write_float_12e # get_key0,
 from pyNastran.f06.f06_formatting import _eigenvalue_header
 
@@ -53,7 +55,7 @@ class ComplexRodForceArray(ComplexForceObject):
         #headers = ['axial', 'torque']
         #return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the ComplexRodForceArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         assert self.ntimes > 0, 'ntimes=%s' % self.ntimes
@@ -61,6 +63,10 @@ class ComplexRodForceArray(ComplexForceObject):
         assert self.ntotal > 0, 'ntotal=%s' % self.ntotal
         #self.names = []
         self.nelements //= self.ntimes
+        if self.is_sort2:
+            # a SORT2 subtable is a single element, so flip this to sort1
+            self.ntimes, self.nelements = self.nelements, self.ntimes
+            self.ntotal = self.nelements
         self.itime = 0
         self.ielement = 0
         self.itotal = 0
@@ -68,7 +74,10 @@ class ComplexRodForceArray(ComplexForceObject):
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
+        dtype, idtype, cfdtype = get_complex_times_dtype(
+            self.nonlinear_factor, self.size, result_dtype, id_dtype)
+        if self.is_sort2:
+            dtype = self.analysis_fmt
 
         self._times = zeros(self.ntimes, dtype=dtype)
         self.element = zeros(self.nelements, dtype=idtype)
@@ -124,6 +133,16 @@ class ComplexRodForceArray(ComplexForceObject):
         self.data[self.itime, self.ielement, :] = [axial, torque]
         self.ielement += 1
 
+    def add_sort2(self, dt, eid, axial, torque):
+        """unvectorized method for adding SORT2 transient data"""
+        assert isinstance(eid, integer_types) and eid > 0, 'dt=%s eid=%s' % (dt, eid)
+        itime = self.ielement
+        ielement = self.itime
+        self._times[itime] = dt
+        self.element[ielement] = eid
+        self.data[itime, ielement, :] = [axial, torque]
+        self.ielement += 1
+
     def get_stats(self, short: bool=False) -> List[str]:
         if not self.is_built:
             return [
@@ -239,10 +258,9 @@ class ComplexRodForceArray(ComplexForceObject):
                   is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -266,9 +284,7 @@ class ComplexRodForceArray(ComplexForceObject):
 
         eids_device = self.element * 10 + self.device_code
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i4f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write(f'nelements={nelements:d}\n')
@@ -288,13 +304,13 @@ class ComplexRodForceArray(ComplexForceObject):
             op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
             op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
 
-            axial = self.data[itime, :, 0]
-            torsion = self.data[itime, :, 1]
-
-            for eid_device, axiali, torsioni in zip(eids_device, axial, torsion):
-                data = [eid_device, axiali.real, torsioni.real, axiali.imag, torsioni.imag]
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, tuple(data)))
-                op2_file.write(struct1.pack(*data))
+            # [eid_device, axial.real, torsion.real, axial.imag, torsion.imag]
+            datai = self.data[itime, :, :2]
+            write_table4_rows(op2_file, [
+                (b'i', eids_device),
+                (b'f', datai.real),
+                (b'f', datai.imag),
+            ], endian)
 
             itable -= 1
             header = [4 * ntotal,]
@@ -348,7 +364,7 @@ class ComplexCShearForceArray(BaseElement):
         #headers = ['axial', 'torque']
         #return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the ComplexCShearForceArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
 
@@ -364,7 +380,8 @@ class ComplexCShearForceArray(BaseElement):
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
+        dtype, idtype, cfdtype = get_complex_times_dtype(
+            self.nonlinear_factor, self.size, result_dtype, id_dtype)
         self._times = zeros(self.ntimes, dtype=dtype)
         self.element = zeros(self.nelements, dtype=idtype)
 
@@ -616,7 +633,7 @@ class ComplexSpringDamperForceArray(ComplexForceObject):
         #headers = ['axial', 'torque']
         #return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the ComplexSpringDamperForceArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         assert self.ntimes > 0, 'ntimes=%s' % self.ntimes
@@ -624,6 +641,10 @@ class ComplexSpringDamperForceArray(ComplexForceObject):
         assert self.ntotal > 0, 'ntotal=%s' % self.ntotal
         #self.names = []
         self.nelements //= self.ntimes
+        if self.is_sort2:
+            # a SORT2 subtable is a single element, so flip this to sort1
+            self.ntimes, self.nelements = self.nelements, self.ntimes
+            self.ntotal = self.nelements
         self.itime = 0
         self.ielement = 0
         self.itotal = 0
@@ -631,7 +652,10 @@ class ComplexSpringDamperForceArray(ComplexForceObject):
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
+        dtype, idtype, cfdtype = get_complex_times_dtype(
+            self.nonlinear_factor, self.size, result_dtype, id_dtype)
+        if self.is_sort2:
+            dtype = self.analysis_fmt
         self._times = zeros(self.ntimes, dtype=dtype)
         self.element = zeros(self.nelements, dtype=idtype)
 
@@ -690,6 +714,16 @@ class ComplexSpringDamperForceArray(ComplexForceObject):
         self.data[self.itime, self.ielement, 0] = force
         self.ielement += 1
 
+    def add_sort2(self, dt, eid, force):
+        """unvectorized method for adding SORT2 transient data"""
+        assert isinstance(eid, integer_types) and eid > 0, 'dt=%s eid=%s' % (dt, eid)
+        itime = self.ielement
+        ielement = self.itime
+        self._times[itime] = dt
+        self.element[ielement] = eid
+        self.data[itime, ielement, :] = [force]
+        self.ielement += 1
+
     def get_stats(self, short: bool=False) -> List[str]:
         if not self.is_built:
             return [
@@ -811,10 +845,9 @@ class ComplexSpringDamperForceArray(ComplexForceObject):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -844,9 +877,7 @@ class ComplexSpringDamperForceArray(ComplexForceObject):
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i2f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
@@ -865,12 +896,13 @@ class ComplexSpringDamperForceArray(ComplexForceObject):
             op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
             op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
 
+            # [eid_device, force.real, force.imag]
             force = self.data[itime, :, 0]
-
-            for eid, forcei in zip(eids_device, force):
-                data = [eid, forcei.real, forcei.imag]
-                op2_ascii.write('  eid=%s force=%s\n' % (eid, forcei))
-                op2_file.write(struct1.pack(*data))
+            write_table4_rows(op2_file, [
+                (b'i', eids_device),
+                (b'f', force.real),
+                (b'f', force.imag),
+            ], endian)
 
             itable -= 1
             header = [4 * ntotal,]
@@ -929,7 +961,7 @@ class ComplexViscForceArray(BaseElement):
         #headers = ['axial', 'torque']
         #return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the ComplexViscForceArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         assert self.ntimes > 0, 'ntimes=%s' % self.ntimes
@@ -947,11 +979,12 @@ class ComplexViscForceArray(BaseElement):
         dtype = 'float32'
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
+        cfdtype, idtype = apply_result_dtypes('complex64', 'int32', result_dtype, id_dtype)
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element = zeros(self.nelements, dtype='int32')
+        self.element = zeros(self.nelements, dtype=idtype)
 
         #[axial_force, torque]
-        self.data = zeros((self.ntimes, self.ntotal, 2), dtype='complex64')
+        self.data = zeros((self.ntimes, self.ntotal, 2), dtype=cfdtype)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -1139,7 +1172,7 @@ class ComplexPlateForceArray(ComplexForceObject):
         headers = ['mx', 'my', 'mxy', 'bmx', 'bmy', 'bmxy', 'tx', 'ty']
         return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the ComplexPlateForceArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         assert self.ntimes > 0, 'ntimes=%s' % self.ntimes
@@ -1147,6 +1180,10 @@ class ComplexPlateForceArray(ComplexForceObject):
         assert self.ntotal > 0, 'ntotal=%s' % self.ntotal
         #self.names = []
         self.nelements //= self.ntimes
+        if self.is_sort2:
+            # a SORT2 subtable is a single element, so flip this to sort1
+            self.ntimes, self.nelements = self.nelements, self.ntimes
+            self.ntotal = self.nelements
         self.itime = 0
         self.ielement = 0
         self.itotal = 0
@@ -1154,7 +1191,10 @@ class ComplexPlateForceArray(ComplexForceObject):
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
+        dtype, idtype, cfdtype = get_complex_times_dtype(
+            self.nonlinear_factor, self.size, result_dtype, id_dtype)
+        if self.is_sort2:
+            dtype = self.analysis_fmt
         self._times = zeros(self.ntimes, dtype=dtype)
         self.element = zeros(self.nelements, dtype=idtype)
 
@@ -1236,6 +1276,16 @@ class ComplexPlateForceArray(ComplexForceObject):
         self.ielement += 1
         self.itotal += 1
 
+    def add_sort2(self, dt, eid, mx, my, mxy, bmx, bmy, bmxy, tx, ty):
+        """unvectorized method for adding SORT2 transient data"""
+        assert isinstance(eid, integer_types) and eid > 0, 'dt=%s eid=%s' % (dt, eid)
+        itime = self.ielement
+        ielement = self.itime
+        self._times[itime] = dt
+        self.element[ielement] = eid
+        self.data[itime, ielement, :] = [mx, my, mxy, bmx, bmy, bmxy, tx, ty]
+        self.ielement += 1
+
     #@property
     #def nnodes_per_element(self):
         #return 1
@@ -1367,10 +1417,9 @@ class ComplexPlateForceArray(ComplexForceObject):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -1406,9 +1455,7 @@ class ComplexPlateForceArray(ComplexForceObject):
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i 16f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
@@ -1428,21 +1475,15 @@ class ComplexPlateForceArray(ComplexForceObject):
             op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
             op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
 
-            mx = self.data[itime, :, 0]
-            my = self.data[itime, :, 1]
-            mxy = self.data[itime, :, 2]
-            bmx = self.data[itime, :, 3]
-            bmy = self.data[itime, :, 4]
-            bmxy = self.data[itime, :, 5]
-            tx = self.data[itime, :, 6]
-            ty = self.data[itime, :, 7]
-
-            for eid_device, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi in zip(eids_device, mx, my, mxy, bmx, bmy, bmxy, tx, ty):
-                data = [eid_device,
-                        mxi.real, myi.real, mxyi.real, bmxi.real, bmyi.real, bmxyi.real, txi.real, tyi.real,
-                        mxi.imag, myi.imag, mxyi.imag, bmxi.imag, bmyi.imag, bmxyi.imag, txi.imag, tyi.imag]
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(data)))
-                op2_file.write(struct1.pack(*data))
+            # [eid_device,
+            #  mx, my, mxy, bmx, bmy, bmxy, tx, ty (real),
+            #  mx, my, mxy, bmx, bmy, bmxy, tx, ty (imag)]
+            datai = self.data[itime, :, :8]
+            write_table4_rows(op2_file, [
+                (b'i', eids_device),
+                (b'f', datai.real),
+                (b'f', datai.imag),
+            ], endian)
 
             itable -= 1
             header = [4 * ntotal,]
@@ -1472,7 +1513,7 @@ class ComplexPlate2ForceArray(ComplexForceObject):
         headers = ['mx', 'my', 'mxy', 'bmx', 'bmy', 'bmxy', 'tx', 'ty']
         return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the ComplexPlate2ForceArray"""
         if self.is_built:
             return
@@ -1490,7 +1531,8 @@ class ComplexPlate2ForceArray(ComplexForceObject):
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
+        dtype, idtype, cfdtype = get_complex_times_dtype(
+            self.nonlinear_factor, self.size, result_dtype, id_dtype)
         self._times = zeros(self.ntimes, dtype=dtype)
 
         self.element = zeros(self.nelements, dtype=idtype)
@@ -1737,10 +1779,9 @@ class ComplexPlate2ForceArray(ComplexForceObject):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -1792,11 +1833,10 @@ class ComplexPlate2ForceArray(ComplexForceObject):
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i 4s i 16f')
-            struct2 = Struct(endian + b'i 16f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
+        ieid = np.arange(0, len(eids), nnodes_all)
+        cen_words = np.full(nelements, b'CEN/')
 
         op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
         for itime in range(self.ntimes):
@@ -1815,33 +1855,22 @@ class ComplexPlate2ForceArray(ComplexForceObject):
             op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
             op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
 
-            mx = self.data[itime, :, 0]
-            my = self.data[itime, :, 1]
-            mxy = self.data[itime, :, 2]
-            bmx = self.data[itime, :, 3]
-            bmy = self.data[itime, :, 4]
-            bmxy = self.data[itime, :, 5]
-            tx = self.data[itime, :, 6]
-            ty = self.data[itime, :, 7]
-
-            nwide = 0
-            ielement = -1
-            for eid, nid, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi in zip(eids, nids, mx, my, mxy, bmx, bmy, bmxy, tx, ty):
-                if nid == 0:
-                    ielement += 1
-                    eid_device = eids_device[ielement]
-                    data = [eid_device, b'CEN/', nid,
-                            mxi.real, myi.real, mxyi.real, bmxi.real, bmyi.real, bmxyi.real, txi.real, tyi.real,
-                            mxi.imag, myi.imag, mxyi.imag, bmxi.imag, bmyi.imag, bmxyi.imag, txi.imag, tyi.imag]
-                    op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(data)))
-                    op2_file.write(struct1.pack(*data))
-                else:
-                    data = [nid,
-                            mxi.real, myi.real, mxyi.real, bmxi.real, bmyi.real, bmxyi.real, txi.real, tyi.real,
-                            mxi.imag, myi.imag, mxyi.imag, bmxi.imag, bmyi.imag, bmxyi.imag, txi.imag, tyi.imag]
-                    op2_ascii.write('    data=%s\n' % (str(data)))
-                    op2_file.write(struct2.pack(*data))
-                nwide += len(data)
+            # centroid: [eid_device, 'CEN/', 0, mx, my, mxy, bmx, bmy, bmxy, tx, ty]
+            # corners:  [nid, mx, my, mxy, bmx, bmy, bmxy, tx, ty]
+            # where the reals come before the imaginaries
+            datai = self.data[itime, :, :8]
+            columns = [
+                (b'i', eids_device),
+                (b'4s', cen_words),
+            ]
+            for inode in range(nnodes_all):
+                inid = ieid + inode
+                columns.extend([
+                    (b'i', nids[inid]),
+                    (b'f', datai[inid, :].real),
+                    (b'f', datai[inid, :].imag),
+                ])
+            nwide = write_table4_rows(op2_file, columns, endian)
             assert nwide == ntotal, 'nwide=%s ntotal=%s' % (nwide, ntotal)
             itable -= 1
             header = [4 * ntotal,]
@@ -1880,7 +1909,7 @@ class ComplexCBarWeldForceArray(ComplexForceObject):
                    'shear1', 'shear2', 'axial', 'torque', ]
         return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the ComplexCBarForceArray"""
         #print('ntimes=%s nelements=%s ntotal=%s subtitle=%s' % (
             #self.ntimes, self.nelements, self.ntotal, self.subtitle))
@@ -1898,7 +1927,8 @@ class ComplexCBarWeldForceArray(ComplexForceObject):
         #print('ntotal=%s ntimes=%s nelements=%s' % (self.ntotal, self.ntimes, self.nelements))
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
+        dtype, idtype, cfdtype = get_complex_times_dtype(
+            self.nonlinear_factor, self.size, result_dtype, id_dtype)
         self._times = zeros(self.ntimes, dtype=dtype)
         self.element = zeros(self.ntotal, dtype=idtype)
 
@@ -2114,10 +2144,9 @@ class ComplexCBarWeldForceArray(ComplexForceObject):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -2153,9 +2182,7 @@ class ComplexCBarWeldForceArray(ComplexForceObject):
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i 16f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
@@ -2175,25 +2202,16 @@ class ComplexCBarWeldForceArray(ComplexForceObject):
             op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
             op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
 
-            #bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq
-            bm1a = self.data[itime, :, 0]
-            bm2a = self.data[itime, :, 1]
-            bm1b = self.data[itime, :, 2]
-            bm2b = self.data[itime, :, 3]
-            ts1 = self.data[itime, :, 4]
-            ts2 = self.data[itime, :, 5]
-            af = self.data[itime, :, 6]
-            trq = self.data[itime, :, 7]
-            assert len(eids_device) == len(bm1a.real)
-
-            for eid_device, bm1ai, bm2ai, bm1bi, bm2bi, ts1i, ts2i, afi, trqi in zip(
-                eids_device, bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq):
-
-                data = [eid_device,
-                        bm1ai.real, bm2ai.real, bm1bi.real, bm2bi.real, ts1i.real, ts2i.real, afi.real, trqi.real,
-                        bm1ai.imag, bm2ai.imag, bm1bi.imag, bm2bi.imag, ts1i.imag, ts2i.imag, afi.imag, trqi.imag]
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(data)))
-                op2_file.write(struct1.pack(*data))
+            # [eid_device,
+            #  bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq (real),
+            #  bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq (imag)]
+            datai = self.data[itime, :, :8]
+            assert len(eids_device) == len(datai)
+            write_table4_rows(op2_file, [
+                (b'i', eids_device),
+                (b'f', datai.real),
+                (b'f', datai.imag),
+            ], endian)
 
             itable -= 1
             header = [4 * ntotal,]
@@ -2238,7 +2256,7 @@ class ComplexCBeamForceArray(ComplexForceObject):
             'axial_force', 'total_torque', 'warping_torque', ]
         return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the ComplexCBeamForceArray"""
         #print('ntimes=%s nelements=%s ntotal=%s subtitle=%s' % (
             #self.ntimes, self.nelements, self.ntotal, self.subtitle))
@@ -2254,7 +2272,8 @@ class ComplexCBeamForceArray(ComplexForceObject):
         #print('ntotal=%s ntimes=%s nelements=%s' % (self.ntotal, self.ntimes, self.nelements))
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
+        dtype, idtype, cfdtype = get_complex_times_dtype(
+            self.nonlinear_factor, self.size, result_dtype, id_dtype)
         self._times = zeros(self.ntimes, dtype)
         self.element = zeros(self.ntotal, idtype)
         self.element_node = zeros((self.ntotal, 2), idtype)
@@ -2522,8 +2541,7 @@ class ComplexCBeamForceArray(ComplexForceObject):
         import inspect
         from struct import Struct, pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -2676,7 +2694,7 @@ class ComplexCBendForceArray(BaseElement):  # 69-CBEND
         ]
         return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the ComplexCBendForceArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         assert self.ntimes > 0, 'ntimes=%s' % self.ntimes
@@ -2694,12 +2712,13 @@ class ComplexCBendForceArray(BaseElement):  # 69-CBEND
         dtype = 'float32'
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
+        cfdtype, idtype = apply_result_dtypes('complex64', 'int32', result_dtype, id_dtype)
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element_node = zeros((self.nelements, 3), dtype='int32')
+        self.element_node = zeros((self.nelements, 3), dtype=idtype)
 
         #[bending_moment_1a, bending_moment_2a, shear_1a, shear_2a, axial_a, torque_a
         # bending_moment_1b, bending_moment_2b, shear_1b, shear_2b, axial_b, torque_b]
-        self.data = zeros((self.ntimes, self.nelements, 12), dtype='complex64')
+        self.data = zeros((self.ntimes, self.nelements, 12), dtype=cfdtype)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -2947,7 +2966,7 @@ class ComplexSolidPressureForceArray(ComplexForceObject):
         #headers = ['axial', 'torque']
         #return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the ComplexSolidPressureForceArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         if self.is_built:
@@ -2965,7 +2984,8 @@ class ComplexSolidPressureForceArray(ComplexForceObject):
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
+        dtype, idtype, cfdtype = get_complex_times_dtype(
+            self.nonlinear_factor, self.size, result_dtype, id_dtype)
         self._times = zeros(self.ntimes, dtype=dtype)
         self.element = zeros(self.nelements, dtype=idtype)
 
@@ -3158,8 +3178,7 @@ class ComplexSolidPressureForceArray(ComplexForceObject):
         import inspect
         from struct import Struct, pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -3295,7 +3314,7 @@ class ComplexForceMomentArray(ComplexForceObject):
         self.itotal = 0
         self.ielement = 0
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the ComplexCBushForceArray"""
         #print('ntimes=%s nelements=%s ntotal=%s subtitle=%s' % (
             #self.ntimes, self.nelements, self.ntotal, self.subtitle))
@@ -3321,7 +3340,8 @@ class ComplexForceMomentArray(ComplexForceObject):
             ntimes = self.ntotal
             ntotal = self.ntimes
             #print(f'CBUSH SORT2: ntimes={ntimes} ntotal={ntotal}')
-        dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
+        dtype, idtype, cfdtype = get_complex_times_dtype(
+            self.nonlinear_factor, self.size, result_dtype, id_dtype)
         self._times = zeros(ntimes, dtype=dtype)
         self.element = zeros(ntotal, dtype=idtype)
 
@@ -3553,17 +3573,14 @@ class ComplexForceMomentArray(ComplexForceObject):
                   is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
             itable = -3
 
-        eids = self.element
-
         # table 4 info
         #ntimes = self.data.shape[0]
         #nnodes = self.data.shape[1]
@@ -3580,9 +3597,7 @@ class ComplexForceMomentArray(ComplexForceObject):
 
         eids_device = self.element * 10 + self.device_code
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i 12f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write(f'nelements={nelements:d}\n')
@@ -3602,29 +3617,15 @@ class ComplexForceMomentArray(ComplexForceObject):
             op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
             op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
 
-            fx = self.data[itime, :, 0]
-            fy = self.data[itime, :, 1]
-            fz = self.data[itime, :, 2]
-            mx = self.data[itime, :, 3]
-            my = self.data[itime, :, 4]
-            mz = self.data[itime, :, 5]
-
-            for eid, eid_device, fxi, fyi, fzi, mxi, myi, mzi in zip(eids, eids_device, fx, fy, fz, mx, my, mz):
-                data = [
-                    eid_device,
-                    fxi.real, fyi.real, fzi.real, mxi.real, myi.real, mzi.real,
-                    fxi.imag, fyi.imag, fzi.imag, mxi.imag, myi.imag, mzi.imag,
-                ]
-
-                vals = (fxi, fyi, fzi, mxi, myi, mzi)
-                vals2 = write_imag_floats_13e(vals, is_mag_phase)
-                (fxir, fyir, fzir, mxir, myir, mzir,
-                 fxii, fyii, fzii, mxii, myii, mzii) = vals2
-                op2_ascii.write('0%26i   %-13s  %-13s  %-13s  %-13s  %-13s  %s\n'
-                               ' %26s   %-13s  %-13s  %-13s  %-13s  %-13s  %s\n' % (
-                                   eid, fxir, fyir, fzir, mxir, myir, mzir,
-                                   '', fxii, fyii, fzii, mxii, myii, mzii))
-                op2_file.write(struct1.pack(*data))
+            # [eid_device,
+            #  fx, fy, fz, mx, my, mz (real),
+            #  fx, fy, fz, mx, my, mz (imag)]
+            datai = self.data[itime, :, :6]
+            write_table4_rows(op2_file, [
+                (b'i', eids_device),
+                (b'f', datai.real),
+                (b'f', datai.imag),
+            ], endian)
 
             itable -= 1
             header = [4 * ntotal,]
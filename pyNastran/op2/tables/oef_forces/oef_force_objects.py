@@ -17,7 +17,7 @@ from pyNastran.f06.f06_formatting import (
     write_float_13e, # write_float_12e,
     _eigenvalue_header,
 )
-from pyNastran.op2.op2_interface.write_utils import set_table3_field
+from pyNastran.op2.op2_interface.write_utils import set_table3_field, write_table4_rows
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import update_stress_force_time_word
 from pyNastran.op2.writer.utils import fix_table3_types
 
@@ -83,8 +83,7 @@ class ForceObject(BaseElement):
         import inspect
         from struct import pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write('%s.write_table_3: %s\n' % (self.__class__.__name__, call_frame[1][3]))
+        op2_ascii.write('%s.write_table_3: %s\n' % (self.__class__.__name__, frame.f_back.f_code.co_name))
 
         #print('new_result=%s itable=%s' % (new_result, itable))
         if new_result and itable != -3:
@@ -293,7 +292,7 @@ class FailureIndicesArray(RealForceObject):
     def nnodes_per_element(self):
         return 1
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the FailureIndices"""
         if self.is_built:
             return
@@ -311,7 +310,8 @@ class FailureIndicesArray(RealForceObject):
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
 
         self._times = zeros(self.ntimes, dtype=dtype)
         self.failure_theory = np.full(self.nelements, '', dtype='U8')
@@ -496,7 +496,7 @@ class RealSpringDamperForceArray(RealForceObject):
         obj.is_built = True
         return obj
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RealSpringDamperForceArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         assert self.ntimes > 0, 'ntimes=%s' % self.ntimes
@@ -504,6 +504,10 @@ class RealSpringDamperForceArray(RealForceObject):
         assert self.ntotal > 0, 'ntotal=%s' % self.ntotal
         #self.names = []
         self.nelements //= self.ntimes
+        if self.is_sort2:
+            # a SORT2 subtable is a single element, so flip this to sort1
+            self.ntimes, self.nelements = self.nelements, self.ntimes
+            self.ntotal = self.nelements
         self.itime = 0
         self.ielement = 0
         self.itotal = 0
@@ -511,7 +515,8 @@ class RealSpringDamperForceArray(RealForceObject):
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self.build_data(self.ntimes, self.nelements, dtype, idtype, fdtype)
 
     def build_data(self, ntimes, nelements, dtype, idtype, fdtype):
@@ -620,6 +625,16 @@ class RealSpringDamperForceArray(RealForceObject):
         self.data[self.itime, self.ielement, :] = [force]
         self.ielement += 1
 
+    def add_sort2(self, dt, eid, force):
+        """unvectorized method for adding SORT2 transient data"""
+        assert isinstance(eid, integer_types) and eid > 0, 'dt=%s eid=%s' % (dt, eid)
+        itime = self.ielement
+        ielement = self.itime
+        self._times[itime] = dt
+        self.element[ielement] = eid
+        self.data[itime, ielement, :] = [force]
+        self.ielement += 1
+
     def get_stats(self, short: bool=False) -> List[str]:
         if not self.is_built:
             return [
@@ -707,10 +722,9 @@ class RealSpringDamperForceArray(RealForceObject):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -740,9 +754,7 @@ class RealSpringDamperForceArray(RealForceObject):
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'if')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
@@ -761,12 +773,11 @@ class RealSpringDamperForceArray(RealForceObject):
             op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
             op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
 
-            force = self.data[itime, :, 0]
-
-            for eid, forcei in zip(eids_device, force):
-                data = [eid, forcei]
-                op2_ascii.write('  eid=%s force=%s\n' % tuple(data))
-                op2_file.write(struct1.pack(*data))
+            # [eid_device, force]
+            write_table4_rows(op2_file, [
+                (b'i', eids_device),
+                (b'f', self.data[itime, :, 0]),
+            ], endian)
 
             itable -= 1
             header = [4 * ntotal,]
@@ -920,13 +931,17 @@ class RealRodForceArray(RealForceObject):
         ctube_msg += base_msg
         return crod_msg, conrod_msg, ctube_msg
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RealRodForceArray"""
         assert self.ntimes > 0, 'ntimes=%s' % self.ntimes
         assert self.nelements > 0, 'nelements=%s' % self.nelements
         assert self.ntotal > 0, 'ntotal=%s' % self.ntotal
         #self.names = []
         self.nelements //= self.ntimes
+        if self.is_sort2:
+            # a SORT2 subtable is a single element, so flip this to sort1
+            self.ntimes, self.nelements = self.nelements, self.ntimes
+            self.ntotal = self.nelements
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         self.itime = 0
         self.ielement = 0
@@ -935,14 +950,17 @@ class RealRodForceArray(RealForceObject):
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        self.build_data(self.ntimes, self.nelements, float_fmt='float32')
+        self.build_data(self.ntimes, self.nelements, float_fmt='float32',
+                        result_dtype=result_dtype, id_dtype=id_dtype)
 
-    def build_data(self, ntimes, nelements, float_fmt='float32'):
+    def build_data(self, ntimes, nelements, float_fmt='float32',
+                   result_dtype=None, id_dtype=None):
         """actually performs the build step"""
         self.ntimes = ntimes
         self.nelements = nelements
         #self.ntotal = ntimes * nelements
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self._times = zeros(ntimes, dtype=dtype)
         self.element = zeros(nelements, dtype=idtype)
 
@@ -979,6 +997,16 @@ class RealRodForceArray(RealForceObject):
         if self.ielement == self.nelements:
             self.ielement = 0
 
+    def add_sort2(self, dt, eid, axial, torque):
+        """unvectorized method for adding SORT2 transient data"""
+        assert isinstance(eid, integer_types) and eid > 0, 'dt=%s eid=%s' % (dt, eid)
+        itime = self.ielement
+        ielement = self.itime
+        self._times[itime] = dt
+        self.element[ielement] = eid
+        self.data[itime, ielement, :] = [axial, torque]
+        self.ielement += 1
+
     def get_stats(self, short: bool=False) -> List[str]:
         if not self.is_built:
             return [
@@ -1116,8 +1144,7 @@ class RealRodForceArray(RealForceObject):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -1155,9 +1182,7 @@ class RealRodForceArray(RealForceObject):
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i2f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
@@ -1177,14 +1202,11 @@ class RealRodForceArray(RealForceObject):
             op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
             op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
 
-            axial = self.data[itime, :, 0]
-            torsion = self.data[itime, :, 1]
-
-            #print('eids3', eids3)
-            for eid, axiali, torsioni in zip(eids_device, axial, torsion):
-                data = [eid, axiali, torsioni]
-                op2_ascii.write('  eid=%s axial=%s torsion=%s\n' % tuple(data))
-                op2_file.write(struct1.pack(*data))
+            # [eid_device, axial, torsion]
+            write_table4_rows(op2_file, [
+                (b'i', eids_device),
+                (b'f', self.data[itime, :, :2]),
+            ], endian)
 
             itable -= 1
             header = [4 * ntotal,]
@@ -1209,7 +1231,7 @@ class RealCBeamForceArray(RealForceObject):
         #else:
             #raise NotImplementedError('SORT2')
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RealCBeamForceArray"""
         #print('ntimes=%s nelements=%s ntotal=%s subtitle=%s' % (self.ntimes, self.nelements, self.ntotal, self.subtitle))
         if self.is_built:
@@ -1226,7 +1248,8 @@ class RealCBeamForceArray(RealForceObject):
         #print('ntotal=%s ntimes=%s nelements=%s' % (self.ntotal, self.ntimes, self.nelements))
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self._times = zeros(self.ntimes, dtype)
         self.element = zeros(self.ntotal, idtype)
         self.element_node = zeros((self.ntotal, 2), idtype)
@@ -1586,8 +1609,7 @@ class RealCBeamForceArray(RealForceObject):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -1743,7 +1765,7 @@ class RealCShearForceArray(RealForceObject):
         #headers = ['axial', 'torque']
         #return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RealCShearForceArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         assert self.ntimes > 0, 'ntimes=%s' % self.ntimes
@@ -1758,7 +1780,8 @@ class RealCShearForceArray(RealForceObject):
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self._times = zeros(self.ntimes, dtype=dtype)
         self.element = zeros(self.nelements, dtype='int32')
 
@@ -1979,8 +2002,7 @@ class RealCShearForceArray(RealForceObject):
                   is_mag_phase=False, endian='>'):
         """writes an OP2"""
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -2011,16 +2033,13 @@ class RealCShearForceArray(RealForceObject):
 
         op2_ascii.write(f'  ntimes = {self.ntimes}\n')
 
-        eids = self.element
         eids_device = self.element * 10 + self.device_code
 
         #fmt = '%2i %6f'
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i 16f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write(f'nelements={nelements:d}\n')
@@ -2043,48 +2062,12 @@ class RealCShearForceArray(RealForceObject):
             op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
             op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
 
-            f14 = self.data[itime, :, 0]
-            f12 = self.data[itime, :, 1]
-            f21 = self.data[itime, :, 2]
-            f23 = self.data[itime, :, 3]
-            f32 = self.data[itime, :, 4]
-            f34 = self.data[itime, :, 5]
-            f43 = self.data[itime, :, 6]
-            f41 = self.data[itime, :, 7]
-
-            kick1 = self.data[itime, :, 8]
-            tau12 = self.data[itime, :, 9]
-            kick2 = self.data[itime, :, 10]
-            tau23 = self.data[itime, :, 11]
-            kick3 = self.data[itime, :, 12]
-            tau34 = self.data[itime, :, 13]
-            kick4 = self.data[itime, :, 14]
-            tau41 = self.data[itime, :, 15]
-
-            for (eid, eid_device, f14i, f12i, f21i, f23i, f32i, f34i, f43i, f41i,
-                 kick1i, tau12i, kick2i, tau23i, kick3i, tau34i, kick4i, tau41i) in zip(
-                    eids, eids_device, f14, f12, f21, f23, f32, f34, f43, f41,
-                    kick1, tau12, kick2, tau23, kick3, tau34, kick4, tau41):
-                op2_file.write(struct1.pack(
-                            eid_device, f14i, f12i, f21i, f23i, f32i, f34i, f43i, f41i,
-                            kick1i, tau12i, kick2i, tau23i, kick3i, tau34i, kick4i, tau41i))
-
-                vals2 = write_floats_12e([
-                    f14i, f12i, f21i, f23i, f32i, f34i, f43i, f41i,
-                    kick1i, tau12i, kick2i, tau23i, kick3i, tau34i, kick4i, tau41i])
-                [
-                    f14i, f12i,
-                    f21i, f23i,
-                    f32i, f34i,
-                    f43i, f41i,
-                    kick1i, tau12i, kick2i, tau23i,
-                    kick3i, tau34i, kick4i, tau41i
-                ] = vals2
-                op2_ascii.write(
-                    '0%13i%-13s %-13s %-13s %-13s %-13s %-13s %-13s %s\n'
-                    '                     %-13s %-13s %-13s %-13s %-13s %-13s %-13s %s\n' % (
-                            eid, f14i, f12i, f21i, f23i, f32i, f34i, f43i, f41i,
-                            kick1i, tau12i, kick2i, tau23i, kick3i, tau34i, kick4i, tau41i))
+            # [eid_device, f14, f12, f21, f23, f32, f34, f43, f41,
+            #  kick1, tau12, kick2, tau23, kick3, tau34, kick4, tau41]
+            write_table4_rows(op2_file, [
+                (b'i', eids_device),
+                (b'f', self.data[itime, :, :16]),
+            ], endian)
 
             itable -= 1
             header = [4 * ntotal,]
@@ -2117,7 +2100,7 @@ class RealViscForceArray(RealForceObject):  # 24-CVISC
         #headers = ['axial', 'torque']
         #return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RealViscForceArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         if self.is_built:
@@ -2135,7 +2118,8 @@ class RealViscForceArray(RealForceObject):  # 24-CVISC
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self._times = zeros(self.ntimes, dtype=dtype)
         self.element = zeros(self.nelements, dtype='int32')
 
@@ -2339,7 +2323,7 @@ class RealPlateForceArray(RealForceObject):  # 33-CQUAD4, 74-CTRIA3
     def get_headers(self) -> List[str]:
         return ['mx', 'my', 'mxy', 'bmx', 'bmy', 'bmxy', 'tx', 'ty']
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RealPlateForceArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         if self.is_built:
@@ -2350,6 +2334,9 @@ class RealPlateForceArray(RealForceObject):  # 33-CQUAD4, 74-CTRIA3
         assert self.ntotal > 0, 'ntotal=%s' % self.ntotal
         #self.names = []
         #self.nelements //= self.ntimes
+        if self.is_sort2:
+            # a SORT2 subtable is a single element, so flip this to sort1
+            self.ntimes, self.ntotal = self.ntotal, self.ntimes
         self.itime = 0
         self.ielement = 0
         self.itotal = 0
@@ -2357,7 +2344,8 @@ class RealPlateForceArray(RealForceObject):  # 33-CQUAD4, 74-CTRIA3
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self._times = zeros(self.ntimes, dtype=dtype)
         self.element = zeros(self.ntotal, dtype=idtype)
 
@@ -2444,11 +2432,15 @@ class RealPlateForceArray(RealForceObject):  # 33-CQUAD4, 74-CTRIA3
         self.data[self.itime, self.itotal, :] = [mx, my, mxy, bmx, bmy, bmxy, tx, ty]
         self.itotal += 1
 
-    def add_sort2(self, eid, mx, my, mxy, bmx, bmy, bmxy, tx, ty):
-        raise NotImplementedError('SORT2')
-        #if dt not in self.mx:
-            #self.add_new_transient(dt)
-        #self.data[self.itime, self.itotal, :] = [mx, my, mxy, bmx, bmy, bmxy, tx, ty]
+    def add_sort2(self, dt, eid, mx, my, mxy, bmx, bmy, bmxy, tx, ty):
+        """unvectorized method for adding SORT2 transient data"""
+        assert isinstance(eid, integer_types) and eid > 0, 'dt=%s eid=%s' % (dt, eid)
+        itime = self.ielement
+        ielement = self.itime
+        self._times[itime] = dt
+        self.element[ielement] = eid
+        self.data[itime, ielement, :] = [mx, my, mxy, bmx, bmy, bmxy, tx, ty]
+        self.ielement += 1
 
     @property
     def nnodes_per_element(self):
@@ -2582,8 +2574,7 @@ class RealPlateForceArray(RealForceObject):  # 33-CQUAD4, 74-CTRIA3
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -2635,9 +2626,7 @@ class RealPlateForceArray(RealForceObject):  # 33-CQUAD4, 74-CTRIA3
 
         #[fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm]
 
-        if self.is_sort1:
-            structi = Struct(endian + b'i 8f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write(f'nelements={nelements:d}\n')
@@ -2657,24 +2646,11 @@ class RealPlateForceArray(RealForceObject):  # 33-CQUAD4, 74-CTRIA3
             op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
             op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
 
-            mx = self.data[itime, :, 0]
-            my = self.data[itime, :, 1]
-            mxy = self.data[itime, :, 2]
-            bmx = self.data[itime, :, 3]
-            bmy = self.data[itime, :, 4]
-            bmxy = self.data[itime, :, 5]
-            tx = self.data[itime, :, 6]
-            ty = self.data[itime, :, 7]
-
-            nwide = 0
-            for eid_device, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi in zip(eids_device, mx, my, mxy, bmx, bmy, bmxy, tx, ty):
-                data = [eid_device, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi]
-                #[mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi] = write_floats_13e(
-                #    [mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi])
-                op2_file.write(structi.pack(*data))
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(data[1:])))
-                nwide += len(data)
-
+            # [eid_device, mx, my, mxy, bmx, bmy, bmxy, tx, ty]
+            nwide = write_table4_rows(op2_file, [
+                (b'i', eids_device),
+                (b'f', self.data[itime, :, :8]),
+            ], endian)
             assert nwide == ntotal, f'nwide={nwide} ntotal={ntotal}'
             itable -= 1
             header = [4 * ntotal,]
@@ -2704,7 +2680,7 @@ class RealPlateBilinearForceArray(RealForceObject):  # 144-CQUAD4
     def get_headers(self) -> List[str]:
         return ['mx', 'my', 'mxy', 'bmx', 'bmy', 'bmxy', 'tx', 'ty']
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RealPlateBilinearForceArray"""
          #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         assert self.ntimes > 0, 'ntimes=%s' % self.ntimes
@@ -2719,7 +2695,8 @@ class RealPlateBilinearForceArray(RealForceObject):  # 144-CQUAD4
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self._times = zeros(self.ntimes, dtype=dtype)
         self.element_node = zeros((self.ntotal, 2), dtype='int32')
 
@@ -2990,8 +2967,7 @@ class RealPlateBilinearForceArray(RealForceObject):  # 144-CQUAD4
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -3005,18 +2981,11 @@ class RealPlateBilinearForceArray(RealForceObject):  # 144-CQUAD4
         eids = self.element_node[:, 0]
         nids = self.element_node[:, 1]
         if self.element_type  in [64, 82, 144]: # CQUAD8, CQUADR, CQUAD4
-            cyci = [0, 1, 2, 3, 4]
-            #cyc = cycle([0, 1, 2, 3, 4])  # TODO: this is totally broken...
             nnodes_per_eid = 5
         elif self.element_type  in [70, 75]: # CTRIAR, CTRIA6
-            cyci = [0, 1, 2, 3]
-            #cyc = cycle([0, 1, 2, 3])  # TODO: this is totally broken...
             nnodes_per_eid = 4
         else:
             raise NotImplementedError(self.element_type)
-
-        # TODO: this shouldn't be necessary
-        cyc = cyci * (len(eids) // nnodes_per_eid)
         assert len(eids) % nnodes_per_eid == 0
 
         #print("nnodes_all =", nnodes_all)
@@ -3051,11 +3020,12 @@ class RealPlateBilinearForceArray(RealForceObject):  # 144-CQUAD4
 
         #[fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm]
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i4s i 8f')
-            struct2 = Struct(endian + b'i 8f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
+        nnodes_all = len(eids)
+        ieid = np.arange(0, nnodes_all, nnodes_per_eid)
+        cen_words = np.full(len(ieid), cen_word)
+        nnodes_array = np.full(len(ieid), nnodes, dtype='int32')
 
         op2_ascii.write(f'nelements={nelements:d}\n')
         for itime in range(self.ntimes):
@@ -3074,35 +3044,19 @@ class RealPlateBilinearForceArray(RealForceObject):  # 144-CQUAD4
             op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
             op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
 
-            mx = self.data[itime, :, 0]
-            my = self.data[itime, :, 1]
-            mxy = self.data[itime, :, 2]
-            bmx = self.data[itime, :, 3]
-            bmy = self.data[itime, :, 4]
-            bmxy = self.data[itime, :, 5]
-            tx = self.data[itime, :, 6]
-            ty = self.data[itime, :, 7]
-
-            nwide = 0
-            for i, eid, eid_device, nid, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi in zip(cyc, eids, eids_device, nids, mx, my, mxy, bmx, bmy, bmxy, tx, ty):
-                #[mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi] = write_floats_13e(
-                #    [mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi])
-
-                if i == 0:
-                    data = [eid_device, cen_word, nnodes, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi]
-                    op2_file.write(struct1.pack(*data))
-                    op2_ascii.write(
-                        '0  %8i    %s %-13s %-13s %-13s %-13s %-13s %-13s %-13s %s\n' % (
-                            eid, cen_word, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi))
-                else:
-                    data = [nid, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi]
-                    op2_file.write(struct2.pack(*data))
-                    op2_ascii.write(
-                        '            %8i %-13s %-13s %-13s %-13s %-13s %-13s %-13s %s\n' % (
-                            nid, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi))
-
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(data)))
-                nwide += len(data)
+            # centroid: [eid_device, 'CEN/', nnodes, mx, my, mxy, bmx, bmy, bmxy, tx, ty]
+            # corners:  [nid, mx, my, mxy, bmx, bmy, bmxy, tx, ty]
+            datai = self.data[itime, :, :8]
+            columns = [
+                (b'i', eids_device[ieid]),
+                (b'4s', cen_words),
+                (b'i', nnodes_array),
+                (b'f', datai[ieid, :]),
+            ]
+            for inode in range(1, nnodes_per_eid):
+                columns.append((b'i', nids[ieid + inode]))
+                columns.append((b'f', datai[ieid + inode, :]))
+            nwide = write_table4_rows(op2_file, columns, endian)
 
             assert nwide == ntotal, f'nwide={nwide} ntotal={ntotal}'
             itable -= 1
@@ -3142,7 +3096,7 @@ class RealCBarFastForceArray(RealForceObject):
             'axial', 'torque']
         return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RealCBarForceArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         assert self.ntimes > 0, 'ntimes=%s' % self.ntimes
@@ -3160,24 +3114,25 @@ class RealCBarFastForceArray(RealForceObject):
             ntimes = self.ntimes
             nelements = self.nelements
             ntotal = self.ntotal
-            self._build(ntimes, nelements, ntotal, self._times_dtype)
+            self._build(ntimes, nelements, ntotal, self._times_dtype, result_dtype, id_dtype)
         else:
             ntimes = self.nelements
             nelements = self.ntimes
             ntotal = nelements * 2
             name = self.analysis_method + 's'
-            self._build(ntimes, nelements, ntotal, self._times_dtype)
+            self._build(ntimes, nelements, ntotal, self._times_dtype, result_dtype, id_dtype)
             setattr(self, name, self._times)
             self.data_code['name'] = self.analysis_method
             self.data_names[0] = self.analysis_method
             #print(f'data_names -> {self.data_names}')
 
-    def _build(self, ntimes, nelements, ntotal, dtype):
+    def _build(self, ntimes, nelements, ntotal, dtype, result_dtype=None, id_dtype=None):
         self.ntimes = ntimes
         self.nelements = nelements
         self.ntotal = ntotal
         #print(f"*ntimes={ntimes} nelements={nelements} ntotal={ntotal} data_names={self.data_names}")
-        unused_dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        unused_dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self._times = zeros(ntimes, dtype=dtype)
         self.element = zeros(nelements, dtype=idtype)
 
@@ -3333,8 +3288,7 @@ class RealCBarFastForceArray(RealForceObject):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -3370,9 +3324,7 @@ class RealCBarFastForceArray(RealForceObject):
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i 8f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
@@ -3392,20 +3344,11 @@ class RealCBarFastForceArray(RealForceObject):
             op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
             op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
 
-            bm1a = self.data[itime, :, 0]
-            bm2a = self.data[itime, :, 1]
-            bm1b = self.data[itime, :, 2]
-            bm2b = self.data[itime, :, 3]
-            ts1 = self.data[itime, :, 4]
-            ts2 = self.data[itime, :, 5]
-            af = self.data[itime, :, 6]
-            trq = self.data[itime, :, 7]
-            for eid_device, bm1ai, bm2ai, bm1bi, bm2bi, ts1i, ts2i, afi, trqi in zip(
-                    eids_device, bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq):
-
-                data = [eid_device, bm1ai, bm2ai, bm1bi, bm2bi, ts1i, ts2i, afi, trqi]
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(data)))
-                op2_file.write(struct1.pack(*data))
+            # [eid_device, bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
+            write_table4_rows(op2_file, [
+                (b'i', eids_device),
+                (b'f', self.data[itime, :, :8]),
+            ], endian)
 
             itable -= 1
             header = [4 * ntotal,]
@@ -3524,7 +3467,7 @@ class RealConeAxForceArray(RealForceObject):
         #headers = ['axial', 'torque']
         #return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RealConeAxForceArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         if self.is_built:
@@ -3542,7 +3485,8 @@ class RealConeAxForceArray(RealForceObject):
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self._times = zeros(self.ntimes, dtype=dtype)
         self.element = zeros(self.nelements, dtype='int32')
 
@@ -3712,7 +3656,7 @@ class RealCBar100ForceArray(RealForceObject):  # 100-CBAR
         ]
         return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RealCBar100ForceArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         assert self.ntimes > 0, 'ntimes=%s' % self.ntimes
@@ -3727,7 +3671,8 @@ class RealCBar100ForceArray(RealForceObject):  # 100-CBAR
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self._times = zeros(self.ntimes, dtype=dtype)
         self.element = zeros(self.nelements, dtype='int32')
 
@@ -3863,8 +3808,7 @@ class RealCBar100ForceArray(RealForceObject):  # 100-CBAR
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -3877,8 +3821,6 @@ class RealCBar100ForceArray(RealForceObject):  # 100-CBAR
             #op2_format = 'i21f'
         #s = Struct(op2_format)
 
-        eids = self.element
-
         # table 4 info
         #ntimes = self.data.shape[0]
         #nnodes = self.data.shape[1]
@@ -3902,17 +3844,13 @@ class RealCBar100ForceArray(RealForceObject):  # 100-CBAR
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i2f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
-        eids = self.element
         #f.write(''.join(words))
 
         #ntimes = self.data.shape[0]
-        struct1 = Struct(endian + b'i7f')
         for itime in range(self.ntimes):
             self._write_table_3(op2_file, op2_ascii, new_result, itable, itime)
 
@@ -3929,23 +3867,11 @@ class RealCBar100ForceArray(RealForceObject):  # 100-CBAR
             op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
             op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
 
-            # sd, bm1, bm2, ts1, ts2, af, trq
-            sd = self.data[itime, :, 0]
-            bm1 = self.data[itime, :, 1]
-            bm2 = self.data[itime, :, 2]
-            ts1 = self.data[itime, :, 3]
-            ts2 = self.data[itime, :, 4]
-            af = self.data[itime, :, 5]
-            trq = self.data[itime, :, 6]
-            for eid, eid_device, sdi, bm1i, bm2i, ts1i, ts2i, afi, trqi in zip(
-                    eids, eids_device, sd, bm1, bm2, ts1, ts2, af, trq):
-                [sbm1i, sbm2i, sts1i, sts2i, safi, strqi] = write_floats_13e([
-                    bm1i, bm2i, ts1i, ts2i, afi, trqi])
-                op2_ascii.write(
-                    '     %8i   %4.3f  %-13s  %-13s     %-13s  %-13s         %-13s      %s\n' % (
-                        eid, sdi, sbm1i, sbm2i, sts1i, sts2i, safi, strqi))
-                data = [eid_device, sdi, bm1i, bm2i, ts1i, ts2i, afi, trqi]
-                op2_file.write(struct1.pack(*data))
+            # [eid_device, sd, bm1, bm2, ts1, ts2, af, trq]
+            write_table4_rows(op2_file, [
+                (b'i', eids_device),
+                (b'f', self.data[itime, :, :7]),
+            ], endian)
 
             itable -= 1
             header = [4 * ntotal,]
@@ -4007,7 +3933,7 @@ class RealCGapForceArray(RealForceObject):  # 38-CGAP
         ]
         return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RealCGapForceArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         if self.is_built:
@@ -4025,7 +3951,8 @@ class RealCGapForceArray(RealForceObject):  # 38-CGAP
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self._times = zeros(self.ntimes, dtype=dtype)
         self.element = zeros(self.nelements, dtype='int32')
 
@@ -4187,7 +4114,7 @@ class RealBendForceArray(RealForceObject):  # 69-CBEND
         ]
         return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RealBendForceArray"""
         assert self.ntimes > 0, 'ntimes=%s' % self.ntimes
         assert self.nelements > 0, 'nelements=%s' % self.nelements
@@ -4202,7 +4129,8 @@ class RealBendForceArray(RealForceObject):  # 69-CBEND
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self._times = zeros(self.ntimes, dtype=dtype)
         self.element_node = zeros((self.nelements, 3), dtype='int32')
 
@@ -4413,7 +4341,7 @@ class RealSolidPressureForceArray(RealForceObject):  # 77-PENTA_PR,78-TETRA_PR
         #headers = ['axial', 'torque']
         #return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RealSolidPressureForceArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         if self.is_built:
@@ -4431,7 +4359,8 @@ class RealSolidPressureForceArray(RealForceObject):  # 77-PENTA_PR,78-TETRA_PR
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self._times = zeros(self.ntimes, dtype=dtype)
         self.element = zeros(self.nelements, dtype=idtype)
 
@@ -4619,7 +4548,7 @@ class RealForceMomentArray(RealForceObject):
         headers = ['fx', 'fy', 'fz', 'mx', 'my', 'mz']
         return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RealCBushForceArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         if self.is_built:
@@ -4637,7 +4566,8 @@ class RealForceMomentArray(RealForceObject):
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self._times = zeros(self.ntimes, dtype=dtype)
         self.element = zeros(self.nelements, dtype='int32')
 
@@ -4822,8 +4752,7 @@ class RealForceMomentArray(RealForceObject):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -4861,9 +4790,7 @@ class RealForceMomentArray(RealForceObject):
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i6f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
@@ -4882,17 +4809,11 @@ class RealForceMomentArray(RealForceObject):
             op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
             op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
 
-            fx = self.data[itime, :, 0]
-            fy = self.data[itime, :, 1]
-            fz = self.data[itime, :, 2]
-            mx = self.data[itime, :, 3]
-            my = self.data[itime, :, 4]
-            mz = self.data[itime, :, 5]
-
-            for eid, fxi, fyi, fzi, mxi, myi, mzi in zip(eids_device, fx, fy, fz, mx, my, mz):
-                data = [eid, fxi, fyi, fzi, mxi, myi, mzi]
-                op2_ascii.write('  eid=%s data=%s\n' % (eid, str(data[1:])))
-                op2_file.write(struct1.pack(*data))
+            # [eid_device, fx, fy, fz, mx, my, mz]
+            write_table4_rows(op2_file, [
+                (b'i', eids_device),
+                (b'f', self.data[itime, :, :6]),
+            ], endian)
 
             itable -= 1
             header = [4 * ntotal,]
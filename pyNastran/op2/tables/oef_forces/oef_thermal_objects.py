@@ -7,7 +7,7 @@ from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.op2.result_objects.op2_objects import BaseElement
 from pyNastran.f06.f06_formatting import (
     write_float_13e, write_floats_13e, _eigenvalue_header)
-from pyNastran.op2.result_objects.op2_objects import get_times_dtype
+from pyNastran.op2.result_objects.op2_objects import get_times_dtype, apply_result_dtypes
 from pyNastran.op2.result_objects.element_table_object import RealElementTableArray
 
 
@@ -52,7 +52,7 @@ class Real1DHeatFluxArray(BaseElement):
         #headers = ['axial', 'torque']
         #return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the Real1DHeatFluxArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         if self.is_built:
@@ -70,7 +70,8 @@ class Real1DHeatFluxArray(BaseElement):
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self._times = np.zeros(self.ntimes, dtype=dtype)
         self.element = np.zeros(self.nelements, dtype='int32')
         self.element_data_type = np.empty(self.nelements, dtype='|U8')
@@ -327,7 +328,7 @@ class RealConvHeatFluxArray(BaseElement):  # 107-CHBDYE 108-CHBDYG 109-CHBDYP
         ]
         return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RealConvHeatFluxArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         assert self.ntimes > 0, 'ntimes=%s' % self.ntimes
@@ -342,7 +343,8 @@ class RealConvHeatFluxArray(BaseElement):  # 107-CHBDYE 108-CHBDYG 109-CHBDYP
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self._times = np.zeros(self.ntimes, dtype=dtype)
         self.element_node = np.zeros((self.nelements, 2), dtype='int32')
 
@@ -544,7 +546,7 @@ class RealChbdyHeatFluxArray(BaseElement):  # 107-CHBDYE 108-CHBDYG 109-CHBDYP
         ]
         return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RealChbdyHeatFluxArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         if self.is_built:
@@ -562,7 +564,8 @@ class RealChbdyHeatFluxArray(BaseElement):  # 107-CHBDYE 108-CHBDYG 109-CHBDYP
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self._times = np.zeros(self.ntimes, dtype=dtype)
         self.element = np.zeros(self.nelements, dtype='int32')
         self.element_type = np.empty(self.nelements, dtype='|U8')
@@ -807,7 +810,7 @@ class RealHeatFluxVUShellArray(BaseElement):
         self.itotal = 0
         self.ielement = 0
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the ElementTableArray"""
         #print('nelements=%s ntimes=%s sort1?=%s ntotal=%s -> _nelements=%s' % (
             #self.nelements, self.ntimes, self.is_sort1,
@@ -834,12 +837,13 @@ class RealHeatFluxVUShellArray(BaseElement):
         self._times = np.zeros(ntimes, dtype=self._times_dtype)
         #self.types = array(self.nelements, dtype='|S1')
 
-        self.element = np.zeros(nelements, dtype='int32')
-        self.element_parent_coord_icord = np.zeros((nelements, 4), dtype='int32')
+        fdtype, idtype = apply_result_dtypes(self.data_type(), 'int32', result_dtype, id_dtype)
+        self.element = np.zeros(nelements, dtype=idtype)
+        self.element_parent_coord_icord = np.zeros((nelements, 4), dtype=idtype)
         #self.element_data_type = empty(nelements, dtype='|U8')
 
         #[xgrad, ygrad, zgrad, xflux, yflux, zflux]
-        self.data = np.zeros((nx, ny, 6), self.data_type())
+        self.data = np.zeros((nx, ny, 6), fdtype)
 
     def __eq__(self, table):  # pragma: no cover
         assert self.is_sort1 == table.is_sort1
@@ -6,6 +6,7 @@ from numpy import zeros
 from pyNastran.op2.result_objects.op2_objects import get_complex_times_dtype
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object)
+from pyNastran.op2.op2_interface.write_utils import write_table4_rows
 from pyNastran.f06.f06_formatting import write_imag_floats_13e
 
 
@@ -43,7 +44,7 @@ class ComplexBarArray(OES_Object):
     def nnodes_per_element(self) -> int:
         return 1
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the ComplexCBarArray"""
         #print('ntimes=%s nelements=%s ntotal=%s subtitle=%s' % (
             #self.ntimes, self.nelements, self.ntotal, self.subtitle))
@@ -58,7 +59,8 @@ class ComplexBarArray(OES_Object):
         self.itotal = 0
         #print('ntotal=%s ntimes=%s nelements=%s' % (self.ntotal, self.ntimes, self.nelements))
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
+        dtype, idtype, cfdtype = get_complex_times_dtype(
+            self.nonlinear_factor, self.size, result_dtype, id_dtype)
         self._times = zeros(self.ntimes, dtype=dtype)
         #self.element = array(self.nelements, dtype='|S8')
 
@@ -289,10 +291,9 @@ class ComplexBarArray(OES_Object):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -328,9 +329,7 @@ class ComplexBarArray(OES_Object):
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i 18f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
@@ -350,25 +349,15 @@ class ComplexBarArray(OES_Object):
             op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
             op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
 
-            sa1 = self.data[itime, :, 0]
-            sa2 = self.data[itime, :, 1]
-            sa3 = self.data[itime, :, 2]
-            sa4 = self.data[itime, :, 3]
-            axial = self.data[itime, :, 4]
-            sb1 = self.data[itime, :, 5]
-            sb2 = self.data[itime, :, 6]
-            sb3 = self.data[itime, :, 7]
-            sb4 = self.data[itime, :, 8]
-            #[sa1, sa2, sa3, sa4, axial, sb1, sb2, sb3, sb4]
-
-            eids = self.element
-            for eid_device, s1ai, s2ai, s3ai, s4ai, axiali, s2ai, s2bi, s2ci, s2di in zip(eids_device, sa1, sa2, sa3, sa4, axial, sb1, sb2, sb3, sb4):
-
-                data = [eid_device,
-                        s1ai.real, s2ai.real, s3ai.real, s4ai.real, axiali.real, s2ai.real, s2bi.real, s2ci.real, s2di.real,
-                        s1ai.imag, s2ai.imag, s3ai.imag, s4ai.imag, axiali.imag, s2ai.imag, s2bi.imag, s2ci.imag, s2di.imag]
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(data)))
-                op2_file.write(struct1.pack(*data))
+            # [eid_device,
+            #  sa1, sa2, sa3, sa4, axial, sb1, sb2, sb3, sb4 (real),
+            #  sa1, sa2, sa3, sa4, axial, sb1, sb2, sb3, sb4 (imag)]
+            datai = self.data[itime, :, :9]
+            write_table4_rows(op2_file, [
+                (b'i', eids_device),
+                (b'f', datai.real),
+                (b'f', datai.imag),
+            ], endian)
 
             itable -= 1
             header = [4 * ntotal,]
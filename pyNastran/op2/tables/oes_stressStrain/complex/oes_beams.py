@@ -40,7 +40,7 @@ class ComplexBeamArray(OES_Object):
     def is_complex(self) -> bool:
         return True
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the ComplexCBeamArray"""
         #print('ntimes=%s nelements=%s ntotal=%s subtitle=%s' % (
             #self.ntimes, self.nelements, self.ntotal, self.subtitle))
@@ -55,7 +55,8 @@ class ComplexBeamArray(OES_Object):
         self.itotal = 0
         #print('ntotal=%s ntimes=%s nelements=%s' % (self.ntotal, self.ntimes, self.nelements))
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
+        dtype, idtype, cfdtype = get_complex_times_dtype(
+            self.nonlinear_factor, self.size, result_dtype, id_dtype)
         #self.element = array(self.nelements, dtype='|S8')
 
         #self.ntotal = self.nelements * nnodes
@@ -346,8 +347,7 @@ class ComplexBeamArray(OES_Object):
         import inspect
         from struct import Struct, pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -4,6 +4,7 @@ from typing import List
 import numpy as np
 
 from pyNastran.utils.numpy_utils import integer_types
+from pyNastran.op2.result_objects.op2_objects import apply_result_dtypes
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object)
 from pyNastran.f06.f06_formatting import write_imag_floats_13e
@@ -45,7 +46,7 @@ class ComplexBendArray(OES_Object):
     #def get_nnodes(self):
         #return get_nnodes(self)
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the ComplexBendArray"""
         if not hasattr(self, 'subtitle'):
             self.subtitle = self.data_code['subtitle']
@@ -69,7 +70,8 @@ class ComplexBendArray(OES_Object):
         self._times = np.zeros(self.ntimes, 'float32')
         #self.ntotal = self.nelements * nnodes
 
-        self.element_node = np.zeros((self.ntotal, 2), 'int32')
+        cfdtype, idtype = apply_result_dtypes('complex64', 'int32', result_dtype, id_dtype)
+        self.element_node = np.zeros((self.ntotal, 2), idtype)
 
         # the number is messed up because of the offset for the element's properties
         if not self.nelements * nnodes * 2 == self.ntotal:
@@ -79,7 +81,7 @@ class ComplexBendArray(OES_Object):
             raise RuntimeError(msg)
 
         # [angle, sc, sd, se, sf]
-        self.data = np.zeros((self.ntimes, self.ntotal, 5), 'complex64')
+        self.data = np.zeros((self.ntimes, self.ntotal, 5), cfdtype)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
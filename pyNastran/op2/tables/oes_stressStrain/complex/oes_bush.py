@@ -7,6 +7,7 @@ from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.op2.result_objects.op2_objects import get_complex_times_dtype
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object)
+from pyNastran.op2.op2_interface.write_utils import write_table4_rows
 from pyNastran.f06.f06_formatting import write_imag_floats_13e, _eigenvalue_header
 
 
@@ -38,7 +39,7 @@ class ComplexCBushArray(OES_Object):
     def get_headers(self):
         raise NotImplementedError()
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the ComplexCBushArray"""
         assert self.ntimes > 0, 'ntimes=%s' % self.ntimes
         assert self.nelements > 0, 'nelements=%s' % self.nelements
@@ -49,7 +50,8 @@ class ComplexCBushArray(OES_Object):
         self.itotal = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
+        dtype, idtype, cfdtype = get_complex_times_dtype(
+            self.nonlinear_factor, self.size, result_dtype, id_dtype)
         self._times = zeros(self.ntimes, dtype=dtype)
         self.element = zeros(self.nelements, dtype=idtype)
 
@@ -212,10 +214,9 @@ class ComplexCBushArray(OES_Object):
         """writes an OP2"""
         # see TestOP2.test_op2_other_01
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -228,8 +229,6 @@ class ComplexCBushArray(OES_Object):
             #op2_format = 'i21f'
         #s = Struct(op2_format)
 
-        eids = self.element
-
         # table 4 info
         #ntimes = self.data.shape[0]
         #nnodes = self.data.shape[1]
@@ -253,9 +252,7 @@ class ComplexCBushArray(OES_Object):
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i12f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write(f'nelements={nelements:d}\n')
@@ -278,19 +275,15 @@ class ComplexCBushArray(OES_Object):
             op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
             op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
 
-            tx = self.data[itime, :, 0]
-            ty = self.data[itime, :, 1]
-            tz = self.data[itime, :, 2]
-            rx = self.data[itime, :, 3]
-            ry = self.data[itime, :, 4]
-            rz = self.data[itime, :, 5]
-            for eid, itx, ity, itz, irx, iry, irz in zip(eids, tx, ty, tz, rx, ry, rz):
-                data = [
-                    eid,
-                    itx.real, ity.real, itz.real, irx.real, iry.real, irz.real,
-                    itx.imag, ity.imag, itz.imag, irx.imag, iry.imag, irz.imag]
-                op2_ascii.write('  eid=%s data=%s\n' % (eids_device, str(data)))
-                op2_file.write(struct1.pack(*data))
+            # [eid_device,
+            #  tx, ty, tz, rx, ry, rz (real),
+            #  tx, ty, tz, rx, ry, rz (imag)]
+            datai = self.data[itime, :, :6]
+            write_table4_rows(op2_file, [
+                (b'i', eids_device),
+                (b'f', datai.real),
+                (b'f', datai.imag),
+            ], endian)
 
             itable -= 1
             header = [4 * ntotal,]
@@ -55,7 +55,7 @@ class ComplexLayeredCompositesArray(OES_Object):
     #def nnodes(self):
         #return self.nnodes_per_element()
 
-    def build(self) -> None:
+    def build(self, result_dtype=None, id_dtype=None) -> None:
         """sizes the vectorized attributes of the ComplexPlateArray
 
         C:\MSC.Software\simcenter_nastran_2019.2\tpl_post1\cqrdbx111.op2
@@ -80,7 +80,8 @@ class ComplexLayeredCompositesArray(OES_Object):
         self.itotal = 0
         #print('ntotal=%s ntimes=%s nelements=%s' % (self.ntotal, self.ntimes, self.nelements))
 
-        dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
+        dtype, idtype, cfdtype = get_complex_times_dtype(
+            self.nonlinear_factor, self.size, result_dtype, id_dtype)
 
         if self.is_sort1:
             ntimes = self.ntimes
@@ -48,7 +48,7 @@ class ComplexFastArray(OES_Object):
     #def get_nnodes(self):
         #return get_nnodes(self)
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the ComplexShearArray"""
         if not hasattr(self, 'subtitle'):
             self.subtitle = self.data_code['subtitle']
@@ -67,7 +67,8 @@ class ComplexFastArray(OES_Object):
         #print('ntotal=%s ntimes=%s nelements=%s' % (self.ntotal, self.ntimes, self.nelements))
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
+        dtype, idtype, cfdtype = get_complex_times_dtype(
+            self.nonlinear_factor, self.size, result_dtype, id_dtype)
         self._times = np.zeros(self.ntimes, dtype=dtype)
         #self.ntotal = self.nelements * nnodes
 
@@ -1,5 +1,5 @@
 import warnings
-from struct import Struct, pack
+from struct import pack
 from typing import List, Tuple
 
 import numpy as np
@@ -8,6 +8,7 @@ from numpy import zeros
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.op2.result_objects.op2_objects import get_complex_times_dtype
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import StressObject, StrainObject, OES_Object
+from pyNastran.op2.op2_interface.write_utils import write_table4_rows, interleave_real_imag
 from pyNastran.f06.f06_formatting import write_imag_floats_13e, write_float_13e
 
 #BASIC_TABLES = {
@@ -64,7 +65,7 @@ class ComplexPlateArray(OES_Object):
     #def nnodes(self):
         #return self.nnodes_per_element()
 
-    def build(self) -> None:
+    def build(self, result_dtype=None, id_dtype=None) -> None:
         """sizes the vectorized attributes of the ComplexPlateArray
 
         C:\MSC.Software\simcenter_nastran_2019.2\tpl_post1\cqrdbx111.op2
@@ -93,7 +94,10 @@ class ComplexPlateArray(OES_Object):
         #print('ntotal=%s ntimes=%s nelements=%s' % (self.ntotal, self.ntimes, self.nelements))
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
+        dtype, idtype, cfdtype = get_complex_times_dtype(
+            self.nonlinear_factor, self.size, result_dtype, id_dtype)
+        if self.is_sort2:
+            dtype = self.analysis_fmt
 
         if self.is_sort1:
             ntimes = self.ntimes
@@ -105,9 +109,13 @@ class ComplexPlateArray(OES_Object):
             #if self.element_type == 74:
                 #aasdf
         elif self.is_sort2:
+            # a SORT2 subtable is a single element, so flip this to sort1
             nelements = self.ntimes
             nlayers = nelements * 2 * nnodes
-            ntimes = self.ntotal
+            ntimes = self.ntotal // (2 * nnodes)
+            self.ntimes = ntimes
+            self.nelements = nelements
+            self.ntotal = nlayers
             #print(f'  SORT2: ntimes={ntimes} nelements={nelements} nlayers={nlayers} {self.element_name}-{self.element_type}')
         #print("nelements=%s nlayers=%s ntimes=%s" % (nelements, nlayers, ntimes))
 
@@ -383,10 +391,9 @@ class ComplexPlateArray(OES_Object):
                   date, is_mag_phase=False, endian='>') -> int:
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -427,19 +434,21 @@ class ComplexPlateArray(OES_Object):
         #[fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm]
         op2_ascii.write('  #elementi = [eid_device, node, fds, oxx, oyy, txy...\n')
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i 4s i 7f')
-            struct2 = Struct(endian + b'i 7f')
-            struct3 = Struct(endian + b'7f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write(f'nelements={nelements:d}\n')
         if nnodes == 1: # CTRIA3 centroid
             itable = self._write_op2_ctria3(
                 op2_file, op2_ascii, new_result, itable,
-                ntotal, eids_device)
+                ntotal, eids_device, endian)
             return itable
+
+        # 2 layers per node; the centroid is first
+        ieid = np.arange(0, len(eids), 2 * nnodes)
+        cen_words = np.full(len(ieid), b'CEN/')
+        nodes = self.element_node[:, 1]
+        fds = self.fiber_curvature
         for itime in range(self.ntimes):
             self._write_table_3(op2_file, op2_ascii, new_result, itable, itime)
 
@@ -455,41 +464,25 @@ class ComplexPlateArray(OES_Object):
             op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
             op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
 
-            fds = self.fiber_curvature
-            oxx = self.data[itime, :, 0]
-            oyy = self.data[itime, :, 1]
-            txy = self.data[itime, :, 2]
-
-            eids = self.element_node[:, 0]
-            nodes = self.element_node[:, 1]
-
-            ilayer0 = True
-            nwide = 0
-
-            for eid_device, eid, node, fd, doxx, doyy, dtxy in zip(eids_device, eids, nodes, fds, oxx, oyy, txy):
-                if node == 0 and ilayer0:
-                    data = [eid_device, b'CEN/', node, fd,
-                            doxx.real, doxx.imag, doyy.real, doyy.imag, dtxy.real, dtxy.imag]
-                    op2_file.write(struct1.pack(*data))
-                    op2_ascii.write('eid=%s node=%s data=%s' % (eid, node, str(data[2:])))
-                    #f06_file.write('0  %8i %8s  %-13s   %-13s / %-13s   %-13s / %-13s   %-13s / %s\n' % (
-                        #eid, cen, fdr, oxxr, oxxi, oyyr, oyyi, txyr, txyi))
-                elif ilayer0:    # TODO: assuming 2 layers?
-                    data = [node, fd,
-                            doxx.real, doxx.imag, doyy.real, doyy.imag, dtxy.real, dtxy.imag]
-                    op2_file.write(struct2.pack(*data))
-                    op2_ascii.write('  node=%s data=%s' % (node, str(data[2:])))
-                    #f06_file.write('   %8s %8i  %-13s   %-13s / %-13s   %-13s / %-13s   %-13s / %s\n' % (
-                        #'', node, fdr, oxxr, oxxi, oyyr, oyyi, txyr, txyi))
-                else:
-                    data = [fd,
-                            doxx.real, doxx.imag, doyy.real, doyy.imag, dtxy.real, dtxy.imag]
-                    op2_file.write(struct3.pack(*data))
-                    op2_ascii.write('    data=%s' % (str(data[2:])))
-                    #f06_file.write('   %8s %8s  %-13s   %-13s / %-13s   %-13s / %-13s   %-13s / %s\n\n' % (
-                        #'', '', fdr, oxxr, oxxi, oyyr, oyyi, txyr, txyi))
-                ilayer0 = not ilayer0
-                nwide += len(data)
+            # centroid: [eid_device, 'CEN/', 0, fd1, oxx1, oyy1, txy1, fd2, oxx2, oyy2, txy2]
+            # corners:  [node, fd1, oxx1, oyy1, txy1, fd2, oxx2, oyy2, txy2]
+            # where each stress is a real/imaginary pair
+            real_imag = interleave_real_imag(self.data[itime, :, :3])
+            columns = [
+                (b'i', eids_device[ieid]),
+                (b'4s', cen_words),
+            ]
+            for inode in range(nnodes):
+                ilayer1 = ieid + 2 * inode
+                ilayer2 = ilayer1 + 1
+                columns.extend([
+                    (b'i', nodes[ilayer1]),
+                    (b'f', fds[ilayer1]),
+                    (b'f', real_imag[ilayer1, :]),
+                    (b'f', fds[ilayer2]),
+                    (b'f', real_imag[ilayer2, :]),
+                ])
+            nwide = write_table4_rows(op2_file, columns, endian)
 
             assert nwide == ntotal, f'nwide={nwide} ntotal={ntotal}'
             itable -= 1
@@ -500,9 +493,8 @@ class ComplexPlateArray(OES_Object):
         return itable
 
     def _write_op2_ctria3(self, op2_file, op2_ascii, new_result, itable,
-                          ntotal, eids_device) -> int:
-        struct1 = Struct(b'i 7f')
-        struct2 = Struct(b'7f')
+                          ntotal, eids_device, endian) -> int:
+        fds = self.fiber_curvature
         for itime in range(self.ntimes):
             self._write_table_3(op2_file, op2_ascii, new_result, itable, itime)
             # record 4
@@ -517,38 +509,17 @@ class ComplexPlateArray(OES_Object):
             op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
             op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
 
-            fds = self.fiber_curvature
-            oxx = self.data[itime, :, 0]
-            oyy = self.data[itime, :, 1]
-            txy = self.data[itime, :, 2]
-
-            eids = self.element_node[:, 0]
-            #nodes = self.element_node[:, 1]
-
-            ilayer0 = True
-            nwide = 0
-
-            for eid_device, eid, fd, doxx, doyy, dtxy in zip(eids_device, eids, fds, oxx, oyy, txy):
-                #ilyaer0 = True
-                if ilayer0:
-                    ndatai = 0
-                    data = [eid_device, fd,
-                            doxx.real, doxx.imag, doyy.real, doyy.imag, dtxy.real, dtxy.imag]
-                    op2_file.write(struct1.pack(*data))
-                    #op2_ascii.write('eid=%s node=%s data=%s' % (eid, node, str(data[2:])))
-                    op2_ascii.write('0  %6i   %-13s     %-13s / %-13s     %-13s / %-13s     %-13s / %s\n' % (
-                        eid, fd, doxx.real, doxx.imag, doyy.real, doyy.imag, dtxy.real, dtxy.imag, ))
-                else:
-                    data = [fd,
-                            doxx.real, doxx.imag, doyy.real, doyy.imag, dtxy.real, dtxy.imag]
-                    op2_file.write(struct2.pack(*data))
-                    #op2_ascii.write('    data=%s' % (str(data[2:])))
-                    op2_ascii.write('   %6s   %-13s     %-13s / %-13s     %-13s / %-13s     %-13s / %s\n' % (
-                        '', fd, doxx.real, doxx.imag, doyy.real, doyy.imag, dtxy.real, dtxy.imag))
-                ndatai += len(data)
-                ilayer0 = not ilayer0
-                nwide += len(data)
-            assert nwide == ntotal, f"numwide={self.num_wide} ndatai={ndatai} nwide={nwide} ntotal={ntotal} headers={self.get_headers()}"
+            # [eid_device, fd1, oxx1, oyy1, txy1, fd2, oxx2, oyy2, txy2]
+            # where each stress is a real/imaginary pair
+            real_imag = interleave_real_imag(self.data[itime, :, :3])
+            nwide = write_table4_rows(op2_file, [
+                (b'i', eids_device[::2]),
+                (b'f', fds[::2]),
+                (b'f', real_imag[::2, :]),
+                (b'f', fds[1::2]),
+                (b'f', real_imag[1::2, :]),
+            ], endian)
+            assert nwide == ntotal, f"numwide={self.num_wide} nwide={nwide} ntotal={ntotal} headers={self.get_headers()}"
             itable -= 1
             header = [4 * ntotal,]
             op2_file.write(pack('i', *header))
@@ -65,7 +65,7 @@ class ComplexPlateVMArray(OES_Object):
     #def nnodes(self):
         #return self.nnodes_per_element()
 
-    def build(self) -> None:
+    def build(self, result_dtype=None, id_dtype=None) -> None:
         """sizes the vectorized attributes of the ComplexPlateArray
 
         SORT1:
@@ -94,7 +94,8 @@ class ComplexPlateVMArray(OES_Object):
         #print('ntotal=%s ntimes=%s nelements=%s' % (self.ntotal, self.ntimes, self.nelements))
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
+        dtype, idtype, cfdtype = get_complex_times_dtype(
+            self.nonlinear_factor, self.size, result_dtype, id_dtype)
 
         # nelements is the actual number of elements
         if self.is_sort1:
@@ -388,8 +389,7 @@ class ComplexPlateVMArray(OES_Object):
         import inspect
         from struct import Struct, pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
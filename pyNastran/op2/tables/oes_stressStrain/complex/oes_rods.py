@@ -5,6 +5,7 @@ from numpy import zeros, allclose
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.op2.result_objects.op2_objects import get_complex_times_dtype
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import StressObject, StrainObject, OES_Object
+from pyNastran.op2.op2_interface.write_utils import write_table4_rows
 from pyNastran.f06.f06_formatting import write_imag_floats_13e, _eigenvalue_header # get_key0,
 
 
@@ -36,18 +37,25 @@ class ComplexRodArray(OES_Object):
     def get_headers(self):
         raise NotImplementedError()
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the ComplexRodArray"""
         assert self.ntimes > 0, 'ntimes=%s' % self.ntimes
         assert self.nelements > 0, 'nelements=%s' % self.nelements
         assert self.ntotal > 0, 'ntotal=%s' % self.ntotal
         self.nelements //= self.ntimes
+        if self.is_sort2:
+            # a SORT2 subtable is a single element, so flip this to sort1
+            self.ntimes, self.nelements = self.nelements, self.ntimes
+            self.ntotal = self.nelements
         self.itime = 0
         self.ielement = 0
         self.itotal = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
+        dtype, idtype, cfdtype = get_complex_times_dtype(
+            self.nonlinear_factor, self.size, result_dtype, id_dtype)
+        if self.is_sort2:
+            dtype = self.analysis_fmt
 
         self._times = zeros(self.ntimes, dtype=dtype)
         self.element = zeros(self.nelements, dtype=idtype)
@@ -122,6 +130,16 @@ class ComplexRodArray(OES_Object):
         self.data[self.itime, self.ielement, :] = [axial, torsion]
         self.ielement += 1
 
+    def add_sort2(self, dt, eid, axial, torsion):
+        """unvectorized method for adding SORT2 transient data"""
+        assert isinstance(eid, integer_types) and eid > 0, 'dt=%s eid=%s' % (dt, eid)
+        itime = self.ielement
+        ielement = self.itime
+        self._times[itime] = dt
+        self.element[ielement] = eid
+        self.data[itime, ielement, :] = [axial, torsion]
+        self.ielement += 1
+
     def get_stats(self, short: bool=False) -> List[str]:
         if not self.is_built:
             return [
@@ -199,10 +217,9 @@ class ComplexRodArray(OES_Object):
                   is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -226,9 +243,7 @@ class ComplexRodArray(OES_Object):
 
         eids_device = self.element * 10 + self.device_code
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i4f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write(f'nelements={nelements:d}\n')
@@ -248,13 +263,13 @@ class ComplexRodArray(OES_Object):
             op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
             op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
 
-            axial = self.data[itime, :, 0]
-            torsion = self.data[itime, :, 1]
-
-            for eid_device, axiali, torsioni in zip(eids_device, axial, torsion):
-                data = [eid_device, axiali.real, torsioni.real, axiali.imag, torsioni.imag]
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, tuple(data)))
-                op2_file.write(struct1.pack(*data))
+            # [eid_device, axial.real, torsion.real, axial.imag, torsion.imag]
+            datai = self.data[itime, :, :2]
+            write_table4_rows(op2_file, [
+                (b'i', eids_device),
+                (b'f', datai.real),
+                (b'f', datai.imag),
+            ], endian)
 
             itable -= 1
             header = [4 * ntotal,]
@@ -21,12 +21,6 @@ class ComplexSolidArray(OES_Object):
         self.nelements = 0  # result specific
         #self.cid = {}  # gridGauss
 
-        if is_sort1:
-            #sort1
-            pass
-        else:
-            raise NotImplementedError('SORT2')
-
     @property
     def is_real(self) -> bool:
         return False
@@ -82,7 +76,7 @@ class ComplexSolidArray(OES_Object):
     def nnodes_per_element_no_centroid(self) -> int:
         return self.nnodes_per_element - 1
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the ComplexSolidArray"""
         #print('ntimes=%s nelements=%s ntotal=%s subtitle=%s' % (
             #self.ntimes, self.nelements, self.ntotal, self.subtitle))
@@ -91,6 +85,10 @@ class ComplexSolidArray(OES_Object):
         #self.names = []
         #self.nelements //= nnodes
         self.nelements //= self.ntimes
+        if self.is_sort2:
+            # a SORT2 subtable is a single element, so flip this to sort1
+            self.ntimes, self.nelements = self.nelements, self.ntimes
+            self.ntotal = self.nelements * nnodes
         #self.ntotal //= self.ntimes
         self.itime = 0
         self.ielement = 0
@@ -98,7 +96,10 @@ class ComplexSolidArray(OES_Object):
         #print('ntotal=%s ntimes=%s nelements=%s' % (self.ntotal, self.ntimes, self.nelements))
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
+        dtype, idtype, cfdtype = get_complex_times_dtype(
+            self.nonlinear_factor, self.size, result_dtype, id_dtype)
+        if self.is_sort2:
+            dtype = self.analysis_fmt
         self._times = zeros(self.ntimes, dtype=dtype)
         #self.element_types2 = array(self.nelements, dtype='|S8')
         #self.element_types3 = zeros((self.nelements, 2), dtype='int32')
@@ -213,6 +214,22 @@ class ComplexSolidArray(OES_Object):
         self.element_node[self.itotal, :] = [eid, grid]
         self.itotal += 1
 
+    def add_eid_sort2(self, element_num, element_type, dt, eid, cid, ctype, nodef):
+        """unvectorized method for adding SORT2 transient data"""
+        itime = self.ielement
+        ielement = self.itime
+        self._times[itime] = dt
+        self.element_cid[ielement] = [eid, cid]
+        self.itotal = ielement * self.nnodes_per_element
+        self.ielement += 1
+
+    def add_node_sort2(self, dt, eid, grid, inode, ex, ey, ez, etxy, etyz, etzx):
+        """unvectorized method for adding SORT2 transient data"""
+        itime = self.ielement - 1
+        self.data[itime, self.itotal, :] = [ex, ey, ez, etxy, etyz, etzx]
+        self.element_node[self.itotal, :] = [eid, grid]
+        self.itotal += 1
+
     def get_stats(self, short: bool=False) -> List[str]:
         if not self.is_built:
             return [
@@ -303,8 +320,7 @@ class ComplexSolidArray(OES_Object):
         import inspect
         from struct import Struct, pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
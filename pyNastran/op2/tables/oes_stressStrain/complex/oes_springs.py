@@ -6,6 +6,7 @@ from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.op2.result_objects.op2_objects import get_complex_times_dtype
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object)
+from pyNastran.op2.op2_interface.write_utils import write_table4_rows
 from pyNastran.f06.f06_formatting import write_imag_floats_13e, _eigenvalue_header
 
 
@@ -41,7 +42,7 @@ class ComplexSpringDamperArray(OES_Object):
         #headers = ['axial', 'torque']
         #return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the ComplexSpringDamperArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         assert self.ntimes > 0, 'ntimes=%s' % self.ntimes
@@ -49,6 +50,10 @@ class ComplexSpringDamperArray(OES_Object):
         assert self.ntotal > 0, 'ntotal=%s' % self.ntotal
         #self.names = []
         self.nelements //= self.ntimes
+        if self.is_sort2:
+            # a SORT2 subtable is a single element, so flip this to sort1
+            self.ntimes, self.nelements = self.nelements, self.ntimes
+            self.ntotal = self.nelements
         self.itime = 0
         self.ielement = 0
         self.itotal = 0
@@ -56,7 +61,10 @@ class ComplexSpringDamperArray(OES_Object):
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
+        dtype, idtype, cfdtype = get_complex_times_dtype(
+            self.nonlinear_factor, self.size, result_dtype, id_dtype)
+        if self.is_sort2:
+            dtype = self.analysis_fmt
         self._times = zeros(self.ntimes, dtype=dtype)
         self.element = zeros(self.nelements, dtype=idtype)
 
@@ -104,6 +112,16 @@ class ComplexSpringDamperArray(OES_Object):
         self.data[self.itime, self.ielement, 0] = stress
         self.ielement += 1
 
+    def add_sort2(self, dt, eid, stress):
+        """unvectorized method for adding SORT2 transient data"""
+        assert isinstance(eid, integer_types) and eid > 0, 'dt=%s eid=%s' % (dt, eid)
+        itime = self.ielement
+        ielement = self.itime
+        self._times[itime] = dt
+        self.element[ielement] = eid
+        self.data[itime, ielement, :] = [stress]
+        self.ielement += 1
+
     def get_stats(self, short: bool=False) -> List[str]:
         if not self.is_built:
             return [
@@ -211,10 +229,9 @@ class ComplexSpringDamperArray(OES_Object):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -244,9 +261,7 @@ class ComplexSpringDamperArray(OES_Object):
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i2f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
@@ -269,10 +284,12 @@ class ComplexSpringDamperArray(OES_Object):
             stress = self.data[itime, :, 0]
             reals, imags = to_mag_phase(stress, is_mag_phase)
 
-            for eid, stress_real, stress_imag in zip(eids_device, reals, imags):
-                data = [eid, stress_real, stress_imag]
-                op2_ascii.write(f'  eid={eid} stress={[stress_real, stress_imag]}\n')
-                op2_file.write(struct1.pack(*data))
+            # [eid_device, stress.real, stress.imag]
+            write_table4_rows(op2_file, [
+                (b'i', eids_device),
+                (b'f', reals),
+                (b'f', imags),
+            ], endian)
 
             itable -= 1
             header = [4 * ntotal,]
@@ -43,7 +43,7 @@ class ComplexTriaxStressArray(OES_Object):
         self.itotal = 0
         self.ielement = 0
 
-    def build(self) -> None:
+    def build(self, result_dtype=None, id_dtype=None) -> None:
         """sizes the vectorized attributes of the ComplexPlateArray"""
         if not hasattr(self, 'subtitle'):
             self.subtitle = self.data_code['subtitle']
@@ -69,7 +69,8 @@ class ComplexTriaxStressArray(OES_Object):
         #self.ntotal = self.nelements * nnodes
 
         # TODO: could be more efficient by using nelements for cid
-        dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
+        dtype, idtype, cfdtype = get_complex_times_dtype(
+            self.nonlinear_factor, self.size, result_dtype, id_dtype)
         self.eids = zeros(self.ntotal, dtype=idtype)
         self.element_node = zeros((self.ntotal, 2), idtype)
         #self.element_cid = zeros((self.nelements, 2), 'int32')
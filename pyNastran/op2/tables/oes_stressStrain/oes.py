@@ -2007,7 +2007,7 @@ class OES(OP2Common2):
                     self.op2.log.error(msg)
                     raise
                 #op2.obj.update_data_code(op2.data_code)
-                build_obj(op2.obj)
+                build_obj(op2.obj, op2.result_dtype, op2.id_dtype)
 
             else:  # not vectorized
                 auto_return = True
@@ -2047,7 +2047,7 @@ class OES(OP2Common2):
                     op2.log.error(msg)
                     raise
                 #op2.obj.update_data_code(op2.data_code)
-                build_obj(op2.obj)
+                build_obj(op2.obj, op2.result_dtype, op2.id_dtype)
 
             else:  # not vectorized
                 auto_return = True
@@ -2124,9 +2124,14 @@ class OES(OP2Common2):
                 self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 #(eid_device, stress)
-                obj.data[obj.itime, itotal:itotal2, 0] = floats[:, 1].copy()
+                obj.data[obj.itime, itotal:itotal2, 0] = floats[:, 1]
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and obj.is_sort2:
+                n = nelements * ntotal
+                ielement, itime, itime2 = op2._set_sort2_element(obj, data, nelements)
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 2)
+                obj.data[itime:itime2, ielement, 0] = floats[:, 1]
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     log.debug('vectorize CELASx real SORT%s' % op2.sort_method)
@@ -2167,6 +2172,12 @@ class OES(OP2Common2):
 
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and obj.is_sort2:
+                n = nelements * ntotal
+                ielement, itime, itime2 = op2._set_sort2_element(obj, data, nelements)
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 3).copy()
+                real_imag = apply_mag_phase(floats, is_magnitude_phase, 1, 2)
+                obj.data[itime:itime2, ielement, 0] = real_imag
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     log.debug('vectorize CELASx imag SORT%s' % op2.sort_method)
@@ -2248,9 +2259,14 @@ class OES(OP2Common2):
                 self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 #[axial, torsion, SMa, SMt]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:]
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and obj.is_sort2:
+                n = nelements * ntotal
+                ielement, itime, itime2 = op2._set_sort2_element(obj, data, nelements)
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 5)
+                obj.data[itime:itime2, ielement, :] = floats[:, 1:]
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     op2.log.debug('vectorize CROD real SORT%s' % op2.sort_method)
@@ -2285,6 +2301,12 @@ class OES(OP2Common2):
 
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and obj.is_sort2:
+                n = nelements * ntotal
+                ielement, itime, itime2 = op2._set_sort2_element(obj, data, nelements)
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 5).copy()
+                real_imag = apply_mag_phase(floats, is_magnitude_phase, [1, 3], [2, 4])
+                obj.data[itime:itime2, ielement, :] = real_imag
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     op2.log.debug('vectorize CROD imag SORT%s' % op2.sort_method)
@@ -2322,7 +2344,7 @@ class OES(OP2Common2):
                 self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 #[axial, torsion, SMa, SMt]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:]
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -2584,7 +2606,7 @@ class OES(OP2Common2):
                 self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 #[max_strain, avg_strain, margin]
-                obj.data[itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                obj.data[itime, itotal:itotal2, :] = floats[:, 1:]
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -2645,7 +2667,7 @@ class OES(OP2Common2):
                 self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 #[max_strain, avg_strain, margin]
-                obj.data[itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                obj.data[itime, itotal:itotal2, :] = floats[:, 1:]
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -2721,7 +2743,7 @@ class OES(OP2Common2):
 
                 #[s1a, s2a, s3a, s4a, axial, smaxa, smina, margin_tension,
                 # s1b, s2b, s3b, s4b,        smaxb, sminb, margin_compression]
-                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:].copy()
+                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:]
                 obj.itotal = ielement2
                 obj.ielement = ielement2
             else:
@@ -2822,7 +2844,7 @@ class OES(OP2Common2):
 
                 #[s1a, s2a, s3a, s4a, axial,
                 # s1b, s2b, s3b, s4b]
-                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:].copy()
+                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:]
                 obj.itotal = ielement2
                 obj.ielement = ielement2
             else:
@@ -2958,6 +2980,27 @@ class OES(OP2Common2):
                 obj.data[obj.itime, itotal:itotal2, 9] = floats1[:, 8]
                 obj.itotal = itotal2
                 obj.ielement = itotali
+            elif op2.use_vector and is_vectorized and obj.is_sort2:
+                n = nelements * ntotal
+                ielement, itime, itime2 = op2._set_sort2_times(obj, data, nelements)
+                itotal = ielement * nnodes_expected
+                itotal2 = itotal + nnodes_expected
+                if itime == 0:
+                    # (time, cid, abcd, nnodes)
+                    ints = frombuffer(data, dtype=op2.idtype8).reshape(nelements, numwide_real)
+                    eid = op2.nonlinear_factor
+                    assert eid > 0, op2.code_information()
+                    obj.element_node[itotal:itotal2, 0] = eid
+                    obj.element_node[itotal:itotal2, 1] = ints[0, 4:].reshape(nnodes_expected, 21)[:, 0]
+                    obj.element_cid[ielement, :] = [eid, ints[0, 1]]
+
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, numwide_real)
+                floats1 = floats[:, 4:].reshape(nelements, nnodes_expected, 21)
+                max_mid_min = floats1[:, :, [3, 11, 17]]
+                max_mid_min.sort(axis=2)
+                obj.data[itime:itime2, itotal:itotal2, :6] = floats1[:, :, [1, 9, 15, 2, 10, 16]]
+                obj.data[itime:itime2, itotal:itotal2, 6:9] = max_mid_min[:, :, [2, 1, 0]]
+                obj.data[itime:itime2, itotal:itotal2, 9] = floats1[:, :, 8]
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     log.debug(f'vectorize CSolid real SORT{op2.sort_method}')
@@ -3013,6 +3056,28 @@ class OES(OP2Common2):
 
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and obj.is_sort2:
+                n = nelements * ntotal
+                ielement, itime, itime2 = op2._set_sort2_times(obj, data, nelements)
+                itotal = ielement * nnodes_expected
+                itotal2 = itotal + nnodes_expected
+                if itime == 0:
+                    # (time, cid, ctype, nodef)
+                    ints = frombuffer(data, dtype=op2.idtype8).reshape(nelements, numwide_imag)
+                    eid = op2.nonlinear_factor
+                    assert eid > 0, op2.code_information()
+                    obj.element_node[itotal:itotal2, 0] = eid
+                    obj.element_node[itotal:itotal2, 1] = ints[0, 4:].reshape(nnodes_expected, 13)[:, 0]
+                    obj.element_cid[ielement, :] = [eid, ints[0, 1]]
+
+                # 0 is nid
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, numwide_imag)
+                floats1 = floats[:, 4:].reshape(nelements * nnodes_expected, 13).copy()
+                isave1 = [1, 2, 3, 4, 5, 6]
+                isave2 = [7, 8, 9, 10, 11, 12]
+                real_imag = apply_mag_phase(floats1, is_magnitude_phase, isave1, isave2)
+                obj.data[itime:itime2, itotal:itotal2, :] = real_imag.reshape(
+                    nelements, nnodes_expected, 6)
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     log.debug(f'vectorize CSolid imag SORT{op2.sort_method}')
@@ -4390,7 +4455,7 @@ class OES(OP2Common2):
                 floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 8)
 
                 #[axial, maxa, mina, maxb, minb, max_shear, bearing]
-                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:].copy()
+                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:]
                 obj.itotal = ielement2
                 obj.ielement = ielement2
             else:
@@ -4436,7 +4501,7 @@ class OES(OP2Common2):
                 floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 8)
 
                 #[axial, maxa, mina, maxb, minb, max_shear, bearing]
-                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:].copy()
+                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:]
                 obj.itotal = ielement2
                 obj.ielement = ielement2
             else:
@@ -4518,7 +4583,7 @@ class OES(OP2Common2):
                 floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 7)
 
                 #[force_x, force_y, force_z, moment_x, moment_y, moment_z]
-                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:].copy()
+                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:]
                 obj.itotal = ielement2
                 obj.ielement = ielement2
             else:
@@ -4567,7 +4632,7 @@ class OES(OP2Common2):
 
 
                 #[force_x, force_y, force_z, moment_x, moment_y, moment_z]
-                obj.data[obj.itime, ielement:ielement2, :] = real_imag # .copy()
+                obj.data[obj.itime, ielement:ielement2, :] = real_imag
                 obj.itotal = ielement2
                 obj.ielement = ielement2
             else:
@@ -4670,9 +4735,22 @@ class OES(OP2Common2):
 
                 #fd, sx, sy, txy, angle, major, minor, max_shear
                 floats1 = floats.reshape(nelements * nnodes_expected, 8)
-                obj.data[obj.itime, itotal:itotal2, :] = floats1.copy()
+                obj.data[obj.itime, itotal:itotal2, :] = floats1
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and obj.is_sort2:
+                n = nelements * ntotal
+                ielement, itime, itime2 = op2._set_sort2_times(obj, data, nelements)
+                itotal = 2 * ielement
+                itotal2 = itotal + 2
+                if itime == 0:
+                    eid = op2.nonlinear_factor
+                    assert eid > 0, op2.code_information()
+                    obj.element_node[itotal:itotal2, 0] = eid
+
+                #fd, sx, sy, txy, angle, major, minor, max_shear
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, numwide_real)
+                obj.data[itime:itime2, itotal:itotal2, :] = floats[:, 1:].reshape(nelements, 2, 8)
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     op2.log.debug(f'vectorize centroidal quad: {op2.element_name}-{op2.element_type} real '
@@ -4728,6 +4806,25 @@ class OES(OP2Common2):
                 obj.data[obj.itime, itotal:itotal2, :] = real_imag
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and obj.is_sort2:
+                n = nelements * ntotal
+                ielement, itime, itime2 = op2._set_sort2_times(obj, data, nelements)
+                itotal = 2 * ielement
+                itotal2 = itotal + 2
+
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 15)
+                floats1 = floats[:, 1:].reshape(nelements * 2, 7).copy()
+                if itime == 0:
+                    eid = op2.nonlinear_factor
+                    assert eid > 0, op2.code_information()
+                    obj.element_node[itotal:itotal2, 0] = eid
+                    obj.fiber_curvature[itotal:itotal2] = floats1[:2, 0]
+
+                #[fd, sxr, sxi, syr, syi, txyr, txyi]
+                isave1 = [1, 3, 5]
+                isave2 = [2, 4, 6]
+                real_imag = apply_mag_phase(floats1, is_magnitude_phase, isave1, isave2)
+                obj.data[itime:itime2, itotal:itotal2, :] = real_imag.reshape(nelements, 2, 3)
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     op2.log.debug(f'vectorize CQUAD4-33 imag SORT{sort_method}')
@@ -4799,8 +4896,8 @@ class OES(OP2Common2):
                     nf2 = floats2.shape[0]
                     floats3 = floats2.reshape(nf2*2, 4)
 
-                    obj.fiber_curvature[itotal:itotal2] = floats3[:, 0].copy()
-                    obj.data[obj.itime, itotal:itotal2, :] = floats3[:, 1:].copy()
+                    obj.fiber_curvature[itotal:itotal2] = floats3[:, 0]
+                    obj.data[obj.itime, itotal:itotal2, :] = floats3[:, 1:]
                     obj.itotal = itotal2
                     obj.ielement = ielement2
 
@@ -4845,10 +4942,10 @@ class OES(OP2Common2):
                     floats3 = floats2.reshape(nf2*2, 4)
                     # we only need to grab the first two fiber/curvature values
                     # as they're duplicated many times for the same element
-                    obj.fiber_curvature[2*obj.itime:2*obj.itime+2] = floats3[:2, 0].copy()
+                    obj.fiber_curvature[2*obj.itime:2*obj.itime+2] = floats3[:2, 0]
                     # we apply the data across 2 rows because we have 2 layers
-                    obj.data[:, ie_upper, :] = floats3[::2, 1:].copy()
-                    obj.data[:, ie_lower, :] = floats3[1::2, 1:].copy()
+                    obj.data[:, ie_upper, :] = floats3[::2, 1:]
+                    obj.data[:, ie_lower, :] = floats3[1::2, 1:]
                 else:
                     raise NotImplementedError(op2.code_information())
                 obj.itotal = itotal2
@@ -4918,7 +5015,7 @@ class OES(OP2Common2):
                 print(floats.shape)
                 #fd, sx, sy, txy,
                 floats1 = floats.reshape(nelements * nnodes_expected, 10)
-                obj.data[obj.itime, itotal:itotal2, :] = floats1.copy()
+                obj.data[obj.itime, itotal:itotal2, :] = floats1
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -5072,6 +5169,18 @@ class OES(OP2Common2):
                 obj._times[obj.itime] = dt
                 obj.itotal += nlayers
                 n = nbytes
+            elif op2.use_vector and is_vectorized and obj.is_sort2:
+                n = nelements * ntotal
+                ielement, itime, itime2 = op2._set_sort2_times(obj, data, nelements)
+                itotal = 2 * ielement
+                itotal2 = itotal + 2
+                if itime == 0:
+                    eid = op2.nonlinear_factor
+                    assert eid > 0, op2.code_information()
+                    obj.element_node[itotal:itotal2, 0] = eid
+
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 17)
+                obj.data[itime:itime2, itotal:itotal2, :] = floats[:, 1:].reshape(nelements, 2, 8)
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     op2.log.debug(f'vectorize centroidal tri: {element_name_type} real SORT{sort_method}')
@@ -5123,10 +5232,30 @@ class OES(OP2Common2):
                 obj.data[obj.itime, itotal:itotal2, :] = real_imag
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and obj.is_sort2:
+                n = nelements * ntotal
+                ielement, itime, itime2 = op2._set_sort2_times(obj, data, nelements)
+                itotal = 2 * ielement
+                itotal2 = itotal + 2
+
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 15)
+                floats1 = floats[:, 1:].reshape(nelements * 2, 7).copy()
+                if itime == 0:
+                    eid = op2.nonlinear_factor
+                    assert eid > 0, op2.code_information()
+                    obj.element_node[itotal:itotal2, 0] = eid
+                    obj.fiber_curvature[itotal:itotal2] = floats1[:2, 0]
+
+                #[fd, sxr, sxi, syr, syi, txyr, txyi]
+                isave1 = [1, 3, 5]
+                isave2 = [2, 4, 6]
+                real_imag = apply_mag_phase(floats1, is_magnitude_phase, isave1, isave2)
+                obj.data[itime:itime2, itotal:itotal2, :] = real_imag.reshape(nelements, 2, 3)
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     op2.log.debug(f'vectorize CTRIA3 imag SORT{sort_method}')
                 struct1 = Struct(op2._endian + mapfmt(op2._analysis_code_fmt + b'14f', self.size))
+                add_sort_x = getattr(obj, 'add_sort' + str(sort_method))
                 cen = 0 # CEN/3
                 for unused_i in range(nelements):
                     edata = data[n:n + ntotal]
@@ -5156,9 +5285,9 @@ class OES(OP2Common2):
                         sy2 = complex(sy2r, sy2i)
                         txy1 = complex(txy1r, txy1i)
                         txy2 = complex(txy2r, txy2i)
-                    obj.add_sort1(dt, eid, cen,
-                                  fd1, sx1, sy1, txy1,
-                                  fd2, sx2, sy2, txy2)
+                    add_sort_x(dt, eid, cen,
+                               fd1, sx1, sy1, txy1,
+                               fd2, sx2, sy2, txy2)
                     n += ntotal
         #elif op2.format_code == 1 and op2.num_wide == 9: # random?
             #msg = op2.code_information()
@@ -5267,7 +5396,7 @@ class OES(OP2Common2):
                 print(floats.shape)
                 #fd, sx, sy, txy,
                 floats1 = floats.reshape(nelements * nnodes_expected, 10)
-                obj.data[obj.itime, itotal:itotal2, :] = floats1.copy()
+                obj.data[obj.itime, itotal:itotal2, :] = floats1
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -5327,7 +5456,7 @@ class OES(OP2Common2):
                 print(floats.shape)
                 #fd, sx, sy, txy,
                 floats1 = floats.reshape(nelements * nnodes_expected, 8)
-                obj.data[obj.itime, itotal:itotal2, :] = floats1.copy()
+                obj.data[obj.itime, itotal:itotal2, :] = floats1
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -5465,6 +5594,27 @@ class OES(OP2Common2):
                 #[fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm]
                 obj.data[obj.itime, istart:iend, :] = results
                 assert obj.element_node[:, 0].min() > 0, obj.element_node[:, 0]
+            elif op2.use_vector and is_vectorized and obj.is_sort2:
+                n = nelements * ntotal
+                ielement, itime, itime2 = op2._set_sort2_times(obj, data, nelements)
+                nlayers_per_element = 2 * nnodes_all
+                istart = ielement * nlayers_per_element
+                iend = istart + nlayers_per_element
+                if itime == 0:
+                    # (time, 'CEN/', grid, ...); the center is node 0
+                    ints = frombuffer(data, dtype=op2.idtype8).reshape(nelements, numwide_real)
+                    nids = ints[0, 2:].reshape(nnodes_all, 17)[:, 0].copy()
+                    nids[0] = 0
+                    eid = op2.nonlinear_factor
+                    assert eid > 0, op2.code_information()
+                    obj.element_node[istart:iend, 0] = eid
+                    obj.element_node[istart:iend, 1] = repeat(nids, 2)
+
+                #[fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm]
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, numwide_real)
+                floats1 = floats[:, 2:].reshape(nelements, nnodes_all, 17)[:, :, 1:]
+                obj.data[itime:itime2, istart:iend, :] = floats1.reshape(
+                    nelements, nlayers_per_element, 8)
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     log.debug(f'vectorize nodal shell: {element_name_type}... real SORT{sort_method}')
@@ -5527,6 +5677,33 @@ class OES(OP2Common2):
                 obj.data[obj.itime, itotal:itotal2, :] = real_imag
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and obj.is_sort2:
+                n = nelements * ntotal
+                ielement, itime, itime2 = op2._set_sort2_times(obj, data, nelements)
+                nlayers_per_element = 2 * nnodes_all
+                itotal = ielement * nlayers_per_element
+                itotal2 = itotal + nlayers_per_element
+
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, numwide_imag)
+                floats1 = floats[:, 2:].reshape(nelements, nnodes_all, 15)[:, :, 1:]
+                floats2 = floats1.reshape(nelements * nlayers_per_element, 7).copy()
+                if itime == 0:
+                    # (time, 'CEN/', grid, ...); the center is node 0
+                    ints = frombuffer(data, dtype=op2.idtype8).reshape(nelements, numwide_imag)
+                    nids = ints[0, 2:].reshape(nnodes_all, 15)[:, 0].copy()
+                    nids[0] = 0
+                    eid = op2.nonlinear_factor
+                    assert eid > 0, op2.code_information()
+                    obj.element_node[itotal:itotal2, 0] = eid
+                    obj.element_node[itotal:itotal2, 1] = repeat(nids, 2)
+                    obj.fiber_curvature[itotal:itotal2] = floats2[:nlayers_per_element, 0]
+
+                #[fd, sxr, sxi, syr, syi, txyr, txyi]
+                isave1 = [1, 3, 5]
+                isave2 = [2, 4, 6]
+                real_imag = apply_mag_phase(floats2, is_magnitude_phase, isave1, isave2)
+                obj.data[itime:itime2, itotal:itotal2, :] = real_imag.reshape(
+                    nelements, nlayers_per_element, 3)
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     log.debug(f'vectorize CQUAD4-144/{element_name_type}... imag SORT{sort_method}')
@@ -5929,7 +6106,7 @@ class OES(OP2Common2):
 
                 #[fiber_distance, oxx, oyy, ozz, txy, exx, eyy, ezz, exy, es, eps, ecs]
                 #floats[:, 1] = 0
-                obj.data[obj.itime, itotal:itotal2, :] = floats.reshape(nelements * 2, 12).copy()
+                obj.data[obj.itime, itotal:itotal2, :] = floats.reshape(nelements * 2, 12)
                 #obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:]
                 obj.ielement = ielement2
                 obj.itotal = itotal2
@@ -6053,7 +6230,7 @@ class OES(OP2Common2):
 
                 floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 11)
                 #[o1, o2, t12, t1z, t2z, angle, major, minor, ovm]
-                obj.data[obj.itime, istart:iend, :] = floats[:, 2:].copy()
+                obj.data[obj.itime, istart:iend, :] = floats[:, 2:]
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     op2.log.debug(f'vectorize COMP_SHELL real SORT{sort_method}')
@@ -6527,7 +6704,7 @@ class OES(OP2Common2):
 
                 floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 7)
                 #[tx, ty, tz, rx, ry, rz]
-                obj.data[obj.itime, istart:iend, :] = floats[:, 1:].copy()
+                obj.data[obj.itime, istart:iend, :] = floats[:, 1:]
             else:
                 n = oes_cbush_real_7(op2, data, obj,
                                      nelements, ntotal, dt)
@@ -6622,7 +6799,7 @@ class OES(OP2Common2):
 
                 floats = frombuffer(data, dtype=op2.fdtype).reshape(nelements, 8)
                 #[xxx, fe, ue, ve, ao, ae, ep, xxx]
-                obj.data[itime, itotal:itotal2, :] = floats[:, 1:7].copy()
+                obj.data[itime, itotal:itotal2, :] = floats[:, 1:7]
 
                 obj.ielement = itotal2
                 obj.itotal = itotal2
@@ -6774,7 +6951,7 @@ class OES(OP2Common2):
                 floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 7)
                 #[axial_stress, equiv_stress, total_strain,
                 # eff_plastic_creep_strain, eff_creep_strain, linear_torsional_stresss]
-                obj.data[obj.itime, istart:iend, :] = floats[:, 1:].copy()
+                obj.data[obj.itime, istart:iend, :] = floats[:, 1:]
             else:
                 struct1 = Struct(op2._endian + mapfmt(op2._analysis_code_fmt + b'6f', self.size))  # 1+6=7
                 for unused_i in range(nelements):
@@ -6852,7 +7029,7 @@ class OES(OP2Common2):
                 floats = frombuffer(data, dtype=op2.fdtype).reshape(nelements, numwide_real)
 
                 #[force, stress]
-                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:].copy()
+                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:]
                 obj.itotal = ielement2
                 obj.ielement = ielement2
             else:
@@ -6926,7 +7103,7 @@ class OES(OP2Common2):
                 floats = frombuffer(data, dtype=op2.fdtype).reshape(nelements, 19)
                 #[fx, fy, fz, otx, oty, otz, etx, ety, etz,
                 # mx, my, mz, orx, ory, orz, erx, ery, erz]
-                obj.data[obj.itime, istart:iend, :] = floats[:, 1:].copy()
+                obj.data[obj.itime, istart:iend, :] = floats[:, 1:]
             else:
                 #             N O N L I N E A R   F O R C E S  A N D  S T R E S S E S  I N   B U S H   E L E M E N T S    ( C B U S H )
                 #
@@ -7198,7 +7375,7 @@ class OES(OP2Common2):
                     obj.element[itotal:itotal2] = eids
 
                 #[max_strain, avg_strain, margin]
-                obj.data[itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                obj.data[itime, itotal:itotal2, :] = floats[:, 1:]
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -7253,7 +7430,7 @@ class OES(OP2Common2):
                     obj.element[itotal:itotal2] = eids
 
                 #[max_strain, avg_strain, margin]
-                obj.data[itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                obj.data[itime, itotal:itotal2, :] = floats[:, 1:]
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -7333,7 +7510,7 @@ class OES(OP2Common2):
                     obj.element[itotal:itotal2] = eids
 
                 #[max_strain, avg_strain, margin]
-                obj.data[itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                obj.data[itime, itotal:itotal2, :] = floats[:, 1:]
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -7414,7 +7591,7 @@ class OES(OP2Common2):
                 floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 11)
                 # skipping [form1, form2]
                 #[cpx, shy, shz, au, shv, shw, slv, slp]
-                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:9].copy()
+                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:9]
             else:
                 if self.size == 4:
                     struct1 = Struct(op2._endian + op2._analysis_code_fmt + b'8f4s4s')
@@ -7582,7 +7759,7 @@ class OES(OP2Common2):
 
                 floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 10)
                 #[sd, sxc, sxd, sxe, sxf, axial, smax, smin, MS]
-                obj.data[obj.itime, istart:iend, :] = floats[:, 1:].copy()
+                obj.data[obj.itime, istart:iend, :] = floats[:, 1:]
             else:
                 n = oes_cbar100_real_10(op2, data, obj, nelements, ntotal, dt)
         else:  # pragma: no cover
@@ -52,7 +52,7 @@ class HyperelasticQuadArray(OES_Object):
         #else:
             #raise NotImplementedError(f'name={self.element_name} type={self.element_type}')
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the HyperelasticQuadArray"""
         #print("self.ielement = %s" % self.ielement)
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
@@ -91,7 +91,8 @@ class HyperelasticQuadArray(OES_Object):
 
         #print("***name=%s type=%s nnodes_per_element=%s ntimes=%s nelements=%s ntotal=%s" % (
             #self.element_name, self.element_type, nnodes_per_element, self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self._times = np.zeros(self.ntimes, dtype=dtype)
         self.element_node = np.zeros((self.ntotal, 2), dtype='int32')
 
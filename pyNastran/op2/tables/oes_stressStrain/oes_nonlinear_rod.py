@@ -5,6 +5,7 @@ from numpy import zeros
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.op2.result_objects.op2_objects import get_times_dtype
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import OES_Object
+from pyNastran.op2.op2_interface.write_utils import write_table4_rows
 from pyNastran.f06.f06_formatting import write_floats_13e, _eigenvalue_header
 
 
@@ -50,7 +51,7 @@ class RealNonlinearRodArray(OES_Object): # 89-CRODNL, 92-CONRODNL
                    'linear_torsional_stress']
         return headers
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RealNonlinearRodArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         assert self.ntimes > 0, 'ntimes=%s' % self.ntimes
@@ -65,7 +66,8 @@ class RealNonlinearRodArray(OES_Object): # 89-CRODNL, 92-CONRODNL
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self._times = zeros(self.ntimes, dtype=dtype)
         self.element = zeros(self.nelements, dtype=idtype)
 
@@ -238,10 +240,9 @@ class RealNonlinearRodArray(OES_Object): # 89-CRODNL, 92-CONRODNL
                   is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -279,9 +280,7 @@ class RealNonlinearRodArray(OES_Object): # 89-CRODNL, 92-CONRODNL
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i6f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write(f'nelements={nelements:d}\n')
@@ -304,17 +303,11 @@ class RealNonlinearRodArray(OES_Object): # 89-CRODNL, 92-CONRODNL
             op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
             op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
 
-            axial = self.data[itime, :, 0]
-            eqs = self.data[itime, :, 1]
-            total = self.data[itime, :, 2]
-            epcs = self.data[itime, :, 3]
-            ecs = self.data[itime, :, 4]
-            lts = self.data[itime, :, 5]
-
-            for eid, axiali, eqsi, totali, epcsi, ecsi, ltsi in zip(eids_device, axial, eqs, total, epcs, ecs, lts):
-                data = [eid, axiali, eqsi, totali, epcsi, ecsi, ltsi]
-                op2_ascii.write('  eid=%s data=%s\n' % (eids_device, str(data)))
-                op2_file.write(struct1.pack(*data))
+            # [eid_device, axial, eqs, total, epcs, ecs, lts]
+            write_table4_rows(op2_file, [
+                (b'i', eids_device),
+                (b'f', self.data[itime, :, :6]),
+            ], endian)
 
             itable -= 1
             header = [4 * ntotal,]
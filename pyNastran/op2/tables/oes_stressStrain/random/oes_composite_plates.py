@@ -65,7 +65,7 @@ class RandomCompositePlateArray(OES_Object):
     def get_headers(self):
         raise NotImplementedError('%s needs to implement get_headers' % self.__class__.__name__)
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RealCompositePlateArray"""
         assert self.ntimes > 0, 'ntimes=%s' % self.ntimes
         assert self.nelements > 0, 'nelements=%s' % self.nelements
@@ -88,7 +88,8 @@ class RandomCompositePlateArray(OES_Object):
         self.ielement = 0
         self.itotal = 0
 
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self._times = zeros(self.ntimes, dtype=dtype)
 
         self.element_layer = zeros((self.ntotal, 2), dtype='int32')
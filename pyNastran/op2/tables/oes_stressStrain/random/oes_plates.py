@@ -4,6 +4,7 @@ import numpy as np
 from numpy import zeros
 
 from pyNastran.utils.numpy_utils import integer_types
+from pyNastran.op2.result_objects.op2_objects import apply_result_dtypes
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object)
 from pyNastran.f06.f06_formatting import write_float_13e, _eigenvalue_header
@@ -50,7 +51,7 @@ class RandomPlateArray(OES_Object):
         self.itotal = 0
         self.ielement = 0
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RandomPlateArray
 
         SORT1:
@@ -132,7 +133,8 @@ class RandomPlateArray(OES_Object):
         #print('ntotal=%s ntimes=%s nelements=%s' % (self.ntotal, self.ntimes, self.nelements))
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        self.build_data(ntimes, nelements, nlayers, nnodes, self._times_dtype)
+        self.build_data(ntimes, nelements, nlayers, nnodes, self._times_dtype,
+                        result_dtype, id_dtype)
         #print(''.join(self.get_stats()))
         #try:
             #name = self.data_code['name']
@@ -140,7 +142,8 @@ class RandomPlateArray(OES_Object):
             #print(''.join(self.get_stats()))
             #raise
 
-    def build_data(self, ntimes, nelements, nlayers, nnodes, dtype):
+    def build_data(self, ntimes, nelements, nlayers, nnodes, dtype,
+                   result_dtype=None, id_dtype=None):
         """actually performs the build step"""
         self.ntimes = ntimes
         self.nelements = nelements
@@ -153,7 +156,8 @@ class RandomPlateArray(OES_Object):
         #self.ntotal = self.nelements * nnodes
 
         #print(f'***nelements={nelements} nlayers={nlayers} ntimes={ntimes}')
-        self.element_node = zeros((nlayers, 2), 'int32')
+        fdtype, idtype = apply_result_dtypes('float32', 'int32', result_dtype, id_dtype)
+        self.element_node = zeros((nlayers, 2), idtype)
 
         # the number is messed up because of the offset for the element's properties
         #if not self.nelements * 2 == self.ntotal:
@@ -165,7 +169,7 @@ class RandomPlateArray(OES_Object):
 
         # [oxx, oyy, txy]
         #print(f'ntimes={self.ntimes} nelements={self.nelements} ntotal={self.ntotal}')
-        self.data = zeros((ntimes, nlayers, 3), 'float32')
+        self.data = zeros((ntimes, nlayers, 3), fdtype)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
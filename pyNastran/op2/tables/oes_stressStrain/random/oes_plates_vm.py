@@ -51,7 +51,7 @@ class RandomPlateVMArray(OES_Object):
     def nnodes_per_element(self) -> int:
         return get_nnodes(self)
 
-    def build(self) -> None:
+    def build(self, result_dtype=None, id_dtype=None) -> None:
         """sizes the vectorized attributes of the RandomPlateVMArray
 
         SORT1:
@@ -119,7 +119,8 @@ class RandomPlateVMArray(OES_Object):
         self.itime = 0
         self.ielement = 0
         self.itotal = 0
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
 
         #print('ntotal=%s ntimes=%s nelements=%s' % (self.ntotal, self.ntimes, self.nelements))
 
@@ -40,7 +40,7 @@ class RandomShearArray(OES_Object):
     def get_headers(self):
         raise NotImplementedError()
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RealShearArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         assert self.ntimes > 0, 'ntimes=%s' % self.ntimes
@@ -62,7 +62,8 @@ class RandomShearArray(OES_Object):
             ntimes = self.nelements
             nelements = self.ntimes
 
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self._times = zeros(ntimes, dtype=dtype)
         self.element = zeros(nelements, dtype='int32')
 
@@ -7,6 +7,7 @@ from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.op2.result_objects.op2_objects import get_times_dtype
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object, oes_data_code)
+from pyNastran.op2.op2_interface.write_utils import write_table4_rows
 from pyNastran.f06.f06_formatting import write_floats_13e, _eigenvalue_header
 
 ELEMENT_NAME_TO_ELEMENT_TYPE = {
@@ -97,7 +98,7 @@ class RealBarArray(OES_Object):
     def get_headers(self):
         raise NotImplementedError('%s needs to implement get_headers' % self.__class__.__name__)
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RealBarArray"""
         #print("self.ielement =", self.ielement)
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
@@ -119,7 +120,8 @@ class RealBarArray(OES_Object):
 
         #print("***name=%s type=%s nnodes_per_element=%s ntimes=%s nelements=%s ntotal=%s" % (
             #self.element_name, self.element_type, nnodes_per_element, self.ntimes, self.nelements, self.ntotal))
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
 
         if self.is_sort1:
             ntimes = self.ntimes
@@ -342,10 +344,9 @@ class RealBarArray(OES_Object):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -381,9 +382,7 @@ class RealBarArray(OES_Object):
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i 15f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write(f'nelements={nelements:d}\n')
@@ -403,37 +402,13 @@ class RealBarArray(OES_Object):
             op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
             op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
 
-            s1a = self.data[itime, :, 0]
-            s2a = self.data[itime, :, 1]
-            s3a = self.data[itime, :, 2]
-            s4a = self.data[itime, :, 3]
-
-            axial = self.data[itime, :, 4]
-            smaxa = self.data[itime, :, 5]
-            smina = self.data[itime, :, 6]
-            MSt = self.data[itime, :, 7]
-
-            s1b = self.data[itime, :, 8]
-            s2b = self.data[itime, :, 9]
-            s3b = self.data[itime, :, 10]
-            s4b = self.data[itime, :, 11]
-
-            smaxb = self.data[itime, :, 12]
-            sminb = self.data[itime, :, 13]
-            MSc = self.data[itime, :, 14]
-
-            for (eid_device,
-                 s1ai, s2ai, s3ai, s4ai, axiali, smaxai, sminai, MSti,
-                 s1bi, s2bi, s3bi, s4bi,         smaxbi, sminbi, MSci) in zip(
-                eids_device,
-                s1a, s2a, s3a, s4a, axial, smaxa, smina, MSt,
-                s1b, s2b, s3b, s4b,        smaxb, sminb, MSc):
-
-                data = [eid_device,
-                        s1ai, s2ai, s3ai, s4ai, axiali, smaxai, sminai, MSti,
-                        s1bi, s2bi, s3bi, s4bi,         smaxbi, sminbi, MSci]
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(data)))
-                op2_file.write(struct1.pack(*data))
+            # [eid_device,
+            #  s1a, s2a, s3a, s4a, axial, smaxa, smina, MSt,
+            #  s1b, s2b, s3b, s4b,        smaxb, sminb, MSc]
+            write_table4_rows(op2_file, [
+                (b'i', eids_device),
+                (b'f', self.data[itime, :, :15]),
+            ], endian)
 
             itable -= 1
             header = [4 * ntotal,]
@@ -46,7 +46,7 @@ class RealBendArray(OES_Object):
     #def get_nnodes(self):
         #return get_nnodes(self)
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the ComplexBendArray"""
         if not hasattr(self, 'subtitle'):
             self.subtitle = self.data_code['subtitle']
@@ -75,7 +75,8 @@ class RealBendArray(OES_Object):
             #print("**BEND: ntimes=%s ntotal=%s" % (ntimes, ntotal))
         #self.ntotal = nelements * nnodes * 2
 
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self._times = np.zeros(ntimes, dtype=dtype)
         #self.ntotal = self.nelements * nnodes
 
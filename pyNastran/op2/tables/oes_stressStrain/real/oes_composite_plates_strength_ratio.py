@@ -51,7 +51,7 @@ class RealCompositePlateStrengthRatioArray(OES_Object):
     def get_headers(self):
         raise NotImplementedError('%s needs to implement get_headers' % self.__class__.__name__)
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RealCompositePlateArray"""
         assert self.ntimes > 0, 'ntimes=%s' % self.ntimes
         assert self.nelements > 0, 'nelements=%s' % self.nelements
@@ -78,7 +78,8 @@ class RealCompositePlateStrengthRatioArray(OES_Object):
         self.ielement = 0
         self.itotal = 0
 
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
 
         if self.is_sort1:
             ntimes = self.ntimes
@@ -508,7 +509,7 @@ class RealCompositePlateStrengthRatioArray(OES_Object):
     #    from struct import Struct, pack
     #    frame = inspect.currentframe()
     #    call_frame = inspect.getouterframes(frame, 2)
-    #    op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+    #    op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
     #
     #    if itable == -1:
     #        self._write_table_header(op2_file, op2_ascii, date)
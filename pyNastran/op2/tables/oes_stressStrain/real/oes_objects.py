@@ -132,8 +132,7 @@ class OES_Object(BaseElement):
         import inspect
         from struct import pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write('%s.write_table_3: %s\n' % (self.__class__.__name__, call_frame[1][3]))
+        op2_ascii.write('%s.write_table_3: %s\n' % (self.__class__.__name__, frame.f_back.f_code.co_name))
 
         #if itable == -3:
         #print('*writing itable=%s' % itable)
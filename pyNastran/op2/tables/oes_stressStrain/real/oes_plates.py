@@ -2,17 +2,22 @@
 #pylint disable=C0103
 from itertools import count
 import warnings
-from typing import Tuple, List
+from typing import List
 import numpy as np
 
 from pyNastran.utils.numpy_utils import integer_types
-from pyNastran.op2.op2_interface.write_utils import to_column_bytes, view_dtype, view_idtype_as_fdtype
+from pyNastran.op2.op2_interface.write_utils import write_table4_rows
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
-    StressObject, StrainObject, OES_Object)
+    StressObject, StrainObject, OES_Object, oes_data_code)
 from pyNastran.op2.result_objects.op2_objects import get_times_dtype
 from pyNastran.f06.f06_formatting import write_floats_13e, _eigenvalue_header
 from pyNastran.op2.errors import SixtyFourBitError
 
+# the centroidal plates
+ELEMENT_NAME_TO_ELEMENT_TYPE = {
+    'CQUAD4' : 33,
+    'CTRIA3' : 74,
+}
 
 class RealPlateArray(OES_Object):
     def __init__(self, data_code, is_sort1, isubcase, dt):
@@ -30,6 +35,59 @@ class RealPlateArray(OES_Object):
         #else:
             #raise NotImplementedError('SORT2')
 
+    @classmethod
+    def add_static_case(cls, table_name, element_name, element_node, data, isubcase,
+                        is_sort1=True, is_random=False, is_stress=True, is_msc=True,
+                        random_code=0, title='', subtitle='', label=''):
+        """
+        Creates a static result for centroidal CQUAD4/CTRIA3 elements
+
+        Parameters
+        ----------
+        element_node : (nelements*2, 2) int ndarray
+            the [eid, 0] for the bottom/top layers of each element
+        data : (1, nelements*2, 8) float ndarray
+            [fiber_dist, oxx, oyy, txy, angle, omax, omin, ovm]
+
+        """
+        analysis_code = 1 # static
+        data_code = oes_data_code(table_name, analysis_code,
+                                  is_sort1=is_sort1, is_random=is_random,
+                                  random_code=random_code,
+                                  title=title, subtitle=subtitle, label=label,
+                                  is_msc=is_msc)
+        data_code['lsdvmns'] = [0] # TODO: ???
+        data_code['data_names'] = []
+
+        # von mises
+        if is_stress:
+            data_code['stress_bits'] = [0, 0, 0, 0, 1]
+            data_code['s_code'] = 1
+        else:
+            data_code['stress_bits'] = [0, 1, 0, 1, 1]
+            data_code['s_code'] = 11
+
+        element_type = ELEMENT_NAME_TO_ELEMENT_TYPE[element_name]
+        data_code['element_name'] = element_name
+        data_code['element_type'] = element_type
+        data_code['num_wide'] = 17
+        data_code['load_set'] = 1
+
+        ntimes = data.shape[0]
+        nlayers = data.shape[1]
+        dt = None
+        obj = cls(data_code, is_sort1, isubcase, dt)
+        obj.element_node = element_node
+        obj.data = data
+
+        obj.ntimes = ntimes
+        obj.ntotal = nlayers
+        obj.nelements = nlayers // 2
+        obj.nnodes = 1
+        obj._times = [None]
+        obj.is_built = True
+        return obj
+
     @property
     def is_real(self) -> bool:
         return True
@@ -71,7 +129,7 @@ class RealPlateArray(OES_Object):
         else:
             raise NotImplementedError(f'name={self.element_name} type={self.element_type}')
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RealPlateArray"""
         #print("self.ielement = %s" % self.ielement)
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
@@ -108,35 +166,15 @@ class RealPlateArray(OES_Object):
         #print("***name=%s type=%s nnodes_per_element=%s ntimes=%s nelements=%s ntotal=%s" % (
             #self.element_name, self.element_type, nnodes_per_element, self.ntimes,
             #self.nelements, self.ntotal))
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
 
-        if self.is_sort1:
-            ntimes = self.ntimes
-            nlayers = self.nelements
-        else:
-            # NUMBER OF CQUAD4   ELEMENTS =      956
-            # NUMBER OF CTRIA3   ELEMENTS =       27
-            #***nelements=956 nlayers_per_element=2 ntimes=201 nlayers=1912
-            #***nelements=27  nlayers_per_element=2 ntimes=201
-
-            #print(self.ntimes, self.nelements, self.ntotal, self._ntotals)
-            nelements = self.ntimes # good
-            ntimes = self._ntotals[0] // nlayers_per_element
-            nlayers = nelements * nlayers_per_element
-            #print(f'***nelements={nelements} nlayers_per_element={nlayers_per_element} ntimes={ntimes} -> nlayers={nlayers}')
-            #nelements = self._ntotals[0]  # good
-            #nlayers += 1
-            #ntimes = nlayers // nelements
-            assert nlayers % nelements == 0
-            #print('***', self.element_name, nlayers)
-            #assert nelements == 4, self.ntimes
-            #nelements = 4
-            #nelements = = self.ntimes // 2
-            #print(f'ntimes={ntimes} nelements={nelements} nlayers={nlayers}; '
-                  #f'nlayers_per_element={nlayers_per_element}')
-            #bbb
-            #assert ntimes == 1, ntimes
-            #print(self.code_information())
+        if self.is_sort2:
+            # a SORT2 subtable is a single element, so flip this to sort1
+            self.ntimes, self.nelements = (self.nelements // nlayers_per_element,
+                                           self.ntimes * nlayers_per_element)
+        ntimes = self.ntimes
+        nlayers = self.nelements
 
         if self.analysis_code == 1:
             #ntimes = 1
@@ -301,115 +339,42 @@ class RealPlateArray(OES_Object):
         self.itotal += 2
         #self.ielement += 2
 
-    def _get_sort2_itime_ilower_iupper_from_itotal(self, dt, eid: int, nid: int,
-                                                   debug=False) -> Tuple[int, int, int]:
-        ntimes = self.data.shape[0]
-
-        # the monotonic element index (no duplicates)
-        ielement = self.itime
-
-        # itime = self.itime
-        itime = self.ielement
-        #ie_upper = self.ielement
-        #ie_lower = self.ielement + 1
-        #itotal = self.itotal
-        #inid = 0
-        nnodes = self.nnodes_per_element
-        #itime = self.ielement // nnodes
-
-        #ilayer = self.itotal % 2 == 0 # 0/1
-        #ielement_inid = self.itotal // ntimes
-        inid = self.itotal // (2 * ntimes)
-        if self.element_type in [33, 74, 227, 228]:
-            #  CQUAD4-33, CTRIA3-74, CTRIAR-227, CQUADR-228
-            assert inid == 0, (self.element_name, self.element_type, inid)
-            #print('inid', inid)
-        elif self.element_type in [64, 144]:  # CQUAD8, CQUAD4-144
-            assert inid in (0, 1, 2, 3, 4), (self.element_name, self.element_type, inid)
-        elif self.element_type == 75:  # CQUAD8
-            assert inid in (0, 1, 2, 3), (self.element_name, self.element_type, inid)
-        else:
-            raise NotImplementedError((self.element_name, self.element_type, inid))
-
-
-        #inid = self.ielement % nnodes
-        #itotal = self.itotal
-        #if itime >= self.data.shape[0]:# or itotal >= self.element_node.shape[0]:
-        ielement = self.itime
-        #if self.element_name == 'CQUAD8':
-            #print(f'*SORT2 {self.element_name}: itime={itime} ielement={ielement} ilayer={ilayer}  inid={inid} itotal={itotal} dt={dt} eid={eid} nid={nid}')
-            #print(f'*SORT2 {self.element_name}: itime={itime} ielement={ielement} ilayer=False inid={inid} itotal={itotal+1} dt={dt} eid={eid} nid={nid}')
-            #print(self.data.shape)
-            #print(self.element_node.shape)
-        #else:
-        #aaa
-        #print(itime, inid, ielement)
-
-        #ibase = 2 * ielement # ctria3/cquad4-33
-        if debug:
-            print(f'ielement={ielement} nnodes={nnodes} inid={inid}')
-        ibase = 2 * (ielement * nnodes + inid)
-        #ibase = ielement_inid
-        ie_upper = ibase
-        ie_lower = ibase + 1
-
-        #if self.element_name == 'CTRIAR': # and self.table_name == 'OESATO2':
-        #debug = False
-        #if self.element_name == 'CTRIAR': # and self.table_name in ['OSTRRMS1', 'OSTRRMS2']:
-            #debug = True
-        #if debug:
-            #print(f'SORT2 {self.table_name} {self.element_name}: itime={itime} ie_upper={ie_upper} ielement={self.itime} inid={inid} nid={nid} itotal={itotal} dt={dt} eid={eid} nid={nid}')
-            #print(f'SORT2 {self.table_name} {self.element_name}: itime={itime} ie_lower={ie_lower} ielement={self.itime} inid={inid} nid={nid} itotal={itotal+1} dt={dt} eid={eid} nid={nid}')
-        return itime, ie_upper, ie_lower
-
     def add_new_eid_sort2(self, dt, eid, node_id,
                           fiber_dist1, oxx1, oyy1, txy1, angle1, major_principal1, minor_principal1, ovm1,
                           fiber_dist2, oxx2, oyy2, txy2, angle2, major_principal2, minor_principal2, ovm2):
+        """unvectorized method for adding SORT2 transient data"""
         assert isinstance(eid, integer_types), eid
         assert isinstance(node_id, integer_types), node_id
-        #itime, itotal = self._get_sort2_itime_ielement_from_itotal()
-
-
-        itime, ie_upper, ie_lower = self._get_sort2_itime_ilower_iupper_from_itotal(dt, eid, node_id)
-        try:
-            #print(f'SORT2: itime={itime} -> dt={dt};   ie_upper={ie_upper} -> eid={eid} ({self.element_name})')
-            self._times[itime] = dt
-            #assert self.itotal == 0, oxx
-            #if itime == 0:
-            self.element_node[ie_upper, :] = [eid, node_id]  # 0 is center
-            self.element_node[ie_lower, :] = [eid, node_id]  # 0 is center
-        except Exception:
-            itime, ie_upper, ie_lower = self._get_sort2_itime_ilower_iupper_from_itotal(
-                dt, eid, node_id, debug=True)
-            print(f'SORT2: itime={itime} -> dt={dt};   ie_upper={ie_upper} -> eid={eid} ({self.element_name})')
-            raise
-        #print(self.element_node)
-        #self.data[self.itime, ie_upper, :] = [fiber_dist1, oxx1, oyy1, txy1, angle1,
-                                              #major_principal1, minor_principal1, ovm1]
-        #self.data[self.itime, ie_lower, :] = [fiber_dist2, oxx2, oyy2, txy2, angle2,
-                                              #major_principal2, minor_principal2, ovm2]
-        self.itotal += 2
-        #self.ielement += 1
+        itime = self.ielement
+        ielement = self.itime
+        itotal = 2 * ielement * self.nnodes_per_element
+
+        self._times[itime] = dt
+        self.element_node[itotal, :] = [eid, node_id]
+        self.element_node[itotal+1, :] = [eid, node_id]
+        self.data[itime, itotal, :] = [fiber_dist1, oxx1, oyy1, txy1, angle1,
+                                       major_principal1, minor_principal1, ovm1]
+        self.data[itime, itotal+1, :] = [fiber_dist2, oxx2, oyy2, txy2, angle2,
+                                         major_principal2, minor_principal2, ovm2]
+        self.itotal = itotal + 2
+        self.ielement += 1
 
     def add_sort2(self, dt, eid, node_id,
                   fiber_dist1, oxx1, oyy1, txy1, angle1, major_principal1, minor_principal1, ovm1,
                   fiber_dist2, oxx2, oyy2, txy2, angle2, major_principal2, minor_principal2, ovm2):
+        """unvectorized method for adding SORT2 transient data"""
         assert eid is not None, eid
         assert isinstance(eid, integer_types) and eid > 0, 'dt=%s eid=%s' % (dt, eid)
         assert isinstance(node_id, integer_types), node_id
-        itime, ie_upper, ie_lower = self._get_sort2_itime_ilower_iupper_from_itotal(dt, eid, node_id)
-        #print(f'SORT2b: itime={itime} -> dt={dt};   ie_upper={ie_upper} -> eid={eid} nid={node_id}')
-        #print(self.element_node.shape)
-        #if itime == 0:
-        self.element_node[ie_upper, :] = [eid, node_id]
-        self.element_node[ie_lower, :] = [eid, node_id]
-        #print(self.element_node.tolist())
-        self.data[itime, ie_upper, :] = [fiber_dist1, oxx1, oyy1, txy1, angle1,
+        itime = self.ielement - 1
+        itotal = self.itotal
+        self.element_node[itotal, :] = [eid, node_id]
+        self.element_node[itotal+1, :] = [eid, node_id]
+        self.data[itime, itotal, :] = [fiber_dist1, oxx1, oyy1, txy1, angle1,
                                        major_principal1, minor_principal1, ovm1]
-        self.data[itime, ie_lower, :] = [fiber_dist2, oxx2, oyy2, txy2, angle2,
+        self.data[itime, itotal+1, :] = [fiber_dist2, oxx2, oyy2, txy2, angle2,
                                          major_principal2, minor_principal2, ovm2]
         self.itotal += 2
-        #self.ielement += 2
 
     def get_stats(self, short: bool=False) -> List[str]:
         if not self.is_built:
@@ -448,16 +413,11 @@ class RealPlateArray(OES_Object):
         return msg
 
     def get_element_index(self, eids):
-        # elements are always sorted; nodes are not
-        itot = np.searchsorted(eids, self.element_node[:, 0])  #[0]
-        return itot
+        """gets the element_node rows of the elements (see ``select``)"""
+        return self.get_row_index(eids=eids)
 
     def eid_to_element_node_index(self, eids):
-        ind = np.ravel([np.searchsorted(self.element_node[:, 0] == eid) for eid in eids])
-        #ind = searchsorted(eids, self.element)
-        #ind = ind.reshape(ind.size)
-        #ind.sort()
-        return ind
+        return self.get_row_index(eids=eids)
 
     def write_f06(self, f06_file, header=None, page_stamp='PAGE %s',
                   page_num: int=1, is_mag_phase: bool=False, is_sort1: bool=True):
@@ -562,10 +522,9 @@ class RealPlateArray(OES_Object):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import Struct
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date)
@@ -580,15 +539,8 @@ class RealPlateArray(OES_Object):
         #print("nnodes_all =", nnodes_all)
         #cen_word_ascii = f'CEN/{nnodes:d}'
         cen_word_bytes = b'CEN/'
-        idtype = self.element_node.dtype
-        fdtype = self.data.dtype
-        if self.size == 4:
-            pass
-        else:
+        if self.size != 4:
             print(f'downcasting {self.class_name}...')
-            #cen_word_bytes = b'CEN/    '
-            idtype = np.int32(1)
-            fdtype = np.float32(1.0)
 
         #msg.append(f'  element_node.shape = {self.element_node.shape}\n')
         #msg.append(f'  data.shape={self.data.shape}\n')
@@ -638,19 +590,15 @@ class RealPlateArray(OES_Object):
         #struct_i8f = Struct(endian + b'i8f')
         #struct_8f = Struct(endian + b'8f')
 
-        nelements_nnodes = len(nids) // 2
         is_centroid = self.element_type in [33, 74, 227, 228]
         is_nodes = self.element_type in [64, 70, 75, 82, 144]
         if is_centroid:
-            eids_device2 = to_column_bytes([eids_device[::2]], idtype).view(fdtype)
+            eids_device2 = eids_device[::2]
             assert len(eids_device2) == nelements
         elif is_nodes:
-            cen_word_array_temp = np.full((nelements, 1), cen_word_bytes)
-            cen_word_array = cen_word_array_temp.view(fdtype)
-            eids_device2 = view_idtype_as_fdtype(eids_device[::2*nnodes_per_element].reshape(nelements, 1),
-                                                 fdtype)
-            nids2 = view_idtype_as_fdtype(nids[::2].reshape(nelements_nnodes, 1),
-                               fdtype)
+            cen_word_array = np.full(nelements, cen_word_bytes)
+            eids_device2 = eids_device[::2*nnodes_per_element]
+            nids2 = nids[::2].reshape(nelements, nnodes_per_element)
 
         #nheader = 15
         struct_i = Struct('i')
@@ -675,21 +623,26 @@ class RealPlateArray(OES_Object):
             if is_centroid:
                 # [eid_device, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi]
                 # [            fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi]
-                datai = view_dtype(self.data[itime, :, :].reshape(nelements, 16), fdtype)
-                data_out = np.hstack([eids_device2, datai])
+                columns = [
+                    (b'i', eids_device2),
+                    (b'f', self.data[itime, :, :].reshape(nelements, 16)),
+                ]
             elif is_nodes:
                 # CQUAD8, CTRIAR, CTRIA6, CQUADR, CQUAD4
                 # bilinear
-                datai = view_dtype(
-                    self.data[itime, :, :].reshape(nelements*nnodes_per_element, 16),
-                    fdtype)
-                nids_data = np.hstack([nids2, datai]).reshape(nelements, nnodes_per_element*17)
-                data_out = np.hstack([eids_device2, cen_word_array, nids_data])
+                datai = self.data[itime, :, :].reshape(nelements, nnodes_per_element, 16)
+                columns = [
+                    (b'i', eids_device2),
+                    (b'4s', cen_word_array),
+                ]
+                for inode in range(nnodes_per_element):
+                    columns.append((b'i', nids2[:, inode]))
+                    columns.append((b'f', datai[:, inode, :]))
             else:  # pragma: no cover
                 msg = f'element_name={self.element_name} element_type={self.element_type}'
                 raise NotImplementedError(msg)
-            assert data_out.size == ntotal, f'data_out.shape={data_out.shape} size={data_out.size}; ntotal={ntotal}'
-            op2_file.write(data_out)
+            nwide = write_table4_rows(op2_file, columns, endian)
+            assert nwide == ntotal, f'nwide={nwide}; ntotal={ntotal}'
 
             itable -= 1
             header = [4 * ntotal,]
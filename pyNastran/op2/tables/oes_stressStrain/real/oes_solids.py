@@ -5,15 +5,22 @@ from struct import pack
 from typing import Tuple, List, Any
 
 import numpy as np
-from numpy import zeros, where, searchsorted
+from numpy import zeros, where
 from numpy.linalg import eigh  # type: ignore
 
 from pyNastran.utils.numpy_utils import float_types
 from pyNastran.f06.f06_formatting import write_floats_13e, _eigenvalue_header
 from pyNastran.op2.result_objects.op2_objects import get_times_dtype
-from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import StressObject, StrainObject, OES_Object
+from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
+    StressObject, StrainObject, OES_Object, oes_data_code)
 from pyNastran.op2.op2_interface.write_utils import to_column_bytes
 
+# the number of nodes (including the centroid) of the linear solids
+ELEMENT_NAME_TO_ELEMENT_TYPE_NNODES = {
+    'CTETRA' : (39, 5),
+    'CPENTA' : (68, 7),
+    'CHEXA' : (67, 9),
+}
 
 class RealSolidArray(OES_Object):
     def __init__(self, data_code, is_sort1, isubcase, dt):
@@ -31,6 +38,64 @@ class RealSolidArray(OES_Object):
         #else:
             #raise NotImplementedError('SORT2')
 
+    @classmethod
+    def add_static_case(cls, table_name, element_name, element_node, element_cid,
+                        data, isubcase,
+                        is_sort1=True, is_random=False, is_stress=True, is_msc=True,
+                        random_code=0, title='', subtitle='', label=''):
+        """
+        Creates a static result for linear CTETRA/CPENTA/CHEXA elements
+
+        Parameters
+        ----------
+        element_node : (nelements*nnodes, 2) int ndarray
+            the [eid, nid] for the centroid (nid=0) and corner nodes
+            of each element
+        element_cid : (nelements, 2) int ndarray
+            the [eid, cid] of each element
+        data : (1, nelements*nnodes, 10) float ndarray
+            [oxx, oyy, ozz, txy, tyz, txz, o1, o2, o3, ovm]
+
+        """
+        analysis_code = 1 # static
+        data_code = oes_data_code(table_name, analysis_code,
+                                  is_sort1=is_sort1, is_random=is_random,
+                                  random_code=random_code,
+                                  title=title, subtitle=subtitle, label=label,
+                                  is_msc=is_msc)
+        data_code['lsdvmns'] = [0] # TODO: ???
+        data_code['data_names'] = []
+
+        # von mises
+        if is_stress:
+            data_code['stress_bits'] = [0, 0, 0, 0, 1]
+            data_code['s_code'] = 1
+        else:
+            data_code['stress_bits'] = [0, 1, 0, 1, 1]
+            data_code['s_code'] = 11
+
+        element_type, nnodes = ELEMENT_NAME_TO_ELEMENT_TYPE_NNODES[element_name]
+        data_code['element_name'] = element_name
+        data_code['element_type'] = element_type
+        data_code['num_wide'] = 4 + 21 * nnodes
+        data_code['load_set'] = 1
+
+        ntimes = data.shape[0]
+        ntotal = data.shape[1]
+        dt = None
+        obj = cls(data_code, is_sort1, isubcase, dt)
+        obj.element_node = element_node
+        obj.element_cid = element_cid
+        obj.data = data
+
+        obj.ntimes = ntimes
+        obj.ntotal = ntotal
+        obj.nelements = ntotal // nnodes
+        obj.nnodes = nnodes
+        obj._times = [None]
+        obj.is_built = True
+        return obj
+
     @property
     def is_real(self) -> bool:
         return True
@@ -111,7 +176,7 @@ class RealSolidArray(OES_Object):
         self.data[:, :, :6] *= 1. / factor
         self.update_data_components()
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RealSolidArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         assert self.ntimes > 0, 'ntimes=%s' % self.ntimes
@@ -125,21 +190,16 @@ class RealSolidArray(OES_Object):
         #self.ntimes = 0
         #self.nelements = 0
 
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
 
-        if self.is_sort1:
-            ntimes = self.ntimes
-            ntotal = self.ntotal
-            nelements = self.nelements
-        else:
-            #print(f'ntimes={self.ntimes} nelements={self.nelements} ntotal={self.ntotal}')
-            ntimes = self.nelements
-            ntotal = self.ntotal
-            nelements = self.ntimes
-            #print(f'ntimes={ntimes} nelements={nelements} ntotal={ntotal}')
-        #self.ntimes = ntimes
-        #self.ntotal = ntotal
-        #self.nelements = nelements
+        if self.is_sort2:
+            # a SORT2 subtable is a single element, so flip this to sort1
+            self.ntimes, self.nelements = self.nelements, self.ntimes
+            self.ntotal = self.nelements * self.nnodes_per_element
+        ntimes = self.ntimes
+        ntotal = self.ntotal
+        nelements = self.nelements
 
         _times = zeros(ntimes, dtype=dtype)
 
@@ -260,24 +320,14 @@ class RealSolidArray(OES_Object):
     def add_eid_sort2(self, unused_etype, cid, dt, eid, unused_node_id,
                       oxx, oyy, ozz, txy, tyz, txz, o1, o2, o3,
                       unused_acos, unused_bcos, unused_ccos, unused_pressure, ovm):
-        #itime = self.ielement
-        #ielement = self.itotal
-        #itotal = self.itime
-        #print(self.ntimes, self.nelements, self.ntotal, self.nnodes)
-        itime = self.itotal // self.nnodes
-        ielement = self.itime
-        itotal = self.itotal
+        """unvectorized method for adding SORT2 transient data"""
         assert cid >= -2, cid
         assert eid >= 0, eid
+        itime = self.ielement
+        ielement = self.itime
+        itotal = ielement * self.nnodes_per_element
 
-        #try:
         self._times[itime] = dt
-            #print(f'dt={dt} eid={eid} ielement={ielement} -> itime={itime} itotal={itotal}')
-        #except IndexError:
-            #print(f'*dt={dt} eid={eid} ielement={ielement} -> itime={itime} itotal={itotal}')
-            #self.itime += 1
-            #self.ielement += 1
-            #return
         self.element_node[itotal, :] = [eid, 0]  # 0 is center
 
         omax_mid_min = [o1, o2, o3]
@@ -289,39 +339,16 @@ class RealSolidArray(OES_Object):
 
         omid = omax_mid_min[0]
         self.data[itime, itotal, :] = [oxx, oyy, ozz, txy, tyz, txz, omax, omid, omin, ovm]
-
-        #print('element_cid[%i, :] = [%s, %s]' % (self.ielement, eid, cid))
-        #if self.ielement == self.nelements:
-            #self.ielement = 0
         self.element_cid[ielement, :] = [eid, cid]
-        #self.itime += 1
-        self.itotal += 1
+        self.itotal = itotal + 1
         self.ielement += 1
-        #print('self._times', self._times)
 
     def add_node_sort2(self, dt, eid, unused_inode, node_id,
                        oxx, oyy, ozz, txy, tyz, txz, o1, o2, o3,
                        unused_acos, unused_bcos, unused_ccos, unused_pressure, ovm):
-        #ielement = self.ielement
-        #itotal = self.itotal
-        #itime = self.itime
-        #itime=0 ielement=1 itotal=1
-        #itime=0 ielement=1 itotal=2
-        #itime=0 ielement=1 itotal=3
-        #itime=0 ielement=1 itotal=4
-
-        #ielement = self.ielement
-        #itime = (self.itime - 1) % self.nelements
-        #itime = self.itime - 1
-        nnodes = self.nnodes
-        itime = self.itotal // nnodes
+        """unvectorized method for adding SORT2 transient data"""
+        itime = self.ielement - 1
         itotal = self.itotal
-        #ielement = self.ielement - 1
-        #ielement = self.itime
-        #inode = self.itotal % nnodes
-        #itotal2 = (self.ielement - 1) * nnodes + inode
-        #print(f'  itime={itime} itotal={itotal}; nid={node_id}; '
-              #f'ielement={ielement} inode={inode} -> itotal2={itotal2}')
 
         # skipping aCos, bCos, cCos, pressure
         omax_mid_min = [o1, o2, o3]
@@ -333,11 +360,7 @@ class RealSolidArray(OES_Object):
 
         omid = omax_mid_min[0]
         self.data[itime, itotal, :] = [oxx, oyy, ozz, txy, tyz, txz, omax, omid, omin, ovm]
-        #print('data[%s, %s, :] = %s' % (self.itime, self.itotal, str(self.data[self.itime, self.itotal, :])))
-
-        #print('eid=%i node_id=%i exx=%s' % (eid, node_id, str(oxx)))
         self.element_node[itotal, :] = [eid, node_id]
-        #self.element_node[ielement-1, inode-1, :] = [eid, node_id]
         self.itotal += 1
 
     def __eq__(self, table):  # pragma: no cover
@@ -431,16 +454,11 @@ class RealSolidArray(OES_Object):
 
 
     def get_element_index(self, eids):
-        # elements are always sorted; nodes are not
-        itot = searchsorted(eids, self.element_node[:, 0])  #[0]
-        return itot
+        """gets the element_node rows of the elements (see ``select``)"""
+        return self.get_row_index(eids=eids)
 
     def eid_to_element_node_index(self, eids):
-        #ind = ravel([searchsorted(self.element_node[:, 0] == eid) for eid in eids])
-        ind = searchsorted(eids, self.element_node[:, 0])
-        #ind = ind.reshape(ind.size)
-        #ind.sort()
-        return ind
+        return self.get_row_index(eids=eids)
 
     def write_f06(self, f06_file, header=None, page_stamp: str='PAGE %s',
                   page_num: int=1, is_mag_phase: bool=False, is_sort1: bool=True):
@@ -540,8 +558,7 @@ class RealSolidArray(OES_Object):
         import inspect
         calculate_directional_vectors = True
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             #print('***************', itable)
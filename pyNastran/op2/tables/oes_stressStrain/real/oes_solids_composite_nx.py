@@ -79,7 +79,7 @@ class RealSolidCompositeArray(OES_Object):
              #[dtxz, dtyz, dozz]]
         #(_lambda, v) = eigh(A)  # a hermitian matrix is a symmetric-real matrix
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the RealSolidArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         assert self.ntimes > 0, 'ntimes=%s' % self.ntimes
@@ -93,7 +93,8 @@ class RealSolidCompositeArray(OES_Object):
         #self.ntimes = 0
         #self.nelements = 0
 
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
 
         if self.is_sort1:
             ntimes = self.ntimes
@@ -489,8 +490,7 @@ class RealSolidCompositeArray(OES_Object):
         import inspect
         calculate_directional_vectors = True
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             #print('***************', itable)
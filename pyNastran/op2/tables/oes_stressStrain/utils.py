@@ -78,6 +78,7 @@ def oes_celas_real_2(op2: OP2, data: bytes,
     n = 0
     fmt1 = mapfmt(op2._endian + op2._analysis_code_fmt + b'f', op2.size)
     struct1 = Struct(fmt1)
+    add_sort = obj.add_sort2 if obj.is_sort2 else obj.add_sort1
     for i in range(nelements):
         edata = data[n:n+ntotal]
         out = struct1.unpack(edata)
@@ -92,7 +93,7 @@ def oes_celas_real_2(op2: OP2, data: bytes,
         if op2.is_debug_file:
             op2.binary_debug.write('  eid=%i result%i=[%i, %f]\n' % (
                 eid, i, eid_device, ox))
-        obj.add_sort1(dt, eid, ox)
+        add_sort(dt, eid, ox)
         n += ntotal
     return n
 
@@ -101,6 +102,7 @@ def oes_celas_complex_3(op2: OP2, data: bytes, obj: Union[ComplexSpringStressArr
                         dt, is_magnitude_phase: bool):
     n = 0
     struct1 = Struct(op2._endian + mapfmt(op2._analysis_code_fmt + b'2f', op2.size))
+    add_sort = obj.add_sort2 if obj.is_sort2 else obj.add_sort1
     for i in range(nelements):
         edata = data[n:n + ntotal]
         out = struct1.unpack(edata)
@@ -116,7 +118,7 @@ def oes_celas_complex_3(op2: OP2, data: bytes, obj: Union[ComplexSpringStressArr
         if op2.is_debug_file:
             op2.binary_debug.write('  eid=%i result%i=[%i, %f, %f]\n' % (
                 eid, i, eid_device, axial_real, axial_imag))
-        obj.add_sort1(dt, eid, axial)
+        add_sort(dt, eid, axial)
         n += ntotal
     return n
 
@@ -208,6 +210,7 @@ def oes_crod_real_5(op2: OP2, data: bytes, obj: Union[RealRodStressArray, RealRo
                     nelements: int, ntotal: int, dt) -> int:
     n = 0
     struct1 = Struct(op2._endian + mapfmt(op2._analysis_code_fmt + b'4f', op2.size))
+    add_sort = obj.add_sort2 if obj.is_sort2 else obj.add_sort1
     for unused_i in range(nelements):
         edata = data[n:n+ntotal]
         out = struct1.unpack(edata)
@@ -218,7 +221,7 @@ def oes_crod_real_5(op2: OP2, data: bytes, obj: Union[RealRodStressArray, RealRo
         if op2.is_debug_file:
             op2.binary_debug.write('  eid=%i; C=[%s]\n' % (
                 eid, ', '.join(['%r' % di for di in out])))
-        obj.add_sort1(dt, eid, axial, axial_margin, torsion, torsion_margin)
+        add_sort(dt, eid, axial, axial_margin, torsion, torsion_margin)
         n += ntotal
     return n
 
@@ -227,6 +230,7 @@ def oes_crod_complex_5(op2: OP2, data: bytes, obj: Union[ComplexRodStressArray,
     n = 0
     fmt = mapfmt(op2._endian + op2._analysis_code_fmt + b'4f', op2.size)
     struct1 = Struct(fmt)
+    add_sort = obj.add_sort2 if obj.is_sort2 else obj.add_sort1
     for unused_i in range(nelements):
         edata = data[n:n + ntotal]
         out = struct1.unpack(edata)
@@ -241,7 +245,7 @@ def oes_crod_complex_5(op2: OP2, data: bytes, obj: Union[ComplexRodStressArray,
             axial = complex(axial_real, axial_imag)
             torsion = complex(torsion_real, torsion_imag)
 
-        obj.add_sort1(dt, eid, axial, torsion)
+        add_sort(dt, eid, axial, torsion)
         n += ntotal
     return n
 
@@ -528,9 +532,9 @@ def oes_cquad4_144_complex_77(op2: OP2,
     n = 0
     grid_center = 0
     if op2.size == 4:
-        s1 = op2.struct_2i  # 2
+        s1 = Struct(op2._endian + op2._analysis_code_fmt + b'i')  # 2
     else:
-        s1 = op2.struct_2q  # 2
+        s1 = Struct(op2._endian + mapfmt(op2._analysis_code_fmt, op2.size) + b'q')  # 2
     s2 = Struct(op2._endian + mapfmt(b'i14f', op2.size)) # 15
 
     ntotal1 = 8 * op2.factor
@@ -545,7 +549,8 @@ def oes_cquad4_144_complex_77(op2: OP2,
         n += ntotal2
         out = s2.unpack(edata)  # len=15*4
 
-        eid = op2._check_id(eid_device, 'element', out)
+        eid, dt = get_eid_dt_from_eid_device(
+            eid_device, op2.nonlinear_factor, op2.sort_method)
         if op2.is_debug_file:
             op2.binary_debug.write('%s\n' % (str(out)))
         (grid,
@@ -1708,10 +1713,12 @@ def oes_csolid_complex(op2: OP2, data: bytes,
                        is_magnitude_phase: bool) -> int:
     n = 0
     if op2.size == 4:
-        s1 = Struct(op2._endian + b'2i4si')
+        s1 = Struct(op2._endian + op2._analysis_code_fmt + b'i4si')
     else:
-        s1 = Struct(op2._endian + b'2q8sq')
+        s1 = Struct(op2._endian + mapfmt(op2._analysis_code_fmt, op2.size) + b'q8sq')
     s2 = Struct(op2._endian + mapfmt(b'i12f', op2.size))
+    add_eid_sort_x = getattr(obj, 'add_eid_sort' + str(op2.sort_method))
+    add_node_sort_x = getattr(obj, 'add_node_sort' + str(op2.sort_method))
     ntotal1 = 16 * op2.factor
     ntotal2 = 52 * op2.factor
     for unused_i in range(nelements):
@@ -1726,7 +1733,7 @@ def oes_csolid_complex(op2: OP2, data: bytes,
                 eid, ', '.join(['%r' % di for di in out])))
 
         #element_name = op2.element_name + str(nodef)  # this is correct, but has problems...
-        obj.add_eid_sort1(op2.element_type, element_name, dt, eid, cid, ctype, nodef)
+        add_eid_sort_x(op2.element_type, element_name, dt, eid, cid, ctype, nodef)
         for inode in range(nnodes_expected):
             edata = data[n:n+ntotal2]
             n += ntotal2
@@ -1755,8 +1762,8 @@ def oes_csolid_complex(op2: OP2, data: bytes,
             if op2.is_debug_file:
                 op2.binary_debug.write('       node%s=[%s]\n' % (
                     grid, ', '.join(['%r' % di for di in out])))
-            obj.add_node_sort1(dt, eid, grid, inode,
-                               ex, ey, ez, etxy, etyz, etzx)
+            add_node_sort_x(dt, eid, grid, inode,
+                            ex, ey, ez, etxy, etyz, etzx)
     return n
 
 def oes_csolid_random(op2: OP2, data: bytes,
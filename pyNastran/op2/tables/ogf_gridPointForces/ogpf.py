@@ -117,7 +117,7 @@ class OGPF:
 
                     floats = np.frombuffer(data, dtype=op2.fdtype8).reshape(nnodes, 10)
                     #[f1, f2, f3, m1, m2, m3]
-                    obj.data[itime, istart:iend, :] = floats[:, 4:].copy()
+                    obj.data[itime, istart:iend, :] = floats[:, 4:]
                     #obj._times[obj.itime] = dt
                     #obj.itotal = itotal2
                     if op2.is_debug_file:
@@ -178,11 +178,11 @@ class OGPF:
                         obj.node_element[istart:iend, 0] = nids
                         obj.node_element[istart:iend, 1] = eids
                         strings = np.frombuffer(data, dtype=op2._uendian + 'S8').reshape(nnodes, 8)
-                        obj.element_names[istart:iend] = strings[:, 1].copy()
+                        obj.element_names[istart:iend] = strings[:, 1]
 
                     floats = np.frombuffer(data, dtype=op2.fdtype).reshape(nnodes, 16)
                     #[f1, f2, f3, m1, m2, m3]
-                    obj.data[obj.itime, istart:iend, :] = floats[:, 4:].copy()
+                    obj.data[obj.itime, istart:iend, :] = floats[:, 4:]
                 else:
                     s = Struct(op2._endian + b'ii8s12f')
 
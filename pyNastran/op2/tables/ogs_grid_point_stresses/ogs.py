@@ -304,7 +304,7 @@ class OGS:
             s4 = 'S%i' % self.size
             strings = frombuffer(data, dtype=op2._uendian + s4).reshape(nelements, 11)[:, 2].copy()
             obj.location[itotal:itotal2] = strings
-            obj.data[obj.itime, itotal:itotal2, :] = floats[:, 3:]#.copy()
+            obj.data[obj.itime, itotal:itotal2, :] = floats[:, 3:]#
             obj.itotal = itotal2
             obj.ielement = ielement2
             n = ndata
@@ -399,7 +399,7 @@ class OGS:
             #[nid, nx, ny, nz, txy, tyz, txz, pressure, ovm]
             #strings = frombuffer(data, dtype=op2._uendian + 'S4').reshape(nelements, 11)[:, 2].copy()
             #obj.location[itotal:itotal2] = strings
-            obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:]#.copy()
+            obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:]#
             obj.itotal = itotal2
             obj.ielement = ielement2
             n = ndata
@@ -474,7 +474,7 @@ class OGS:
                     obj.node[itotal:itotal2] = nids
 
                 #[nid, nx, ny, nz, txy, pressure]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:]#.copy()
+                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:]#
                 obj.itotal = itotal2
                 obj.ielement = ielement2
                 n = ndata
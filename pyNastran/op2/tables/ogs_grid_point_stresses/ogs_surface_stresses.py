@@ -44,7 +44,7 @@ class GridPointSurfaceArray(ScalarObject):
     def is_complex(self) -> bool:
         return False
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the GridPointStressesArray"""
         if self.is_built:
             return
@@ -59,7 +59,8 @@ class GridPointSurfaceArray(ScalarObject):
         #self.names = []
         self.nelements //= self.ntimes
 
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self.node_element = np.zeros((self.ntotal, 2), dtype=idtype)
         #oxx, oyy, txy, angle, major, minor, ovm
         self.data = np.zeros((self.ntimes, self.nelements, 8), dtype=fdtype)
@@ -71,8 +72,7 @@ class GridPointSurfaceArray(ScalarObject):
         import inspect
         from struct import pack
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write('%s.write_table_3: %s\n' % (self.__class__.__name__, call_frame[1][3]))
+        op2_ascii.write('%s.write_table_3: %s\n' % (self.__class__.__name__, frame.f_back.f_code.co_name))
 
         #if itable == -3:
         #print('*writing itable=%s' % itable)
@@ -327,8 +327,7 @@ class GridPointSurfaceArray(ScalarObject):
         import inspect
         from struct import Struct
         frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
+        op2_ascii.write(f'{self.__class__.__name__}.write_op2: {frame.f_back.f_code.co_name}\n')
 
         if itable == -1:
             #print('***************', itable)
@@ -611,7 +610,7 @@ class GridPointStressesVolumePrincipalArray(ScalarObject):
     def is_complex(self) -> bool:
         return False
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the GridPointStressesArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         #print('self.IDs', self.data)
@@ -624,7 +623,8 @@ class GridPointStressesVolumePrincipalArray(ScalarObject):
         assert self.ntotal > 0, 'ntotal=%s' % self.ntotal
         self.nelements //= self.ntimes
 
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self.node = np.zeros(self.ntotal, dtype=idtype)
         #lxa, lxb, lxc, lya, lyb, lyc, lza, lzb, lzc, sa, sb, sc, epr, ovm
         self.data = np.zeros((self.ntimes, self.ntotal, 14), dtype=fdtype)
@@ -701,7 +701,7 @@ class GridPointStressesVolumeDirectArray(ScalarObject):
     def is_complex(self) -> bool:
         return False
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the GridPointStressesArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         #print('self.IDs', self.data)
@@ -714,7 +714,8 @@ class GridPointStressesVolumeDirectArray(ScalarObject):
         assert self.ntotal > 0, 'ntotal=%s' % self.ntotal
         self.nelements //= self.ntimes
 
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
         self.node = np.zeros(self.ntotal, dtype=idtype)
         #oxx, oyy, txy, angle, major, minor, ovm
         self.data = np.zeros((self.ntimes, self.ntotal, 8), dtype=fdtype)
@@ -889,7 +890,7 @@ class GridPointStressesSurfaceDiscontinutiesArray(ScalarObject): # tCode=35
     def is_complex(self) -> bool:
         return False
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the GridPointStressesArray"""
         #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
         #print('self.IDs', self.data)
@@ -907,7 +908,8 @@ class GridPointStressesSurfaceDiscontinutiesArray(ScalarObject): # tCode=35
         #oxx, oyy, ozz, txy, pressure
         self.data = np.zeros((self.ntimes, self.ntotal, 5), dtype='float32')
         self.location = np.empty(self.ntotal, dtype='U8')
-        dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
+        dtype, idtype, fdtype = get_times_dtype(
+            self.nonlinear_factor, self.size, self.analysis_fmt, result_dtype, id_dtype)
 
         self._times = np.zeros(self.ntimes, dtype=dtype)
 
@@ -1,7 +1,7 @@
 from typing import List
 import numpy as np
 from pyNastran.utils.numpy_utils import integer_types
-from pyNastran.op2.result_objects.op2_objects import ScalarObject
+from pyNastran.op2.result_objects.op2_objects import ScalarObject, apply_result_dtypes
 from pyNastran.f06.f06_formatting import write_floats_13e, write_imag_floats_13e
 
 
@@ -21,12 +21,13 @@ class AppliedLoadsVectorArray(ScalarObject):
     def _reset_indices(self) -> None:
         self.itotal = 0
 
-    def build(self):
+    def build(self, result_dtype=None, id_dtype=None):
         """sizes the vectorized attributes of the AppliedLoadsVectorArray"""
-        self.eids = np.zeros(self.itotal, dtype='int32')
+        fdtype, idtype = apply_result_dtypes(self.data_type(), 'int32', result_dtype, id_dtype)
+        self.eids = np.zeros(self.itotal, dtype=idtype)
         self.sources = np.zeros(self.itotal, dtype='|S8')
         #[f1, f2, f3, m1, m2, m3]
-        self.data = np.zeros((self.ntimes, self.itotal, 6), dtype=self.data_type())
+        self.data = np.zeros((self.ntimes, self.itotal, 6), dtype=fdtype)
 
     def get_stats(self, short: bool=False) -> List[str]:
         if not self.is_built:
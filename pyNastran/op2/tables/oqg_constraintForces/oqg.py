@@ -1006,7 +1006,7 @@ class OQG:
                 #obj.node_gridtype[itotal:itotal2, 1] = ints[:, 1].copy()
 
             floats = np.frombuffer(data, dtype=op2.fdtype8).reshape(nnodes, 4)
-            obj.data[obj.itime, obj.itotal:itotal2, :] = floats[:, 2:].copy()
+            obj.data[obj.itime, obj.itotal:itotal2, :] = floats[:, 2:]
             obj._times[itime] = dt
             obj.itotal = itotal2
         else:
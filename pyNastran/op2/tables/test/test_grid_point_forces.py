@@ -767,8 +767,7 @@ class TestGridPointForces(unittest.TestCase):
                 np.abs(total_moment_local_expected - total_moment_local))
             self.assertTrue(np.allclose(total_moment_local_expected, total_moment_local, atol=0.005), msg)
 
-    @unittest.expectedFailure
-    def test_broken_op2_solid_shell_bar_01_gpforce_radial_global_cd(self):
+    def test_op2_solid_shell_bar_01_gpforce_radial_global_cd(self):
         warning_log = SimpleLogger(level='warning')
         debug_log = SimpleLogger(level='debug')
         folder = os.path.join(MODEL_PATH, 'sol_101_elements')
@@ -0,0 +1,380 @@
+"""
+Defines:
+ - create_synthetic_bdf(nx, nlayers=2, nsubcases=2, log=None)
+ - create_synthetic_op2(model, seed=0)
+ - run_benchmark(scales=None, nlayers=2, nsubcases=2, nrepeat=1,
+                 dirname=None, json_filename=None, log=None)
+ - compare_benchmarks(json_filename_old, json_filename_new)
+
+Times the BDF/OP2 readers and writers on a synthetic plate/solid model at
+several scales, so the timings can be compared between releases:
+
+.. code-block:: console
+
+   >>> python -m pyNastran.op2.test.benchmark --scales 10 50 100 --json v1.4.json
+   >>> python -m pyNastran.op2.test.benchmark --scales 10 50 100 --json v1.5.json --compare v1.4.json
+
+"""
+import os
+import sys
+import json
+import platform
+import tempfile
+from time import perf_counter
+from typing import List, Dict, Optional, Any
+
+import numpy as np
+from cpylog import SimpleLogger, get_logger2
+
+import pyNastran
+from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.case_control_deck import CaseControlDeck
+from pyNastran.op2.op2 import OP2, read_op2
+from pyNastran.op2.tables.oug.oug_displacements import RealDisplacementArray
+from pyNastran.op2.tables.oqg_constraintForces.oqg_spc_forces import RealSPCForcesArray
+from pyNastran.op2.tables.oes_stressStrain.real.oes_plates import RealPlateStressArray
+from pyNastran.op2.tables.oes_stressStrain.real.oes_solids import RealSolidStressArray
+
+#: the steps that are timed (in order)
+BENCHMARK_STEPS = [
+    'read_bdf', 'cross_reference', 'write_bdf',
+    'write_op2', 'read_op2', 'export_hdf5_filename', 'build_dataframe',
+]
+
+
+def create_synthetic_bdf(nx: int, nlayers: int=2, nsubcases: int=2,
+                         log: Optional[SimpleLogger]=None) -> BDF:
+    """
+    Creates a static model of an (nx, nx) CQUAD4 plate that sits on an
+    (nx, nx, nlayers) CHEXA block, which is clamped on the bottom face
+
+    Parameters
+    ----------
+    nx : int
+        the number of elements along the x/y edges
+    nlayers : int; default=2
+        the number of CHEXA layers
+    nsubcases : int; default=2
+        the number of subcases; subcase i applies a FORCE to the
+        corners of the plate
+    log : SimpleLogger; default=None
+        the logger
+
+    Returns
+    -------
+    model : BDF
+        the model with (nx+1)**2 * (nlayers+1) GRIDs, nx**2 CQUAD4s
+        and nx**2 * nlayers CHEXAs
+
+    """
+    model = BDF(log=log)
+    model.sol = 101
+    model.executive_control_lines = ['SOL 101', 'CEND']
+    model.sol_iline = 0
+
+    case_control_lines = [
+        'DISPLACEMENT(PLOT) = ALL',
+        'SPCFORCES(PLOT) = ALL',
+        'STRESS(PLOT) = ALL',
+        'SPC = 1',
+    ]
+    for isubcase in range(1, nsubcases + 1):
+        case_control_lines += [f'SUBCASE {isubcase:d}', f'  LOAD = {isubcase:d}']
+    model.case_control_deck = CaseControlDeck(case_control_lines, log=model.log)
+
+    n1 = nx + 1
+    def nid(i, j, k):
+        return 1 + i + n1 * (j + n1 * k)
+
+    for k in range(nlayers + 1):
+        for j in range(n1):
+            for i in range(n1):
+                model.add_grid(nid(i, j, k), [float(i), float(j), float(-k)])
+
+    eid = 1
+    for j in range(nx):
+        for i in range(nx):
+            nids = [nid(i, j, 0), nid(i+1, j, 0), nid(i+1, j+1, 0), nid(i, j+1, 0)]
+            model.add_cquad4(eid, 1, nids)
+            eid += 1
+    for k in range(nlayers):
+        for j in range(nx):
+            for i in range(nx):
+                nids = [nid(i, j, k), nid(i+1, j, k), nid(i+1, j+1, k), nid(i, j+1, k),
+                        nid(i, j, k+1), nid(i+1, j, k+1), nid(i+1, j+1, k+1), nid(i, j+1, k+1)]
+                model.add_chexa(eid, 2, nids)
+                eid += 1
+
+    model.add_pshell(1, mid1=1, t=0.1, mid2=1, mid3=1)
+    model.add_psolid(2, 1)
+    model.add_mat1(1, 3.0e7, None, 0.3)
+    model.add_spc1(1, '123456', [nid(i, j, nlayers) for j in range(n1) for i in range(n1)])
+    corners = [nid(0, 0, 0), nid(nx, 0, 0), nid(nx, nx, 0), nid(0, nx, 0)]
+    for isubcase in range(1, nsubcases + 1):
+        corner = corners[(isubcase - 1) % 4]
+        model.add_force(isubcase, corner, 100. * isubcase, [0., 0., 1.])
+    return model
+
+
+def create_synthetic_op2(model: BDF, seed: int=0) -> OP2:
+    """
+    Creates the displacement, SPC force, CQUAD4 stress and CHEXA stress
+    results of each subcase of a model from ``create_synthetic_bdf``
+
+    The results are random, so only the sizes match a real analysis.
+
+    Parameters
+    ----------
+    model : BDF
+        the model
+    seed : int; default=0
+        the random seed
+
+    Returns
+    -------
+    op2 : OP2
+        the results, which can be written with ``op2.write_op2``
+
+    """
+    rng = np.random.RandomState(seed)
+    op2 = OP2(log=model.log, mode='msc')
+
+    nids = np.array(sorted(model.nodes), dtype='int32')
+    nnodes = len(nids)
+    node_gridtype = np.column_stack([nids, np.ones(nnodes, dtype='int32')])
+
+    quad_eids = np.array(sorted(model._type_to_id_map['CQUAD4']), dtype='int32')
+    hexa_eids = np.array(sorted(model._type_to_id_map['CHEXA']), dtype='int32')
+    nquads = len(quad_eids)
+    nhexas = len(hexa_eids)
+    quad_element_node = np.column_stack([
+        np.repeat(quad_eids, 2), np.zeros(nquads * 2, dtype='int32')])
+    hexa_nids = np.array([model.elements[eid].node_ids for eid in hexa_eids], dtype='int32')
+    hexa_element_node = np.column_stack([
+        np.repeat(hexa_eids, 9),
+        np.hstack([np.zeros((nhexas, 1), dtype='int32'), hexa_nids]).ravel()])
+    hexa_element_cid = np.column_stack([hexa_eids, np.zeros(nhexas, dtype='int32')])
+
+    for isubcase in model.case_control_deck.subcases:
+        if isubcase == 0:
+            continue
+        disp = rng.rand(1, nnodes, 6).astype('float32')
+        spc_forces = rng.rand(1, nnodes, 6).astype('float32')
+        op2.displacements[isubcase] = RealDisplacementArray.add_static_case(
+            'OUGV1', node_gridtype, disp, isubcase)
+        op2.spc_forces[isubcase] = RealSPCForcesArray.add_static_case(
+            'OQG1', node_gridtype, spc_forces, isubcase)
+
+        quad_stress = rng.rand(1, nquads * 2, 8).astype('float32')
+        quad_stress[0, :, 0] = np.tile([-0.05, 0.05], nquads)
+        op2.cquad4_stress[isubcase] = RealPlateStressArray.add_static_case(
+            'OES1X1', 'CQUAD4', quad_element_node, quad_stress, isubcase)
+
+        hexa_stress = rng.rand(1, nhexas * 9, 10).astype('float32')
+        hexa = RealSolidStressArray.add_static_case(
+            'OES1X1', 'CHEXA', hexa_element_node, hexa_element_cid, hexa_stress, isubcase)
+        hexa.update_data_components()
+        op2.chexa_stress[isubcase] = hexa
+    return op2
+
+
+def run_benchmark(scales: Optional[List[int]]=None, nlayers: int=2, nsubcases: int=2,
+                  nrepeat: int=1, dirname: Optional[str]=None,
+                  json_filename: Optional[str]=None,
+                  log: Optional[SimpleLogger]=None) -> Dict[str, Any]:
+    """
+    Times the BDF/OP2 readers and writers on synthetic models
+
+    Parameters
+    ----------
+    scales : List[int]; default=None -> [10, 50, 100]
+        the nx values for ``create_synthetic_bdf``
+    nlayers : int; default=2
+        the number of CHEXA layers
+    nsubcases : int; default=2
+        the number of subcases
+    nrepeat : int; default=1
+        the number of times each step is run; the fastest time is kept
+    dirname : str; default=None -> a temporary directory
+        the directory for the bdf/op2/h5 files, which are deleted
+    json_filename : str; default=None
+        the file to write the results to
+    log : SimpleLogger; default=None
+        the logger
+
+    Returns
+    -------
+    benchmark : Dict[str, Any]
+        version, python, numpy, platform : str
+            the environment
+        cases : List[Dict[str, Any]]
+            the nx, nnodes, nelements, nsubcases, bdf_nbytes, op2_nbytes
+            and the times (sec) for each step in ``BENCHMARK_STEPS``
+
+    """
+    if scales is None:
+        scales = [10, 50, 100]
+    log = get_logger2(log=log, debug=None)
+    if dirname is None:
+        with tempfile.TemporaryDirectory() as dirname:
+            return run_benchmark(scales=scales, nlayers=nlayers, nsubcases=nsubcases,
+                                 nrepeat=nrepeat, dirname=dirname,
+                                 json_filename=json_filename, log=log)
+
+    cases = []
+    for nx in scales:
+        case = _run_benchmark_case(nx, nlayers, nsubcases, nrepeat, dirname, log)
+        cases.append(case)
+
+    benchmark = {
+        'version' : pyNastran.__version__,
+        'python' : platform.python_version(),
+        'numpy' : np.__version__,
+        'platform' : platform.platform(),
+        'nrepeat' : nrepeat,
+        'cases' : cases,
+    }
+    if json_filename is not None:
+        with open(json_filename, 'w') as json_file:
+            json.dump(benchmark, json_file, indent=2)
+    return benchmark
+
+
+def _run_benchmark_case(nx: int, nlayers: int, nsubcases: int, nrepeat: int,
+                        dirname: str, log: SimpleLogger) -> Dict[str, Any]:
+    """times each step for a single scale"""
+    base = os.path.join(dirname, f'benchmark_nx{nx:d}')
+    bdf_filename = base + '.bdf'
+    bdf_filename_out = base + '.out.bdf'
+    op2_filename = base + '.op2'
+    h5_filename = base + '.h5'
+
+    model = create_synthetic_bdf(nx, nlayers=nlayers, nsubcases=nsubcases, log=log)
+    model.write_bdf(bdf_filename)
+    op2 = create_synthetic_op2(model)
+    nnodes = len(model.nodes)
+    nelements = len(model.elements)
+    del model
+
+    times = {step : [] for step in BENCHMARK_STEPS}
+    for unused_irepeat in range(nrepeat):
+        t0 = perf_counter()
+        op2.write_op2(op2_filename, nastran_format='msc')
+        times['write_op2'].append(perf_counter() - t0)
+
+        t0 = perf_counter()
+        model = read_bdf(bdf_filename, xref=False, log=log)
+        t1 = perf_counter()
+        model.cross_reference()
+        t2 = perf_counter()
+        model.write_bdf(bdf_filename_out)
+        t3 = perf_counter()
+        times['read_bdf'].append(t1 - t0)
+        times['cross_reference'].append(t2 - t1)
+        times['write_bdf'].append(t3 - t2)
+        del model
+
+        t0 = perf_counter()
+        results = read_op2(op2_filename, build_dataframe=False, log=log)
+        t1 = perf_counter()
+        results.export_hdf5_filename(h5_filename)
+        t2 = perf_counter()
+        results.build_dataframe()
+        t3 = perf_counter()
+        times['read_op2'].append(t1 - t0)
+        times['export_hdf5_filename'].append(t2 - t1)
+        times['build_dataframe'].append(t3 - t2)
+        del results
+
+    case = {
+        'nx' : nx,
+        'nnodes' : nnodes,
+        'nelements' : nelements,
+        'nsubcases' : nsubcases,
+        'bdf_nbytes' : os.path.getsize(bdf_filename),
+        'op2_nbytes' : os.path.getsize(op2_filename),
+        'times' : {step : min(timesi) for step, timesi in times.items()},
+    }
+    for filename in [bdf_filename, bdf_filename_out, op2_filename, h5_filename]:
+        os.remove(filename)
+    log.info(f'nx={nx} nnodes={nnodes} nelements={nelements} times={case["times"]}')
+    return case
+
+
+def compare_benchmarks(json_filename_old: str, json_filename_new: str) -> List[Dict[str, Any]]:
+    """
+    Compares the times of two benchmarks (e.g., two releases)
+
+    Parameters
+    ----------
+    json_filename_old / json_filename_new : str
+        the benchmarks from ``run_benchmark``
+
+    Returns
+    -------
+    rows : List[Dict[str, Any]]
+        the nx, step, time_old, time_new and ratio (time_new / time_old)
+        for the scales/steps that are in both benchmarks; a ratio > 1
+        is a regression
+
+    """
+    with open(json_filename_old, 'r') as json_file:
+        benchmark_old = json.load(json_file)
+    with open(json_filename_new, 'r') as json_file:
+        benchmark_new = json.load(json_file)
+
+    cases_old = {case['nx'] : case for case in benchmark_old['cases']}
+    rows = []
+    for case_new in benchmark_new['cases']:
+        nx = case_new['nx']
+        if nx not in cases_old:
+            continue
+        times_old = cases_old[nx]['times']
+        for step, time_new in case_new['times'].items():
+            if step not in times_old:
+                continue
+            time_old = times_old[step]
+            ratio = time_new / time_old if time_old > 0. else np.nan
+            rows.append({'nx' : nx, 'step' : step, 'time_old' : time_old,
+                         'time_new' : time_new, 'ratio' : ratio})
+    return rows
+
+
+def main(argv=None) -> None:
+    """the interface for the benchmark"""
+    import argparse
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = argparse.ArgumentParser(
+        prog='benchmark',
+        description=f'Times the BDF/OP2 readers/writers of pyNastran {pyNastran.__version__}'
+        ' on synthetic models')
+    parser.add_argument('--scales', type=int, nargs='+', default=[10, 50, 100],
+                        help='the number of elements along the plate edges (default=10 50 100)')
+    parser.add_argument('--nlayers', type=int, default=2, help='the number of CHEXA layers (default=2)')
+    parser.add_argument('--nsubcases', type=int, default=2, help='the number of subcases (default=2)')
+    parser.add_argument('--nrepeat', type=int, default=1,
+                        help='the number of times each step is run; the fastest is kept (default=1)')
+    parser.add_argument('--dirname', help='the directory for the temporary files')
+    parser.add_argument('--json', dest='json_filename', help='the file to write the results to')
+    parser.add_argument('--compare', dest='json_filename_old',
+                        help='a benchmark to compare the results to (requires --json)')
+    args = parser.parse_args(argv)
+    if args.json_filename_old and not args.json_filename:
+        parser.error('--compare requires --json')
+
+    log = SimpleLogger(level='info')
+    run_benchmark(scales=args.scales, nlayers=args.nlayers, nsubcases=args.nsubcases,
+                  nrepeat=args.nrepeat, dirname=args.dirname,
+                  json_filename=args.json_filename, log=log)
+
+    if args.json_filename_old:
+        rows = compare_benchmarks(args.json_filename_old, args.json_filename)
+        print(f'{"nx":>6} {"step":<22} {"old":>10} {"new":>10} {"ratio":>7}')
+        for row in rows:
+            print(f'{row["nx"]:6d} {row["step"]:<22} {row["time_old"]:10.4f} '
+                  f'{row["time_new"]:10.4f} {row["ratio"]:7.3f}')
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
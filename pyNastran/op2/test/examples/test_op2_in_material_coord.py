@@ -5,13 +5,14 @@ from cpylog import get_logger
 
 import pyNastran
 from pyNastran.utils import print_bad_path
-from pyNastran.bdf.bdf import BDF
-from pyNastran.op2.op2 import OP2
+from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.op2.op2 import OP2, read_op2
 from pyNastran.op2.data_in_material_coord import (
-    data_in_material_coord,
+    data_in_material_coord, get_plate_material_angles, transform_solids,
     get_eids_from_op2_vector, force_vectors, stress_vectors,
     strain_vectors)
 pkg_path = pyNastran.__path__[0]
+MODEL_PATH = os.path.join(pkg_path, '..', 'models')
 
 
 CASES = [
@@ -33,7 +34,9 @@ class TestMaterialCoordReal(unittest.TestCase):
             basepath = os.path.join(pkg_path, 'op2', 'test', 'examples', folder)
             bdf.read_bdf(os.path.join(basepath, prefix + '.bdf'))
             op2.read_op2(os.path.join(basepath, prefix + '.op2'))
-            op2_new = data_in_material_coord(bdf, op2)
+            material_angles = get_plate_material_angles(bdf)
+            op2_new = data_in_material_coord(bdf, op2, material_angles=material_angles)
+            _check_material_angles(bdf, op2, op2_new, material_angles)
             for vecname in force_vectors:
                 vector = getattr(op2_new, vecname).get(subcase)
                 if vector is None:
@@ -105,6 +108,68 @@ class TestMaterialCoordReal(unittest.TestCase):
                     assert np.allclose(data[:, check], ref_result, rtol=RTOL, atol=ATOL)
             #print('OK')
 
+    def test_transform_solids(self):
+        """tests transforming the solid stresses to a rectangular coordinate system"""
+        log = get_logger(level='warning')
+        bdf_filename = os.path.join(MODEL_PATH, 'solid_bending', 'solid_bending.bdf')
+        op2_filename = os.path.join(MODEL_PATH, 'solid_bending', 'solid_bending.op2')
+        bdf = read_bdf(bdf_filename, xref=False, log=log)
+        bdf.add_cord2r(10, [1., 2., 3.], [1., 1., 4.], [2., 3., 3.])
+        bdf.cross_reference()
+        op2 = read_op2(op2_filename, log=log)
+        stress = op2.ctetra_stress[1]
+        data0 = stress.data.copy()
+
+        transform_solids(bdf, op2, 10)
+        assert np.array_equal(np.unique(stress.element_cid[:, 1]), [10])
+
+        # [stress_out] = [T] [stress_in] [T]^T
+        T = bdf.coords[10].beta()
+        oxx, oyy, ozz, txy, tyz, txz = data0[0, 3, :6]
+        stress_in = np.array([
+            [oxx, txy, txz],
+            [txy, oyy, tyz],
+            [txz, tyz, ozz],
+        ])
+        stress_out = T @ stress_in @ T.T
+        expected = [stress_out[0, 0], stress_out[1, 1], stress_out[2, 2],
+                    stress_out[0, 1], stress_out[1, 2], stress_out[0, 2]]
+        assert np.allclose(stress.data[0, 3, :6], expected, rtol=1e-4, atol=0.01)
+
+        # the invariants don't change
+        assert np.array_equal(stress.data[:, :, 6:], data0[:, :, 6:])
+
+        # and back to the basic system
+        transform_solids(bdf, op2, 0)
+        assert np.allclose(stress.data, data0, rtol=1e-4, atol=0.01)
+
+
+def _check_material_angles(bdf: BDF, op2: OP2, op2_new: OP2, material_angles) -> None:
+    """the precalculated angles are used and a modified BDF isn't stale"""
+    eids, thetarad = material_angles
+    op2_new2 = data_in_material_coord(bdf, op2)
+    for vecname in force_vectors:
+        for subcase, vector in getattr(op2_new, vecname).items():
+            vector2 = getattr(op2_new2, vecname)[subcase]
+            assert np.array_equal(vector.data, vector2.data)
+
+    ieid = 0
+    elem = bdf.elements[eids[ieid]]
+    if isinstance(elem.theta_mcid, float):
+        elem.theta_mcid += 10.
+        unused_eids2, thetarad2 = get_plate_material_angles(bdf)
+        elem.theta_mcid -= 10.
+        assert np.allclose(thetarad2[ieid] - thetarad[ieid], np.radians(10.))
+        assert np.array_equal(thetarad2[1:], thetarad[1:])
+    else:
+        # the element x-axis is rotated by moving a node
+        node = bdf.nodes[elem.node_ids[1]]
+        xyz0 = node.xyz.copy()
+        node.xyz += elem.Centroid() - bdf.nodes[elem.node_ids[0]].xyz
+        unused_eids2, thetarad2 = get_plate_material_angles(bdf)
+        node.xyz = xyz0
+        assert not np.isclose(thetarad2[ieid], thetarad[ieid])
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -1,8 +1,10 @@
 """defines OP2 Matrix Test"""
 import os
+import tempfile
 import unittest
 
 import numpy as np
+import scipy.sparse
 from cpylog import SimpleLogger
 
 import pyNastran
@@ -76,6 +78,27 @@ class TestOP2Matrix(unittest.TestCase):
             #print(sil, 'neids=%s cdof=%s ndof=%s dof/grid=%s ngrid=%s' % (sil.shape[0], ndofci, ndofi, dof_per_grid, numgrid))
         #print(kdict)
 
+    def test_kelm_memmap(self):
+        """Tests memory-mapping the dense matrices to a directory"""
+        log = SimpleLogger(level='warning', encoding='utf-8')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar_kelm.op2')
+        model = OP2(log=log)
+        model.read_op2(op2_filename)
+        kelm = model.matrices['KELM'].data
+        kgg = model.matrices['KGG'].data
+        assert isinstance(kgg, scipy.sparse.csc_matrix), type(kgg)
+
+        with tempfile.TemporaryDirectory() as dirname:
+            model2 = OP2(log=log)
+            model2.dense_matrix_dirname = dirname
+            model2.read_op2(op2_filename)
+            kelm2 = model2.matrices['KELM'].data
+            assert isinstance(kelm2, np.memmap), type(kelm2)
+            assert np.array_equal(kelm, kelm2)
+            assert np.array_equal(kelm, np.load(os.path.join(dirname, 'KELM.npy')))
+            assert np.array_equal(kgg.toarray(), model2.matrices['KGG'].data.toarray())
+            del model2, kelm2
+
     def test_op2_dmi_01(self):
         """tests DMI matrix style"""
         log = SimpleLogger(level='warning', encoding='utf-8')
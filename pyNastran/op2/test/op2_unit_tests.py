@@ -1,7 +1,11 @@
 """various OP2 tests"""
+import copy
 import os
+import pickle
+import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 import numpy as np
 from cpylog import get_logger
@@ -23,13 +27,29 @@ try:
 except ImportError:  # pragma: no cover
     IS_H5PY = False
 
+try:
+    import pyarrow.parquet as pq
+    IS_PYARROW = True
+except ImportError:  # pragma: no cover
+    IS_PYARROW = False
+
 
 import pyNastran
 from pyNastran.bdf.bdf import BDF, read_bdf, CORD2R
 from pyNastran.op2.op2 import OP2, read_op2, FatalError, FortranMarkerError
 from pyNastran.op2.op2_interface.op2_common import get_scode_word
 from pyNastran.op2.op2_geom import OP2Geom, read_op2_geom
+from pyNastran.op2.op2_stream import iter_op2_results
+from pyNastran.op2.op2_batch import read_op2s
+from pyNastran.op2.op2_envelope import OP2Envelope, envelope_op2s
+from pyNastran.op2.op2_combine import combine_subcases
+from pyNastran.op2.op2_interface import op2_parallel
+from pyNastran.op2.op2_interface.op2_index import OP2Index, get_index_filename
+from pyNastran.op2.op2_interface.op2_reader import OP2Reader
 from pyNastran.op2.test.test_op2 import run_op2, main as test_op2
+from pyNastran.op2.test.benchmark import (
+    run_benchmark, compare_benchmarks, create_synthetic_bdf, create_synthetic_op2,
+    BENCHMARK_STEPS)
 
 from pyNastran.bdf.test.bdf_unit_tests import Tester
 from pyNastran.bdf.cards.test.utils import save_load_deck
@@ -3097,6 +3117,824 @@ class TestOP2(Tester):
                 stop_on_failure=True, dev=False,
                 build_pandas=True, log=log)
 
+    def test_op2_single_pass(self):
+        """the single pass reader gives the same results as the two pass reader"""
+        log = get_logger(level='warning')
+        folder = MODEL_PATH / 'sol_101_elements'
+        for op2_filename in ['static_solid_shell_bar.op2',
+                             'transient_solid_shell_bar.op2']:
+            op2_filename = folder / op2_filename
+            model1 = read_op2(op2_filename, log=log)
+            model2 = read_op2(op2_filename, log=log, single_pass=True)
+            model1.assert_op2_equal(model2)
+
+        # the result records are only read by the sizing pass
+        op2_filename = folder / 'static_solid_shell_bar.op2'
+        read_record_view = OP2Reader._read_record_view
+        read_modes = []
+        def _read_record_view(op2_reader):
+            read_modes.append(op2_reader.read_mode)
+            return read_record_view(op2_reader)
+
+        model2 = OP2(log=log)
+        model2.set_element_ids([3, 5, 16])
+        with mock.patch.object(OP2Reader, '_read_record_view', _read_record_view):
+            model2.read_op2(op2_filename, single_pass=True)
+        assert read_modes and set(read_modes) == {1}, read_modes
+        assert model2._single_pass_records == {}
+        model3 = OP2(log=log)
+        model3.set_element_ids([3, 5, 16])
+        model3.read_op2(op2_filename)
+        model2.assert_op2_equal(model3)
+
+        # SOL 200 with repeated EPT/BOUGV1 tables, so it falls back to two passes
+        op2_filename = MODEL_PATH / 'aero' / 'cpmopt.op2'
+        model1 = read_op2_geom(op2_filename, log=log, xref=False)
+        model2 = read_op2_geom(op2_filename, log=log, xref=False, single_pass=True)
+        model1.assert_op2_equal(model2)
+        assert model1.get_bdf_stats() == model2.get_bdf_stats()
+
+    def test_op2_mmap(self):
+        """the memory mapped reader gives the same results as the file reader"""
+        log = get_logger(level='warning')
+        folder = MODEL_PATH / 'sol_101_elements'
+        for op2_filename in ['static_solid_shell_bar.op2',
+                             'transient_solid_shell_bar.op2']:
+            op2_filename = folder / op2_filename
+            model1 = read_op2(op2_filename, log=log)
+            model2 = read_op2(op2_filename, log=log, use_mmap=True)
+            model1.assert_op2_equal(model2)
+            model3 = read_op2(op2_filename, log=log, use_mmap=True, single_pass=True)
+            model1.assert_op2_equal(model3)
+
+            # the results don't reference the memory map
+            for disp in model2.displacements.values():
+                assert disp.data.flags.writeable
+                assert disp.data.base is None
+
+    def test_op2_index(self):
+        """the table of contents is used to seek past the subcases that weren't requested"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'other' / 'bcell9p0.op2'
+        index_filename = get_index_filename(op2_filename)
+        if os.path.exists(index_filename):
+            os.remove(index_filename)
+
+        model1 = read_op2(op2_filename, log=log)
+        model2 = read_op2(op2_filename, log=log, use_index=True)
+        model1.assert_op2_equal(model2)
+
+        index = OP2Index.load(op2_filename)
+        assert index is not None
+        assert index.get_table_names() == [name.decode('latin1') for name in model1.table_names]
+        subtables = index.get_subtables(table_name='OUGV1', isubcase=120)
+        assert len(subtables) == 1, subtables
+
+        model1 = read_op2(op2_filename, log=log, subcases=[120])
+        model2 = read_op2(op2_filename, log=log, subcases=[120], use_index=True)
+        model1.assert_op2_equal(model2)
+        assert list(model2.displacements) == [120]
+        os.remove(index_filename)
+
+    def test_op2_lazy(self):
+        """the lazy results are decoded on first access"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2'
+        model1 = read_op2(op2_filename, log=log)
+        model2 = read_op2(op2_filename, log=log, lazy=True, lazy_max_nbytes=1)
+        assert not os.path.exists(get_index_filename(op2_filename))
+
+        # the headers are read, but the arrays aren't
+        disp1 = model1.displacements[1]
+        disp2 = model2.displacements[1]
+        assert 'data' not in disp2.__dict__
+        assert disp2.ntimes == disp1.ntimes
+        assert np.array_equal(disp2.data, disp1.data)
+        assert np.array_equal(disp2.node_gridtype, disp1.node_gridtype)
+
+        # the cap evicts the least recently decoded result
+        stress2 = model2.ctetra_stress[1]
+        assert np.array_equal(stress2.data, model1.ctetra_stress[1].data)
+        assert 'data' not in disp2.__dict__
+        assert np.array_equal(disp2.data, disp1.data)
+        model1.assert_op2_equal(model2)
+
+    def test_op2_lazy_design_cycles(self):
+        """the lazy results of a SOL 200 are found without rereading the DESCYC/R1TABRG tables"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'sol200' / 'model_200.op2'
+        model1 = read_op2(op2_filename, log=log, combine=False)
+        model2 = read_op2(op2_filename, log=log, combine=False, lazy=True)
+
+        keys = list(model1.displacements.keys())
+        assert [key[3] for key in keys] == [1, 55], keys
+        for key in keys:
+            disp2 = model2.displacements[key]
+            assert 'data' not in disp2.__dict__
+            assert np.array_equal(disp2.data, model1.displacements[key].data)
+
+    def test_op2_snapshot(self):
+        """the results are saved as .npy arrays and memory-mapped on load"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'mode_solid_shell_bar.op2'
+        model1 = read_op2(op2_filename, log=log)
+        with tempfile.TemporaryDirectory() as dirname:
+            model1.save_snapshot(dirname)
+            model2 = OP2(log=log)
+            model2.load_snapshot(dirname)
+            model1.assert_op2_equal(model2)
+            assert model2.is_msc
+            assert model2.isubcase_name_map == model1.isubcase_name_map
+
+            eigenvectors1 = model1.eigenvectors[1]
+            eigenvectors2 = model2.eigenvectors[1]
+            assert isinstance(eigenvectors2.data, np.memmap)
+            assert not eigenvectors2.data.flags.writeable
+            assert np.array_equal(eigenvectors2._times, eigenvectors1._times)
+            assert eigenvectors2.data_code == eigenvectors1.data_code
+            assert eigenvectors2.table_name == eigenvectors1.table_name
+            assert eigenvectors2.sort_bits == eigenvectors1.sort_bits
+
+            model3 = OP2(log=log)
+            model3.load_snapshot(dirname, mmap=False)
+            assert not isinstance(model3.eigenvectors[1].data, np.memmap)
+            model1.assert_op2_equal(model3)
+            del model2, model3, eigenvectors2
+
+        # lazy results are decoded before they're saved
+        model4 = read_op2(op2_filename, log=log, lazy=True)
+        with tempfile.TemporaryDirectory() as dirname:
+            model4.save_snapshot(dirname)
+            model5 = OP2(log=log)
+            model5.load_snapshot(dirname, mmap=False)
+            assert '_lazy_results' not in model5.eigenvectors[1].__dict__
+            model1.assert_op2_equal(model5)
+
+    def test_op2_select(self):
+        """the rows are found with a cached index of the ids"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'mode_solid_shell_bar.op2'
+        model = read_op2(op2_filename, log=log)
+
+        # one element is a view
+        stress = model.cquad4_stress[1]
+        element_node, data = stress.select(eids=6)
+        assert np.all(element_node[:, 0] == 6)
+        assert np.shares_memory(data, stress.data)
+        assert np.array_equal(data, stress.data[:, stress.element_node[:, 0] == 6])
+        assert np.array_equal(stress.get_element_index([7, 6]),
+                              np.hstack([np.where(stress.element_node[:, 0] == eid)[0]
+                                         for eid in [7, 6]]))
+
+        # the index is shared with the strain and works for unsorted ids
+        strain = model.cquad4_strain[1]
+        assert strain.get_entity_index() is stress.get_entity_index()
+        stress.element_node = stress.element_node[::-1].copy()
+        stress.data = stress.data[:, ::-1].copy()
+        element_node2, data2 = stress.select(eids=6)
+        assert np.array_equal(data2, data[:, ::-1])
+        assert np.array_equal(element_node2, element_node[::-1])
+
+        # nodes and modes
+        eigenvectors = model.eigenvectors[1]
+        node_gridtype, data = eigenvectors.select(nids=[3, 1], times=[1., 3.])
+        assert np.array_equal(node_gridtype[:, 0], [3, 1])
+        assert np.array_equal(data, eigenvectors.data[[0, 2]][:, [2, 0]])
+        node_gridtype, data = eigenvectors.select(nids=3, times=2.)
+        assert data.shape == (1, 1, 6), data.shape
+        with self.assertRaises(KeyError):
+            eigenvectors.select(nids=[1, 1000])
+        with self.assertRaises(ValueError):
+            eigenvectors.select(eids=1)
+
+        # a node of a solid element
+        stress = model.ctetra_stress[1]
+        eid, nid = stress.element_node[2]
+        element_node, data = stress.select(eids=eid, nids=nid)
+        assert np.array_equal(element_node, [[eid, nid]])
+        assert np.array_equal(data, stress.data[:, [2]])
+
+    def test_op2_nprocs(self):
+        """the results are decoded in worker processes"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2'
+        model1 = read_op2(op2_filename, log=log)
+        model2 = read_op2(op2_filename, log=log, nprocs=2)
+        disp2 = model2.displacements[1]
+        assert '_lazy_results' not in disp2.__dict__
+        assert np.array_equal(disp2.data, model1.displacements[1].data)
+        model1.assert_op2_equal(model2)
+
+        # the shared memory of the results that weren't merged is freed
+        shm_dirname = '/dev/shm'
+        shm_names0 = set(os.listdir(shm_dirname)) if os.path.isdir(shm_dirname) else set()
+        from_shared_memory = op2_parallel._from_shared_memory
+        ncalls = []
+        def from_shared_memory_error(shared_arrays):
+            ncalls.append(len(shared_arrays))
+            if len(ncalls) == 2:
+                raise RuntimeError('the arrays could not be copied')
+            return from_shared_memory(shared_arrays)
+
+        with mock.patch.object(op2_parallel, '_from_shared_memory', from_shared_memory_error):
+            with self.assertRaises(RuntimeError):
+                read_op2(op2_filename, log=log, nprocs=2)
+
+        # a block that can't be filled/copied frees the other blocks
+        class BadArray:
+            """an array that can't be copied"""
+            shape = (3, )
+            dtype = np.dtype('float64')
+            nbytes = 24
+
+        with self.assertRaises(TypeError):
+            op2_parallel._to_shared_memory({'ids': np.arange(3), 'data': BadArray()})
+        shared_arrays = op2_parallel._to_shared_memory({'ids': np.arange(3), 'data': np.ones(4)})
+        name, shm_name, unused_shape, dtype = shared_arrays[0]
+        shared_arrays[0] = (name, shm_name, (1000, ), dtype)
+        with self.assertRaises(TypeError):
+            op2_parallel._from_shared_memory(shared_arrays)
+        if os.path.isdir(shm_dirname):
+            assert set(os.listdir(shm_dirname)) == shm_names0
+
+        # Python 3.7 doesn't have multiprocessing.shared_memory
+        with mock.patch.object(op2_parallel, 'shared_memory', None):
+            with self.assertRaises(NotImplementedError):
+                read_op2(op2_filename, log=log, nprocs=2)
+
+    def test_op2_set_element_node_ids(self):
+        """only the requested elements/nodes are read"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2'
+        model1 = read_op2(op2_filename, log=log)
+
+        model2 = OP2(log=log)
+        model2.set_element_ids([3, 5, 16])
+        model2.set_node_ids(range(1, 10, 2))
+        model2.read_op2(op2_filename)
+
+        disp1 = model1.displacements[1]
+        disp2 = model2.displacements[1]
+        inid = np.isin(disp1.node_gridtype[:, 0], [1, 3, 5, 7, 9])
+        assert np.array_equal(disp2.node_gridtype, disp1.node_gridtype[inid, :])
+        assert np.array_equal(disp2.data, disp1.data[:, inid, :])
+
+        stress1 = model1.ctetra_stress[1]
+        stress2 = model2.ctetra_stress[1]
+        ieid = np.isin(stress1.element_node[:, 0], [3, 5, 16])
+        assert ieid.sum() < len(ieid)
+        assert np.array_equal(stress2.element_node, stress1.element_node[ieid, :])
+        assert np.array_equal(stress2.data, stress1.data[:, ieid, :])
+
+        # the ctria3 ids aren't requested
+        assert len(model1.ctria3_stress) == 1
+        assert len(model2.ctria3_stress) == 0
+
+    def test_iter_op2_results(self):
+        """the results are streamed one time step at a time"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2'
+        model = read_op2(op2_filename, log=log)
+        disp = model.displacements[1]
+
+        blocks = list(iter_op2_results(op2_filename, results=['displacements'], log=log))
+        assert len(blocks) == disp.ntimes, len(blocks)
+        for itime, (result_name, isubcase, dt, ids, data) in enumerate(blocks):
+            assert result_name == 'displacements'
+            assert isubcase == 1
+            assert np.isclose(dt, disp._times[itime])
+            assert np.array_equal(ids, disp.node_gridtype)
+            assert np.array_equal(data, disp.data[itime, :, :])
+
+        # stop early
+        stream = iter_op2_results(op2_filename, log=log)
+        result_name, isubcase, dt, ids, data = next(stream)
+        stream.close()
+
+    @unittest.skipIf(not IS_H5PY, "No h5py")
+    def test_convert_op2_to_hdf5(self):
+        """the op2 is streamed into an HDF5 file"""
+        from pyNastran.op2.op2_interface.hdf5_interface import (
+            convert_op2_to_hdf5, load_op2_from_hdf5_filename)
+        log = get_logger(level='warning')
+        for op2_filename in [MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2',
+                             MODEL_PATH / 'elements' / 'time_elements.op2']:
+            hdf5_filename = str(op2_filename.with_suffix('.convert.h5'))
+            model1 = read_op2(op2_filename, log=log)
+            convert_op2_to_hdf5(op2_filename, hdf5_filename, log=log)
+            model2 = load_op2_from_hdf5_filename(hdf5_filename, log=log)
+
+            for result_type in ['displacements', 'cquad4_stress', 'chexa_stress']:
+                obj1 = model1.get_result(result_type)[1]
+                obj2 = model2.get_result(result_type)[1]
+                assert obj2.ntimes == obj1.ntimes, (result_type, obj2.ntimes, obj1.ntimes)
+                assert np.allclose(obj2._times, obj1._times)
+                assert np.array_equal(obj2.data, obj1.data), result_type
+
+            # the time steps are appended to resizable datasets and the
+            # time steps with fewer elements are padded
+            with h5py.File(hdf5_filename, 'r') as h5_file:
+                assert h5_file['Subcase=1/displacements/data'].maxshape[0] is None
+                for result_type in ['strain_energy.cquad4_strain_energy', 'grid_point_forces']:
+                    result1 = model1.get_result(result_type)
+                    if not result1:
+                        continue
+                    data = h5_file[f'Subcase=1/{result_type}/data'][()]
+                    assert np.array_equal(data, result1[1].data, equal_nan=True), result_type
+            os.remove(hdf5_filename)
+
+    @unittest.skipIf(not IS_PANDAS, "No pandas")
+    def test_eigenvalue_data_frame(self):
+        """the results without a lazy DataFrame still get one"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'beam_modes' / 'beam_modes_m1.op2'
+        model = read_op2(op2_filename, build_dataframe=True, log=log)
+        assert len(model.eigenvalues)
+        for eigenvalue in model.eigenvalues.values():
+            data_frame = eigenvalue.data_frame
+            assert data_frame is not None
+            assert len(data_frame) == len(eigenvalue.mode)
+        assert model.eigenvectors[1].data_frame is not None
+
+    @unittest.skipIf(not IS_PANDAS, "No pandas")
+    def test_lazy_data_frame(self):
+        """the DataFrames are built on first access and rebuilt when data changes"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2'
+        model = read_op2(op2_filename, build_dataframe=True, log=log)
+        disp = model.displacements[1]
+        stress = model.cquad4_stress[1]
+        assert disp.__dict__['_data_frame'] is None
+        assert stress.__dict__['_data_frame'] is None
+
+        data_frame = disp.data_frame
+        assert data_frame.shape == (disp.data.shape[1] * 6, disp.ntimes)
+        assert disp.data_frame is data_frame
+        assert disp.dataframe is data_frame
+        assert stress.__dict__['_data_frame'] is None
+
+        # replacing data drops the cached DataFrame
+        disp.data = disp.data * 2.
+        data_frame2 = disp.data_frame
+        assert data_frame2 is not data_frame
+        assert np.allclose(data_frame2.to_numpy(), 2. * data_frame.to_numpy())
+
+        stress_frame = stress.data_frame
+        index = stress_frame.index
+        assert index.names == ['ElementID', 'NodeID', 'Location', 'Item']
+        nlayers, nheaders = stress.data.shape[1:]
+        headers = stress.get_headers()
+        assert list(index.get_level_values('ElementID')[:nheaders]) == [stress.element_node[0, 0]] * nheaders
+        assert list(index.get_level_values('Item')[:nheaders]) == headers
+        assert len(index) == nlayers * nheaders
+
+        disp2 = pickle.loads(pickle.dumps(disp))
+        assert disp2.data_frame.equals(data_frame2)
+
+    def test_read_op2s(self):
+        """the results of op2s with the same mesh are stacked along a file axis"""
+        log = get_logger(level='warning')
+        folder = MODEL_PATH / 'sol_101_elements'
+        op2_filenames = [
+            folder / 'static_solid_shell_bar.op2',
+            folder / 'static_solid_shell_bar_xyz.op2',
+            folder / 'static_solid_shell_bar.op2',
+        ]
+        model = read_op2(op2_filenames[1], log=log)
+        stacked_results = read_op2s(op2_filenames, results=['displacements', 'stress'], log=log)
+        assert 'displacements' in stacked_results
+        assert 'stress.chexa_stress' in stacked_results
+
+        disp = stacked_results['displacements'][1]
+        assert disp.data.shape == (3, ) + model.displacements[1].data.shape
+        assert disp.headers == model.displacements[1].get_headers()
+        assert np.array_equal(disp.ids, model.displacements[1].node_gridtype)
+        assert np.array_equal(disp.data[1], model.displacements[1].data)
+        assert np.array_equal(disp.data[0], disp.data[2])
+
+        stress = stacked_results['stress.chexa_stress'][1]
+        assert stress.id_name == 'element_node'
+        assert np.array_equal(stress.data[1], model.chexa_stress[1].data)
+
+        stacked_results2 = read_op2s(op2_filenames, results=['displacements', 'stress'],
+                                     nprocs=2, log=log)
+        assert sorted(stacked_results2) == sorted(stacked_results)
+        for result_name, result in stacked_results.items():
+            for key, stacked in result.items():
+                assert np.array_equal(stacked.data, stacked_results2[result_name][key].data)
+
+        # the fiber distance changes the cquad4 stress
+        op2_filenames = [folder / 'static_solid_shell_bar.op2',
+                         folder / 'static_solid_shell_bar_fiberdist.op2']
+        with self.assertRaises(ValueError):
+            read_op2s(op2_filenames, results=['stress'], log=log)
+
+        # the shared memory of the op2s that weren't stacked is freed
+        shm_dirname = '/dev/shm'
+        shm_names0 = set(os.listdir(shm_dirname)) if os.path.isdir(shm_dirname) else set()
+        with self.assertRaises(ValueError):
+            read_op2s(op2_filenames + [folder / 'static_solid_shell_bar.op2'],
+                      results=['stress'], nprocs=2, log=log)
+        if os.path.isdir(shm_dirname):
+            assert set(os.listdir(shm_dirname)) == shm_names0
+
+    def test_op2_envelope(self):
+        """the results are enveloped across time steps one block at a time"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2'
+        model = read_op2(op2_filename, log=log)
+        envelope = OP2Envelope()
+        envelope.add_op2(model)
+
+        disp = model.displacements[1]
+        disp_envelope = envelope['displacements']
+        assert np.array_equal(disp_envelope.ids, disp.node_gridtype)
+        assert np.allclose(disp_envelope.max, disp.data.max(axis=0))
+        assert np.allclose(disp_envelope.min, disp.data.min(axis=0))
+        assert np.allclose(np.abs(disp_envelope.abs_max), np.abs(disp.data).max(axis=0))
+        assert np.allclose(disp_envelope.max_time, disp._times[disp.data.argmax(axis=0)])
+        assert (disp_envelope.max_subcase == 1).all()
+
+        # the derived stresses match the stresses in the op2
+        stress = model.cquad4_stress[1]
+        stress_envelope = envelope['cquad4_stress']
+        headers = stress.get_headers()
+        assert stress_envelope.names == headers + ['max_principal', 'max_shear']
+        imax_principal = stress_envelope.names.index('max_principal')
+        assert np.allclose(stress_envelope.max[:, imax_principal],
+                           stress.data[:, :, headers.index('omax')].max(axis=0),
+                           rtol=1e-4, atol=1e-3)
+
+        # the op2s are streamed
+        envelope2 = envelope_op2s([op2_filename, op2_filename], log=log)
+        assert sorted(envelope2.results) == sorted(envelope.results)
+        for result_name, result_envelope in envelope.results.items():
+            result_envelope2 = envelope2[result_name]
+            assert np.array_equal(result_envelope.max, result_envelope2.max, equal_nan=True)
+            assert np.array_equal(result_envelope.abs_max_time, result_envelope2.abs_max_time,
+                                  equal_nan=True)
+
+        # a new node is added to the envelope
+        ids = np.array([[1, 1], [1000, 1]])
+        data = np.array([[1., 2.], [-3., 4.]])
+        envelope.add_block('temperatures', 1, None, ids[:1], data[:1])
+        envelope.add_block('temperatures', 2, None, ids[::-1], -data[::-1])
+        temperature = envelope['temperatures']
+        assert np.array_equal(temperature.ids, ids)
+        assert np.array_equal(temperature.max, [[1., 2.], [3., -4.]])
+        assert np.array_equal(temperature.abs_max, [[1., 2.], [3., -4.]])
+        assert np.array_equal(temperature.min_subcase, [[2, 2], [2, 2]])
+
+    def test_combine_subcases(self):
+        """linear combinations of subcases with the stresses recalculated"""
+        log = get_logger(level='error')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'static_solid_shell_bar.op2'
+        model = read_op2(op2_filename, log=log)
+        result_names = ['displacements', 'cquad4_stress', 'stress.chexa_stress',
+                        'cbar_stress', 'grid_point_forces']
+
+        # subcase 2 is 3 * subcase 1
+        for result_name in result_names:
+            result = model.get_result(result_name)
+            obj = copy.deepcopy(result[1])
+            obj.data = obj.data * 3.
+            obj.isubcase = 2
+            result[2] = obj
+
+        # the GPFORCE rows of the subcases don't need to be the same
+        gpforce2 = model.grid_point_forces[2]
+        is_load = np.char.strip(gpforce2.element_names[0].astype('U')) == 'APP-LOAD'
+        gpforce2.node_element = gpforce2.node_element[:, ~is_load]
+        gpforce2.element_names = gpforce2.element_names[:, ~is_load]
+        gpforce2.data = gpforce2.data[:, ~is_load]
+        gpforce2.ntotal = gpforce2.data.shape[1]
+
+        combinations = {101: [(1, 1.0), (2, 1.0)], 102: [(1, -2.0)]}
+        combined_results = combine_subcases(model, combinations, results=result_names,
+                                            max_nbytes=1000)
+        assert sorted(combined_results) == sorted(result_names)
+
+        disp = model.displacements[1]
+        disp101 = model.displacements[101]
+        assert disp101.isubcase == 101
+        assert disp101.node_gridtype is disp.node_gridtype
+        assert np.allclose(disp101.data, 4. * disp.data)
+        assert np.allclose(model.displacements[102].data, -2. * disp.data)
+        assert disp.label == 'SUBCASE 1'
+
+        # the stresses are recalculated from the combined components
+        stress = model.cquad4_stress[1]
+        stress102 = model.cquad4_stress[102]
+        headers = stress.get_headers()
+        ifiber, iangle, iomax, iomin, ivm = (headers.index(name) for name in [
+            'fiber_distance', 'angle', 'omax', 'omin', 'von_mises'])
+        assert np.allclose(stress102.data[:, :, ifiber], stress.data[:, :, ifiber])
+        assert np.allclose(stress102.data[:, :, iomax], -2. * stress.data[:, :, iomin],
+                           rtol=1e-4, atol=1e-3)
+        assert np.allclose(stress102.data[:, :, ivm], 2. * stress.data[:, :, ivm],
+                           rtol=1e-4, atol=1e-3)
+        angle = stress.data[:, :, iangle]
+        angle102 = stress102.data[:, :, iangle]
+        assert np.allclose(np.cos(np.radians(2 * angle102)), -np.cos(np.radians(2 * angle)),
+                           atol=1e-4)
+
+        solid = model.chexa_stress[1]
+        ivm = solid.get_headers().index('von_mises')
+        assert np.allclose(model.chexa_stress[101].data[:, :, ivm], 4. * solid.data[:, :, ivm],
+                           rtol=1e-4, atol=1e-3)
+        bar = model.cbar_stress[101]
+        assert np.isnan(bar.data[:, :, bar.get_headers().index('MS_tension')]).all()
+
+        gpforce = model.grid_point_forces[1]
+        gpforce101 = model.grid_point_forces[101]
+        assert np.array_equal(gpforce101.node_element, gpforce.node_element)
+        is_load = np.char.strip(gpforce.element_names[0].astype('U')) == 'APP-LOAD'
+        assert np.allclose(gpforce101.data[0, is_load], gpforce.data[0, is_load])
+        assert np.allclose(gpforce101.data[0, ~is_load], 4. * gpforce.data[0, ~is_load])
+
+        with self.assertRaises(ValueError):
+            combine_subcases(model, combinations, results=['displacements'])
+
+    @unittest.skipIf(not IS_PYARROW, "No pyarrow")
+    def test_export_parquet(self):
+        """the results are written to Parquet with a row group per time step"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2'
+        dirname = str(op2_filename.with_suffix('.parquet'))
+        model = read_op2(op2_filename, log=log)
+        filenames = model.export_parquet(dirname, results=['displacements', 'chexa_stress'])
+        assert len(filenames) == 2, filenames
+
+        disp = model.displacements[1]
+        table = pq.read_table(os.path.join(dirname, 'displacements_1.parquet'))
+        parquet_file = pq.ParquetFile(os.path.join(dirname, 'displacements_1.parquet'))
+        assert parquet_file.metadata.num_row_groups == disp.ntimes
+        assert table.column_names == ['subcase', 'time', 'node_id', 'grid_type',
+                                      't1', 't2', 't3', 'r1', 'r2', 'r3']
+        nnodes = disp.data.shape[1]
+        assert np.array_equal(table['node_id'].to_numpy()[:nnodes], disp.node_gridtype[:, 0])
+        assert np.allclose(table['time'].to_numpy()[nnodes], disp._times[1])
+        assert np.array_equal(table['t3'].to_numpy(), disp.data[:, :, 2].ravel())
+
+        stress = model.chexa_stress[1]
+        table = pq.read_table(os.path.join(dirname, 'stress.chexa_stress_1.parquet'))
+        assert table.column_names[:4] == ['subcase', 'time', 'element_id', 'node_id']
+        assert np.array_equal(table['von_mises'].to_numpy(), stress.data[:, :, -1].ravel())
+        for filename in filenames:
+            os.remove(filename)
+        os.rmdir(dirname)
+
+    @unittest.skipIf(not IS_H5PY, "No h5py")
+    def test_hdf5_partial_load(self):
+        """a few time steps/nodes/elements are loaded from a compressed HDF5 file"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2'
+        hdf5_filename = str(op2_filename.with_suffix('.partial.h5'))
+        model = read_op2(op2_filename, log=log)
+        model.export_hdf5_filename(hdf5_filename, compression='gzip', compression_opts=4)
+        with h5py.File(hdf5_filename, 'r') as h5_file:
+            h5_result = h5_file['Subcase=1/stress.chexa_stress']
+            assert h5_result['data'].compression == 'gzip'
+            assert h5_result['data'].chunks[0] == 1
+            assert np.array_equal(h5_result['row_ids'][()],
+                                  model.chexa_stress[1].element_node[:, 0])
+
+        # everything
+        model2 = OP2(log=log)
+        model2.load_hdf5_filename(hdf5_filename)
+        assert np.array_equal(model2.chexa_stress[1].data, model.chexa_stress[1].data)
+
+        model2 = OP2(log=log)
+        model2.load_hdf5_filename(
+            hdf5_filename, include_results=['displacements', 'chexa_stress'],
+            subcases=1, itimes=[3, 1], node_ids=[1, 3], element_ids=[1])
+        assert len(model2.cquad4_stress) == 0
+
+        disp = model.displacements[1]
+        disp2 = model2.displacements[1]
+        inode = np.isin(disp.node_gridtype[:, 0], [1, 3])
+        assert disp2.ntimes == 2
+        assert np.allclose(disp2._times, disp._times[[1, 3]])
+        assert np.array_equal(disp2.node_gridtype, disp.node_gridtype[inode, :])
+        assert np.array_equal(disp2.data, disp.data[[1, 3], :, :][:, inode, :])
+
+        stress = model.chexa_stress[1]
+        stress2 = model2.chexa_stress[1]
+        ielement = stress.element_node[:, 0] == 1
+        assert stress2.nelements == 1
+        assert np.array_equal(stress2.element_node, stress.element_node[ielement, :])
+        assert np.array_equal(stress2.element_cid, stress.element_cid[:1, :])
+        assert np.array_equal(stress2.data, stress.data[[1, 3], :, :][:, ielement, :])
+
+        # no subcase 2
+        model2 = OP2(log=log)
+        model2.load_hdf5_filename(hdf5_filename, subcases=[2])
+        assert len(model2.displacements) == 0
+        os.remove(hdf5_filename)
+
+    @unittest.skipIf(not IS_H5PY, "No h5py")
+    def test_hdf5_partial_load_modes(self):
+        """a few modes are loaded from an HDF5 file"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'mode_solid_shell_bar.op2'
+        hdf5_filename = str(op2_filename.with_suffix('.partial_modes.h5'))
+        model = read_op2(op2_filename, log=log)
+        model.export_hdf5_filename(hdf5_filename)
+
+        model2 = OP2(log=log)
+        model2.load_hdf5_filename(hdf5_filename, include_results=['eigenvectors'],
+                                  itimes=[2, 0])
+        # the time steps are sorted
+        eigenvector = model.eigenvectors[1]
+        eigenvector2 = model2.eigenvectors[1]
+        for name in ['_times', 'modes', 'eigns', 'mode_cycles']:
+            value = getattr(eigenvector2, name)
+            assert isinstance(value, np.ndarray), name
+            assert np.allclose(value, np.asarray(getattr(eigenvector, name))[[0, 2]]), name
+        assert np.array_equal(eigenvector2._times, eigenvector2.modes)
+        assert np.array_equal(eigenvector2.data, eigenvector.data[[0, 2], :, :])
+        os.remove(hdf5_filename)
+
+    def test_op2_sort2_elements(self):
+        """the vectorized SORT2 element results are stored as SORT1"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'other' / 'tr1091x.op2'
+        model = read_op2(op2_filename, log=log)
+        for result in [model.op2_results.force.cquad4_force,
+                       model.op2_results.force.ctria3_force]:
+            sort1 = result[(1, 6, 1, 0, 0, '', '')]
+            sort2 = result[(1, 6, 2, 0, 0, '', '')]
+            assert np.array_equal(sort1._times, sort2._times)
+            assert np.array_equal(sort1.element, sort2.element)
+            assert np.allclose(sort1.data, sort2.data)
+
+        # the unvectorized reader gives the same results
+        op2_filename = MODEL_PATH / 'other' / 'ofprand1.op2'
+        model1 = read_op2(op2_filename, log=log)
+        model2 = OP2(log=log)
+        model2.use_vector = False
+        model2.read_op2(op2_filename)
+        key = (10, 5, 2, 0, 0, '', '')
+        crod_force1 = model1.op2_results.psd.crod_force[key]
+        crod_force2 = model2.op2_results.psd.crod_force[key]
+        assert np.array_equal(crod_force1.element, [1101, 1102])
+        assert np.array_equal(crod_force1._times, [0., 2.5, 10.])
+        assert np.array_equal(crod_force1.element, crod_force2.element)
+        assert np.array_equal(crod_force1.data, crod_force2.data)
+
+    def test_op2_sort2_plates_solids(self):
+        """the SORT2 plate/solid stresses are stored as SORT1"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'other' / 'tr1091x.op2'
+        model1 = read_op2(op2_filename, log=log)
+        model2 = OP2(log=log)
+        model2.use_vector = False
+        model2.read_op2(op2_filename)
+
+        sort1_key = (1, 6, 1, 0, 0, '', '')
+        sort2_key = (1, 6, 2, 0, 0, '', '')
+        for model in [model1, model2]:
+            stress = model.op2_results.stress
+            for result in [model.ctria3_stress, model.cquad4_stress,
+                           model.ctria6_stress, model.cquad8_stress,
+                           stress.cpenta_stress, stress.chexa_stress]:
+                sort1 = result[sort1_key]
+                sort2 = result[sort2_key]
+                assert np.array_equal(sort1._times, sort2._times)
+                assert np.array_equal(sort1.element_node, sort2.element_node)
+                assert np.allclose(sort1.data, sort2.data)
+            chexa = stress.chexa_stress[sort2_key]
+            assert chexa.data.shape == (4, 27, 10), chexa.data.shape
+            assert np.array_equal(stress.chexa_stress[sort1_key].element_cid,
+                                  chexa.element_cid)
+
+    def test_op2_result_dtype(self):
+        """the result arrays are stored at the requested precision"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'freq_solid_shell_bar.op2'
+        model1 = read_op2(op2_filename, log=log)
+        model2 = read_op2(op2_filename, log=log, result_dtype='float64', id_dtype='int64')
+        disp1 = model1.displacements[1]
+        disp2 = model2.displacements[1]
+        assert disp1.data.dtype == np.complex64
+        assert disp2.data.dtype == np.complex128
+        assert disp2.node_gridtype.dtype == np.int64
+        assert np.array_equal(disp1.data, disp2.data)
+
+        stress1 = model1.ctetra_stress[1]
+        stress2 = model2.ctetra_stress[1]
+        assert stress2.element_node.dtype == np.int64
+        assert np.array_equal(stress1.element_node, stress2.element_node)
+        assert np.array_equal(stress1.data, stress2.data)
+
+        # the op2 is written at its own precision
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'static_solid_shell_bar.op2'
+        op2_filename_out = str(MODEL_PATH / 'sol_101_elements' / 'static_solid_shell_bar.float64.op2')
+        model = read_op2(op2_filename, log=log, result_dtype='float64')
+        assert model.displacements[1].data.dtype == np.float64
+        model.write_op2(op2_filename_out)
+        model3 = read_op2(op2_filename_out, log=log)
+        assert model3.displacements[1].data.dtype == np.float32
+        assert np.allclose(model3.displacements[1].data, model.displacements[1].data)
+        os.remove(op2_filename_out)
+
+        with self.assertRaises(ValueError):
+            read_op2(op2_filename, log=log, result_dtype='int32')
+
+    def test_op2_result_dtype_64bit(self):
+        """a 64-bit op2 is built at the requested precision (not cast after the build)"""
+        log = get_logger(level='error')
+        op2_filename = os.path.join(MODEL_PATH, 'other', 'sdr11se_s2dclg.op2')
+        model1 = read_op2(op2_filename, log=log)
+
+        from pyNastran.op2.op2_interface import utils
+        def cast_result_arrays(obj, result_dtype, id_dtype):
+            dtypes = {name: value.dtype for name, value in obj.__dict__.items()
+                      if isinstance(value, np.ndarray)}
+            cast_result_arrays0(obj, result_dtype, id_dtype)
+            for name, dtype in dtypes.items():
+                assert getattr(obj, name).dtype == dtype, (obj.class_name, name)
+        cast_result_arrays0 = utils.cast_result_arrays
+        with mock.patch.object(utils, 'cast_result_arrays', cast_result_arrays):
+            model2 = read_op2(op2_filename, log=log, result_dtype='float32')
+
+        stress1 = model1.op2_results.modal_contribution.cbush_stress[6]
+        stress2 = model2.op2_results.modal_contribution.cbush_stress[6]
+        assert stress1.data.dtype == np.complex128
+        assert stress1.element.dtype == np.int64
+        assert stress2.data.dtype == np.complex64
+        assert stress2.element.dtype == np.int64
+        assert np.array_equal(stress1.element, stress2.element)
+        assert np.array_equal(stress1.data.astype(np.complex64), stress2.data)
+
+        disp2 = model2.displacements[100]
+        assert disp2.data.dtype == np.complex64
+        assert disp2.node_gridtype.dtype == np.int64
+        assert np.array_equal(model1.displacements[100].data, disp2.data)
+
+    def test_op2_read_profile(self):
+        """tests the read profile"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'static_solid_shell_bar.op2'
+        model = OP2(log=log)
+        model.read_op2(op2_filename)
+        assert model.get_read_profile() is None
+
+        model = OP2(log=log)
+        model.set_read_profile()
+        model.read_op2(op2_filename)
+        profile = model.get_read_profile()
+        phases = [row['phase'] for row in profile['phases']]
+        assert phases == ['read_tables', 'finalize', 'combine_results'], phases
+
+        # the sizing and filling passes walk the whole table
+        tables = {(row['table_name'], row['read_mode']) : row for row in profile['tables']}
+        nbytes = os.path.getsize(op2_filename)
+        for read_mode in [1, 2]:
+            nbytes_tables = sum(row['nbytes'] for row in profile['tables']
+                                if row['read_mode'] == read_mode)
+            assert nbytes_tables < nbytes
+            assert tables[('OUGV1', read_mode)]['ntables'] == 1
+
+        # the table 3/4 records of subcase 1
+        subcases = {(row['table_name'], row['isubcase'], row['read_mode']) : row
+                    for row in profile['subcases']}
+        oug = subcases[('OUGV1', 1, 2)]
+        assert oug['nrecords'] == 2, oug
+        assert oug['nbytes'] <= tables[('OUGV1', 2)]['nbytes']
+        disp = model.displacements[1]
+        assert oug['nvalues'] == 146 + disp.data.size // disp.ntimes + disp.node_gridtype.shape[0] * 2
+
+    def test_benchmark(self):
+        """tests the synthetic model benchmark"""
+        log = get_logger(level='warning')
+        model = create_synthetic_bdf(3, nlayers=1, nsubcases=3, log=log)
+        assert len(model.nodes) == 32, len(model.nodes)
+        assert len(model._type_to_id_map['CQUAD4']) == 9
+        assert len(model._type_to_id_map['CHEXA']) == 9
+
+        # the results can be written and read back
+        op2_filename = str(MODEL_PATH / 'sol_101_elements' / 'benchmark_nx3.op2')
+        op2 = create_synthetic_op2(model)
+        op2.write_op2(op2_filename, nastran_format='msc')
+        op2b = read_op2(op2_filename, log=log)
+        os.remove(op2_filename)
+        for isubcase in [1, 2, 3]:
+            assert np.array_equal(op2b.displacements[isubcase].data, op2.displacements[isubcase].data)
+            assert np.array_equal(op2b.cquad4_stress[isubcase].element_node,
+                                  op2.cquad4_stress[isubcase].element_node)
+            assert np.allclose(op2b.chexa_stress[isubcase].data, op2.chexa_stress[isubcase].data)
+
+        json_filename = str(MODEL_PATH / 'sol_101_elements' / 'benchmark.json')
+        benchmark = run_benchmark(scales=[2, 3], nlayers=1, json_filename=json_filename, log=log)
+        assert [case['nx'] for case in benchmark['cases']] == [2, 3]
+        assert list(benchmark['cases'][0]['times']) == BENCHMARK_STEPS
+
+        rows = compare_benchmarks(json_filename, json_filename)
+        os.remove(json_filename)
+        assert len(rows) == 2 * len(BENCHMARK_STEPS), rows
+        assert all(row['ratio'] == 1.0 for row in rows if row['time_old'] > 0.)
+
     @unittest.expectedFailure
     def test_set_times_01(self):
         """specify the modes to extract"""
@@ -1,14 +1,17 @@
 #pylint: disable=W0201,C0301,C0111
 from __future__ import annotations
+import copy
 import datetime
 from collections import defaultdict
 from struct import pack, Struct
 from typing import Set, List, TYPE_CHECKING
+import numpy as np
 from cpylog import get_logger2
 
 #import pyNastran
 from pyNastran.op2.op2_interface.op2_f06_common import OP2_F06_Common
 from pyNastran.op2.op2_interface.write_utils import _write_markers
+from pyNastran.op2.op2_interface.utils import cast_result_arrays
 #from pyNastran.op2.errors import FatalError
 from .case_writer import write_casecc
 from .geom1_writer import write_geom1
@@ -199,6 +202,19 @@ def _write_op2(op2_file, fop2_ascii, obj: OP2,
     case_count = _write_result_tables(obj, op2_file, fop2_ascii, struct_3i, endian, skips)
     return case_count
 
+def _to_op2_precision(result):
+    """
+    The result writers expect the arrays to have the precision of the op2
+    that was read, so a result that was read with ``result_dtype`` or
+    ``id_dtype`` is written from a copy at that precision.
+    """
+    size = getattr(result, 'size', 4)
+    fdtype = np.dtype('float32') if size == 4 else np.dtype('float64')
+    idtype = np.dtype('int32') if size == 4 else np.dtype('int64')
+    result2 = copy.copy(result)
+    cast_result_arrays(result2, fdtype, idtype)
+    return result2
+
 def _write_result_tables(obj: OP2, op2_file, fop2_ascii,
                          struct_3i,
                          endian, skips: Set[str]):
@@ -378,6 +394,8 @@ def _write_result_tables(obj: OP2, op2_file, fop2_ascii,
                 if hasattr(result, 'isubcase'): # no for eigenvalues
                     isubcase = result.isubcase
                     #print(f' {result.__class__.__name__} - isubcase={isubcase}')
+                if obj.result_dtype is not None or obj.id_dtype is not None:
+                    result = _to_op2_precision(result)
                 try:
                     #print(' %-6s - %s - isubcase=%s%s; itable=%s %s' % (
                         #table_name, result.__class__.__name__,
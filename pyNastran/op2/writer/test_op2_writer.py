@@ -1,5 +1,9 @@
 import unittest
 import os
+from io import BytesIO
+from struct import Struct
+
+import numpy as np
 from cpylog import SimpleLogger
 
 import pyNastran
@@ -8,6 +12,7 @@ import pyNastran
 #from pyNastran.op2.op2_interface.op2_common import get_scode_word
 from pyNastran.op2.op2_geom import read_op2_geom
 from pyNastran.op2.op2 import OP2
+from pyNastran.op2.op2_interface.write_utils import write_table4_rows
 #from pyNastran.op2.test.test_op2 import run_op2
 #from pyNastran.op2.writer.op2_writer import OP2Writer
 
@@ -315,6 +320,31 @@ class TestOP2Writer(unittest.TestCase):
                              stop_on_failure=True, debug=False)
         os.remove(op2_filename_debug_out)
 
+    def test_write_table4_rows(self):
+        """tests the rows are interleaved the same way as a Struct"""
+        eids_device = np.array([11, 21, 31])
+        nids = np.array([[1, 2], [3, 4], [5, 6]], dtype='int32')
+        data = np.arange(12, dtype='float64').reshape(3, 2, 2) + 0.5
+        cen_words = np.full(3, b'CEN/')
+        for endian in [b'<', b'>']:
+            op2_file = BytesIO()
+            nwords = write_table4_rows(op2_file, [
+                (b'i', eids_device),
+                (b'4s', cen_words),
+                (b'i', nids[:, 0]),
+                (b'f', data[:, 0, :]),
+                (b'i', nids[:, 1]),
+                (b'f', data[:, 1, :]),
+            ], endian)
+            assert nwords == 3 * 8, nwords
+
+            structi = Struct(endian + b'i 4s i2f i2f')
+            expected = b''.join(
+                structi.pack(eid_device, b'CEN/',
+                             nid[0], *datai[0, :], nid[1], *datai[1, :])
+                for eid_device, nid, datai in zip(eids_device, nids, data))
+            assert op2_file.getvalue() == expected
+
     def test_thermal_1(self):
         """tests basic op2 thermal writing"""
         log = SimpleLogger(level='info', encoding='utf-8')
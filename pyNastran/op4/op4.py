@@ -5,7 +5,7 @@ from struct import pack, unpack, Struct
 
 import numpy as np
 from numpy import array, zeros, float32, float64, complex64, complex128, ndarray
-from scipy.sparse import coo_matrix  # type: ignore
+from scipy.sparse import coo_matrix, issparse  # type: ignore
 from cpylog import get_logger2
 
 from pyNastran.utils import is_binary_file as file_is_binary
@@ -1438,13 +1438,13 @@ class OP4:
             if not form in (1, 2, 3, 6, 8, 9):
                 raise ValueError('form=%r and must be in [1, 2, 3, 6, 8, 9]' % form)
 
-            if isinstance(matrix, coo_matrix):
+            if issparse(matrix):
                 #write_DMIG(f, name, matrix, form, precision='default')
                 if is_binary:
                     raise NotImplementedError('sparse binary op4 writing not implemented')
                 else:
                     _write_sparse_matrix_ascii(
-                        op4, name, matrix, form=form,
+                        op4, name, matrix.tocoo(), form=form,
                         precision=precision, is_big_mat=is_big_mat)
             elif isinstance(matrix, ndarray):
                 if is_binary:
@@ -0,0 +1,87 @@
+"""
+Defines:
+ - ReadProfile()
+
+Accumulates the time spent in each step of an OP2/BDF read, so the table
+or card type that dominates a slow read can be found
+(see ``OP2.set_read_profile`` and ``BDF.set_read_profile``).
+
+"""
+from time import perf_counter
+from typing import Dict, Any
+
+
+class ReadProfile:
+    """
+    Accumulates rows of timings/counts by group
+
+    The rows of a group are keyed by their key fields (e.g., the table
+    name and subcase), so repeated steps are summed.
+    """
+    def __init__(self):
+        self.t0 = perf_counter()
+        self.total_time = 0.
+        #: {group : {key : row}}
+        self.groups = {}  # type: Dict[str, Dict[tuple, Dict[str, Any]]]
+
+    def add(self, group: str, key: Dict[str, Any], **values: Any) -> None:
+        """
+        Adds the values to a row
+
+        Parameters
+        ----------
+        group : str
+            the group of rows (e.g., 'tables', 'cards')
+        key : Dict[str, Any]
+            the fields that identify the row (e.g., {'card_name' : 'GRID'})
+        **values : int / float
+            the values to sum (e.g., time=0.1, nbytes=1000)
+
+        """
+        rows = self.groups.setdefault(group, {})
+        row_key = tuple(key.values())
+        row = rows.get(row_key)
+        if row is None:
+            row = dict(key)
+            row.update((name, 0) for name in values)
+            rows[row_key] = row
+        for name, value in values.items():
+            row[name] += value
+
+    def add_phase(self, phase: str, t0: float) -> float:
+        """
+        Adds the time since ``t0`` to a phase
+
+        Returns
+        -------
+        t1 : float
+            the current time (the start of the next phase)
+
+        """
+        t1 = perf_counter()
+        self.add('phases', {'phase' : phase}, time=t1 - t0)
+        return t1
+
+    def stop(self) -> None:
+        """sets the total time of the read"""
+        self.total_time = perf_counter() - self.t0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Gets the profile
+
+        Returns
+        -------
+        profile : Dict[str, Any]
+            total_time : float
+                the wall time of the read (sec)
+            <group> : List[Dict[str, Any]]
+                the rows of each group, which can be loaded with
+                ``pd.DataFrame(profile[group])``
+
+        """
+        profile = {'total_time' : self.total_time}  # type: Dict[str, Any]
+        for group, rows in self.groups.items():
+            profile[group] = [dict(row) for row in rows.values()]
+        return profile
+